@@ -15,11 +15,13 @@ Utility methods for serializing responses
 """
 
 import datetime
+import itertools
 
 from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_serialization import jsonutils
 from oslo_utils import encodeutils
+from oslo_utils import reflection
 import six
 import webob
 
@@ -75,18 +77,84 @@ class JSONRequestDeserializer(object):
             return {}
 
 
+class StreamedList(object):
+    """A list in a response which is read while the response is written.
+
+    :param pages: An iterable of lists of items. Only one page is held in
+                  memory at a time when the response body is written.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+
+
 class JSONResponseSerializer(object):
 
-    def to_json(self, data):
+    def __init__(self, sort_keys=True):
+        self.sort_keys = sort_keys
+
+    def _dumps(self, data):
         def sanitizer(obj):
             if isinstance(obj, datetime.datetime):
                 return obj.isoformat()
             return six.text_type(obj)
 
-        response = jsonutils.dumps(data, default=sanitizer, sort_keys=True)
+        return jsonutils.dumps(data, default=sanitizer,
+                               sort_keys=self.sort_keys)
+
+    def to_json(self, data):
+        response = self._dumps(data)
         LOG.debug("JSON response : %s", response)
         return response
 
+    def to_json_chunks(self, key, streamed):
+        """Serialize a dict with a single streamed list, page by page.
+
+        The first chunk holds the first page, errors raised until then are
+        not caught. When a later page fails, the status of the response has
+        already been sent, so the list is ended and the document gets an
+        'error' key describing the failure instead.
+        """
+        head = '{%s: [' % self._dumps(key)
+        count = 0
+        try:
+            for page in streamed.pages:
+                if not page:
+                    continue
+                # separate the items of a page from those of the previous one
+                prefix = ', ' if count else ''
+                chunk = head + prefix + ', '.join(self._dumps(item)
+                                                  for item in page)
+                count += len(page)
+                head = ''
+                yield encodeutils.safe_encode(chunk)
+        except Exception as ex:
+            if head:
+                raise
+            LOG.exception("JSON response : streaming '%(key)s' failed after "
+                          "%(count)s items", {'count': count, 'key': key})
+            error = {
+                'code': 500,
+                'message': six.text_type(ex).split('\n', 1)[0],
+                'type': reflection.get_class_name(
+                    ex, fully_qualified=False).replace('_Remote', ''),
+            }
+            yield encodeutils.safe_encode(
+                '], %s: %s}' % (self._dumps('error'), self._dumps(error)))
+            return
+        yield encodeutils.safe_encode(head + ']}')
+        LOG.debug("JSON response : %(count)s items of '%(key)s' streamed",
+                  {'count': count, 'key': key})
+
     def default(self, response, result):
         response.content_type = 'application/json'
+        if isinstance(result, dict) and len(result) == 1:
+            key, value = list(result.items())[0]
+            if isinstance(value, StreamedList):
+                chunks = self.to_json_chunks(key, value)
+                # the first page is serialized before the response is
+                # started so that errors are reported with a status code
+                first = next(chunks)
+                response.app_iter = itertools.chain([first], chunks)
+                return
         response.body = encodeutils.safe_encode(self.to_json(result))
@@ -14,10 +14,12 @@
 import functools
 
 import jsonschema
+from oslo_config import cfg
 from oslo_utils import strutils
 import six
 from webob import exc
 
+from senlin.api.common import serializers
 from senlin.common.i18n import _
 from senlin.common import policy
 from senlin.objects import base as obj_base
@@ -117,3 +119,34 @@ def parse_bool_param(name, value):
         raise exc.HTTPBadRequest(msg)
 
     return strutils.bool_from_string(value, strict=True)
+
+
+def stream_list(req, rpc_client, method, obj):
+    """Read the results of a list request from the engine page by page.
+
+    The first page is read before returning, so that errors are reported
+    with a proper status code. The following pages are read when the
+    response body is written, each one starting after the last object of
+    the previous page.
+
+    :param req: Reference to a WSGI request object.
+    :param rpc_client: The RPC client to call the engine with.
+    :param method: The name of the list method of the engine.
+    :param obj: A versioned list request object without a limit.
+    :returns: A list of the objects as dicts if they fit in one page, or a
+              `StreamedList` of them otherwise.
+    """
+    obj.limit = cfg.CONF.senlin_api.list_page_size
+    page = rpc_client.call(req.context, method, obj)
+    if len(page) < obj.limit:
+        return page
+
+    def pages(page):
+        while True:
+            yield page
+            if len(page) < obj.limit:
+                return
+            obj.marker = page[-1]['id']
+            page = rpc_client.call(req.context, method, obj)
+
+    return serializers.StreamedList(pages(page))
@@ -92,8 +92,28 @@ api_opts = [
                       "waiting forever.")),
     cfg.IntOpt('max_json_body_size', default=1048576,
                deprecated_group='DEFAULT',
-               help=_('Maximum raw byte size of JSON request body.'))
-
+               help=_('Maximum raw byte size of JSON request body.')),
+    cfg.IntOpt('trust_cache_ttl', default=300,
+               help=_('Seconds an API worker caches the trust of a user in '
+                      'a project. Set to 0 to disable caching.')),
+    cfg.BoolOpt('json_sort_keys', default=True,
+                help=_('Whether the keys of the objects in JSON responses '
+                       'are sorted. Sorting costs time for large '
+                       'responses.')),
+    cfg.IntOpt('list_page_size', default=1000, min=1,
+               help=_('Number of objects read from the engine at a time '
+                      'for a list request without a limit. The response '
+                      'is streamed to the client page by page.')),
+    cfg.FloatOpt('event_feed_interval', default=1.0, min=0.1,
+                 help=_('Seconds between two polls of the engine for new '
+                        'events by a stream of the event feed.')),
+    cfg.IntOpt('event_feed_heartbeat', default=30, min=1,
+               help=_('Seconds after which an empty line is sent on a '
+                      'stream of the event feed without new events.')),
+    cfg.IntOpt('event_feed_duration', default=3600, min=1,
+               help=_('Maximum number of seconds a stream of the event '
+                      'feed is kept open. Clients reconnect with the last '
+                      'cursor received to continue reading.')),
 ]
 api_group = cfg.OptGroup('senlin_api')
 cfg.CONF.register_group(api_group)
@@ -605,7 +625,8 @@ class Resource(object):
         """
         self.controller = controller
         self.deserializer = serializers.JSONRequestDeserializer()
-        self.serializer = serializers.JSONResponseSerializer()
+        self.serializer = serializers.JSONResponseSerializer(
+            sort_keys=cfg.CONF.senlin_api.json_sort_keys)
 
     @webob_dec.wsgify(RequestClass=Request)
     def __call__(self, request):
@@ -656,7 +677,12 @@ class Resource(object):
             raise translate_exception(err, request.best_match_language())
 
         try:
-            response = webob.Response(request=request)
+            # a controller may build the response itself, e.g. for streaming
+            streamed = isinstance(action_result, webob.Response)
+            if streamed:
+                response, action_result = action_result, None
+            else:
+                response = webob.Response(request=request)
             # Customize status code if default (200) should be overridden
             if status_code is not None:
                 response.status_code = int(status_code)
@@ -684,7 +710,9 @@ class Resource(object):
                     response.headers[API_VERSION_KEY] = ver_res
                     response.headers['Vary'] = API_VERSION_KEY
 
-            self.dispatch(self.serializer, action, response, action_result)
+            if not streamed:
+                self.dispatch(self.serializer, action, response,
+                              action_result)
             return response
 
         # return unserializable result (typically an exception)
@@ -12,6 +12,7 @@
 
 from senlin.api.middleware import context
 from senlin.api.middleware import fault
+from senlin.api.middleware import metrics
 from senlin.api.middleware import trust
 from senlin.api.middleware import version_negotiation as vn
 from senlin.api.middleware import webhook
@@ -35,3 +36,7 @@ def trust_filter(app, conf, **local_conf):
 
 def webhook_filter(app, conf, **local_conf):
     return webhook.WebhookMiddleware(app)
+
+
+def metrics_filter(app, conf, **local_conf):
+    return metrics.MetricsMiddleware(app)
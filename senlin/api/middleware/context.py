@@ -13,6 +13,7 @@
 from oslo_config import cfg
 from oslo_middleware import request_id as oslo_request_id
 from oslo_utils import encodeutils
+from oslo_utils import strutils
 
 from senlin.api.common import wsgi
 from senlin.common import context
@@ -50,6 +51,10 @@ class ContextMiddleware(wsgi.Middleware):
 
             region_name = headers.get('X-Region-Name')
 
+            # Read from the primary database for reading own writes
+            read_primary = strutils.bool_from_string(
+                headers.get('X-Senlin-Read-Primary'))
+
             roles = headers.get('X-Roles')
             if roles is not None:
                 roles = roles.split(',')
@@ -81,5 +86,6 @@ class ContextMiddleware(wsgi.Middleware):
             auth_token_info=auth_token_info,
             region_name=region_name,
             roles=roles,
-            api_version=api_version
+            api_version=api_version,
+            read_primary=read_primary
         )
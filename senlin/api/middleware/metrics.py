@@ -0,0 +1,50 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+A middleware that times API requests and serves the metrics of the worker.
+"""
+
+import time
+
+from oslo_config import cfg
+import webob
+from webob import dec as webob_dec
+
+from senlin.api.common import wsgi
+from senlin.common import metrics
+
+REQUEST_SECONDS = metrics.histogram(
+    'senlin_api_request_seconds',
+    'Time spent handling API requests.', ('method', 'status'))
+
+
+class MetricsMiddleware(wsgi.Middleware):
+    """Time requests and serve the metrics from the `/metrics` path.
+
+    The metrics path is only served when enabled by the `api_route` option
+    of the `metrics` group, before any authentication takes place.
+    """
+
+    @webob_dec.wsgify
+    def __call__(self, req):
+        if (cfg.CONF.metrics.api_route and req.path == '/metrics' and
+                req.method == 'GET'):
+            return webob.Response(
+                body=metrics.render().encode('utf-8'),
+                headerlist=[('Content-Type', metrics.CONTENT_TYPE)])
+
+        start = time.time()
+        response = req.get_response(self.application)
+        REQUEST_SECONDS.observe(time.time() - start, method=req.method,
+                                status=response.status_int)
+        return response
@@ -10,13 +10,36 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from oslo_config import cfg
+
 from senlin.api.common import util
 from senlin.api.common import wsgi
+from senlin.common import cache
 from senlin.common import context
 from senlin.common import exception
 from senlin.drivers import base as driver_base
 from senlin.rpc import client as rpc
 
+# Maximum number of entries kept in the trust cache
+MAX_ENTRIES = 4096
+
+_cache = None
+
+
+def trust_cache():
+    """Get the cache of the trusts used by users in projects.
+
+    The cache lives in an API worker process and is keyed by a tuple of
+    user ID and project ID.
+    """
+    global _cache
+
+    if _cache is None:
+        _cache = cache.TTLCache(
+            'trust', ttl=lambda: cfg.CONF.senlin_api.trust_cache_ttl,
+            max_entries=MAX_ENTRIES)
+    return _cache
+
 
 class TrustMiddleware(wsgi.Middleware):
     """Extract trust info from request.
@@ -72,5 +95,7 @@ class TrustMiddleware(wsgi.Middleware):
         return trust.id
 
     def process_request(self, req):
-        trust_id = self._get_trust(req)
+        ctx = req.context
+        key = (ctx.user_id, ctx.project_id)
+        trust_id = trust_cache().get(key, lambda: self._get_trust(req))
         req.context.trusts = trust_id
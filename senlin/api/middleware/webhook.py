@@ -10,12 +10,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from oslo_config import cfg
 from oslo_log import log as logging
+from oslo_utils import timeutils
 from six.moves.urllib import parse as urlparse
 import webob
+from webob import dec as webob_dec
 
 from senlin.api.common import util
 from senlin.api.common import wsgi
+from senlin.common import cache
 from senlin.common import context
 from senlin.common import exception as exc
 from senlin.common.i18n import _
@@ -24,6 +28,72 @@ from senlin.rpc import client as rpc
 
 LOG = logging.getLogger(__name__)
 
+# Seconds before its expiry at which a cached token is no longer used
+TOKEN_EXPIRY_MARGIN = 60
+
+# Key of the request environment holding the receiver whose token was used
+# for the request
+ENV_RECEIVER = 'senlin.webhook.receiver_id'
+
+_cache = None
+
+
+def receiver_cache():
+    global _cache
+
+    if _cache is None:
+        _cache = ReceiverCache()
+    return _cache
+
+
+def _cache_ttl():
+    return cfg.CONF.receiver.cache_ttl
+
+
+def _token_ttl(value):
+    expires_at = value[1]
+    if expires_at is None:
+        return 0
+    delta = timeutils.normalize_time(expires_at) - timeutils.utcnow()
+    return delta.total_seconds() - TOKEN_EXPIRY_MARGIN
+
+
+class ReceiverCache(object):
+    """Cache of webhook receiver actors and the tokens issued for them.
+
+    The cache lives in an API worker process and is keyed by receiver ID.
+    Actors and tokens are kept for at most `cache_ttl` seconds, tokens are
+    dropped earlier when they are about to expire. Updating or deleting a
+    receiver only invalidates the cache of the worker serving that request,
+    other workers keep their entries until they time out. A token rejected
+    by the authentication middleware is dropped as well.
+    """
+
+    def __init__(self):
+        self._actors = cache.TTLCache('webhook_actor', ttl=_cache_ttl)
+        # Values are tuples of token and expiry time
+        self._tokens = cache.TTLCache('webhook_token', ttl=_cache_ttl,
+                                      value_ttl=_token_ttl)
+
+    def get_actor(self, receiver_id, loader):
+        """Get the actor of a receiver, calling the loader on a miss."""
+        return self._actors.get(receiver_id, loader)
+
+    def get_token(self, receiver_id, loader):
+        """Get a token of the actor of a receiver.
+
+        :param receiver_id: ID of the receiver.
+        :param loader: A callable without arguments returning a tuple of a
+                       new token and its expiry time.
+        :returns: The token.
+        """
+        return self._tokens.get(receiver_id, loader)[0]
+
+    def invalidate(self, receiver_id=None):
+        """Drop cached data of a receiver, or of all receivers if None."""
+        self._actors.invalidate(receiver_id)
+        self._tokens.invalidate(receiver_id)
+
 
 class WebhookMiddleware(wsgi.Middleware):
     """Middleware for authenticating webhook triggering requests.
@@ -32,6 +102,18 @@ class WebhookMiddleware(wsgi.Middleware):
     rebuilds the request header so that the request will successfully pass
     the verification of keystone auth_token middleware.
     """
+    @webob_dec.wsgify
+    def __call__(self, req):
+        response = self.process_request(req)
+        if response:
+            return response
+        response = req.get_response(self.application)
+        receiver_id = req.environ.get(ENV_RECEIVER)
+        if receiver_id is not None and response.status_int == 401:
+            # The token may have been revoked, get a new one next time
+            receiver_cache().invalidate(receiver_id)
+        return response
+
     def process_request(self, req):
         # We only handle POST requests
         if req.method != 'POST':
@@ -48,10 +130,28 @@ class WebhookMiddleware(wsgi.Middleware):
         ctx = context.RequestContext(is_admin=True, api_version=api_version)
         req.context = ctx
 
-        obj = util.parse_request(
-            'ReceiverGetRequest', req, {'identity': receiver_id})
-        rpcc = rpc.EngineClient()
-        receiver = rpcc.call(ctx, 'receiver_get', obj)
+        token = receiver_cache().get_token(
+            receiver_id, lambda: self._new_token(req, receiver_id))
+        req.environ[ENV_RECEIVER] = receiver_id
+
+        # Fill the token into the request header
+        req.headers['X-Auth-Token'] = token
+
+    def _new_token(self, req, receiver_id):
+        """Get a new token for the actor of a receiver.
+
+        :param req: The webhook triggering request.
+        :param receiver_id: ID of the receiver.
+        :returns: A tuple of the token and its expiry time.
+        """
+        def load_actor():
+            obj = util.parse_request(
+                'ReceiverGetRequest', req, {'identity': receiver_id})
+            rpcc = rpc.EngineClient()
+            receiver = rpcc.call(req.context, 'receiver_get', obj)
+            return receiver['actor']
+
+        actor = receiver_cache().get_actor(receiver_id, load_actor)
 
         svc_ctx = context.get_service_credentials()
         kwargs = {
@@ -60,11 +160,8 @@ class WebhookMiddleware(wsgi.Middleware):
             'user_domain_name': svc_ctx['user_domain_name'],
             'password': svc_ctx['password']
         }
-        kwargs.update(receiver['actor'])
-
-        # Get token and fill it into the request header
-        token = self._get_token(**kwargs)
-        req.headers['X-Auth-Token'] = token
+        kwargs.update(actor)
+        return self._get_token(**kwargs)
 
     def _parse_url(self, url):
         """Extract receiver ID from the request URL.
@@ -100,11 +197,11 @@ class WebhookMiddleware(wsgi.Middleware):
         """Get a valid token based on the credential provided.
 
         :param cred: Rebuilt credential dictionary for authentication.
+        :returns: A tuple of the token and its expiry time.
         """
         try:
-            token = driver_base.SenlinDriver().identity.get_token(**kwargs)
+            identity = driver_base.SenlinDriver().identity
+            return identity.get_token_info(**kwargs)
         except Exception as ex:
             LOG.exception('Webhook failed authentication: %s.', ex)
             raise exc.Forbidden()
-
-        return token
@@ -11,6 +11,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from oslo_config import cfg
 from webob import exc
 
 from senlin.api.common import util
@@ -18,6 +19,10 @@ from senlin.api.common import wsgi
 from senlin.common import consts
 from senlin.common.i18n import _
 
+# Seconds left to the engine for returning an action waited for before the
+# RPC call times out
+WAIT_RESPONSE_MARGIN = 5
+
 
 class ActionData(object):
     """All required data fields for an action."""
@@ -57,6 +62,7 @@ class ActionController(wsgi.Controller):
     @util.policy_enforce
     def index(self, req):
         whitelist = {
+            consts.ACTION_IDS: 'mixed',
             consts.ACTION_NAME: 'mixed',
             consts.ACTION_TARGET: 'mixed',
             consts.ACTION_ACTION: 'mixed',
@@ -70,6 +76,11 @@ class ActionController(wsgi.Controller):
             if key not in whitelist.keys():
                 raise exc.HTTPBadRequest(_('Invalid parameter %s') % key)
         params = util.get_allowed_params(req.params, whitelist)
+        if consts.ACTION_IDS in params:
+            # IDs can be given as a comma separated list
+            params[consts.ACTION_IDS] = [
+                i for v in params[consts.ACTION_IDS] for i in v.split(',')
+                if i]
 
         project_safe = not util.parse_bool_param(
             consts.PARAM_GLOBAL_PROJECT,
@@ -77,7 +88,11 @@ class ActionController(wsgi.Controller):
         params['project_safe'] = project_safe
 
         obj = util.parse_request('ActionListRequest', req, params)
-        actions = self.rpc_client.call(req.context, "action_list", obj)
+        if consts.PARAM_LIMIT in params:
+            actions = self.rpc_client.call(req.context, "action_list", obj)
+        else:
+            actions = util.stream_list(req, self.rpc_client, "action_list",
+                                       obj)
 
         return {'actions': actions}
 
@@ -94,8 +109,20 @@ class ActionController(wsgi.Controller):
 
     @util.policy_enforce
     def get(self, req, action_id):
-        params = {'identity': action_id}
+        whitelist = {
+            consts.ACTION_WAIT: 'single',
+            consts.ACTION_UNTIL: 'single',
+        }
+        params = util.get_allowed_params(req.params, whitelist)
+        params['identity'] = action_id
         obj = util.parse_request('ActionGetRequest', req, params)
+        if consts.ACTION_WAIT in params and obj.wait:
+            # The engine holds a worker while waiting for the action, so the
+            # wait ends in time for the call to return before it times out
+            limit = cfg.CONF.rpc_response_timeout - WAIT_RESPONSE_MARGIN
+            obj.wait = min(obj.wait, cfg.CONF.max_action_wait,
+                           max(limit, 0))
+
         action = self.rpc_client.call(req.context, 'action_get', obj)
 
         return {'action': action}
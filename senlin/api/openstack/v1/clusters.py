@@ -61,7 +61,12 @@ class ClusterController(wsgi.Controller):
         unsafe = util.parse_bool_param(consts.PARAM_GLOBAL_PROJECT, is_global)
         params['project_safe'] = not unsafe
         req_obj = util.parse_request('ClusterListRequest', req, params)
-        clusters = self.rpc_client.call(req.context, 'cluster_list', req_obj)
+        if consts.PARAM_LIMIT in params:
+            clusters = self.rpc_client.call(req.context, 'cluster_list',
+                                            req_obj)
+        else:
+            clusters = util.stream_list(req, self.rpc_client, 'cluster_list',
+                                        req_obj)
         return {'clusters': clusters}
 
     @util.policy_enforce
@@ -14,6 +14,13 @@
 Event endpoint for Senlin v1 REST API.
 """
 
+import time
+
+import eventlet
+from oslo_config import cfg
+from oslo_log import log as logging
+from oslo_serialization import jsonutils
+import webob
 from webob import exc
 
 from senlin.api.common import util
@@ -21,6 +28,10 @@ from senlin.api.common import wsgi
 from senlin.common import consts
 from senlin.common.i18n import _
 
+LOG = logging.getLogger(__name__)
+
+FEED_CONTENT_TYPE = 'application/x-ndjson'
+
 
 class EventController(wsgi.Controller):
     """WSGI controller for events in Senlin v1 API."""
@@ -55,10 +66,90 @@ class EventController(wsgi.Controller):
         params['project_safe'] = project_safe
 
         obj = util.parse_request('EventListRequest', req, params)
-        events = self.rpc_client.call(req.context, "event_list", obj)
+        if consts.PARAM_LIMIT in params:
+            events = self.rpc_client.call(req.context, "event_list", obj)
+        else:
+            events = util.stream_list(req, self.rpc_client, "event_list",
+                                      obj)
 
         return {'events': events}
 
+    @wsgi.Controller.api_version('1.12')
+    @util.policy_enforce
+    def feed(self, req):
+        """Stream the events recorded after a cursor as JSON lines."""
+        whitelist = {
+            consts.EVENT_CURSOR: 'single',
+            consts.EVENT_OBJ_TYPE: 'mixed',
+            consts.EVENT_OBJ_ID: 'mixed',
+            consts.EVENT_CLUSTER_ID: 'mixed',
+            consts.EVENT_ACTION: 'mixed',
+            consts.EVENT_LEVEL: 'mixed',
+            consts.PARAM_LIMIT: 'single',
+            consts.PARAM_GLOBAL_PROJECT: 'single',
+        }
+
+        for key in req.params.keys():
+            if key not in whitelist.keys():
+                raise exc.HTTPBadRequest(_('Invalid parameter %s') % key)
+        params = util.get_allowed_params(req.params, whitelist)
+
+        project_safe = not util.parse_bool_param(
+            consts.PARAM_GLOBAL_PROJECT,
+            params.pop(consts.PARAM_GLOBAL_PROJECT, False))
+        params['project_safe'] = project_safe
+
+        obj = util.parse_request('EventFeedRequest', req, params)
+        obj.obj_set_defaults()
+        # the first batch is read before the response is started so that
+        # errors are reported with a proper status code
+        result = self.rpc_client.call(req.context, 'event_feed', obj)
+
+        response = webob.Response(request=req, charset='utf-8',
+                                  content_type=FEED_CONTENT_TYPE)
+        response.app_iter = self._stream(req.context, obj, result)
+        return response
+
+    def _stream(self, context, obj, result):
+        """Generate the lines of the event feed.
+
+        Each event is sent as a JSON document on a line of its own. A line
+        with only the cursor is sent whenever the cursor moves without any
+        event to send, so that a client always knows where to resume from.
+        An empty line is sent as a heartbeat on an idle stream.
+        """
+        conf = cfg.CONF.senlin_api
+        start = last_sent = time.time()
+        cursor = obj.cursor
+        while True:
+            for event in result['events']:
+                yield self._line(event)
+            if not result['events'] and result['cursor'] != cursor:
+                yield self._line({consts.EVENT_CURSOR: result['cursor']})
+            if result['events'] or result['cursor'] != cursor:
+                last_sent = time.time()
+            cursor = obj.cursor = result['cursor']
+
+            if time.time() - start >= conf.event_feed_duration:
+                return
+            # a full batch means more events are ready to be read
+            if len(result['events']) < obj.limit:
+                eventlet.sleep(conf.event_feed_interval)
+                if time.time() - last_sent >= conf.event_feed_heartbeat:
+                    last_sent = time.time()
+                    yield b'\n'
+
+            try:
+                result = self.rpc_client.call(context, 'event_feed', obj)
+            except Exception as ex:
+                # the client resumes from the last cursor received
+                LOG.warning('Event feed stopped at cursor %(cursor)s: '
+                            '%(ex)s', {'cursor': cursor, 'ex': ex})
+                return
+
+    def _line(self, data):
+        return (jsonutils.dumps(data, sort_keys=True) + '\n').encode('utf-8')
+
     @util.policy_enforce
     def get(self, req, event_id):
 
@@ -32,6 +32,23 @@ class NodeController(wsgi.Controller):
         'check', 'recover'
     )
 
+    # Names of the request objects of an item and of a batch, and the name
+    # of the engine method for each batch operation
+    BATCH_REQUESTS = {
+        consts.NODE_BATCH_CREATE: ('NodeCreateRequestBody',
+                                   'NodeBatchCreateRequest',
+                                   'node_batch_create'),
+        consts.NODE_BATCH_ADOPT: ('NodeAdoptRequest',
+                                  'NodeBatchAdoptRequest',
+                                  'node_batch_adopt'),
+        consts.NODE_BATCH_DELETE: ('NodeDeleteRequest',
+                                   'NodeBatchDeleteRequest',
+                                   'node_batch_delete'),
+        consts.NODE_BATCH_OPERATION: ('NodeOperationRequest',
+                                      'NodeBatchOperationRequest',
+                                      'node_batch_op'),
+    }
+
     @util.policy_enforce
     def index(self, req):
         whitelist = {
@@ -54,7 +71,10 @@ class NodeController(wsgi.Controller):
         params['project_safe'] = project_safe
 
         obj = util.parse_request('NodeListRequest', req, params)
-        nodes = self.rpc_client.call(req.context, 'node_list', obj)
+        if consts.PARAM_LIMIT in params:
+            nodes = self.rpc_client.call(req.context, 'node_list', obj)
+        else:
+            nodes = util.stream_list(req, self.rpc_client, 'node_list', obj)
         return {'nodes': nodes}
 
     @util.policy_enforce
@@ -87,6 +107,44 @@ class NodeController(wsgi.Controller):
         node = self.rpc_client.call(req.context, 'node_adopt_preview', obj)
         return {'node_profile': node}
 
+    @wsgi.Controller.api_version('1.13')
+    @util.policy_enforce
+    def batch(self, req, body=None):
+        """Perform an operation on a batch of nodes."""
+        body = body or {}
+        if len(body) < 1:
+            raise exc.HTTPBadRequest(_('No operation specified'))
+
+        if len(body) > 1:
+            raise exc.HTTPBadRequest(_('Multiple operations specified'))
+
+        this_op = list(body.keys())[0]
+        if this_op not in self.BATCH_REQUESTS:
+            msg = _("Unrecognized operation '%s' specified") % this_op
+            raise exc.HTTPBadRequest(msg)
+
+        items = body[this_op]
+        if (not isinstance(items, list) or len(items) < 1 or
+                not all(isinstance(i, dict) for i in items)):
+            msg = _("The nodes for operation '%s' must be a non-empty list."
+                    ) % this_op
+            raise exc.HTTPBadRequest(msg)
+
+        if this_op == consts.NODE_BATCH_DELETE:
+            for item in items:
+                force = item.get(consts.NODE_DELETE_FORCE)
+                if force is None:
+                    force = False
+                item[consts.NODE_DELETE_FORCE] = util.parse_bool_param(
+                    consts.NODE_DELETE_FORCE, force)
+
+        item_name, batch_name, method = self.BATCH_REQUESTS[this_op]
+        nodes = [util.parse_request(item_name, req, item) for item in items]
+        obj = util.parse_request(
+            batch_name, req, {'nodes': [n.obj_to_primitive() for n in nodes]})
+        results = self.rpc_client.call(req.context, method, obj)
+        return {'nodes': results}
+
     @util.policy_enforce
     def get(self, req, node_id):
         params = {'identity': node_id}
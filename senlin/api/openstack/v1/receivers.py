@@ -14,10 +14,12 @@
 Receiver endpoint for Senlin v1 REST API.
 """
 
+from oslo_utils import uuidutils
 from webob import exc
 
 from senlin.api.common import util
 from senlin.api.common import wsgi
+from senlin.api.middleware import webhook
 from senlin.common import consts
 from senlin.common.i18n import _
 
@@ -85,6 +87,7 @@ class ReceiverController(wsgi.Controller):
         obj = util.parse_request('ReceiverUpdateRequest', req,
                                  kwargs)
         receiver = self.rpc_client.call(req.context, 'receiver_update', obj)
+        self._invalidate_cache(receiver.get('id', receiver_id))
 
         return {'receiver': receiver}
 
@@ -94,6 +97,7 @@ class ReceiverController(wsgi.Controller):
         obj = util.parse_request(
             'ReceiverDeleteRequest', req, {'identity': receiver_id})
         self.rpc_client.call(req.context, 'receiver_delete', obj)
+        self._invalidate_cache(receiver_id)
         raise exc.HTTPNoContent()
 
     @util.policy_enforce
@@ -103,3 +107,12 @@ class ReceiverController(wsgi.Controller):
             'ReceiverNotifyRequest', req, {'identity': receiver_id})
         self.rpc_client.call(req.context, 'receiver_notify', obj)
         raise exc.HTTPNoContent()
+
+    def _invalidate_cache(self, receiver_id):
+        """Drop the webhook data of a receiver cached by this worker."""
+        cache = webhook.receiver_cache()
+        # The receiver may be identified by its name or short ID
+        if uuidutils.is_uuid_like(receiver_id):
+            cache.invalidate(receiver_id)
+        else:
+            cache.invalidate()
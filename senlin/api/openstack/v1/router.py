@@ -199,6 +199,10 @@ class API(wsgi.Router):
                                "/nodes/adopt-preview",
                                action="adopt_preview",
                                conditions={'method': 'POST'})
+            sub_mapper.connect("node_batch",
+                               "/nodes/batch",
+                               action="batch",
+                               conditions={'method': 'POST'})
             sub_mapper.connect("node_get",
                                "/nodes/{node_id}",
                                action="get",
@@ -304,6 +308,10 @@ class API(wsgi.Router):
                                "/events",
                                action="index",
                                conditions={'method': 'GET'})
+            sub_mapper.connect("event_feed",
+                               "/events/feed",
+                               action="feed",
+                               conditions={'method': 'GET'})
             sub_mapper.connect("event_get",
                                "/events/{event_id}",
                                action="get",
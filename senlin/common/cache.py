@@ -0,0 +1,168 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""In-process Caches.
+
+TTL caches shared by the green threads of a service process, e.g. for the
+results of resolving resources through the drivers or for the trusts used
+by API requests. A cache never outlives the process it is created in, so
+invalidating an entry does not reach other workers. Concurrent lookups of
+the same key wait for the first one instead of calling the loader on their
+own. Lookups and invalidations are counted in the runtime metrics.
+"""
+
+import collections
+import time
+import weakref
+
+from eventlet import event
+
+from senlin.common import metrics
+
+# Default maximum number of entries kept in a cache
+MAX_ENTRIES = 1024
+
+_caches = weakref.WeakSet()
+
+
+def _collect_entries():
+    res = collections.Counter()
+    for c in list(_caches):
+        res[(c.name,)] += len(c._entries)
+    return res
+
+
+LOOKUPS = metrics.counter(
+    'senlin_cache_lookups_total',
+    'Lookups of the in-process caches by result.',
+    labels=('cache', 'result'))
+INVALIDATIONS = metrics.counter(
+    'senlin_cache_invalidations_total',
+    'Invalidations of the in-process caches.',
+    labels=('cache',))
+ENTRIES = metrics.gauge(
+    'senlin_cache_entries',
+    'Number of entries kept in the in-process caches.',
+    labels=('cache',), collect=_collect_entries)
+
+
+class TTLCache(object):
+    """A cache of values loaded on demand and kept for a limited time.
+
+    :param name: Name of the cache used as the label of its metrics.
+    :param ttl: Seconds a loaded value is kept, or a callable without
+                arguments returning them, e.g. to read a config option.
+                A value not greater than 0 disables caching.
+    :param negative_ttl: Seconds an error accepted by `cache_error` is kept,
+                         or a callable returning them.
+    :param cache_error: A callable deciding whether an exception raised
+                        from the loader is kept. No error is kept by default.
+    :param value_ttl: A callable returning the seconds a loaded value is
+                      kept, for values that expire earlier than `ttl`.
+    :param max_entries: Maximum number of entries kept.
+    """
+
+    def __init__(self, name, ttl, negative_ttl=0, cache_error=None,
+                 value_ttl=None, max_entries=MAX_ENTRIES):
+        self.name = name
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._cache_error = cache_error
+        self._value_ttl = value_ttl
+        self.max_entries = max_entries
+        # Mapping from key to a tuple of expiry time, value and error
+        self._entries = {}
+        # Mapping from key to an event for a lookup in progress
+        self._pending = {}
+        _caches.add(self)
+
+    @staticmethod
+    def _seconds(ttl):
+        return ttl() if callable(ttl) else ttl
+
+    @property
+    def ttl(self):
+        return self._seconds(self._ttl)
+
+    @property
+    def negative_ttl(self):
+        return self._seconds(self._negative_ttl)
+
+    def get(self, key, loader):
+        """Get the value of a key, calling the loader on a cache miss.
+
+        :param key: A hashable key of the value.
+        :param loader: A callable without arguments returning the value.
+        :returns: The value returned from the loader.
+        :raises: The exception raised from the loader.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.time():
+            LOOKUPS.inc(cache=self.name, result='hit')
+            return self._result(entry)
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            LOOKUPS.inc(cache=self.name, result='hit')
+            return self._result(pending.wait())
+
+        LOOKUPS.inc(cache=self.name, result='miss')
+        pending = event.Event()
+        self._pending[key] = pending
+        value = error = None
+        try:
+            value = loader()
+        except Exception as ex:
+            error = ex
+        finally:
+            del self._pending[key]
+
+        if error is None:
+            ttl = self.ttl
+            if self._value_ttl is not None and ttl > 0:
+                ttl = min(ttl, self._value_ttl(value))
+            entry = (time.time() + ttl, value, None)
+            self._store(key, entry)
+        else:
+            entry = (time.time() + self.negative_ttl, None, error)
+            if self._cache_error is not None and self._cache_error(error):
+                self._store(key, entry)
+        pending.send(entry)
+        return self._result(entry)
+
+    @staticmethod
+    def _result(entry):
+        if entry[2] is not None:
+            raise entry[2]
+        return entry[1]
+
+    def _store(self, key, entry):
+        now = time.time()
+        if entry[0] <= now:
+            return
+
+        if len(self._entries) >= self.max_entries:
+            for k, v in list(self._entries.items()):
+                if v[0] <= now:
+                    del self._entries[k]
+        if len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            del self._entries[oldest]
+        self._entries[key] = entry
+
+    def invalidate(self, key=None):
+        """Drop the entry of a key, or all entries if None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+        INVALIDATIONS.inc(cache=self.name)
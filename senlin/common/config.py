@@ -60,6 +60,10 @@ engine_opts = [
     cfg.IntOpt('max_nodes_per_cluster',
                default=1000,
                help=_('Maximum nodes allowed per top-level cluster.')),
+    cfg.IntOpt('max_nodes_per_batch',
+               default=1000, min=1,
+               help=_('Maximum number of nodes in one request of a batch '
+                      'operation on nodes.')),
     cfg.IntOpt('max_clusters_per_project',
                default=100,
                help=_('Maximum number of clusters any one project may have'
@@ -76,6 +80,58 @@ engine_opts = [
                default=3,
                help=_('Seconds to pause between scheduling two consecutive '
                       'batches of node actions.')),
+    cfg.IntOpt('server_watch_interval',
+               default=2,
+               help=_('Seconds between two batched status queries of the '
+                      'compute servers node actions are waiting for.')),
+    cfg.IntOpt('stack_watch_interval',
+               default=2,
+               help=_('Seconds between two batched status queries of the '
+                      'heat stacks node actions are waiting for.')),
+    cfg.StrOpt('stack_check_mode',
+               default='full',
+               choices=['full', 'status'],
+               help=_('How the heat stack profile checks a stack. "full" '
+                      'runs a heat stack check operation on each stack, '
+                      '"status" only reads the stack status from the '
+                      'shared stack listing.')),
+    cfg.IntOpt('collect_concurrency',
+               default=10, min=1,
+               help=_('Maximum number of nodes whose details are fetched '
+                      'concurrently when collecting attributes of a cluster '
+                      'from a profile that cannot list them in bulk.')),
+    cfg.IntOpt('lookup_cache_ttl',
+               default=60,
+               help=_('Seconds the engine caches the result of resolving '
+                      'the name or ID of a resource, e.g. a flavor, used '
+                      'by profiles. Set to 0 to disable caching.')),
+    cfg.IntOpt('lookup_cache_negative_ttl',
+               default=10,
+               help=_('Seconds the engine caches a failure to find a '
+                      'resource used by profiles.')),
+    cfg.BoolOpt('action_timing',
+                default=True,
+                help=_('Whether to record the time spent in each phase of an '
+                       'action and the number of SQL statements and driver '
+                       'calls it made. The result is kept in the data of '
+                       'the action.')),
+    cfg.IntOpt('max_action_wait',
+               default=60, min=0,
+               help=_('Maximum number of seconds a request getting an '
+                      'action can wait for the action to reach a status. '
+                      'The wait also ends before the RPC call for the '
+                      'request times out.')),
+    cfg.IntOpt('action_wait_check_interval',
+               default=5, min=1,
+               help=_('Maximum number of seconds between two reloads of an '
+                      'action being waited for. The reloads catch status '
+                      'changes made by engines which do not notify the '
+                      'waiting engine.')),
+    cfg.IntOpt('max_action_waiters',
+               default=32, min=0,
+               help=_('Maximum number of requests each engine worker holds '
+                      'while waiting for actions to reach a status. Further '
+                      'requests get the current action without waiting.')),
     cfg.IntOpt('lock_retry_times',
                default=3,
                help=_('Number of times trying to grab a lock.')),
@@ -92,6 +148,19 @@ engine_opts = [
     cfg.IntOpt('database_max_retry_interval',
                default=2,
                help=_('Maximum number of seconds between database retries.')),
+    cfg.IntOpt('database_replica_max_lag',
+               default=10,
+               help=_('Number of seconds, in addition to periodic_interval, '
+                      'the latest engine heartbeat found on a read replica '
+                      'configured as the slave_connection of the database '
+                      'may be older than the current time. Reads tolerating '
+                      'staleness are served by the primary while the '
+                      'heartbeat is older. Since the heartbeats are only '
+                      'written every periodic_interval seconds, the replica '
+                      'may lag behind the primary by up to periodic_interval '
+                      'plus this value, 70 seconds by default. The bound '
+                      'includes the time the result of the check is reused '
+                      'for, which is 5 seconds or this value if less.')),
     cfg.IntOpt('engine_life_check_timeout',
                default=2,
                help=_('RPC timeout for the engine liveness check that is used'
@@ -198,7 +267,28 @@ receiver_opts = [
                        'behind a proxy.')),
     cfg.IntOpt('max_message_size', default=65535,
                help=_('The max size(bytes) of message can be posted to '
-                      'receiver queue.'))
+                      'receiver queue.')),
+    cfg.IntOpt('cache_ttl', default=60,
+               help=_('Seconds an API worker caches the actor of a webhook '
+                      'receiver and the tokens issued for the actor, unless '
+                      'the tokens are about to expire earlier. Updating or '
+                      'deleting a receiver only drops the cache of the '
+                      'worker serving that request, other workers may use '
+                      'the old actor for up to this long. Set to 0 to '
+                      'disable caching.')),
+    cfg.IntOpt('coalesce_window', default=0, min=0,
+               help=_('Seconds within which a webhook trigger is merged '
+                      'into a compatible action of the same receiver that '
+                      'is still waiting to be executed, instead of creating '
+                      'a new action. Scaling triggers are only merged when '
+                      'both carry a count, the counts are added up. Set to 0 '
+                      'to disable coalescing.')),
+    cfg.IntOpt('claim_limit', default=20, min=1,
+               help=_('Maximum number of messages claimed at once from the '
+                      'queue of a message receiver.')),
+    cfg.IntOpt('max_claims', default=10, min=1,
+               help=_('Maximum number of claims made from the queue of a '
+                      'message receiver for one notification.')),
 ]
 cfg.CONF.register_group(receiver_group)
 cfg.CONF.register_opts(receiver_opts, group=receiver_group)
@@ -216,6 +306,24 @@ notification_opts = [
 cfg.CONF.register_group(notification_group)
 cfg.CONF.register_opts(notification_opts, group=notification_group)
 
+# Metrics group
+metrics_group = cfg.OptGroup('metrics')
+metrics_opts = [
+    cfg.HostAddressOpt('bind_host', default='127.0.0.1',
+                       help=_('Address on which an engine serves its '
+                              'metrics.')),
+    cfg.PortOpt('engine_port', default=0,
+                help=_('Port on which an engine serves its metrics in the '
+                       'Prometheus text format. Engine workers listen on '
+                       'consecutive ports starting from this one. Set to 0 '
+                       'to disable the listener.')),
+    cfg.BoolOpt('api_route', default=False,
+                help=_('Whether API workers serve their metrics at the '
+                       'unauthenticated /metrics path.')),
+]
+cfg.CONF.register_group(metrics_group)
+cfg.CONF.register_opts(metrics_opts, group=metrics_group)
+
 # Notification topic
 notification_topic_opts = [
     cfg.ListOpt('notification_topics',
@@ -271,6 +379,7 @@ def list_opts():
     yield healthmgr_group.name, healthmgr_opts
     yield revision_group.name, revision_opts
     yield receiver_group.name, receiver_opts
+    yield metrics_group.name, metrics_opts
     yield zaqar_group.name, zaqar_opts
     yield profiler.list_opts()[0]
 
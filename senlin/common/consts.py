@@ -74,6 +74,13 @@ NODE_ACTION_NAMES = (
     'NODE_CHECK', 'NODE_RECOVER', 'NODE_OPERATION',
 )
 
+# Actions without any work of their own, waiting for the actions of a batch
+BATCH_ACTION_NAMES = (
+    BATCH_NODE_CREATE,
+) = (
+    'BATCH_NODE_CREATE',
+)
+
 ADJUSTMENT_PARAMS = (
     ADJUSTMENT_TYPE, ADJUSTMENT_NUMBER, ADJUSTMENT_MIN_STEP,
     ADJUSTMENT_MIN_SIZE, ADJUSTMENT_MAX_SIZE, ADJUSTMENT_STRICT,
@@ -154,6 +161,13 @@ NODE_PARAMS = (
     'force',
 )
 
+NODE_BATCH_OPS = (
+    NODE_BATCH_CREATE, NODE_BATCH_ADOPT, NODE_BATCH_DELETE,
+    NODE_BATCH_OPERATION,
+) = (
+    'create', 'adopt', 'delete', 'operation',
+)
+
 PROFILE_ATTRS = (
     PROFILE_ID, PROFILE_NAME, PROFILE_TYPE,
     PROFILE_CREATED_AT, PROFILE_UPDATED_AT,
@@ -208,6 +222,12 @@ EVENT_SORT_KEYS = [
     EVENT_ACTION, EVENT_STATUS, EVENT_OBJ_ID, EVENT_CLUSTER_ID,
 ]
 
+EVENT_FEED_PARAMS = (
+    EVENT_CURSOR, EVENT_SEQ,
+) = (
+    'cursor', 'seq',
+)
+
 ACTION_ATTRS = (
     ACTION_NAME, ACTION_TARGET, ACTION_ACTION, ACTION_CAUSE,
     ACTION_INTERVAL, ACTION_START_TIME, ACTION_END_TIME,
@@ -227,6 +247,12 @@ ACTION_SORT_KEYS = [
     ACTION_STATUS,
 ]
 
+ACTION_QUERY_PARAMS = (
+    ACTION_IDS, ACTION_WAIT, ACTION_UNTIL,
+) = (
+    'ids', 'wait', 'until',
+)
+
 RECEIVER_TYPES = (
     RECEIVER_WEBHOOK, RECEIVER_MESSAGE,
 ) = (
@@ -266,6 +292,10 @@ ACTION_STATUSES = (
     'SUSPENDED',
 )
 
+ACTION_TERMINAL_STATUSES = (
+    ACTION_SUCCEEDED, ACTION_FAILED, ACTION_CANCELLED,
+)
+
 EVENT_LEVELS = {
     'CRITICAL': logging.CRITICAL,
     'ERROR': logging.ERROR,
@@ -312,3 +342,9 @@ VM_STATUS = (
 ) = (
     'ACTIVE', 'ERROR', 'SUSPENDED', 'SHUTOFF', 'PAUSED',
 )
+
+VICTIM_CRITERIA = (
+    RANDOM, OLDEST_FIRST, YOUNGEST_FIRST, OLDEST_PROFILE_FIRST,
+) = (
+    'RANDOM', 'OLDEST_FIRST', 'YOUNGEST_FIRST', 'OLDEST_PROFILE_FIRST',
+)
@@ -31,7 +31,8 @@ class RequestContext(base_context.RequestContext):
                  user_name=None, project_name=None, domain_name=None,
                  user_domain_name=None, project_domain_name=None,
                  auth_token_info=None, region_name=None, roles=None,
-                 password=None, api_version=None, **kwargs):
+                 password=None, api_version=None, read_primary=False,
+                 **kwargs):
 
         '''Initializer of request context.'''
         # We still have 'tenant' param because oslo_context still use it.
@@ -62,6 +63,18 @@ class RequestContext(base_context.RequestContext):
         self.region_name = region_name
         self.password = password
         self.api_version = api_version
+        # Whether the request reads its own writes, so it never reads from
+        # a read replica
+        self.read_primary = read_primary
+
+        # Whether the request tolerates stale reads from a read replica,
+        # decided by the service handling the request. This is never
+        # serialized.
+        self.stale_reads = False
+
+        # Objects resolved from identities during this request, see
+        # SenlinObject.find_many(). This is never serialized.
+        self.identity_cache = {}
 
         # Check user is admin or not
         if is_admin is None:
@@ -92,6 +105,7 @@ class RequestContext(base_context.RequestContext):
             'region_name': self.region_name,
             'password': self.password,
             'api_version': self.api_version,
+            'read_primary': self.read_primary,
         })
         return d
 
@@ -0,0 +1,233 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Runtime Metrics.
+
+Counters, gauges and histograms of the internals of a service process,
+exported in the Prometheus text format. Updating a metric only changes a
+value in memory. Gauges whose value is expensive to track, e.g. the depth
+of the action queue, are given a function that is called when the metrics
+are rendered instead.
+"""
+
+import bisect
+import contextlib
+import socket
+import time
+
+import eventlet
+from eventlet import wsgi
+from oslo_log import log as logging
+import six
+
+LOG = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 30.0, 60.0)
+
+_metrics = {}
+
+
+def _escape(value):
+    return (six.text_type(value).replace('\\', r'\\')
+            .replace('\n', r'\n').replace('"', r'\"'))
+
+
+def _format(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class Metric(object):
+    """Base class of metrics with a value for each set of label values."""
+
+    TYPE = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+
+    def _key(self, labels):
+        return tuple(six.text_type(labels[n]) for n in self.labels)
+
+    def _labels(self, key, **extra):
+        pairs = list(zip(self.labels, key)) + sorted(extra.items())
+        if not pairs:
+            return ''
+        return '{%s}' % ','.join('%s="%s"' % (k, _escape(v))
+                                 for k, v in pairs)
+
+    def samples(self):
+        """Get the samples of the metric.
+
+        :returns: An iterable of tuples each containing the suffix of the
+                  sample name, a tuple of label values, a dict of extra
+                  labels and the value.
+        """
+        for key, value in sorted(self._values.items()):
+            yield '', key, {}, value
+
+    def render(self):
+        lines = ['# HELP %s %s' % (self.name, self.documentation),
+                 '# TYPE %s %s' % (self.name, self.TYPE)]
+        for suffix, key, extra, value in self.samples():
+            lines.append('%s%s%s %s' % (self.name, suffix,
+                                        self._labels(key, **extra),
+                                        _format(value)))
+        return '\n'.join(lines)
+
+
+class Counter(Metric):
+    TYPE = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    TYPE = 'gauge'
+
+    def __init__(self, name, documentation, labels=(), collect=None):
+        super(Gauge, self).__init__(name, documentation, labels)
+        self._collect = collect
+
+    def set(self, value, **labels):
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self):
+        if self._collect is None:
+            return super(Gauge, self).samples()
+
+        try:
+            values = self._collect()
+        except Exception as ex:
+            LOG.warning('Failed collecting metric %(name)s: %(ex)s',
+                        {'name': self.name, 'ex': ex})
+            return []
+        return [('', tuple(six.text_type(v) for v in k), {}, value)
+                for k, value in sorted(values.items())]
+
+
+class Histogram(Metric):
+    TYPE = 'histogram'
+
+    def __init__(self, name, documentation, labels=(),
+                 buckets=DEFAULT_BUCKETS):
+        super(Histogram, self).__init__(name, documentation, labels)
+        self.buckets = tuple(buckets) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        entry = self._values.get(key)
+        if entry is None:
+            # counts of each bucket, sum of values
+            entry = self._values[key] = [[0] * len(self.buckets), 0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    @contextlib.contextmanager
+    def time(self, **labels):
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.observe(time.time() - start, **labels)
+
+    def samples(self):
+        for key, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield '_bucket', key, {'le': _format(bound)}, cumulative
+            yield '_sum', key, {}, total
+            yield '_count', key, {}, cumulative
+
+
+def _register(metric):
+    existing = _metrics.get(metric.name)
+    if existing is not None:
+        return existing
+    _metrics[metric.name] = metric
+    return metric
+
+
+def counter(name, documentation, labels=()):
+    return _register(Counter(name, documentation, labels))
+
+
+def gauge(name, documentation, labels=(), collect=None):
+    """Get a gauge, optionally computed when the metrics are rendered.
+
+    :param collect: A callable without arguments returning a dict from a
+                    tuple of label values to the value of the gauge.
+    """
+    return _register(Gauge(name, documentation, labels, collect))
+
+
+def histogram(name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+    return _register(Histogram(name, documentation, labels, buckets))
+
+
+def render():
+    """Render all metrics in the Prometheus text format."""
+    return ''.join(m.render() + '\n'
+                   for _n, m in sorted(_metrics.items()))
+
+
+def app(environ, start_response):
+    """WSGI application serving the metrics."""
+    if environ.get('PATH_INFO', '/') not in ('/', '/metrics'):
+        start_response('404 Not Found', [('Content-Type', 'text/plain')])
+        return [b'Not Found\n']
+
+    body = render().encode('utf-8')
+    start_response('200 OK', [('Content-Type', CONTENT_TYPE),
+                              ('Content-Length', str(len(body)))])
+    return [body]
+
+
+def serve(host, port, tries=1):
+    """Serve the metrics over HTTP from a green thread.
+
+    :param host: The address to listen on.
+    :param port: The first port to try listening on.
+    :param tries: Number of consecutive ports to try, so that each worker
+                  process of a service gets a port of its own.
+    :returns: The port listened on, or None if no port was available.
+    """
+    for p in range(port, port + tries):
+        try:
+            sock = eventlet.listen((host, p))
+        except socket.error:
+            continue
+        eventlet.spawn(wsgi.server, sock, app, log_output=False)
+        LOG.info('Serving metrics on %(host)s:%(port)s',
+                 {'host': host, 'port': p})
+        return p
+
+    LOG.warning('No port available for serving metrics on %(host)s between '
+                '%(first)s and %(last)s.',
+                {'host': host, 'first': port, 'last': port + tries - 1})
+    return None
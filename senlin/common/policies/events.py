@@ -29,6 +29,17 @@ rules = [
             }
         ]
     ),
+    policy.DocumentedRuleDefault(
+        name="events:feed",
+        check_str=base.UNPROTECTED,
+        description="Stream new events",
+        operations=[
+            {
+                'path': '/v1/events/feed',
+                'method': 'GET'
+            }
+        ]
+    ),
     policy.DocumentedRuleDefault(
         name="events:get",
         check_str=base.UNPROTECTED,
@@ -62,6 +62,17 @@ rules = [
             }
         ]
     ),
+    policy.DocumentedRuleDefault(
+        name="nodes:batch",
+        check_str=base.UNPROTECTED,
+        description="Create, adopt, delete or operate on a batch of nodes",
+        operations=[
+            {
+                'path': '/v1/nodes/batch',
+                'method': 'POST'
+            }
+        ]
+    ),
     policy.DocumentedRuleDefault(
         name="nodes:get",
         check_str=base.UNPROTECTED,
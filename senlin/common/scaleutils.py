@@ -14,6 +14,7 @@
 Utilities for scaling actions and related policies.
 '''
 
+import heapq
 import math
 import random
 
@@ -260,11 +261,18 @@ def filter_error_nodes(nodes):
     return bad, good
 
 
-def nodes_by_random(nodes, count):
-    """Select nodes based on random number.
+def nodes_by_key(nodes, count, key, reverse=False):
+    """Select nodes with the smallest (or largest) values of a key.
+
+    Nodes in an error state or not yet created are always selected first.
+    The remaining candidates are picked using a bounded heap so that only
+    ``count`` entries are ever kept sorted, i.e. the selection takes
+    O(n log k) time instead of sorting the whole candidate list.
 
     :param nodes: list of candidate nodes.
     :param count: maximum number of nodes for selection.
+    :param key: a function returning the sort key of a node.
+    :param reverse: whether nodes with larger keys should be selected.
     :return: a list of IDs for victim nodes.
     """
     selected, candidates = filter_error_nodes(nodes)
@@ -272,56 +280,82 @@ def nodes_by_random(nodes, count):
         return selected[:count]
 
     count -= len(selected)
-    random.seed()
-
-    i = count
-    while i > 0:
-        rand = random.randrange(len(candidates))
-        selected.append(candidates[rand].id)
-        candidates.remove(candidates[rand])
-        i = i - 1
-
+    pick = heapq.nlargest if reverse else heapq.nsmallest
+    selected.extend(n.id for n in pick(count, candidates, key=key))
     return selected
 
 
-def nodes_by_age(nodes, count, old_first):
-    """Select nodes based on node creation time.
+def nodes_by_random(nodes, count):
+    """Select nodes based on random number.
 
     :param nodes: list of candidate nodes.
     :param count: maximum number of nodes for selection.
-    :param old_first: whether old nodes should appear before young ones.
     :return: a list of IDs for victim nodes.
     """
     selected, candidates = filter_error_nodes(nodes)
     if count <= len(selected):
         return selected[:count]
 
-    count -= len(selected)
-    sorted_list = sorted(candidates, key=lambda r: r.created_at)
-    for i in range(count):
-        if old_first:
-            selected.append(sorted_list[i].id)
-        else:  # YOUNGEST_FIRST
-            selected.append(sorted_list[-1 - i].id)
+    count = min(count - len(selected), len(candidates))
+    selected.extend(n.id for n in random.sample(candidates, count))
     return selected
 
 
-def nodes_by_profile_age(nodes, count):
+def nodes_by_age(nodes, count, old_first):
+    """Select nodes based on node creation time.
+
+    :param nodes: list of candidate nodes.
+    :param count: maximum number of nodes for selection.
+    :param old_first: whether old nodes should appear before young ones.
+    :return: a list of IDs for victim nodes.
+    """
+    return nodes_by_key(nodes, count, lambda n: n.created_at,
+                        reverse=not old_first)
+
+
+def nodes_by_profile_age(nodes, count, profile_ages):
     """Select nodes based on node profile creation time.
 
     Note that old nodes will come before young ones.
 
     :param nodes: list of candidate nodes.
     :param count: maximum number of nodes for selection.
+    :param profile_ages: a dict mapping profile IDs to profile creation
+                         time, typically built with a single bulk lookup.
     :return: a list of IDs for victim nodes.
     """
-    selected, candidates = filter_error_nodes(nodes)
-    if count <= len(selected):
-        return selected[:count]
+    return nodes_by_key(nodes, count, lambda n: profile_ages.get(n.profile_id))
 
-    count -= len(selected)
-    sorted_list = sorted(candidates, key=lambda n: n.profile_created_at)
-    for i in range(count):
-        selected.append(sorted_list[i].id)
 
-    return selected
+# Victim selection criteria, keyed by name. Each entry is a function that
+# takes the candidate nodes, the count and optional keyword arguments. The
+# module level functions are looked up at call time so that they can be
+# mocked.
+_CRITERIA = {
+    consts.RANDOM:
+        lambda nodes, count, **kw: nodes_by_random(nodes, count),
+    consts.OLDEST_FIRST:
+        lambda nodes, count, **kw: nodes_by_age(nodes, count, True),
+    consts.YOUNGEST_FIRST:
+        lambda nodes, count, **kw: nodes_by_age(nodes, count, False),
+    consts.OLDEST_PROFILE_FIRST:
+        lambda nodes, count, profile_ages, **kw: nodes_by_profile_age(
+            nodes, count, profile_ages),
+}
+
+
+def select_victims(nodes, count, criterion, **kwargs):
+    """Select victim nodes using the named criterion.
+
+    :param nodes: list of candidate nodes.
+    :param count: maximum number of nodes for selection.
+    :param criterion: name of a selection criterion.
+    :param kwargs: extra arguments for the selection criterion.
+    :return: a list of IDs for victim nodes.
+    :raises: ``ValueError`` if the criterion is unknown.
+    """
+    selector = _CRITERIA.get(criterion)
+    if selector is None:
+        raise ValueError(_("Unknown victim selection criterion "
+                           "'%s'.") % criterion)
+    return selector(nodes, count, **kwargs)
@@ -0,0 +1,163 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Action Timing.
+
+A lightweight instrumentation of action execution. While an action is being
+executed, a recorder bound to the executing thread accumulates the wall
+time spent in each phase of the action, together with the number of SQL
+statements and driver calls made by the thread. Phases are exclusive, time
+spent in a phase entered from another phase is not counted for the outer
+one, so the phases add up to the total time of the action. The result is
+written together with the final status of the action, whose write is the
+only part of the action left out.
+"""
+
+import contextlib
+import functools
+import threading
+import time
+
+PHASES = (
+    QUEUED, LOCK_WAIT, PRE_OP, EXECUTE, CHILD_WAIT, POST_OP,
+) = (
+    'queued', 'lock_wait', 'pre_op', 'execute', 'child_wait', 'post_op',
+)
+
+_local = threading.local()
+
+
+class Recorder(object):
+    """Time spent and calls made while executing one action."""
+
+    def __init__(self):
+        self.phases = {}
+        self.queries = 0
+        self.driver_calls = 0
+        self._in_driver = False
+        self._stack = []
+        self._mark = None
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0) + seconds
+
+    def enter(self, phase):
+        now = time.time()
+        if self._stack:
+            self.add(self._stack[-1], now - self._mark)
+        self._stack.append(phase)
+        self._mark = now
+
+    def leave(self):
+        now = time.time()
+        self.add(self._stack.pop(), now - self._mark)
+        self._mark = now
+
+    def to_dict(self):
+        return {
+            'phases': dict((k, round(v, 3)) for k, v in self.phases.items()),
+            'queries': self.queries,
+            'driver_calls': self.driver_calls,
+        }
+
+
+def start():
+    """Start recording for the current thread."""
+    _local.recorder = Recorder()
+    return _local.recorder
+
+
+def stop():
+    """Stop recording for the current thread.
+
+    :returns: The `Recorder` of the thread, or None if not recording.
+    """
+    recorder = current()
+    _local.recorder = None
+    return recorder
+
+
+def current():
+    return getattr(_local, 'recorder', None)
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Account the time spent in the block to a phase of the action."""
+    recorder = current()
+    if recorder is None:
+        yield
+        return
+
+    recorder.enter(name)
+    try:
+        yield
+    finally:
+        recorder.leave()
+
+
+def timed(name):
+    """Decorator accounting the time spent in a function to a phase."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapped
+
+    return decorator
+
+
+def count_query(*args, **kwargs):
+    """Count a SQL statement, usable as a SQLAlchemy event listener."""
+    recorder = current()
+    if recorder is not None:
+        recorder.queries += 1
+
+
+@contextlib.contextmanager
+def driver_call():
+    """Count a call to a driver made in the block.
+
+    Calls made by a driver to itself or to other drivers while serving a
+    call are part of that call and are not counted again.
+    """
+    recorder = current()
+    if recorder is None or recorder._in_driver:
+        yield
+        return
+
+    recorder.driver_calls += 1
+    recorder._in_driver = True
+    try:
+        yield
+    finally:
+        recorder._in_driver = False
+
+
+def summarize(timing):
+    """Summarize the timing recorded for an action.
+
+    :param timing: A dict as returned from `Recorder.to_dict`.
+    :returns: A dict with the total time, the phase the action spent most
+              of its time in and the call counters.
+    """
+    phases = timing.get('phases') or {}
+    slowest = max(phases, key=phases.get) if phases else None
+    return {
+        'total': round(sum(phases.values()), 3),
+        'slowest_phase': slowest,
+        'phases': phases,
+        'queries': timing.get('queries', 0),
+        'driver_calls': timing.get('driver_calls', 0),
+    }
@@ -18,6 +18,7 @@ import random
 import re
 import string
 
+from jsonpath_rw import jsonpath
 from jsonpath_rw import parse
 from oslo_config import cfg
 from oslo_log import log as logging
@@ -219,6 +220,24 @@ def get_path_parser(path):
     return expr
 
 
+def get_path_fields(expr):
+    """Get the top level fields referenced by a JsonPath.
+
+    :param expr: A parser returned from `get_path_parser`.
+    :returns: A set of field names, or None if the path may match any
+              field, e.g. when it starts with a wildcard.
+    """
+    while isinstance(expr, jsonpath.Child):
+        if isinstance(expr.left, (jsonpath.Root, jsonpath.This)):
+            expr = expr.right
+        else:
+            expr = expr.left
+
+    if isinstance(expr, jsonpath.Fields) and '*' not in expr.fields:
+        return set(expr.fields)
+    return None
+
+
 def is_engine_dead(ctx, engine_id, duration=None):
     """Check if an engine is dead.
 
@@ -50,14 +50,19 @@ def cluster_get_by_short_id(context, short_id, project_safe=True):
                                         project_safe=project_safe)
 
 
+def cluster_get_by_identities(context, identities, project_safe=True):
+    return IMPL.cluster_get_by_identities(context, identities,
+                                          project_safe=project_safe)
+
+
 def cluster_get_all(context, limit=None, marker=None, sort=None, filters=None,
                     project_safe=True):
     return IMPL.cluster_get_all(context, limit=limit, marker=marker, sort=sort,
                                 filters=filters, project_safe=project_safe)
 
 
-def cluster_next_index(context, cluster_id):
-    return IMPL.cluster_next_index(context, cluster_id)
+def cluster_next_index(context, cluster_id, count=1):
+    return IMPL.cluster_next_index(context, cluster_id, count=count)
 
 
 def cluster_count_all(context, filters=None, project_safe=True):
@@ -78,6 +83,11 @@ def node_create(context, values):
     return IMPL.node_create(context, values)
 
 
+def node_create_many(context, values, actions=None, parent=None):
+    return IMPL.node_create_many(context, values, actions=actions,
+                                 parent=parent)
+
+
 def node_get(context, node_id, project_safe=True):
     return IMPL.node_get(context, node_id, project_safe=project_safe)
 
@@ -91,6 +101,11 @@ def node_get_by_short_id(context, short_id, project_safe=True):
                                      project_safe=project_safe)
 
 
+def node_get_by_identities(context, identities, project_safe=True):
+    return IMPL.node_get_by_identities(context, identities,
+                                       project_safe=project_safe)
+
+
 def node_get_all(context, cluster_id=None, limit=None, marker=None, sort=None,
                  filters=None, project_safe=True):
     return IMPL.node_get_all(context, cluster_id=cluster_id, filters=filters,
@@ -108,6 +123,13 @@ def node_ids_by_cluster(context, cluster_id, filters=None):
     return IMPL.node_ids_by_cluster(context, cluster_id, filters=None)
 
 
+def node_summary_get_all_by_cluster(context, cluster_id, filters=None,
+                                    project_safe=True):
+    return IMPL.node_summary_get_all_by_cluster(context, cluster_id,
+                                                filters=filters,
+                                                project_safe=project_safe)
+
+
 def node_count_by_cluster(context, cluster_id, **kwargs):
     return IMPL.node_count_by_cluster(context, cluster_id, **kwargs)
 
@@ -116,6 +138,10 @@ def node_update(context, node_id, values):
     return IMPL.node_update(context, node_id, values)
 
 
+def node_update_many(context, updates):
+    return IMPL.node_update_many(context, updates)
+
+
 def node_migrate(context, node_id, to_cluster, timestamp, role=None):
     return IMPL.node_migrate(context, node_id, to_cluster, timestamp, role)
 
@@ -149,6 +175,14 @@ def node_lock_steal(node_id, action_id):
     return IMPL.node_lock_steal(node_id, action_id)
 
 
+def node_lock_acquire_many(node_ids, action_id):
+    return IMPL.node_lock_acquire_many(node_ids, action_id)
+
+
+def node_lock_release_many(action_id, handover=None):
+    return IMPL.node_lock_release_many(action_id, handover=handover)
+
+
 # Policies
 def policy_create(context, values):
     return IMPL.policy_create(context, values)
@@ -235,6 +269,11 @@ def profile_get_by_short_id(context, short_id, project_safe=True):
                                         project_safe=project_safe)
 
 
+def profile_get_by_identities(context, identities, project_safe=True):
+    return IMPL.profile_get_by_identities(context, identities,
+                                          project_safe=project_safe)
+
+
 def profile_get_all(context, limit=None, marker=None, sort=None, filters=None,
                     project_safe=True):
     return IMPL.profile_get_all(context, limit=limit, marker=marker,
@@ -242,6 +281,10 @@ def profile_get_all(context, limit=None, marker=None, sort=None, filters=None,
                                 project_safe=project_safe)
 
 
+def profile_created_at_by_ids(context, profile_ids):
+    return IMPL.profile_created_at_by_ids(context, profile_ids)
+
+
 def profile_update(context, profile_id, values):
     return IMPL.profile_update(context, profile_id, values)
 
@@ -303,6 +346,15 @@ def event_get_all_by_cluster(context, cluster_id, limit=None, marker=None,
                                          project_safe=project_safe)
 
 
+def event_feed(context, cursor, limit, filters=None, project_safe=True):
+    return IMPL.event_feed(context, cursor, limit, filters=filters,
+                           project_safe=project_safe)
+
+
+def event_sequence_last(context):
+    return IMPL.event_sequence_last(context)
+
+
 def event_prune(context, cluster_id, project_safe=True):
     return IMPL.event_prune(context, cluster_id, project_safe=project_safe)
 
@@ -312,6 +364,10 @@ def action_create(context, values):
     return IMPL.action_create(context, values)
 
 
+def action_create_many(context, values):
+    return IMPL.action_create_many(context, values)
+
+
 def action_update(context, action_id, values):
     return IMPL.action_update(context, action_id, values)
 
@@ -341,6 +397,10 @@ def action_get_all(context, filters=None, limit=None, marker=None, sort=None,
                                project_safe=project_safe)
 
 
+def action_count_by_status(context, statuses):
+    return IMPL.action_count_by_status(context, statuses)
+
+
 def action_check_status(context, action_id, timestamp):
     return IMPL.action_check_status(context, action_id, timestamp)
 
@@ -364,20 +424,28 @@ def dependency_get_dependents(context, action_id):
     return IMPL.dependency_get_dependents(context, action_id)
 
 
-def action_mark_succeeded(context, action_id, timestamp):
-    return IMPL.action_mark_succeeded(context, action_id, timestamp)
+def dependency_get_all(context, action_ids):
+    return IMPL.dependency_get_all(context, action_ids)
+
+
+def action_mark_succeeded(context, action_id, timestamp, data=None):
+    return IMPL.action_mark_succeeded(context, action_id, timestamp,
+                                      data=data)
 
 
 def action_mark_ready(context, action_id, timestamp):
     return IMPL.action_mark_ready(context, action_id, timestamp)
 
 
-def action_mark_failed(context, action_id, timestamp, reason=None):
-    return IMPL.action_mark_failed(context, action_id, timestamp, reason)
+def action_mark_failed(context, action_id, timestamp, reason=None,
+                       data=None):
+    return IMPL.action_mark_failed(context, action_id, timestamp, reason,
+                                   data=data)
 
 
-def action_mark_cancelled(context, action_id, timestamp):
-    return IMPL.action_mark_cancelled(context, action_id, timestamp)
+def action_mark_cancelled(context, action_id, timestamp, data=None):
+    return IMPL.action_mark_cancelled(context, action_id, timestamp,
+                                      data=data)
 
 
 def action_acquire(context, action_id, owner, timestamp):
@@ -396,6 +464,13 @@ def action_abandon(context, action_id, values=None):
     return IMPL.action_abandon(context, action_id, values)
 
 
+def action_coalesce(context, target, action, name, since, inputs,
+                    sum_keys=None):
+    '''Merge inputs into a READY action not yet picked up by a worker.'''
+    return IMPL.action_coalesce(context, target, action, name, since, inputs,
+                                sum_keys)
+
+
 def action_lock_check(context, action_id, owner=None):
     '''Check whether an action has been locked(by a owner).'''
     return IMPL.action_lock_check(context, action_id, owner)
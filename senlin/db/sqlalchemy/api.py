@@ -14,6 +14,8 @@
 Implementation of SQLAlchemy backend.
 """
 
+import bisect
+import collections
 import datetime
 import six
 import sys
@@ -23,17 +25,20 @@ import time
 from oslo_config import cfg
 from oslo_db import api as oslo_db_api
 from oslo_db import exception as db_exc
+from oslo_db import options as db_options
 from oslo_db.sqlalchemy import enginefacade
 from oslo_db.sqlalchemy import utils as sa_utils
 from oslo_log import log as logging
 from oslo_utils import timeutils
+from oslo_utils import uuidutils
 import osprofiler.sqlalchemy
 import sqlalchemy
-from sqlalchemy.orm import joinedload_all
+from sqlalchemy import orm
 from sqlalchemy.sql.expression import func
 
 from senlin.common import consts
 from senlin.common import exception
+from senlin.common import timing
 from senlin.db.sqlalchemy import migration
 from senlin.db.sqlalchemy import models
 from senlin.db.sqlalchemy import utils
@@ -41,12 +46,36 @@ from senlin.db.sqlalchemy import utils
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
+# Maximum number of action IDs in a query for dependencies, each ID is bound
+# twice and SQLite limits a statement to 999 parameters
+DEPENDENCY_BATCH_SIZE = 400
+
+# Maximum number of node IDs in a query for node locks
+NODE_LOCK_BATCH_SIZE = 500
+
+# ID of the only row of the event sequence counter
+EVENT_SEQUENCE_COUNTER = 1
+
+# Maximum number of seconds for which the lag of the read replica is cached
+REPLICA_CHECK_INTERVAL = 5
+
 _main_context_manager = None
 _CONTEXT = threading.local()
+# Transaction context for checking the lag of the read replica apart from
+# any transaction in progress
+_REPLICA_CONTEXT = threading.local()
+_replica_state = {'checked': None, 'lagging': False}
 
 cfg.CONF.import_opt('database_retry_limit', 'senlin.common.config')
 cfg.CONF.import_opt('database_retry_interval', 'senlin.common.config')
 cfg.CONF.import_opt('database_max_retry_interval', 'senlin.common.config')
+cfg.CONF.import_opt('database_replica_max_lag', 'senlin.common.config')
+cfg.CONF.import_opt('periodic_interval', 'senlin.common.config')
+cfg.CONF.register_opts(db_options.database_opts, 'database')
+
+# Count the SQL statements issued while executing an action
+sqlalchemy.event.listen(sqlalchemy.engine.Engine, 'before_cursor_execute',
+                        timing.count_query)
 
 
 def _get_main_context_manager():
@@ -65,14 +94,76 @@ def get_engine():
     return _get_main_context_manager().get_legacy_facade().get_engine()
 
 
-def session_for_read():
-    return _get_main_context_manager().reader.using(_CONTEXT)
+def session_for_read(context=None):
+    """Start a read transaction.
+
+    The transaction is served by the read replica, if any, when the request
+    of the context tolerates stale reads, see `_read_from_replica`.
+    """
+    reader = _get_main_context_manager().reader
+    if _read_from_replica(context):
+        return reader.async_.using(_CONTEXT)
+    return reader.allow_async.using(_CONTEXT)
 
 
 def session_for_write():
     return _get_main_context_manager().writer.using(_CONTEXT)
 
 
+def _read_from_replica(context):
+    """Check whether the reads for a request go to the read replica.
+
+    A request tolerates stale reads when its context has `stale_reads` set,
+    unless `read_primary` is set for reading its own writes.
+    """
+    if not getattr(context, 'stale_reads', False):
+        return False
+    if getattr(context, 'read_primary', False):
+        return False
+    if not CONF.database.slave_connection:
+        return False
+    return not _replica_lagging()
+
+
+def _replica_lagging():
+    """Check whether the read replica lags too far behind the primary.
+
+    Every engine records a heartbeat in the service table each
+    periodic_interval seconds, so the age of the latest heartbeat found on
+    the replica bounds its lag. The result is cached for
+    REPLICA_CHECK_INTERVAL seconds, or database_replica_max_lag seconds if
+    less, and the replica may fall further behind meanwhile, so the cache
+    period is part of the lag compared with the bound.
+    """
+    now = time.time()
+    interval = min(REPLICA_CHECK_INTERVAL, CONF.database_replica_max_lag)
+    checked = _replica_state['checked']
+    if checked is not None and now - checked < interval:
+        return _replica_state['lagging']
+
+    reader = _get_main_context_manager().reader.async_
+    try:
+        with reader.using(_REPLICA_CONTEXT) as session:
+            latest = session.query(
+                func.max(models.Service.updated_at)).scalar()
+    except db_exc.DBError:
+        LOG.exception('Failed in checking the lag of the read replica.')
+        latest = None
+
+    lagging = True
+    if latest is not None:
+        lag = timeutils.delta_seconds(latest.replace(tzinfo=None),
+                                      timeutils.utcnow())
+        bound = CONF.periodic_interval + CONF.database_replica_max_lag
+        lagging = lag + interval > bound
+    if lagging and not _replica_state['lagging']:
+        LOG.warning('The read replica lags behind, reading from the '
+                    'primary database.')
+
+    _replica_state.update(checked=now, lagging=lagging)
+    return lagging
+
+
 def get_backend():
     """The backend is this module itself."""
     return sys.modules[__name__]
@@ -87,41 +178,140 @@ def retry_on_deadlock(f):
         max_retry_interval=CONF.database_max_retry_interval)(f)
 
 
-def model_query(context, *args):
-    with session_for_read() as session:
-        query = session.query(*args).options(joinedload_all('*'))
+def model_query(context, *args, **kwargs):
+    """Build a read query on the given models or columns.
+
+    Relationships are loaded lazily unless loader options are given with
+    the ``options`` keyword argument, so each caller decides what to load.
+    """
+    options = kwargs.get('options')
+    with session_for_read(context) as session:
+        query = session.query(*args)
+        if options:
+            query = query.options(*options)
         return query
 
 
-def query_by_short_id(context, model, short_id, project_safe=True):
-    q = model_query(context, model)
+def _count(query, column):
+    """Count the rows of a query without selecting the whole rows."""
+    return query.with_entities(func.count(column)).scalar()
+
+
+# Loader options for node queries. The node object always reports the name
+# of its profile, so the profile is loaded with the node in one query.
+_NODE_OPTIONS = (orm.joinedload(models.Node.profile),)
+
+# Loader options for cluster-policy binding queries. A binding reports the
+# names of its cluster and policy, so both are loaded with the binding.
+_CLUSTER_POLICY_OPTIONS = (orm.joinedload(models.ClusterPolicies.cluster),
+                           orm.joinedload(models.ClusterPolicies.policy))
+
+# Loader options for event queries, the cluster of an event is loaded with
+# the event so that it can be read once the session is closed.
+_EVENT_OPTIONS = (orm.joinedload(models.Event.cluster),)
+
+
+def query_by_short_id(context, model, short_id, project_safe=True,
+                      options=None):
+    q = model_query(context, model, options=options)
     q = q.filter(model.id.like('%s%%' % short_id))
 
     if project_safe:
         q = q.filter_by(project=context.project_id)
 
-    if q.count() == 1:
-        return q.first()
-    elif q.count() == 0:
-        return None
-    else:
+    # Fetching at most two rows is enough for detecting ambiguity
+    rows = q.limit(2).all()
+    if len(rows) > 1:
         raise exception.MultipleChoices(arg=short_id)
 
+    return rows[0] if rows else None
+
 
-def query_by_name(context, model, name, project_safe=True):
-    q = model_query(context, model)
+def query_by_name(context, model, name, project_safe=True, options=None):
+    q = model_query(context, model, options=options)
     q = q.filter_by(name=name)
 
     if project_safe:
         q = q.filter_by(project=context.project_id)
 
-    if q.count() == 1:
-        return q.first()
-    elif q.count() == 0:
-        return None
-    else:
+    rows = q.limit(2).all()
+    if len(rows) > 1:
         raise exception.MultipleChoices(arg=name)
 
+    return rows[0] if rows else None
+
+
+def query_by_identities(context, model, identities, project_safe=True,
+                        options=None):
+    """Resolve a list of identities using a single query.
+
+    An identity can be an ID, a name or a short ID of an object. The rules
+    for resolving an identity are the same as those used by the ``find``
+    methods of the object layer, i.e. a UUID-like identity is matched
+    against IDs before names and other identities are matched against
+    names before short IDs.
+
+    :param context: The request context.
+    :param model: The DB model to query.
+    :param identities: A list of object identities.
+    :param project_safe: Whether only objects from the requesting project
+                         are qualified.
+    :param options: Optional loader options for the query.
+    :returns: A dict mapping each identity to a list of matching records.
+              The list contains at most two records, where two records
+              means the identity is ambiguous.
+    """
+    identities = set(identities)
+    if not identities:
+        return {}
+
+    uuids = set(i for i in identities if uuidutils.is_uuid_like(i))
+    others = identities - uuids
+    conditions = [model.name.in_(identities)]
+    if uuids:
+        conditions.append(model.id.in_(uuids))
+    if others:
+        # At most two IDs are selected for each short ID, which is enough
+        # for detecting ambiguity
+        short_ids = []
+        for identity in others:
+            sq = sqlalchemy.select([model.id]).where(
+                model.id.like('%s%%' % identity))
+            if project_safe:
+                sq = sq.where(model.project == context.project_id)
+            sq = sq.limit(2).alias()
+            short_ids.append(sqlalchemy.select([sq.c.id]))
+        short_ids = sqlalchemy.union_all(*short_ids).alias()
+        conditions.append(model.id.in_(sqlalchemy.select([short_ids.c.id])))
+
+    q = model_query(context, model, options=options)
+    q = q.filter(sqlalchemy.or_(*conditions))
+    if project_safe:
+        q = q.filter_by(project=context.project_id)
+
+    by_id = {}
+    by_name = {}
+    for row in q.all():
+        by_id[row.id] = row
+        by_name.setdefault(row.name, []).append(row)
+    ids = sorted(by_id)
+
+    result = {}
+    for identity in identities:
+        if identity in uuids:
+            matches = [by_id[identity]] if identity in by_id else []
+            if not matches:
+                matches = by_name.get(identity, [])
+        else:
+            matches = by_name.get(identity, [])
+            if not matches:
+                start = bisect.bisect_left(ids, identity)
+                matches = [by_id[i] for i in ids[start:start + 2]
+                           if i.startswith(identity)]
+        result[identity] = matches[:2]
+
+    return result
+
 
 # Clusters
 def cluster_create(context, values):
@@ -154,6 +344,11 @@ def cluster_get_by_short_id(context, short_id, project_safe=True):
                              project_safe=project_safe)
 
 
+def cluster_get_by_identities(context, identities, project_safe=True):
+    return query_by_identities(context, models.Cluster, identities,
+                               project_safe=project_safe)
+
+
 def _query_cluster_get_all(context, project_safe=True):
     query = model_query(context, models.Cluster)
 
@@ -176,7 +371,12 @@ def cluster_get_all(context, limit=None, marker=None, sort=None, filters=None,
                                    marker=marker, sort_dirs=dirs).all()
 
 
-def cluster_next_index(context, cluster_id):
+def cluster_next_index(context, cluster_id, count=1):
+    """Reserve indexes for new nodes of a cluster.
+
+    :param count: Number of consecutive indexes to reserve.
+    :returns: The first index reserved.
+    """
     with session_for_write() as session:
         cluster = session.query(models.Cluster).with_for_update().get(
             cluster_id)
@@ -184,7 +384,7 @@ def cluster_next_index(context, cluster_id):
             return 0
 
         next_index = cluster.next_index
-        cluster.next_index = cluster.next_index + 1
+        cluster.next_index = cluster.next_index + count
         cluster.save(session)
         return next_index
 
@@ -192,7 +392,7 @@ def cluster_next_index(context, cluster_id):
 def cluster_count_all(context, filters=None, project_safe=True):
     query = _query_cluster_get_all(context, project_safe=project_safe)
     query = utils.exact_filter(query, models.Cluster, filters)
-    return query.count()
+    return _count(query, models.Cluster.id)
 
 
 def cluster_update(context, cluster_id, values):
@@ -237,8 +437,31 @@ def node_create(context, values):
         return node
 
 
+def node_create_many(context, values, actions=None, parent=None):
+    """Create a batch of nodes and the actions on them in one transaction.
+
+    :param values: A list of dictionaries of values for the nodes. Each
+                   dictionary must contain the ID of the node.
+    :param actions: An optional list of dictionaries of values for actions,
+                    each containing the ID of the action.
+    :param parent: An optional dictionary of values for an action depending
+                   on all the actions, containing the ID of the action.
+    """
+    with session_for_write() as session:
+        session.bulk_insert_mappings(models.Node, values)
+        if actions:
+            session.bulk_insert_mappings(models.Action, actions)
+        if parent:
+            session.bulk_insert_mappings(models.Action, [parent])
+            session.bulk_insert_mappings(
+                models.ActionDependency,
+                [{'depended': a['id'], 'dependent': parent['id']}
+                 for a in actions or []])
+
+
 def node_get(context, node_id, project_safe=True):
-    node = model_query(context, models.Node).get(node_id)
+    node = model_query(context, models.Node, options=_NODE_OPTIONS).get(
+        node_id)
     if not node:
         return None
 
@@ -250,16 +473,23 @@ def node_get(context, node_id, project_safe=True):
 
 
 def node_get_by_name(context, name, project_safe=True):
-    return query_by_name(context, models.Node, name, project_safe=project_safe)
+    return query_by_name(context, models.Node, name, project_safe=project_safe,
+                         options=_NODE_OPTIONS)
 
 
 def node_get_by_short_id(context, short_id, project_safe=True):
     return query_by_short_id(context, models.Node, short_id,
-                             project_safe=project_safe)
+                             project_safe=project_safe, options=_NODE_OPTIONS)
+
+
+def node_get_by_identities(context, identities, project_safe=True):
+    return query_by_identities(context, models.Node, identities,
+                               project_safe=project_safe,
+                               options=_NODE_OPTIONS)
 
 
 def _query_node_get_all(context, project_safe=True, cluster_id=None):
-    query = model_query(context, models.Node)
+    query = model_query(context, models.Node, options=_NODE_OPTIONS)
 
     if cluster_id is not None:
         query = query.filter_by(cluster_id=cluster_id)
@@ -306,6 +536,26 @@ def node_ids_by_cluster(context, cluster_id, filters=None):
         return [n[0] for n in query.all()]
 
 
+def node_summary_get_all_by_cluster(context, cluster_id, filters=None,
+                                    project_safe=True):
+    """An internal API for getting narrow node rows of a cluster.
+
+    Only the columns needed for placement and victim selection are fetched
+    and no relationship is loaded eagerly.
+    """
+    with session_for_read() as session:
+        query = session.query(models.Node.id, models.Node.status,
+                              models.Node.created_at, models.Node.profile_id,
+                              models.Node.data)
+        query = query.filter_by(cluster_id=cluster_id)
+        if project_safe:
+            query = query.filter_by(project=context.project_id)
+        if filters:
+            query = utils.exact_filter(query, models.Node, filters)
+
+        return query.all()
+
+
 def node_count_by_cluster(context, cluster_id, **kwargs):
     project_safe = kwargs.pop('project_safe', True)
     query = model_query(context, models.Node)
@@ -314,7 +564,7 @@ def node_count_by_cluster(context, cluster_id, **kwargs):
     if project_safe:
         query = query.filter_by(project=context.project_id)
 
-    return query.count()
+    return _count(query, models.Node.id)
 
 
 def node_update(context, node_id, values):
@@ -342,6 +592,53 @@ def node_update(context, node_id, values):
                 cluster.save(session)
 
 
+def node_update_many(context, updates):
+    """Update a batch of nodes with per-node property values.
+
+    The nodes are updated with one executemany statement for each distinct
+    set of updated keys, instead of one load and save per node.
+
+    :param updates: A dictionary mapping node IDs to dictionaries of values
+                    to be updated on the corresponding nodes.
+    """
+    if not updates:
+        return
+
+    mappings = []
+    for node_id, values in updates.items():
+        mapping = dict(values)
+        mapping['id'] = node_id
+        mappings.append(mapping)
+
+    with session_for_write() as session:
+        session.bulk_update_mappings(models.Node, mappings)
+
+        # Propagate status changes to the owning clusters like node_update
+        status_ids = [n for n, v in updates.items() if 'status' in v]
+        if not status_ids:
+            return
+        rows = session.query(models.Node.id, models.Node.name,
+                             models.Node.cluster_id).filter(
+            models.Node.id.in_(status_ids),
+            models.Node.cluster_id.isnot(None)).all()
+        clusters = {}
+        for node_id, name, cluster_id in rows:
+            cluster = clusters.get(cluster_id)
+            if cluster is None:
+                cluster = session.query(models.Cluster).get(cluster_id)
+                if cluster is None:
+                    continue
+                clusters[cluster_id] = cluster
+            values = updates[node_id]
+            if values['status'] == 'ERROR':
+                cluster.status = consts.CS_WARNING
+            if 'status_reason' in values:
+                cluster.status_reason = 'Node %(node)s: %(reason)s' % {
+                    'node': name, 'reason': values['status_reason']}
+        for cluster in clusters.values():
+            cluster.save(session)
+
+
 def node_add_dependents(context, depended, dependent, dep_type=None):
     """Add dependency between nodes.
 
@@ -546,6 +843,59 @@ def node_lock_steal(node_id, action_id):
         return lock.action_id
 
 
+@retry_on_deadlock
+def node_lock_acquire_many(node_ids, action_id):
+    """Lock a set of nodes with one multi-row insert.
+
+    The nodes already locked by other actions are left alone.
+
+    :param node_ids: IDs of the nodes to be locked.
+    :param action_id: ID of the action which wants to lock the nodes.
+    :returns: A dict mapping the ID of each node to the ID of the action
+              owning its lock.
+    """
+    node_ids = list(set(node_ids))
+    try:
+        with session_for_write() as session:
+            owners = {}
+            for i in range(0, len(node_ids), NODE_LOCK_BATCH_SIZE):
+                batch = node_ids[i:i + NODE_LOCK_BATCH_SIZE]
+                query = session.query(models.NodeLock).with_lockmode('update')
+                query = query.filter(models.NodeLock.node_id.in_(batch))
+                for lock in query.all():
+                    owners[lock.node_id] = lock.action_id
+
+            free = [n for n in node_ids if n not in owners]
+            session.bulk_insert_mappings(
+                models.NodeLock,
+                [{'node_id': n, 'action_id': action_id} for n in free])
+            owners.update((n, action_id) for n in free)
+            return owners
+    except db_exc.DBDuplicateEntry:
+        # some nodes have been locked by another action meanwhile, none of
+        # the nodes is locked then
+        return {}
+
+
+@retry_on_deadlock
+def node_lock_release_many(action_id, handover=None):
+    """Release all the node locks owned by an action in one transaction.
+
+    :param action_id: ID of the action owning the locks.
+    :param handover: An optional dict mapping the IDs of nodes to the IDs of
+                     the actions which take over the locks of these nodes
+                     instead.
+    """
+    with session_for_write() as session:
+        for node_id, new_owner in (handover or {}).items():
+            query = session.query(models.NodeLock).filter_by(
+                node_id=node_id, action_id=action_id)
+            query.update({'action_id': new_owner}, synchronize_session=False)
+
+        query = session.query(models.NodeLock).filter_by(action_id=action_id)
+        query.delete(synchronize_session=False)
+
+
 # Policies
 def policy_create(context, values):
     with session_for_write() as session:
@@ -616,21 +966,23 @@ def policy_delete(context, policy_id):
 
         bindings = session.query(models.ClusterPolicies).filter_by(
             policy_id=policy_id)
-        if bindings.count():
+        if _count(bindings, models.ClusterPolicies.id):
             raise exception.EResourceBusy(type='policy', id=policy_id)
         session.delete(policy)
 
 
 # Cluster-Policy Associations
 def cluster_policy_get(context, cluster_id, policy_id):
-    query = model_query(context, models.ClusterPolicies)
+    query = model_query(context, models.ClusterPolicies,
+                        options=_CLUSTER_POLICY_OPTIONS)
     bindings = query.filter_by(cluster_id=cluster_id,
                                policy_id=policy_id)
     return bindings.first()
 
 
 def cluster_policy_get_all(context, cluster_id, filters=None, sort=None):
-    query = model_query(context, models.ClusterPolicies)
+    query = model_query(context, models.ClusterPolicies,
+                        options=_CLUSTER_POLICY_OPTIONS)
     query = query.filter_by(cluster_id=cluster_id)
 
     if filters is not None:
@@ -667,7 +1019,8 @@ def cluster_policy_ids_by_cluster(context, cluster_id):
 
 def cluster_policy_get_by_type(context, cluster_id, policy_type, filters=None):
 
-    query = model_query(context, models.ClusterPolicies)
+    query = model_query(context, models.ClusterPolicies,
+                        options=_CLUSTER_POLICY_OPTIONS)
     query = query.filter_by(cluster_id=cluster_id)
 
     key_enabled = consts.CP_ENABLED
@@ -683,7 +1036,8 @@ def cluster_policy_get_by_type(context, cluster_id, policy_type, filters=None):
 
 def cluster_policy_get_by_name(context, cluster_id, policy_name, filters=None):
 
-    query = model_query(context, models.ClusterPolicies)
+    query = model_query(context, models.ClusterPolicies,
+                        options=_CLUSTER_POLICY_OPTIONS)
     query = query.filter_by(cluster_id=cluster_id)
 
     key_enabled = consts.CP_ENABLED
@@ -810,9 +1164,16 @@ def profile_get_by_short_id(context, short_id, project_safe=True):
                              project_safe=project_safe)
 
 
+def profile_get_by_identities(context, identities, project_safe=True):
+    return query_by_identities(context, models.Profile, identities,
+                               project_safe=project_safe)
+
+
 def profile_get_all(context, limit=None, marker=None, sort=None, filters=None,
                     project_safe=True):
-    query = model_query(context, models.Profile)
+    # The context column is never needed when listing profiles
+    query = model_query(context, models.Profile,
+                        options=[orm.defer(models.Profile.context)])
 
     if project_safe:
         query = query.filter_by(project=context.project_id)
@@ -827,6 +1188,17 @@ def profile_get_all(context, limit=None, marker=None, sort=None, filters=None,
                                    marker=marker, sort_dirs=dirs).all()
 
 
+def profile_created_at_by_ids(context, profile_ids):
+    """An internal API for getting creation time of many profiles."""
+    if not profile_ids:
+        return {}
+
+    with session_for_read() as session:
+        query = session.query(models.Profile.id, models.Profile.created_at)
+        query = query.filter(models.Profile.id.in_(set(profile_ids)))
+        return dict(query.all())
+
+
 def profile_update(context, profile_id, values):
     with session_for_write() as session:
         profile = session.query(models.Profile).get(profile_id)
@@ -847,12 +1219,12 @@ def profile_delete(context, profile_id):
         # used by any clusters?
         clusters = session.query(models.Cluster).filter_by(
             profile_id=profile_id)
-        if clusters.count() > 0:
+        if _count(clusters, models.Cluster.id) > 0:
             raise exception.EResourceBusy(type='profile', id=profile_id)
 
         # used by any nodes?
         nodes = session.query(models.Node).filter_by(profile_id=profile_id)
-        if nodes.count() > 0:
+        if _count(nodes, models.Node.id) > 0:
             raise exception.EResourceBusy(type='profile', id=profile_id)
         session.delete(profile)
 
@@ -901,11 +1273,36 @@ def event_create(context, values):
         event = models.Event()
         event.update(values)
         session.add(event)
+        # the ID of the event is only known after it has been flushed
+        session.flush()
+        # numbered as the last step to keep other events waiting for the
+        # counter for the least time
+        session.add(models.EventSequence(seq=_event_sequence_next(session),
+                                         event_id=event.id))
         return event
 
 
+def _event_sequence_next(session):
+    """Get the sequence number of a new event.
+
+    The counter stays locked until the event is committed, so events are
+    numbered in the order they become visible.
+    """
+    query = session.query(models.EventSequenceCounter).with_for_update()
+    counter = query.get(EVENT_SEQUENCE_COUNTER)
+    if counter is None:
+        # the row is missing after the table has been emptied
+        last = session.query(func.max(models.EventSequence.seq)).scalar()
+        counter = models.EventSequenceCounter(id=EVENT_SEQUENCE_COUNTER,
+                                              seq=last or 0)
+        session.add(counter)
+    counter.seq += 1
+    return counter.seq
+
+
 def event_get(context, event_id, project_safe=True):
-    event = model_query(context, models.Event).get(event_id)
+    event = model_query(context, models.Event,
+                        options=_EVENT_OPTIONS).get(event_id)
     if project_safe and event is not None:
         if event.project != context.project_id:
             return None
@@ -915,7 +1312,7 @@ def event_get(context, event_id, project_safe=True):
 
 def event_get_by_short_id(context, short_id, project_safe=True):
     return query_by_short_id(context, models.Event, short_id,
-                             project_safe=project_safe)
+                             project_safe=project_safe, options=_EVENT_OPTIONS)
 
 
 def _event_filter_paginate_query(context, query, filters=None,
@@ -932,7 +1329,7 @@ def _event_filter_paginate_query(context, query, filters=None,
 
 def event_get_all(context, limit=None, marker=None, sort=None, filters=None,
                   project_safe=True):
-    query = model_query(context, models.Event)
+    query = model_query(context, models.Event, options=_EVENT_OPTIONS)
     if project_safe:
         query = query.filter_by(project=context.project_id)
 
@@ -945,14 +1342,14 @@ def event_count_by_cluster(context, cluster_id, project_safe=True):
 
     if project_safe:
         query = query.filter_by(project=context.project_id)
-    count = query.filter_by(cluster_id=cluster_id).count()
+    count = _count(query.filter_by(cluster_id=cluster_id), models.Event.id)
 
     return count
 
 
 def event_get_all_by_cluster(context, cluster_id, limit=None, marker=None,
                              sort=None, filters=None, project_safe=True):
-    query = model_query(context, models.Event)
+    query = model_query(context, models.Event, options=_EVENT_OPTIONS)
     query = query.filter_by(cluster_id=cluster_id)
 
     if project_safe:
@@ -962,6 +1359,57 @@ def event_get_all_by_cluster(context, cluster_id, limit=None, marker=None,
                                         limit=limit, marker=marker, sort=sort)
 
 
+def event_feed(context, cursor, limit, filters=None, project_safe=True):
+    """Get the events recorded after a cursor, in the order recorded.
+
+    Events are numbered in the order they are committed, see event_create,
+    so no event can appear below the head of the feed after it is read.
+
+    :param cursor: Sequence number of the last event already read.
+    :param limit: Maximum number of events to return.
+    :param filters: A dict of exact filters on the event columns.
+    :returns: A tuple of the cursor to read the following events from and
+              a list of tuples of sequence number and event.
+    """
+    if limit < 1:
+        return cursor, []
+
+    seq = models.EventSequence.seq
+    with session_for_read() as session:
+        head = session.query(func.max(seq)).filter(seq > cursor).scalar()
+        if head is None or head <= cursor:
+            return cursor, []
+
+        query = session.query(models.EventSequence.seq, models.Event).join(
+            models.Event, models.Event.id == models.EventSequence.event_id)
+        query = query.options(*_EVENT_OPTIONS)
+        query = query.filter(seq > cursor, seq <= head)
+        if project_safe:
+            query = query.filter(models.Event.project == context.project_id)
+        if filters:
+            query = utils.exact_filter(query, models.Event, filters)
+        rows = query.order_by(seq).limit(limit).all()
+
+    if len(rows) == limit:
+        return rows[-1][0], rows
+    # the events not matching the filters up to the head are skipped too
+    return head, rows
+
+
+def event_sequence_last(context):
+    with session_for_read() as session:
+        return session.query(
+            func.max(models.EventSequence.seq)).scalar() or 0
+
+
+def _event_sequence_delete(session, criterion):
+    query = session.query(models.EventSequence)
+    if criterion is not None:
+        events = sqlalchemy.select([models.Event.id]).where(criterion)
+        query = query.filter(models.EventSequence.event_id.in_(events))
+    query.delete(synchronize_session=False)
+
+
 def event_prune(context, cluster_id, project_safe=True):
     with session_for_write() as session:
         query = session.query(models.Event).with_for_update()
@@ -969,6 +1417,7 @@ def event_prune(context, cluster_id, project_safe=True):
         if project_safe:
             query = query.filter_by(project=context.project_id)
 
+        _event_sequence_delete(session, query.whereclause)
         return query.delete(synchronize_session='fetch')
 
 
@@ -987,6 +1436,7 @@ def event_purge(project, granularity='days', age=30):
             time_line = timeutils.utcnow() - datetime.timedelta(seconds=age)
             query = query.filter(models.Event.timestamp < time_line)
 
+        _event_sequence_delete(session, query.whereclause)
         return query.delete(synchronize_session='fetch')
 
 
@@ -999,6 +1449,19 @@ def action_create(context, values):
         return action
 
 
+def action_create_many(context, values):
+    """Create a batch of actions with a single executemany statement.
+
+    :param values: A list of dictionaries of values for the actions. Each
+                   dictionary must contain the ID of the action.
+    """
+    if not values:
+        return
+
+    with session_for_write() as session:
+        session.bulk_insert_mappings(models.Action, values)
+
+
 def action_update(context, action_id, values):
     with session_for_write() as session:
         action = session.query(models.Action).get(action_id)
@@ -1010,8 +1473,13 @@ def action_update(context, action_id, values):
 
 
 def action_get(context, action_id, project_safe=True, refresh=False):
-    with session_for_read() as session:
-        action = session.query(models.Action).get(action_id)
+    with session_for_read(context) as session:
+        query = session.query(models.Action)
+        if refresh:
+            # Overwrite any copy in the session with the row just fetched
+            # rather than issuing a second SELECT for the same row.
+            query = query.populate_existing()
+        action = query.get(action_id)
         if action is None:
             return None
 
@@ -1019,7 +1487,6 @@ def action_get(context, action_id, project_safe=True, refresh=False):
             if action.project != context.project_id:
                 return None
 
-        session.refresh(action)
         return action
 
 
@@ -1042,7 +1509,9 @@ def action_get_all_by_owner(context, owner_id):
 def action_get_all(context, filters=None, limit=None, marker=None, sort=None,
                    project_safe=True):
 
-    query = model_query(context, models.Action)
+    # The context column is never needed when listing actions
+    query = model_query(context, models.Action,
+                        options=[orm.defer(models.Action.context)])
     if project_safe:
         query = query.filter_by(project=context.project_id)
 
@@ -1056,10 +1525,20 @@ def action_get_all(context, filters=None, limit=None, marker=None, sort=None,
                                    marker=marker, sort_dirs=dirs).all()
 
 
+def action_count_by_status(context, statuses):
+    with session_for_read() as session:
+        query = session.query(models.Action.status, models.Action.action,
+                              func.count(models.Action.id))
+        query = query.filter(models.Action.status.in_(statuses))
+        return query.group_by(models.Action.status,
+                              models.Action.action).all()
+
+
 def action_check_status(context, action_id, timestamp):
     with session_for_write() as session:
         q = session.query(models.ActionDependency)
-        count = q.filter_by(dependent=action_id).count()
+        count = _count(q.filter_by(dependent=action_id),
+                       models.ActionDependency.id)
         if count > 0:
             return consts.ACTION_WAITING
 
@@ -1087,6 +1566,22 @@ def dependency_get_dependents(context, action_id):
         return [d.dependent for d in q.all()]
 
 
+def dependency_get_all(context, action_ids):
+    action_ids = list(action_ids)
+    result = collections.OrderedDict()
+    with session_for_read() as session:
+        for i in range(0, len(action_ids), DEPENDENCY_BATCH_SIZE):
+            batch = action_ids[i:i + DEPENDENCY_BATCH_SIZE]
+            q = session.query(models.ActionDependency)
+            q = q.filter(sqlalchemy.or_(
+                models.ActionDependency.depended.in_(batch),
+                models.ActionDependency.dependent.in_(batch)))
+            for dep in q.all():
+                # a dependency between actions of two batches is found twice
+                result.setdefault(dep.id, dep)
+    return list(result.values())
+
+
 @retry_on_deadlock
 def dependency_add(context, depended, dependent):
     if isinstance(depended, list) and isinstance(dependent, list):
@@ -1125,7 +1620,7 @@ def dependency_add(context, depended, dependent):
 
 
 @retry_on_deadlock
-def action_mark_succeeded(context, action_id, timestamp):
+def action_mark_succeeded(context, action_id, timestamp, data=None):
     with session_for_write() as session:
 
         query = session.query(models.Action).filter_by(id=action_id)
@@ -1135,12 +1630,33 @@ def action_mark_succeeded(context, action_id, timestamp):
             'status_reason': 'Action completed successfully.',
             'end_time': timestamp,
         }
+        if data is not None:
+            values['data'] = data
         query.update(values, synchronize_session=False)
 
         subquery = session.query(models.ActionDependency).filter_by(
             depended=action_id)
+        dependents = [d.dependent for d in subquery.with_for_update()]
+        # A batch action has no work of its own, it succeeds with the last
+        # of the actions it depends on.
+        waiting = []
+        if dependents:
+            q = session.query(models.Action).with_for_update()
+            q = q.filter(models.Action.id.in_(dependents),
+                         models.Action.action.in_(consts.BATCH_ACTION_NAMES),
+                         models.Action.status == consts.ACTION_WAITING)
+            waiting = q.all()
         subquery.delete(synchronize_session='fetch')
 
+        for action in waiting:
+            q = session.query(models.ActionDependency).with_for_update()
+            if q.filter_by(dependent=action.id).first() is not None:
+                continue
+            action.status = consts.ACTION_SUCCEEDED
+            action.status_reason = 'All depended actions completed.'
+            action.end_time = timestamp
+            action.save(session)
+
 
 @retry_on_deadlock
 def action_mark_ready(context, action_id, timestamp):
@@ -1156,7 +1672,7 @@ def action_mark_ready(context, action_id, timestamp):
         query.update(values, synchronize_session=False)
 
 
-def _mark_failed(session, action_id, timestamp, reason=None):
+def _mark_failed(session, action_id, timestamp, reason=None, data=None):
     # mark myself as failed
     query = session.query(models.Action).filter_by(id=action_id)
     values = {
@@ -1166,6 +1682,8 @@ def _mark_failed(session, action_id, timestamp, reason=None):
                           'Action execution failed'),
         'end_time': timestamp,
     }
+    if data is not None:
+        values['data'] = data
     query.update(values, synchronize_session=False)
 
     query = session.query(models.ActionDependency)
@@ -1178,12 +1696,13 @@ def _mark_failed(session, action_id, timestamp, reason=None):
 
 
 @retry_on_deadlock
-def action_mark_failed(context, action_id, timestamp, reason=None):
+def action_mark_failed(context, action_id, timestamp, reason=None,
+                       data=None):
     with session_for_write() as session:
-        _mark_failed(session, action_id, timestamp, reason)
+        _mark_failed(session, action_id, timestamp, reason, data=data)
 
 
-def _mark_cancelled(session, action_id, timestamp, reason=None):
+def _mark_cancelled(session, action_id, timestamp, reason=None, data=None):
     query = session.query(models.Action).filter_by(id=action_id)
     values = {
         'owner': None,
@@ -1192,6 +1711,8 @@ def _mark_cancelled(session, action_id, timestamp, reason=None):
                           'Action execution failed'),
         'end_time': timestamp,
     }
+    if data is not None:
+        values['data'] = data
     query.update(values, synchronize_session=False)
 
     query = session.query(models.ActionDependency)
@@ -1204,9 +1725,10 @@ def _mark_cancelled(session, action_id, timestamp, reason=None):
 
 
 @retry_on_deadlock
-def action_mark_cancelled(context, action_id, timestamp, reason=None):
+def action_mark_cancelled(context, action_id, timestamp, reason=None,
+                          data=None):
     with session_for_write() as session:
-        _mark_cancelled(session, action_id, timestamp, reason)
+        _mark_cancelled(session, action_id, timestamp, reason, data=data)
 
 
 @retry_on_deadlock
@@ -1275,6 +1797,49 @@ def action_acquire_first_ready(context, owner, timestamp):
                                      consts.ACTION_CREATED_AT)
 
 
+@retry_on_deadlock
+def action_coalesce(context, target, action, name, since, inputs,
+                    sum_keys=None):
+    """Merge inputs into a READY action that no worker has picked up yet.
+
+    :param target: ID of the target of the action.
+    :param action: Name of the action, e.g. CLUSTER_SCALE_OUT.
+    :param name: Name of the action record.
+    :param since: Only actions created after this time are considered.
+    :param inputs: A dict of inputs to merge into the existing action.
+    :param sum_keys: A list of input keys with integer values which are
+                     added up, other values are replaced. An action is only
+                     merged into if both it and the inputs have an integer
+                     value for each of these keys, because a missing value
+                     may stand for a default chosen later, e.g. by a policy.
+    :returns: The merged action, or None if no compatible action is found.
+    """
+    with session_for_write() as session:
+        act = session.query(models.Action).\
+            filter_by(target=target, action=action, name=name,
+                      status=consts.ACTION_READY, owner=None).\
+            filter(models.Action.created_at >= since).\
+            order_by(models.Action.created_at).\
+            with_for_update().first()
+        if act is None:
+            return None
+
+        merged = dict(act.inputs or {})
+        merged.update(inputs)
+        for key in sum_keys or []:
+            try:
+                merged[key] = int(act.inputs[key]) + int(inputs[key])
+            except (KeyError, TypeError, ValueError):
+                return None
+
+        data = dict(act.data or {})
+        data['coalesced'] = data.get('coalesced', 0) + 1
+        act.inputs = merged
+        act.data = data
+        act.save(session)
+        return act
+
+
 def action_abandon(context, action_id, values=None):
     '''Abandon an action for other workers to execute again.
 
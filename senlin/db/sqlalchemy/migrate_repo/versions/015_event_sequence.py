@@ -0,0 +1,34 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from sqlalchemy import Column, Integer, MetaData, String, Table
+from sqlalchemy import select
+
+
+def upgrade(migrate_engine):
+    meta = MetaData()
+    meta.bind = migrate_engine
+
+    event = Table('event', meta, autoload=True)
+    event_sequence = Table(
+        'event_sequence', meta,
+        Column('seq', Integer, primary_key=True, autoincrement=True),
+        Column('event_id', String(36), nullable=False, index=True),
+        mysql_engine='InnoDB',
+        mysql_charset='utf8'
+    )
+    event_sequence.create()
+
+    # existing events are numbered in the order they were recorded
+    query = select([event.c.id]).order_by(event.c.timestamp)
+    migrate_engine.execute(
+        event_sequence.insert().from_select(['event_id'], query))
@@ -0,0 +1,34 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from sqlalchemy import Column, Integer, MetaData, Table
+from sqlalchemy import func, select
+
+
+def upgrade(migrate_engine):
+    meta = MetaData()
+    meta.bind = migrate_engine
+
+    event_sequence = Table('event_sequence', meta, autoload=True)
+    counter = Table(
+        'event_sequence_counter', meta,
+        Column('id', Integer, primary_key=True, autoincrement=False),
+        Column('seq', Integer, nullable=False),
+        mysql_engine='InnoDB',
+        mysql_charset='utf8'
+    )
+    counter.create()
+
+    # the numbering goes on from the last event recorded
+    last = migrate_engine.execute(
+        select([func.max(event_sequence.c.seq)])).scalar()
+    migrate_engine.execute(counter.insert().values(id=1, seq=last or 0))
@@ -17,7 +17,7 @@ SQLAlchemy models for Senlin data.
 from oslo_db.sqlalchemy import models
 from oslo_utils import uuidutils
 from sqlalchemy import Boolean, Column, Numeric, ForeignKey, Integer
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.ext import declarative
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import relationship
@@ -35,7 +35,10 @@ class TimestampMixin(object):
 
 class Profile(BASE, TimestampMixin, models.ModelBase):
     """Profile objects."""
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        Index('ix_profile_project_name', 'project', 'name'),
+        {'mysql_engine': 'InnoDB'},
+    )
     __tablename__ = 'profile'
 
     id = Column('id', String(36), primary_key=True, default=lambda: UUID4())
@@ -69,7 +72,10 @@ class Policy(BASE, TimestampMixin, models.ModelBase):
 
 class Cluster(BASE, TimestampMixin, models.ModelBase):
     """Cluster objects."""
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        Index('ix_cluster_project_name', 'project', 'name'),
+        {'mysql_engine': 'InnoDB'},
+    )
     __tablename__ = 'cluster'
 
     id = Column('id', String(36), primary_key=True, default=lambda: UUID4())
@@ -99,7 +105,10 @@ class Cluster(BASE, TimestampMixin, models.ModelBase):
 class Node(BASE, TimestampMixin, models.ModelBase):
     """Node objects."""
 
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        Index('ix_node_project_name', 'project', 'name'),
+        {'mysql_engine': 'InnoDB'},
+    )
     __tablename__ = 'node'
 
     id = Column('id', String(36), primary_key=True, default=lambda: UUID4())
@@ -269,6 +278,24 @@ class Event(BASE, models.ModelBase):
         return data
 
 
+class EventSequence(BASE, models.ModelBase):
+    """Order in which events are recorded, for reading them as a feed."""
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __tablename__ = 'event_sequence'
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(String(36), nullable=False, index=True)
+
+
+class EventSequenceCounter(BASE, models.ModelBase):
+    """The last sequence number given to an event."""
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __tablename__ = 'event_sequence_counter'
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    seq = Column(Integer, nullable=False)
+
+
 class Service(BASE, TimestampMixin, models.ModelBase):
     """Senlin service engine registry."""
     __table_args__ = {'mysql_engine': 'InnoDB'}
@@ -11,14 +11,41 @@
 # under the License.
 
 import copy
+import functools
+import inspect
 
 from oslo_config import cfg
+import six
 
+from senlin.common import timing
 from senlin.engine import environment
 
 CONF = cfg.CONF
 
 
+def _counted(func):
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        with timing.driver_call():
+            return func(*args, **kwargs)
+    return wrapped
+
+
+class DriverMeta(type):
+    """Metaclass counting the calls to the public methods of drivers.
+
+    All drivers, including the fake ones used for testing, are counted in
+    the timing of the action making the calls.
+    """
+
+    def __new__(mcs, name, bases, attrs):
+        for key, value in list(attrs.items()):
+            if not key.startswith('_') and inspect.isfunction(value):
+                attrs[key] = _counted(value)
+        return super(DriverMeta, mcs).__new__(mcs, name, bases, attrs)
+
+
+@six.add_metaclass(DriverMeta)
 class DriverBase(object):
     '''Base class for all drivers.'''
 
@@ -10,10 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from oslo_config import cfg
-
 from senlin.drivers import base
 from senlin.drivers import sdk
+from senlin.drivers import stack_watcher
 
 
 class HeatClient(base.DriverBase):
@@ -65,27 +64,29 @@ class HeatClient(base.DriverBase):
         return self.conn.orchestration.get_stack_template(stack_id)
 
     @sdk.translate_exception
-    def wait_for_stack(self, stack_id, status, failures=None, interval=2,
-                       timeout=None):
-        if failures is None:
-            failures = []
+    def stack_status(self, stack_id):
+        """Get a stack as reported by the shared stack listing.
+
+        :returns: The stack object, or None if the stack does not exist.
+        """
+        return stack_watcher.global_watcher().wait(self, stack_id, None)
 
-        if timeout is None:
-            timeout = cfg.CONF.default_action_timeout
+    @sdk.translate_exception
+    def wait_for_stack(self, stack_id, status, failures=None, timeout=None):
+        """Wait for stack to reach the given status.
 
-        stack_obj = self.conn.orchestration.find_stack(stack_id, False)
-        if stack_obj:
-            self.conn.orchestration.wait_for_status(
-                stack_obj, status, failures, interval, timeout)
+        The wait is served by the engine wide stack watcher, which polls
+        the status of all waited stacks with one listing per interval.
+
+        :returns: The stack object in its final status.
+        """
+        return stack_watcher.global_watcher().wait(
+            self, stack_id, status=status, failures=failures, timeout=timeout)
 
     @sdk.translate_exception
     def wait_for_stack_delete(self, stack_id, timeout=None):
-        '''Wait for stack deleting complete'''
-        if timeout is None:
-            timeout = cfg.CONF.default_action_timeout
-
-        server_obj = self.conn.orchestration.find_stack(stack_id, True)
-        if server_obj:
-            self.conn.orchestration.wait_for_delete(server_obj, wait=timeout)
+        """Wait for stack deleting complete"""
+        stack_watcher.global_watcher().wait(
+            self, stack_id, status=stack_watcher.DELETED, timeout=timeout)
 
         return
@@ -25,6 +25,36 @@ from senlin.engine import node as nodem
 
 LOG = logging.getLogger(__name__)
 
+# Bounds in seconds of the exponential backoff used when waiting for a
+# load-balancer to become ready.
+LB_STATUS_INTERVAL_MIN = 1
+LB_STATUS_INTERVAL_MAX = 10
+
+# Writable member attributes of the Octavia API, mapped to the attributes
+# of the SDK member resource. All of them are preserved when replacing the
+# members of a pool.
+MEMBER_ATTRS = {
+    'name': 'name',
+    'address': 'address',
+    'protocol_port': 'protocol_port',
+    'subnet_id': 'subnet_id',
+    'weight': 'weight',
+    'admin_state_up': 'is_admin_state_up',
+    'monitor_address': 'monitor_address',
+    'monitor_port': 'monitor_port',
+    'backup': 'backup',
+    'tags': 'tags',
+}
+
+
+def _member_attrs(member):
+    attrs = {}
+    for key, attr in MEMBER_ATTRS.items():
+        value = getattr(member, attr, None)
+        if value is not None:
+            attrs[key] = value
+    return attrs
+
 
 class LoadBalancerDriver(base.DriverBase):
     """Load-balancing driver based on Neutron LBaaS V2 service."""
@@ -70,6 +100,7 @@ class LoadBalancerDriver(base.DriverBase):
             resource is also an acceptable result.
         """
         waited = 0
+        interval = LB_STATUS_INTERVAL_MIN
         while waited < self.lb_status_timeout:
             try:
                 lb = self.oc().loadbalancer_get(lb_id, ignore_missing=True)
@@ -88,8 +119,9 @@ class LoadBalancerDriver(base.DriverBase):
             LOG.debug('Waiting for loadbalancer %(lb)s to become ready',
                       {'lb': lb_id})
 
-            eventlet.sleep(10)
-            waited += 10
+            eventlet.sleep(interval)
+            waited += interval
+            interval = min(interval * 2, LB_STATUS_INTERVAL_MAX)
 
         return False
 
@@ -348,3 +380,117 @@ class LoadBalancerDriver(base.DriverBase):
             return None
 
         return True
+
+    def _node_addresses(self, nodes, net_name):
+        ctx = oslo_context.get_current()
+        addresses = {}
+        for node in nodes:
+            node_obj = nodem.Node.load(ctx, db_node=node)
+            node_detail = node_obj.get_details(ctx)
+            node_addresses = node_detail.get('addresses')
+            if net_name not in node_addresses:
+                LOG.error('Node %(node)s is not in network %(net)s',
+                          {'node': node.id, 'net': net_name})
+                continue
+            # Use the first IP address if more than one are found
+            addresses[node.id] = node_addresses[net_name][0]['addr']
+        return addresses
+
+    def _members_replace(self, lb_id, pool_id, update):
+        """Replace the members of a pool with one batch update.
+
+        :param lb_id: The ID of the loadbalancer.
+        :param pool_id: The ID of the pool to update.
+        :param update: A callable taking the list of current members and
+                       returning the list of member dicts to apply.
+        :returns: True if the operation succeeded or False otherwise.
+        """
+        try:
+            if not self._wait_for_lb_ready(lb_id):
+                msg = 'Loadbalancer %s is not ready.' % lb_id
+                raise exception.Error(msg)
+            current = self.oc().pool_member_list(pool_id)
+            self.oc().pool_members_update(pool_id, update(current))
+        except (exception.InternalError, exception.Error) as ex:
+            LOG.exception('Failed in updating members of pool %(p)s: %(ex)s',
+                          {'p': pool_id, 'ex': ex})
+            return False
+
+        if not self._wait_for_lb_ready(lb_id):
+            LOG.error('Failed in updating members of pool (%s).', pool_id)
+            return False
+        return True
+
+    def members_add(self, nodes, lb_id, pool_id, port, subnet):
+        """Add members to Neutron lbaas pool in one batch.
+
+        All nodes are added with a single batch member update, so that the
+        load-balancer goes through only one provisioning cycle.
+
+        :param nodes: A list of node objects to be added to the pool.
+        :param lb_id: The ID of the loadbalancer.
+        :param pool_id: The ID of the pool for receiving the nodes.
+        :param port: The port for the new LB members to be created.
+        :param subnet: The subnet to be used by the new LB members.
+        :returns: A dict mapping the ID of each node to the ID of its new LB
+                  member, or to None if the node was not added.
+        """
+        result = dict((node.id, None) for node in nodes)
+        try:
+            subnet_obj = self.nc().subnet_get(subnet)
+            net = self.nc().network_get(subnet_obj.network_id)
+        except exception.InternalError as ex:
+            resource = 'subnet' if subnet in ex.message else 'network'
+            LOG.exception('Failed in getting %(resource)s: %(msg)s.',
+                          {'resource': resource, 'msg': ex})
+            return result
+
+        addresses = self._node_addresses(nodes, net.name)
+        if not addresses:
+            return result
+
+        def _update(current):
+            members = [_member_attrs(m) for m in current]
+            existing = set((m.address, m.protocol_port) for m in current)
+            for address in addresses.values():
+                if (address, port) not in existing:
+                    existing.add((address, port))
+                    members.append({
+                        'address': address,
+                        'protocol_port': port,
+                        'subnet_id': subnet_obj.id,
+                    })
+            return members
+
+        if not self._members_replace(lb_id, pool_id, _update):
+            return result
+
+        try:
+            members = self.oc().pool_member_list(pool_id)
+        except exception.InternalError as ex:
+            LOG.exception('Failed in listing members of pool %(p)s: %(ex)s',
+                          {'p': pool_id, 'ex': ex})
+            return result
+
+        member_ids = dict(((m.address, m.protocol_port), m.id)
+                          for m in members)
+        for node_id, address in addresses.items():
+            result[node_id] = member_ids.get((address, port))
+        return result
+
+    def members_remove(self, lb_id, pool_id, member_ids):
+        """Delete members from Neutron lbaas pool in one batch.
+
+        :param lb_id: The ID of the loadbalancer the operation is targeted at;
+        :param pool_id: The ID of the pool from which the members are deleted;
+        :param member_ids: A list of IDs of the LB members.
+        :returns: A dict mapping each member ID to True if the member was
+                  removed or None if errors occurred.
+        """
+        removed = set(member_ids)
+
+        def _update(current):
+            return [_member_attrs(m) for m in current if m.id not in removed]
+
+        res = True if self._members_replace(lb_id, pool_id, _update) else None
+        return dict((member_id, res) for member_id in member_ids)
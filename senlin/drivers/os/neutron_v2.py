@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from openstack import exceptions as sdk_exc
+from openstack.network.v2 import port as _port
 from oslo_utils import uuidutils
 
 from senlin.drivers import base
@@ -129,6 +131,18 @@ class NeutronClient(base.DriverBase):
         res = self.conn.network.create_port(**attr)
         return res
 
+    @sdk.translate_exception
+    def port_create_bulk(self, ports):
+        """Create many ports with a single request.
+
+        :param ports: A list of dicts, each containing the attributes of a
+                      port to create.
+        :returns: A list of the created ports, in the order requested.
+        """
+        res = self.conn.network.post('/ports', json={'ports': ports})
+        sdk_exc.raise_from_response(res)
+        return [_port.Port.existing(**p) for p in res.json()['ports']]
+
     @sdk.translate_exception
     def port_delete(self, port, ignore_missing=True):
         res = self.conn.network.delete_port(
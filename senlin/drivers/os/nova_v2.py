@@ -10,12 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from oslo_config import cfg
 from oslo_log import log
 
 from senlin.common import consts
 from senlin.drivers import base
 from senlin.drivers import sdk
+from senlin.drivers import server_watcher
 
 LOG = log.getLogger(__name__)
 
@@ -57,6 +57,10 @@ class NovaClient(base.DriverBase):
     def server_get(self, server):
         return self.conn.compute.get_server(server)
 
+    @sdk.translate_exception
+    def server_list(self, details=True, **query):
+        return self.conn.compute.servers(details=details, **query)
+
     @sdk.translate_exception
     def server_update(self, server, **attrs):
         return self.conn.compute.update_server(server, **attrs)
@@ -150,28 +154,22 @@ class NovaClient(base.DriverBase):
 
     @sdk.translate_exception
     def wait_for_server(self, server, status=consts.VS_ACTIVE,
-                        failures=[consts.VS_ERROR],
-                        interval=2, timeout=None):
-        '''Wait for server creation complete'''
-        if timeout is None:
-            timeout = cfg.CONF.default_action_timeout
-
-        server_obj = self.conn.compute.find_server(server, False)
-        self.conn.compute.wait_for_server(server_obj, status=status,
-                                          failures=failures,
-                                          interval=interval,
-                                          wait=timeout)
-        return
+                        failures=[consts.VS_ERROR], timeout=None):
+        '''Wait for server to reach the given status.
+
+        The wait is served by the engine wide server watcher, which polls
+        the status of all waited servers with one listing per interval.
+
+        :returns: The server object in its final status.
+        '''
+        return server_watcher.global_watcher().wait(
+            self, server, status=status, failures=failures, timeout=timeout)
 
     @sdk.translate_exception
     def wait_for_server_delete(self, server, timeout=None):
         '''Wait for server deleting complete'''
-        if timeout is None:
-            timeout = cfg.CONF.default_action_timeout
-
-        server_obj = self.conn.compute.find_server(server, True)
-        if server_obj:
-            self.conn.compute.wait_for_delete(server_obj, wait=timeout)
+        server_watcher.global_watcher().wait(
+            self, server, status=server_watcher.DELETED, timeout=timeout)
 
         return
 
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from openstack import exceptions as sdk_exc
+
 from senlin.drivers import base
 from senlin.drivers import sdk
 
@@ -135,6 +137,27 @@ class OctaviaClient(base.DriverBase):
             member_id, pool_id, ignore_missing=ignore_missing)
         return
 
+    @sdk.translate_exception
+    def pool_member_list(self, pool_id, **query):
+        return [m for m in self.conn.load_balancer.members(pool_id, **query)]
+
+    @sdk.translate_exception
+    def pool_members_update(self, pool_id, members):
+        """Replace the members of a pool in one batch.
+
+        Listed members that do not exist are created, existing ones (matched
+        by address and protocol port) are updated and members not listed are
+        deleted, all in a single provisioning cycle of the load-balancer.
+
+        :param pool_id: ID of the pool.
+        :param members: A list of dicts with the attributes of each member.
+        """
+        res = self.conn.load_balancer.put(
+            '/v2.0/lbaas/pools/%s/members' % pool_id,
+            json={'members': members})
+        sdk_exc.raise_from_response(res)
+        return
+
     @sdk.translate_exception
     def healthmonitor_create(self, hm_type, delay, timeout, max_retries,
                              pool_id, admin_state_up=True,
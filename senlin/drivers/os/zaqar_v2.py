@@ -11,6 +11,7 @@
 # under the License.
 
 from openstack import exceptions as sdk_exc
+from oslo_utils import uuidutils
 
 from senlin.drivers import base
 from senlin.drivers import sdk
@@ -65,6 +66,25 @@ class ZaqarClient(base.DriverBase):
         return self.conn.message.delete_message(queue_name, message,
                                                 claim_id, ignore_missing)
 
+    @sdk.translate_exception
+    def message_delete_many(self, queue_name, messages, claim_id=None):
+        """Delete a list of messages with a single request.
+
+        :param queue_name: Name of the queue.
+        :param messages: A list of message IDs.
+        :param claim_id: ID of the claim holding the messages, if any.
+        """
+        params = {'ids': ','.join(messages)}
+        if claim_id:
+            params['claim_ids'] = claim_id
+        headers = {
+            'Client-ID': uuidutils.generate_uuid(),
+            'X-PROJECT-ID': self.session.get_project_id(),
+        }
+        res = self.conn.message.delete('/queues/%s/messages' % queue_name,
+                                       params=params, headers=headers)
+        sdk_exc.raise_from_response(res)
+
     @sdk.translate_exception
     def message_post(self, queue_name, message):
         return self.conn.message.post_message(queue_name, message)
@@ -77,8 +77,10 @@ class HeatClient(base.DriverBase):
     def stack_delete(self, stack_id, ignore_missing=True):
         return
 
-    def wait_for_stack(self, stack_id, status, failures=None, interval=2,
-                       timeout=None):
+    def stack_status(self, stack_id):
+        return sdk.FakeResourceObject(self.fake_stack_get)
+
+    def wait_for_stack(self, stack_id, status, failures=None, timeout=None):
         return
 
     def wait_for_stack_delete(self, stack_id, timeout=None):
@@ -57,6 +57,9 @@ class NeutronClient(base.DriverBase):
     def port_create(self, **attr):
         return sdk.FakeResourceObject(self.fake_port)
 
+    def port_create_bulk(self, ports):
+        return [sdk.FakeResourceObject(self.fake_port) for p in ports]
+
     def port_delete(self, port, ignore_missing=True):
         return None
 
@@ -187,8 +187,12 @@ class NovaClient(base.DriverBase):
     def server_get(self, server):
         return sdk.FakeResourceObject(self.fake_server_get)
 
-    def wait_for_server(self, server, timeout=None):
-        return
+    def server_list(self, details=True, **query):
+        return [sdk.FakeResourceObject(self.fake_server_get)]
+
+    def wait_for_server(self, server, status=None, failures=None,
+                        timeout=None):
+        return sdk.FakeResourceObject(self.fake_server_get)
 
     def wait_for_server_delete(self, server, timeout=None):
         return
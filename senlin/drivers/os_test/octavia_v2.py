@@ -197,6 +197,12 @@ class OctaviaClient(base.DriverBase):
     def pool_member_delete(self, pool_id, member_id, ignore_missing=True):
         return
 
+    def pool_member_list(self, pool_id, **query):
+        return [sdk.FakeResourceObject(self.fake_member)]
+
+    def pool_members_update(self, pool_id, members):
+        return
+
     def healthmonitor_create(self, hm_type, delay, timeout, max_retries,
                              pool_id, admin_state_up=True, http_method=None,
                              url_path=None, expected_codes=None):
@@ -70,5 +70,8 @@ class ZaqarClient(base.DriverBase):
                        ignore_missing=True):
         return None
 
+    def message_delete_many(self, queue_name, messages, claim_id=None):
+        return None
+
     def message_post(self, queue_name, message):
         return sdk.FakeResourceObject(self.fake_message)
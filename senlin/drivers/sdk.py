@@ -14,6 +14,7 @@
 SDK Client
 '''
 import sys
+import time
 
 import functools
 from openstack import connection
@@ -26,6 +27,7 @@ from requests import exceptions as req_exc
 import six
 
 from senlin.common import exception as senlin_exc
+from senlin.common import metrics
 from senlin import version
 
 USER_AGENT = 'senlin'
@@ -34,6 +36,23 @@ LOG = logging.getLogger(__name__)
 
 sdk_utils.enable_logging(debug=False, stream=sys.stdout)
 
+# Kinds of driver calls, waiting for a resource to reach a status is kept
+# apart from the latency of the service APIs
+CALL_KINDS = (
+    CALL_API, CALL_WAIT,
+) = (
+    'api', 'wait',
+)
+
+DRIVER_SECONDS = metrics.histogram(
+    'senlin_driver_call_seconds',
+    'Seconds spent in calls to the drivers of each service by kind.',
+    labels=('service', 'kind'))
+DRIVER_ERRORS = metrics.counter(
+    'senlin_driver_call_errors_total',
+    'Calls to the drivers of each service that failed by kind.',
+    labels=('service', 'kind'))
+
 
 def parse_exception(ex):
     '''Parse exception code and yield useful information.'''
@@ -90,16 +109,28 @@ def parse_exception(ex):
     raise senlin_exc.InternalError(code=code, message=message)
 
 
+def _service_name(driver):
+    # e.g. 'nova_v2' for the compute driver
+    return type(driver).__module__.rsplit('.', 1)[-1]
+
+
 def translate_exception(func):
     """Decorator for exception translation."""
+    # the wait_for_* methods block until a resource reaches a status
+    kind = CALL_WAIT if func.__name__.startswith('wait_for') else CALL_API
 
     @functools.wraps(func)
     def invoke_with_catch(driver, *args, **kwargs):
+        start = time.time()
         try:
             return func(driver, *args, **kwargs)
         except Exception as ex:
+            DRIVER_ERRORS.inc(service=_service_name(driver), kind=kind)
             LOG.exception(ex)
             raise parse_exception(ex)
+        finally:
+            DRIVER_SECONDS.observe(time.time() - start,
+                                   service=_service_name(driver), kind=kind)
 
     return invoke_with_catch
 
@@ -131,7 +162,8 @@ def authenticate(**kwargs):
     access_info = {
         'token': conn.session.get_token(),
         'user_id': conn.session.get_user_id(),
-        'project_id': conn.session.get_project_id()
+        'project_id': conn.session.get_project_id(),
+        'expires_at': conn.session.auth.get_access(conn.session).expires
     }
 
     return access_info
@@ -0,0 +1,60 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Server Watcher.
+
+The server watcher is a process wide helper of the compute drivers for
+threads waiting on compute servers to reach a given status. Pending servers
+reachable with one credential are resolved with a single 'changes-since'
+server listing per interval.
+"""
+
+from senlin.common import consts
+from senlin.drivers import watcher
+
+# Status reported by the compute service for deleted servers when listing
+# with the 'changes-since' filter.
+DELETED = 'DELETED'
+
+_watcher = None
+
+
+def global_watcher():
+    global _watcher
+
+    if _watcher is None:
+        _watcher = ServerWatcher()
+    return _watcher
+
+
+class ServerWatcher(watcher.Watcher):
+    """Batch status polling of compute servers for all waiting threads."""
+
+    KIND = 'server'
+    DELETED = DELETED
+    INTERVAL_OPT = 'server_watch_interval'
+
+    def watch(self, driver, server_id, status=consts.VS_ACTIVE,
+              failures=None, timeout=None):
+        return super(ServerWatcher, self).watch(driver, server_id, status,
+                                                failures, timeout)
+
+    def wait(self, driver, server_id, status=consts.VS_ACTIVE,
+             failures=None, timeout=None):
+        return super(ServerWatcher, self).wait(driver, server_id, status,
+                                               failures, timeout)
+
+    def _list(self, driver, since):
+        return driver.server_list(changes_since=since.isoformat())
+
+    def _get(self, driver, server_id):
+        return driver.server_get(server_id)
@@ -0,0 +1,51 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Stack Watcher.
+
+The stack watcher is the counterpart of the server watcher for the heat
+drivers. Threads waiting on stacks register the stack they are interested
+in, and all pending stacks reachable with one credential are resolved with
+a single stack listing per interval. Heat cannot filter stacks by the time
+of their last change, so each listing covers all stacks of the project.
+"""
+
+from senlin.drivers import watcher
+
+# Status of a deleted stack. Deleted stacks are not listed, they are looked
+# up individually when they disappear from the listing.
+DELETED = 'DELETE_COMPLETE'
+
+_watcher = None
+
+
+def global_watcher():
+    global _watcher
+
+    if _watcher is None:
+        _watcher = StackWatcher()
+    return _watcher
+
+
+class StackWatcher(watcher.Watcher):
+    """Batch status polling of heat stacks for all waiting threads."""
+
+    KIND = 'stack'
+    DELETED = DELETED
+    INTERVAL_OPT = 'stack_watch_interval'
+    FULL_LISTING = True
+
+    def _list(self, driver, since):
+        return driver.stack_list()
+
+    def _get(self, driver, stack_id):
+        return driver.stack_get(stack_id)
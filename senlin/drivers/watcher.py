@@ -0,0 +1,268 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Resource Watchers.
+
+Helpers of the drivers for threads waiting on resources of a backend
+service to reach a given status. Instead of each waiting thread polling the
+service on its own, waiters register the resource they are interested in.
+A watcher groups pending resources by the credential used to reach the
+service and resolves each group with a single listing per interval, waking
+up the waiters individually. Subclasses provide the listing and the lookup
+of a resource type.
+"""
+
+import datetime
+
+import eventlet
+from eventlet import event
+from oslo_config import cfg
+from oslo_log import log as logging
+from oslo_serialization import jsonutils
+from oslo_utils import timeutils
+
+from senlin.common import exception as exc
+
+LOG = logging.getLogger(__name__)
+
+# Seconds subtracted from the 'changes-since' time of a waiter to tolerate
+# clock skew between the engine and the backend service and status changes
+# that happened shortly before the waiter was registered.
+CHANGES_MARGIN = 60
+
+
+class Waiter(object):
+    """A pending wait on one resource reaching a status.
+
+    A waiter without a status is resolved by the first status reported.
+    """
+
+    def __init__(self, resource_id, status, failures, timeout,
+                 kind='resource', deleted=None):
+        self.resource_id = resource_id
+        self.status = status.upper() if status else None
+        self.failures = set(f.upper() for f in failures or [])
+        self.kind = kind
+        self.deleted = deleted
+        now = timeutils.utcnow(True)
+        self.since = now - datetime.timedelta(seconds=CHANGES_MARGIN)
+        self.deadline = now + datetime.timedelta(seconds=timeout)
+        self.verified = False
+        self.event = event.Event()
+
+    def check(self, resource):
+        """Check a resource reported by the backend service.
+
+        :param resource: The resource as returned from the listing.
+        :returns: True if the waiter was resolved, or False otherwise.
+        """
+        status = (resource.status or '').upper()
+        if self.status is None or status == self.status:
+            self.event.send(resource)
+        elif status in self.failures or status == self.deleted:
+            msg = ("%(kind)s %(id)s transitioned to status '%(status)s' "
+                   "while waiting for status '%(expected)s'."
+                   ) % {'kind': self.kind.capitalize(),
+                        'id': self.resource_id, 'status': status,
+                        'expected': self.status}
+            self.event.send_exception(exc.InternalError(message=msg))
+        else:
+            return False
+        return True
+
+    def missing(self):
+        """Resolve the waiter for a resource that no longer exists."""
+        if self.status is None or self.status == self.deleted:
+            self.event.send(None)
+            return
+
+        msg = ("%(kind)s %(id)s is not found while waiting for status "
+               "'%(status)s'.") % {'kind': self.kind.capitalize(),
+                                   'id': self.resource_id,
+                                   'status': self.status}
+        self.event.send_exception(exc.InternalError(code=404, message=msg))
+
+    def expire(self, now):
+        """Fail the waiter if its deadline has passed.
+
+        :returns: True if the waiter has expired, or False otherwise.
+        """
+        if now < self.deadline:
+            return False
+
+        msg = ("Timeout waiting for %(kind)s %(id)s to transition to "
+               "status '%(status)s'."
+               ) % {'kind': self.kind, 'id': self.resource_id,
+                    'status': self.status}
+        self.event.send_exception(exc.InternalError(code=408, message=msg))
+        return True
+
+    def wait(self):
+        return self.event.wait()
+
+
+class Watcher(object):
+    """Batch status polling of resources for all waiting threads.
+
+    Subclasses provide the listing and the lookup of the resources.
+    """
+
+    KIND = None
+    DELETED = None
+    INTERVAL_OPT = None
+    # Whether the listing reports all resources rather than only those
+    # changed recently
+    FULL_LISTING = False
+
+    def __init__(self, interval=None):
+        self._interval = interval
+        # Mapping from credential key to a tuple of a driver and a list of
+        # pending waiters using that credential.
+        self._groups = {}
+        self._runner = None
+
+    @property
+    def interval(self):
+        if self._interval is None:
+            return cfg.CONF[self.INTERVAL_OPT]
+        return self._interval
+
+    @staticmethod
+    def _group_key(driver):
+        params = getattr(driver, 'conn_params', None)
+        if params is None:
+            return id(driver)
+        return jsonutils.dumps(params, sort_keys=True)
+
+    def watch(self, driver, resource_id, status, failures=None,
+              timeout=None):
+        """Register a waiter for a resource reaching the given status.
+
+        :param driver: The driver used to list the resources.
+        :param resource_id: ID of the resource to watch.
+        :param status: The status the resource is expected to reach, or
+                       None to get the resource in any status.
+        :param failures: A list of status values that indicate a failure.
+        :param timeout: Seconds to wait before giving up.
+        :returns: A `Waiter` object.
+        """
+        if timeout is None:
+            timeout = cfg.CONF.default_action_timeout
+
+        waiter = Waiter(resource_id, status, failures, timeout,
+                        kind=self.KIND, deleted=self.DELETED)
+        key = self._group_key(driver)
+        group = self._groups.get(key)
+        if group is None:
+            self._groups[key] = (driver, [waiter])
+        else:
+            group[1].append(waiter)
+
+        if self._runner is None:
+            self._runner = eventlet.spawn(self._run)
+        return waiter
+
+    def wait(self, driver, resource_id, status, failures=None,
+             timeout=None):
+        """Block the calling thread until a resource reaches a status.
+
+        :returns: The resource as reported by the backend service.
+        :raises: `InternalError` if the resource ends in a failure status,
+                 is deleted or does not reach the status before timeout.
+        """
+        return self.watch(driver, resource_id, status, failures,
+                          timeout).wait()
+
+    def _run(self):
+        try:
+            while self._groups:
+                eventlet.sleep(self.interval)
+                self.tick()
+        finally:
+            self._runner = None
+
+    def tick(self):
+        """Poll the backend service once for each group of waiters."""
+        for key in list(self._groups):
+            driver, waiters = self._groups.pop(key)
+            pending = self._poll(driver, waiters)
+            if pending:
+                group = self._groups.get(key)
+                if group is None:
+                    self._groups[key] = (driver, pending)
+                else:
+                    # waiters registered during the listing call
+                    group[1].extend(pending)
+
+    def _list(self, driver, since):
+        """List the resources changed since a given time."""
+        raise NotImplementedError
+
+    def _get(self, driver, resource_id):
+        """Get a single resource."""
+        raise NotImplementedError
+
+    def _poll(self, driver, waiters):
+        now = timeutils.utcnow(True)
+        since = min(w.since for w in waiters)
+        try:
+            resources = list(self._list(driver, since))
+        except Exception as ex:
+            LOG.warning("Failed listing %(kind)ss for status watch: %(ex)s",
+                        {'kind': self.KIND, 'ex': ex})
+            resources = None
+
+        by_id = {}
+        for w in waiters:
+            by_id.setdefault(w.resource_id, []).append(w)
+
+        seen = set()
+        resolved = set()
+        for resource in resources or []:
+            for w in by_id.get(resource.id, []):
+                w.verified = True
+                seen.add(w)
+                if w.check(resource):
+                    resolved.add(w)
+
+        pending = []
+        for w in waiters:
+            if w in resolved or w.expire(now):
+                continue
+            if resources is not None:
+                # A resource not reported by its first listing has not
+                # changed recently, it is checked individually once instead.
+                # A resource missing from a full listing is gone or hidden,
+                # it is checked every time.
+                verify = not w.verified or self.FULL_LISTING
+                if w not in seen and verify and self._verify(driver, w):
+                    continue
+                w.since = now - datetime.timedelta(seconds=CHANGES_MARGIN)
+            pending.append(w)
+        return pending
+
+    def _verify(self, driver, waiter):
+        try:
+            resource = self._get(driver, waiter.resource_id)
+        except exc.InternalError as ex:
+            if ex.code != 404:
+                LOG.warning("Failed getting %(kind)s %(id)s: %(ex)s",
+                            {'kind': self.KIND, 'id': waiter.resource_id,
+                             'ex': ex})
+                return False
+            resource = None
+
+        waiter.verified = True
+        if resource is None:
+            waiter.missing()
+            return True
+        return waiter.check(resource)
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import calendar
+
 import eventlet
 import six
 import time
@@ -17,10 +19,13 @@ import time
 from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import timeutils
+from oslo_utils import uuidutils
 
 from senlin.common import consts
 from senlin.common import context as req_context
 from senlin.common import exception
+from senlin.common import metrics
+from senlin.common import timing
 from senlin.common import utils
 from senlin.engine import dispatcher
 from senlin.engine import event as EVENT
@@ -32,6 +37,11 @@ from senlin.policies import base as policy_mod
 wallclock = time.time
 LOG = logging.getLogger(__name__)
 
+ACTION_RETRIES = metrics.counter(
+    'senlin_action_retries_total',
+    'Actions put back for a retry, or failed after the last retry.',
+    labels=('result',))
+
 
 class Action(object):
     '''An action can be performed on a cluster or a node of a cluster.'''
@@ -146,7 +156,22 @@ class Action(object):
 
         timestamp = timeutils.utcnow(True)
 
-        values = {
+        values = self._to_values()
+
+        if self.id:
+            self.updated_at = timestamp
+            values['updated_at'] = timestamp
+            ao.Action.update(ctx, self.id, values)
+        else:
+            self.created_at = timestamp
+            values['created_at'] = timestamp
+            action = ao.Action.create(ctx, values)
+            self.id = action.id
+
+        return self.id
+
+    def _to_values(self):
+        return {
             'name': self.name,
             'context': self.context.to_dict(),
             'target': self.target,
@@ -169,18 +194,6 @@ class Action(object):
             'domain': self.domain,
         }
 
-        if self.id:
-            self.updated_at = timestamp
-            values['updated_at'] = timestamp
-            ao.Action.update(ctx, self.id, values)
-        else:
-            self.created_at = timestamp
-            values['created_at'] = timestamp
-            action = ao.Action.create(ctx, values)
-            self.id = action.id
-
-        return self.id
-
     @classmethod
     def _from_object(cls, obj):
         """Construct an action from database object.
@@ -247,6 +260,76 @@ class Action(object):
         :param dict kwargs: Other keyword arguments for the action.
         :return: ID of the action created.
         """
+        c = cls._action_context(ctx)
+        obj = cls(target, action, c, **kwargs)
+        return obj.store(ctx)
+
+    @classmethod
+    def create_many(cls, ctx, specs):
+        """Create a batch of actions with a single database insert.
+
+        Unlike `create`, the targets of the actions are not loaded, so
+        values derived from the target, e.g. the timeout of a cluster
+        action, have to be provided in the keyword arguments.
+
+        :param ctx: The requesting context.
+        :param specs: A list of tuples each containing the ID of the target,
+                      the name of the action and a dict of other keyword
+                      arguments for the action.
+        :return: A list of IDs of the actions created.
+        """
+        records = cls.build_records(ctx, specs)
+        ao.Action.create_many(ctx, records)
+        return [r['id'] for r in records]
+
+    @classmethod
+    def build_records(cls, ctx, specs):
+        """Build the database records of a batch of actions.
+
+        :param ctx: The requesting context.
+        :param specs: A list of tuples as accepted by `create_many`.
+        :return: A list of dicts of values for the actions, each with a new
+                 ID, ready to be inserted in a batch.
+        """
+        c = cls._action_context(ctx)
+        timestamp = timeutils.utcnow(True)
+        records = []
+        for target, action, kwargs in specs:
+            values = cls._values_from_kwargs(c, target, action, kwargs)
+            values['id'] = uuidutils.generate_uuid()
+            values['created_at'] = timestamp
+            records.append(values)
+        return records
+
+    @staticmethod
+    def _values_from_kwargs(ctx, target, action, kwargs):
+        """Get the values of a new action with the defaults of __init__."""
+        return {
+            'name': kwargs.get('name', ''),
+            'context': ctx.to_dict(),
+            'target': target,
+            'action': action,
+            'cause': kwargs.get('cause', ''),
+            'owner': kwargs.get('owner', None),
+            'interval': kwargs.get('interval', -1),
+            'start_time': kwargs.get('start_time', None),
+            'end_time': kwargs.get('end_time', None),
+            'timeout': kwargs.get('timeout',
+                                  cfg.CONF.default_action_timeout),
+            'status': kwargs.get('status', Action.INIT),
+            'status_reason': kwargs.get('status_reason', ''),
+            'inputs': kwargs.get('inputs', {}),
+            'outputs': kwargs.get('outputs', {}),
+            'created_at': kwargs.get('created_at', None),
+            'updated_at': kwargs.get('updated_at', None),
+            'data': kwargs.get('data', {}),
+            'user': ctx.user_id,
+            'project': ctx.project_id,
+            'domain': ctx.domain_id,
+        }
+
+    @staticmethod
+    def _action_context(ctx):
         params = {
             'user_id': ctx.user_id,
             'project_id': ctx.project_id,
@@ -255,9 +338,7 @@ class Action(object):
             'request_id': ctx.request_id,
             'trusts': ctx.trusts,
         }
-        c = req_context.RequestContext.from_dict(params)
-        obj = cls(target, action, c, **kwargs)
-        return obj.store(ctx)
+        return req_context.RequestContext.from_dict(params)
 
     @classmethod
     def delete(cls, ctx, action_id):
@@ -304,28 +385,45 @@ class Action(object):
         '''
         raise NotImplementedError
 
-    def set_status(self, result, reason=None):
-        """Set action status based on return value from execute."""
+    def set_status(self, result, reason=None, timing=None):
+        """Set action status based on return value from execute.
+
+        :param result: The result returned from execute.
+        :param reason: An optional string explaining the result.
+        :param timing: An optional dict of the timing of the action, kept in
+                       its data when the action completes.
+        """
 
         timestamp = wallclock()
 
+        def final():
+            # the timing is written together with the final status
+            if timing is None:
+                return {}
+            if self.data is None:
+                self.data = {}
+            self.data['timing'] = timing
+            return {'data': self.data}
+
         if result == self.RES_OK:
             status = self.SUCCEEDED
-            ao.Action.mark_succeeded(self.context, self.id, timestamp)
+            ao.Action.mark_succeeded(self.context, self.id, timestamp,
+                                     **final())
 
         elif result == self.RES_ERROR:
             status = self.FAILED
             ao.Action.mark_failed(self.context, self.id, timestamp,
-                                  reason or 'ERROR')
+                                  reason or 'ERROR', **final())
 
         elif result == self.RES_TIMEOUT:
             status = self.FAILED
             ao.Action.mark_failed(self.context, self.id, timestamp,
-                                  reason or 'TIMEOUT')
+                                  reason or 'TIMEOUT', **final())
 
         elif result == self.RES_CANCEL:
             status = self.CANCELLED
-            ao.Action.mark_cancelled(self.context, self.id, timestamp)
+            ao.Action.mark_cancelled(self.context, self.id, timestamp,
+                                     **final())
 
         elif result == self.RES_LIFECYCLE_COMPLETE:
             status = self.SUCCEEDED
@@ -338,6 +436,7 @@ class Action(object):
             if retries < cfg.CONF.lock_retry_times:
                 status = self.READY
                 retries += 1
+                ACTION_RETRIES.inc(result='retried')
 
                 self.data.update({'retries': retries})
                 ao.Action.abandon(self.context, self.id, {'data': self.data})
@@ -346,10 +445,12 @@ class Action(object):
                 dispatcher.start_action(self.id)
             else:
                 status = self.RES_ERROR
+                ACTION_RETRIES.inc(result='exhausted')
                 if not reason:
                     reason = ('Exceeded maximum number of retries (%d)'
                               '') % cfg.CONF.lock_retry_times
-                ao.Action.mark_failed(self.context, self.id, timestamp, reason)
+                ao.Action.mark_failed(self.context, self.id, timestamp, reason,
+                                      **final())
 
         if status == self.SUCCEEDED:
             EVENT.info(self, consts.PHASE_END, reason or 'SUCCEEDED')
@@ -418,6 +519,11 @@ class Action(object):
         if target not in ['BEFORE', 'AFTER']:
             return
 
+        name = timing.PRE_OP if target == 'BEFORE' else timing.POST_OP
+        with timing.phase(name):
+            self._policy_check(cluster_id, target)
+
+    def _policy_check(self, cluster_id, target):
         bindings = cpo.ClusterPolicy.get_all(self.context, cluster_id,
                                              sort='priority',
                                              filters={'enabled': True})
@@ -492,6 +598,23 @@ class Action(object):
         return action_dict
 
 
+def _queued_time(action):
+    """Get the seconds an action waited before being picked up."""
+    if action.created_at is None or action.start_time is None:
+        return 0
+    created = (calendar.timegm(action.created_at.utctimetuple()) +
+               action.created_at.microsecond / 1e6)
+    return max(0, float(action.start_time) - created)
+
+
+def _notify_waiters(action):
+    dispatcher.wake_waiters(action.id)
+    if (action.status in consts.ACTION_TERMINAL_STATUSES and
+            action.cause == consts.CAUSE_RPC):
+        # requests for the action may be held by other engines
+        dispatcher.action_done(action.id)
+
+
 def ActionProc(ctx, action_id):
     '''Action process.'''
 
@@ -501,13 +624,21 @@ def ActionProc(ctx, action_id):
         LOG.error('Action "%s" could not be found.', action_id)
         return False
 
+    recorder = None
+    if cfg.CONF.action_timing:
+        recorder = timing.start()
+        recorder.add(timing.QUEUED, _queued_time(action))
+
     EVENT.info(action, consts.PHASE_START, action_id[:8])
+    # the action has been claimed and is running now
+    dispatcher.wake_waiters(action.id)
 
     reason = 'Action completed'
     success = True
     try:
         # Step 2: execute the action
-        result, reason = action.execute()
+        with timing.phase(timing.EXECUTE):
+            result, reason = action.execute()
         if result == action.RES_RETRY:
             success = False
     except Exception as ex:
@@ -521,7 +652,12 @@ def ActionProc(ctx, action_id):
                        'reason': reason})
         success = False
     finally:
+        recorded = None
+        if recorder is not None:
+            timing.stop()
+            recorded = recorder.to_dict()
         # NOTE: locks on action is eventually released here by status update
-        action.set_status(result, reason)
+        action.set_status(result, reason, timing=recorded)
+        _notify_waiters(action)
 
     return success
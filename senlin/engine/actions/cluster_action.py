@@ -13,6 +13,7 @@
 import copy
 import eventlet
 
+from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import timeutils
 from osprofiler import profiler
@@ -20,6 +21,7 @@ from osprofiler import profiler
 from senlin.common import consts
 from senlin.common import exception
 from senlin.common import scaleutils
+from senlin.common import timing
 from senlin.common import utils
 from senlin.engine.actions import base
 from senlin.engine import cluster as cluster_mod
@@ -33,6 +35,7 @@ from senlin.objects import cluster as co
 from senlin.objects import dependency as dobj
 from senlin.objects import node as no
 from senlin.policies import base as policy_mod
+from senlin.profiles import base as pfb
 
 LOG = logging.getLogger(__name__)
 
@@ -50,6 +53,10 @@ class ClusterAction(base.Action):
         """
         super(ClusterAction, self).__init__(target, action, context, **kwargs)
 
+        # IDs of the nodes locked for derived actions, mapped to the IDs of
+        # the derived actions created on them, if any
+        self._node_locks = {}
+
         try:
             self.entity = cluster_mod.Cluster.load(self.context, self.target)
             self.timeout = self.entity.timeout
@@ -60,6 +67,59 @@ class ClusterAction(base.Action):
         if period:
             eventlet.sleep(period)
 
+    def _lock_nodes(self, node_ids):
+        """Lock nodes at once for the derived actions on them.
+
+        :param node_ids: IDs of the nodes to be locked.
+        """
+        locked = senlin_lock.node_lock_acquire_many(self.context, node_ids,
+                                                    self.id)
+        for node_id in locked:
+            self._node_locks.setdefault(node_id, None)
+
+    def _create_node_action(self, node_id, action, **kwargs):
+        """Create a derived action on a node.
+
+        If the node has been locked by this action, the derived action
+        inherits the lock instead of locking the node itself.
+
+        :returns: ID of the action created.
+        """
+        locked = node_id in self._node_locks
+        if locked:
+            data = dict(kwargs.get('data') or {})
+            data[senlin_lock.NODE_LOCK_OWNER] = self.id
+            kwargs['data'] = data
+
+        action_id = base.Action.create(self.context, node_id, action,
+                                       **kwargs)
+        if locked:
+            self._node_locks[node_id] = action_id
+        return action_id
+
+    def _release_nodes(self):
+        """Release the node locks held for the derived actions.
+
+        The lock of a node whose derived action has not completed, e.g. when
+        this action failed early, is handed over to the derived action.
+        """
+        if not self._node_locks:
+            return
+
+        children = dict((a, n) for n, a in self._node_locks.items() if a)
+        handover = {}
+        if children:
+            actions = ao.Action.get_all(self.context,
+                                        filters={'id': list(children)},
+                                        project_safe=False)
+            for action in actions:
+                if action.status not in consts.ACTION_TERMINAL_STATUSES:
+                    handover[children[action.id]] = action.id
+
+        senlin_lock.node_lock_release_many(self.id, handover=handover)
+        self._node_locks = {}
+
+    @timing.timed(timing.CHILD_WAIT)
     def _wait_for_dependents(self, lifecycle_hook_timeout=None):
         """Wait for dependent actions to complete.
 
@@ -140,13 +200,35 @@ class ClusterAction(base.Action):
             node.store(self.context)
             nodes.append(node)
 
-            kwargs = {
-                'name': 'node_create_%s' % node.id[:8],
-                'cause': consts.CAUSE_DERIVED,
-            }
-            action_id = base.Action.create(self.context, node.id,
-                                           consts.NODE_CREATE, **kwargs)
-            child.append(action_id)
+        # Let the profile allocate resources for all new nodes in one pass,
+        # before any action is created for the nodes. The nodes are created
+        # one by one when this fails.
+        prepared = False
+        if count > 1:
+            try:
+                pfb.Profile.prepare_objects(self.context,
+                                            self.entity.profile_id, nodes)
+                prepared = True
+            except Exception as ex:
+                LOG.warning('Failed in preparing %(n)s nodes, they will be '
+                            'created one by one: %(ex)s',
+                            {'n': count, 'ex': ex})
+
+        try:
+            for node in nodes:
+                kwargs = {
+                    'name': 'node_create_%s' % node.id[:8],
+                    'cause': consts.CAUSE_DERIVED,
+                }
+                action_id = base.Action.create(self.context, node.id,
+                                               consts.NODE_CREATE, **kwargs)
+                child.append(action_id)
+        except Exception:
+            # No node will be created, so nothing picks up the resources
+            # prepared for them
+            if prepared:
+                self._release_prepared(nodes)
+            raise
 
         # Build dependency and make the new action ready
         dobj.Dependency.create(self.context, [a for a in child], self.id)
@@ -170,6 +252,18 @@ class ClusterAction(base.Action):
 
         return res, reason
 
+    def _release_prepared(self, nodes):
+        """Release the resources prepared for nodes which are not created.
+
+        Errors are logged so that they do not hide the original failure.
+        """
+        try:
+            pfb.Profile.release_objects(self.context, self.entity.profile_id,
+                                        nodes)
+        except Exception as ex:
+            LOG.warning('Failed in releasing the resources prepared for '
+                        '%(n)s nodes: %(ex)s', {'n': len(nodes), 'ex': ex})
+
     @profiler.trace('ClusterAction.do_create', hide_args=False)
     def do_create(self):
         """Handler for CLUSTER_CREATE action.
@@ -200,6 +294,9 @@ class ClusterAction(base.Action):
         plan = []
 
         pd = self.data.get('update', None)
+        if pd and pd.get('rolling'):
+            return self._update_nodes_rolling(profile_id, pd['rolling'])
+
         if pd:
             pause_time = pd.get('pause_time')
             plan = pd.get('plan')
@@ -210,6 +307,7 @@ class ClusterAction(base.Action):
                 nodes_list.append(node.id)
             plan.append(set(nodes_list))
 
+        self._lock_nodes([n for node_set in plan for n in node_set])
         for node_set in plan:
             child = []
             nodes = list(node_set)
@@ -222,8 +320,8 @@ class ClusterAction(base.Action):
                         'new_profile_id': profile_id,
                     },
                 }
-                action_id = base.Action.create(self.context, node,
-                                               consts.NODE_UPDATE, **kwargs)
+                action_id = self._create_node_action(
+                    node, consts.NODE_UPDATE, **kwargs)
                 child.append(action_id)
 
             if child:
@@ -251,6 +349,124 @@ class ClusterAction(base.Action):
                                 updated_at=timeutils.utcnow(True))
         return self.RES_OK, 'Cluster update completed.'
 
+    @timing.timed(timing.CHILD_WAIT)
+    def _wait_for_any_child(self, action_ids):
+        return dispatcher.wait_for_any_action(
+            self.context, action_ids, consts.ACTION_TERMINAL_STATUSES,
+            cfg.CONF.action_wait_check_interval)
+
+    def _start_rolling(self, profile_id, pending, in_flight, width,
+                       min_in_service):
+        """Start node updates while the sliding window has free slots.
+
+        :param pending: IDs of the nodes to be updated, in order.
+        :param in_flight: A dict mapping the IDs of the node update actions
+                          in progress to the IDs of their nodes.
+        """
+        if not pending or len(in_flight) >= width:
+            return
+
+        # count the nodes in service using their current status, the nodes
+        # being updated are out of service whatever their status says
+        nodes = no.Node.summaries_by_cluster(self.context, self.entity.id)
+        status = dict((n.id, n.status) for n in nodes)
+        busy = set(in_flight.values())
+        in_service = len([n for n, s in status.items()
+                          if s == consts.NS_ACTIVE and n not in busy])
+
+        started = False
+        while pending and len(in_flight) < width:
+            active = status.get(pending[0]) == consts.NS_ACTIVE
+            # always keep one node updating so that the update can proceed
+            # even if the cluster is smaller than 'min_in_service'
+            if active and in_flight and in_service - 1 < min_in_service:
+                break
+
+            node_id = pending.pop(0)
+            kwargs = {
+                'name': 'node_update_%s' % node_id[:8],
+                'cause': consts.CAUSE_DERIVED,
+                'status': base.Action.READY,
+                'inputs': {
+                    'new_profile_id': profile_id,
+                },
+            }
+            action_id = self._create_node_action(node_id,
+                                                 consts.NODE_UPDATE, **kwargs)
+            in_flight[action_id] = node_id
+            if active:
+                in_service -= 1
+            started = True
+
+        if started:
+            dispatcher.start_action()
+
+    def _update_nodes_rolling(self, profile_id, rolling):
+        """Update nodes in a sliding window.
+
+        Up to 'width' node updates are kept in progress and the next node is
+        started as soon as the update of another one is done. An ACTIVE node
+        is only started if 'min_in_service' nodes remain ACTIVE. The update
+        is aborted once more than 'max_failures' node updates have failed.
+
+        The node actions are not made dependents of this action, so that the
+        failure of one does not fail this action.
+
+        :param profile_id: ID of the new profile of the nodes.
+        :param rolling: A dict of the settings of the window and the nodes
+                        to update as computed by the batch policy.
+        :returns: A tuple containing the result and the corresponding reason.
+        """
+        pending = list(rolling['nodes'])
+        width = max(rolling['width'], 1)
+        min_in_service = rolling['min_in_service']
+        max_failures = rolling['max_failures']
+        in_flight = {}
+        failed = []
+
+        self._lock_nodes(pending)
+        while pending or in_flight:
+            if self.is_cancelled():
+                self.entity.eval_status(self.context, consts.CLUSTER_UPDATE)
+                return self.RES_CANCEL, 'Failed in updating nodes.'
+
+            if self.is_timeout():
+                self.entity.eval_status(self.context, consts.CLUSTER_UPDATE)
+                return self.RES_TIMEOUT, 'Failed in updating nodes.'
+
+            # no more node is started once the failure budget is exhausted,
+            # the updates in progress are left to finish
+            if len(failed) <= max_failures:
+                self._start_rolling(profile_id, pending, in_flight, width,
+                                    min_in_service)
+            elif not in_flight:
+                break
+
+            done = self._wait_for_any_child(list(in_flight))
+            for action_id, status in done.items():
+                node_id = in_flight.pop(action_id)
+                if status != consts.ACTION_SUCCEEDED:
+                    LOG.warning("Failed in updating node '%(node)s' of "
+                                "cluster '%(cluster)s'.",
+                                {'node': node_id, 'cluster': self.entity.id})
+                    failed.append(node_id)
+
+        if len(failed) > max_failures:
+            self.entity.eval_status(self.context, consts.CLUSTER_UPDATE)
+            reason = ('Failed in updating nodes: %(f)s nodes failed while '
+                      'at most %(m)s failures are tolerated.'
+                      ) % {'f': len(failed), 'm': max_failures}
+            return self.RES_ERROR, reason
+
+        self.entity.profile_id = profile_id
+        self.entity.eval_status(self.context, consts.CLUSTER_UPDATE,
+                                profile_id=profile_id,
+                                updated_at=timeutils.utcnow(True))
+        if failed:
+            return self.RES_OK, ('Cluster update completed, %s nodes failed.'
+                                 ) % len(failed)
+        return self.RES_OK, 'Cluster update completed.'
+
     @profiler.trace('ClusterAction.do_update', hide_args=False)
     def do_update(self):
         """Handler for CLUSTER_UPDATE action.
@@ -716,6 +932,7 @@ class ClusterAction(base.Action):
         child = []
         res = self.RES_OK
         reason = 'Cluster checking completed.'
+        self._lock_nodes([node.id for node in self.entity.nodes])
         for node in self.entity.nodes:
             node_id = node.id
             need_delete = self.inputs.get('delete_check_action', False)
@@ -726,8 +943,8 @@ class ClusterAction(base.Action):
                     status=[consts.ACTION_SUCCEEDED, consts.ACTION_FAILED])
 
             name = 'node_check_%s' % node_id[:8]
-            action_id = base.Action.create(
-                self.context, node_id, consts.NODE_CHECK, name=name,
+            action_id = self._create_node_action(
+                node_id, consts.NODE_CHECK, name=name,
                 cause=consts.CAUSE_DERIVED,
                 inputs=self.inputs
             )
@@ -752,7 +969,7 @@ class ClusterAction(base.Action):
     def _check_capacity(self):
         cluster = self.entity
 
-        current = len(cluster.nodes)
+        current = len(cluster.node_summaries)
         desired = cluster.desired_capacity
 
         if current < desired:
@@ -761,7 +978,7 @@ class ClusterAction(base.Action):
 
         if current > desired:
             count = current - desired
-            nodes = no.Node.get_all_by_cluster(self.context, cluster.id)
+            nodes = no.Node.summaries_by_cluster(self.context, cluster.id)
             candidates = scaleutils.nodes_by_random(nodes, count)
             self._delete_nodes(candidates)
 
@@ -790,7 +1007,7 @@ class ClusterAction(base.Action):
             if recover_action is not None:
                 inputs['operation'] = recover_action
 
-        children = []
+        recovering = []
         for node in self.entity.nodes:
             node_id = node.id
             if check:
@@ -799,8 +1016,14 @@ class ClusterAction(base.Action):
 
             if node.status == consts.NS_ACTIVE:
                 continue
-            action_id = base.Action.create(
-                self.context, node_id, consts.NODE_RECOVER,
+            recovering.append(node_id)
+
+        children = []
+        if recovering:
+            self._lock_nodes(recovering)
+        for node_id in recovering:
+            action_id = self._create_node_action(
+                node_id, consts.NODE_RECOVER,
                 name='node_recover_%s' % node_id[:8],
                 cause=consts.CAUSE_DERIVED, inputs=inputs,
             )
@@ -865,7 +1088,7 @@ class ClusterAction(base.Action):
 
             # Choose victims randomly if not already picked
             if not candidates:
-                node_list = self.entity.nodes
+                node_list = self.entity.node_summaries
                 candidates = scaleutils.nodes_by_random(node_list, count)
 
             self._update_cluster_size(curr_capacity - count)
@@ -969,7 +1192,8 @@ class ClusterAction(base.Action):
 
         # Choose victims randomly
         if len(candidates) == 0:
-            candidates = scaleutils.nodes_by_random(self.entity.nodes, count)
+            candidates = scaleutils.nodes_by_random(
+                self.entity.node_summaries, count)
 
         # Sleep period
         self._sleep(grace_period)
@@ -1057,9 +1281,10 @@ class ClusterAction(base.Action):
         res = self.RES_OK
         reason = "Cluster operation '%s' completed." % operation
         nodes = inputs.pop('nodes')
+        self._lock_nodes(nodes)
         for node_id in nodes:
-            action_id = base.Action.create(
-                self.context, node_id, consts.NODE_OPERATION,
+            action_id = self._create_node_action(
+                node_id, consts.NODE_OPERATION,
                 name='node_%s_%s' % (operation, node_id[:8]),
                 cause=consts.CAUSE_DERIVED,
                 inputs=inputs,
@@ -1136,8 +1361,11 @@ class ClusterAction(base.Action):
         try:
             res, reason = self._execute(**kwargs)
         finally:
-            senlin_lock.cluster_lock_release(self.target, self.id,
-                                             senlin_lock.CLUSTER_SCOPE)
+            try:
+                self._release_nodes()
+            finally:
+                senlin_lock.cluster_lock_release(self.target, self.id,
+                                                 senlin_lock.CLUSTER_SCOPE)
 
         return res, reason
 
@@ -267,9 +267,15 @@ class NodeAction(base.Action):
             elif self.cause == consts.CAUSE_DERIVED_LCH:
                 self.policy_check(self.entity.cluster_id, 'BEFORE')
 
+        # A derived action inherits the node lock its parent action holds,
+        # or has handed over to it when completing
+        parent = None
+        if self.cause == consts.CAUSE_DERIVED:
+            parent = self.data.get(senlin_lock.NODE_LOCK_OWNER)
         try:
-            res = senlin_lock.node_lock_acquire(self.context, self.entity.id,
-                                                self.id, self.owner, False)
+            res = senlin_lock.node_lock_acquire(
+                self.context, self.entity.id, self.id, self.owner, False,
+                parent=parent)
             if not res:
                 res = self.RES_RETRY
                 reason = 'Failed in locking node'
@@ -79,8 +79,11 @@ class Cluster(object):
         self.rt = {
             'profile': None,
             'nodes': [],
+            'summaries': None,
+            'placement': None,
             'policies': []
         }
+        self._context = context
 
         if context is not None:
             self._load_runtime_data(context)
@@ -96,11 +99,16 @@ class Cluster(object):
             policy = pcb.Policy.load(context, b.policy_id, project_safe=False)
             policies.append(policy)
 
+        # NOTE: Full node objects are loaded on demand, only the compact
+        # node summaries are loaded upfront.
+        self._context = context
         self.rt = {
             'profile': pfb.Profile.load(context,
                                         profile_id=self.profile_id,
                                         project_safe=False),
-            'nodes': no.Node.get_all_by_cluster(context, self.id),
+            'nodes': None,
+            'summaries': no.Node.summaries_by_cluster(context, self.id),
+            'placement': None,
             'policies': policies
         }
 
@@ -419,23 +427,46 @@ class Cluster(object):
 
     @property
     def nodes(self):
+        if self.rt['nodes'] is None:
+            self.rt['nodes'] = no.Node.get_all_by_cluster(self._context,
+                                                          self.id)
         return self.rt['nodes']
 
+    @property
+    def node_summaries(self):
+        """Compact summaries of the cluster members.
+
+        The summaries are the preferred input for placement calculation and
+        victim selection, which only read a handful of node fields.
+        """
+        if self.rt.get('summaries') is None:
+            self.rt['summaries'] = [no.NodeSummary.from_node(n)
+                                    for n in self.nodes]
+        return self.rt['summaries']
+
     def add_node(self, node):
         """Append specified node to the cluster cache.
 
         :param node: The node to become a new member of the cluster.
         """
-        self.rt['nodes'].append(node)
+        if self.rt['nodes'] is not None:
+            self.rt['nodes'].append(node)
+        if self.rt.get('summaries') is not None:
+            self.rt['summaries'].append(no.NodeSummary.from_node(node))
+        self.rt['placement'] = None
 
     def remove_node(self, node_id):
         """Remove node with specified ID from cache.
 
         :param node_id: ID of the node to be removed from cache.
         """
-        for node in self.rt['nodes']:
-            if node.id == node_id:
-                self.rt['nodes'].remove(node)
+        if self.rt['nodes'] is not None:
+            self.rt['nodes'] = [n for n in self.rt['nodes']
+                                if n.id != node_id]
+        if self.rt.get('summaries') is not None:
+            self.rt['summaries'] = [n for n in self.rt['summaries']
+                                    if n.id != node_id]
+        self.rt['placement'] = None
 
     def update_node(self, nodes):
         """Update cluster runtime data
@@ -443,27 +474,72 @@ class Cluster(object):
         :param nodes: List of node objects
         """
         self.rt['nodes'] = nodes
+        self.rt['summaries'] = None
+        self.rt['placement'] = None
 
     @property
     def policies(self):
         return self.rt['policies']
 
+    def _placement_index(self):
+        """Get the index of node summaries by region and by zone.
+
+        The index is built with one pass over the node summaries and then
+        cached until the membership of the cluster changes.
+
+        :return: A dict with keys 'region_name' and 'zone', each mapping a
+                 placement name to the list of node summaries placed there.
+        """
+        index = self.rt.get('placement')
+        if index is None:
+            index = {'region_name': {}, 'zone': {}}
+            for node in self.node_summaries:
+                for key, nodes in index.items():
+                    value = node.placement.get(key, None)
+                    if value:
+                        nodes.setdefault(value, []).append(node)
+            self.rt['placement'] = index
+        return index
+
+    def _resolve_zones(self, ctx):
+        """Fill in availability zones missing from node placement data.
+
+        Nodes are grouped by profile so that each profile resolves the zones
+        of all its nodes in one pass, e.g. with a single server list call,
+        instead of retrieving the details of each node one by one.
+
+        :param ctx: context used to access node details.
+        """
+        missing = set(n.id for n in self.node_summaries
+                      if 'zone' not in n.placement)
+        if not missing:
+            return
+
+        groups = {}
+        for node in self.nodes:
+            if node.id in missing:
+                groups.setdefault(node.profile_id, []).append(node)
+
+        found = {}
+        for profile_id, nodes in groups.items():
+            found.update(pfb.Profile.get_placements(ctx, profile_id, nodes))
+
+        for summary in self.node_summaries:
+            zone = found.get(summary.id, {}).get('zone', None)
+            if zone:
+                placement = dict(summary.placement)
+                placement['zone'] = zone
+                summary.placement = placement
+        self.rt['placement'] = None
+
     def get_region_distribution(self, regions):
         """Get node distribution regarding given regions.
 
         :param regions: list of region names to check.
         :return: a dict containing region and number as key value pairs.
         """
-        dist = dict.fromkeys(regions, 0)
-
-        for node in self.nodes:
-            placement = node.data.get('placement', {})
-            if placement:
-                region = placement.get('region_name', None)
-                if region and region in regions:
-                    dist[region] += 1
-
-        return dist
+        index = self._placement_index()['region_name']
+        return dict((r, len(index.get(r, []))) for r in regions)
 
     def get_zone_distribution(self, ctx, zones):
         """Get node distribution regarding the given the availability zones.
@@ -474,48 +550,25 @@ class Cluster(object):
         :param zones: list of zone names to check.
         :returns: a dict containing zone and number as key-value pairs.
         """
-        dist = dict.fromkeys(zones, 0)
-
-        for node in self.nodes:
-            placement = node.data.get('placement', {})
-            if placement and 'zone' in placement:
-                zone = placement['zone']
-                dist[zone] += 1
-            else:
-                details = node.get_details(ctx)
-                zname = details.get('OS-EXT-AZ:availability_zone', None)
-                if zname and zname in dist:
-                    dist[zname] += 1
-
-        return dist
+        self._resolve_zones(ctx)
+        index = self._placement_index()['zone']
+        return dict((z, len(index.get(z, []))) for z in zones)
 
     def nodes_by_region(self, region):
         """Get list of nodes that belong to the specified region.
 
         :param region: Name of region for filtering.
-        :return: A list of nodes that are from the specified region.
+        :return: A list of node summaries that are from the specified region.
         """
-        result = []
-        for node in self.nodes:
-            placement = node.data.get('placement', {})
-            if placement and 'region_name' in placement:
-                if region == placement['region_name']:
-                    result.append(node)
-        return result
+        return list(self._placement_index()['region_name'].get(region, []))
 
     def nodes_by_zone(self, zone):
         """Get list of nodes that reside in the specified availability zone.
 
         :param zone: Name of availability zone for filtering.
-        :return: A list of nodes that reside in the specified AZ.
+        :return: A list of node summaries that reside in the specified AZ.
         """
-        result = []
-        for node in self.nodes:
-            placement = node.data.get('placement', {})
-            if placement and 'zone' in placement:
-                if zone == placement['zone']:
-                    result.append(node)
-        return result
+        return list(self._placement_index()['zone'].get(zone, []))
 
     def health_check(self, ctx):
         """Check physical resources status
@@ -540,7 +593,7 @@ class Cluster(object):
         :returns: ``None``.
         """
         nodes = node_mod.Node.load_all(ctx, cluster_id=self.id)
-        self.rt['nodes'] = [n for n in nodes]
+        self.update_node([n for n in nodes])
 
         active_count = 0
         for node in self.nodes:
@@ -10,6 +10,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import time
+
+import eventlet
+from eventlet import event
 from oslo_config import cfg
 from oslo_context import context as oslo_context
 from oslo_log import log as logging
@@ -18,15 +23,19 @@ from oslo_service import service
 
 from senlin.common import consts
 from senlin.common import messaging
+from senlin.objects import action as ao
 
 LOG = logging.getLogger(__name__)
 
 OPERATIONS = (
-    START_ACTION, CANCEL_ACTION, STOP
+    START_ACTION, CANCEL_ACTION, STOP, ACTION_DONE,
 ) = (
-    'start_action', 'cancel_action', 'stop'
+    'start_action', 'cancel_action', 'stop', 'action_done',
 )
 
+# Events of the threads waiting for a status change, by action ID
+_waiters = collections.defaultdict(set)
+
 
 class Dispatcher(service.Service):
     """RPC server for dispatching actions.
@@ -73,6 +82,10 @@ class Dispatcher(service.Service):
         '''Resume an action.'''
         self.TG.resume_action(action_id)
 
+    def action_done(self, ctxt, action_id):
+        '''Wake up the threads waiting for a completed action.'''
+        wake_waiters(action_id)
+
     def stop(self):
         super(Dispatcher, self).stop()
         # Wait for all action threads to be finished
@@ -113,3 +126,94 @@ def notify(method, engine_id=None, **kwargs):
 
 def start_action(engine_id=None, **kwargs):
     return notify(START_ACTION, engine_id, **kwargs)
+
+
+def action_done(action_id):
+    """Broadcast the completion of an action to the waiters of all engines."""
+    return notify(ACTION_DONE, None, action_id=action_id)
+
+
+def wake_waiters(action_id):
+    """Wake up the threads of this process waiting for an action."""
+    for waiter in _waiters.pop(action_id, ()):
+        # a thread may be waiting for several actions completing together
+        if not waiter.ready():
+            waiter.send()
+
+
+def _discard_waiter(action_id, waiter):
+    waiters = _waiters.get(action_id)
+    if waiters is not None:
+        waiters.discard(waiter)
+        if not waiters:
+            del _waiters[action_id]
+
+
+def wait_for_action(ctx, action_id, statuses, timeout):
+    """Wait for an action to reach one of the given statuses.
+
+    A waiting thread is woken up by the status changes of the action made in
+    this process and by the completion of actions requested over RPC which
+    is broadcasted by other engines. The action is also reloaded every
+    `action_wait_check_interval` seconds, or when the wait ends if that is
+    sooner.
+
+    :param ctx: The request context for loading the action.
+    :param action_id: The UUID of the action.
+    :param statuses: The statuses to wait for.
+    :param timeout: Maximum number of seconds to wait.
+    :returns: The action object, which is not in one of the statuses when
+              the wait timed out, or None if the action has been deleted.
+    """
+    deadline = time.time() + timeout
+    while True:
+        # register before loading the action so no change can be missed
+        waiter = event.Event()
+        _waiters[action_id].add(waiter)
+        try:
+            action = ao.Action.get(ctx, action_id, project_safe=False)
+            left = deadline - time.time()
+            if action is None or action.status in statuses or left <= 0:
+                return action
+            interval = cfg.CONF.action_wait_check_interval
+            with eventlet.Timeout(min(left, interval), False):
+                waiter.wait()
+        finally:
+            _discard_waiter(action_id, waiter)
+
+
+def wait_for_any_action(ctx, action_ids, statuses, timeout):
+    """Wait for any of a group of actions to reach one of given statuses.
+
+    The waiting thread is woken up the same way as in `wait_for_action`. The
+    actions are loaded with one query each time.
+
+    :param ctx: The request context for loading the actions.
+    :param action_ids: A list of UUIDs of actions.
+    :param statuses: The statuses to wait for.
+    :param timeout: Maximum number of seconds to wait.
+    :returns: A dict mapping the IDs of the actions which have reached one
+              of the statuses to their status, empty when the wait timed
+              out. An action which has been deleted is mapped to None.
+    """
+    action_ids = list(action_ids)
+    deadline = time.time() + timeout
+    while True:
+        waiter = event.Event()
+        for action_id in action_ids:
+            _waiters[action_id].add(waiter)
+        try:
+            actions = ao.Action.get_all(ctx, filters={'id': action_ids},
+                                        project_safe=False)
+            found = dict((a.id, a.status) for a in actions)
+            done = dict((i, found.get(i)) for i in action_ids
+                        if i not in found or found[i] in statuses)
+            left = deadline - time.time()
+            if done or left <= 0:
+                return done
+            interval = cfg.CONF.action_wait_check_interval
+            with eventlet.Timeout(min(left, interval), False):
+                waiter.wait()
+        finally:
+            for action_id in action_ids:
+                _discard_waiter(action_id, waiter)
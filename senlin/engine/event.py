@@ -17,11 +17,19 @@ import six
 from stevedore import named
 
 from senlin.common import consts
+from senlin.common import metrics
 
 LOG = logging.getLogger(__name__)
 FMT = '%(name)s[%(obj_id)s] %(action)s[%(id)s] %(phase)s: %(reason)s'
 dispatchers = None
 
+WRITE_SECONDS = metrics.histogram(
+    'senlin_event_write_seconds',
+    'Seconds spent writing an event through all event dispatchers.')
+WRITES_IN_PROGRESS = metrics.gauge(
+    'senlin_event_writes_in_progress',
+    'Number of events being written by the event dispatchers.')
+
 
 def load_dispatcher():
     """Load dispatchers."""
@@ -71,12 +79,18 @@ def _dump(level, action, phase, reason, timestamp):
         if action.cause == consts.CAUSE_DERIVED:
             return
 
+    # events are written synchronously by the action threads, so the
+    # writes in progress are the backlog of the event dispatchers
+    WRITES_IN_PROGRESS.inc()
     try:
-        dispatchers.map_method("dump", level, action,
-                               phase=phase, reason=reason, timestamp=timestamp)
+        with WRITE_SECONDS.time():
+            dispatchers.map_method("dump", level, action, phase=phase,
+                                   reason=reason, timestamp=timestamp)
     except Exception as ex:
         LOG.exception("Dispatcher failed to handle the event: %s",
                       six.text_type(ex))
+    finally:
+        WRITES_IN_PROGRESS.dec()
 
 
 def critical(action, phase=None, reason=None, timestamp=None):
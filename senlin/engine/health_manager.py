@@ -24,16 +24,24 @@ from oslo_service import service
 from oslo_service import threadgroup
 from oslo_utils import timeutils
 import six
-import time
 
 from senlin.common import consts
 from senlin.common import context
 from senlin.common import messaging as rpc
+from senlin.common import metrics
+from senlin.engine import dispatcher
 from senlin import objects
 from senlin.rpc import client as rpc_client
 
 LOG = logging.getLogger(__name__)
 
+POLL_SECONDS = metrics.histogram(
+    'senlin_health_poll_seconds',
+    'Seconds spent in one round of health checks of a cluster.')
+MISSED_INTERVALS = metrics.counter(
+    'senlin_health_poll_missed_intervals_total',
+    'Health check intervals missed because a round took too long.')
+
 
 def _chase_up(start_time, interval):
     """Utility function to check if there are missed intervals.
@@ -46,7 +54,9 @@ def _chase_up(start_time, interval):
     elapsed = timeutils.delta_seconds(start_time, end_time)
     # check if we have missed any intervals?
     missed = int((elapsed - 0.0000001) / interval)
+    POLL_SECONDS.observe(elapsed)
     if missed >= 1:
+        MISSED_INTERVALS.inc(missed)
         LOG.warning("Poller missed %s intervals for checking", missed)
     return (missed + 1) * interval - elapsed
 
@@ -217,23 +227,12 @@ class HealthManager(service.Service):
         self._load_runtime_registry()
 
     def _wait_for_action(self, ctx, action_id, timeout):
-        done = False
-        req = objects.ActionGetRequest(identity=action_id)
-        with timeutils.StopWatch(timeout) as timeout_watch:
-            while timeout > 0:
-                action = self.rpc_client.call(ctx, 'action_get', req)
-                if action['status'] in [consts.ACTION_SUCCEEDED,
-                                        consts.ACTION_FAILED,
-                                        consts.ACTION_CANCELLED]:
-                    if action['status'] == consts.ACTION_SUCCEEDED:
-                        done = True
-                    break
-                time.sleep(2)
-                timeout = timeout_watch.leftover(True)
-
-        if done:
+        action = dispatcher.wait_for_action(
+            ctx, action_id, consts.ACTION_TERMINAL_STATUSES, timeout)
+        if action is not None and action.status == consts.ACTION_SUCCEEDED:
             return True, ""
-        elif timeout <= 0:
+        elif action is not None and (
+                action.status not in consts.ACTION_TERMINAL_STATUSES):
             return False, "Timeout while polling cluster status"
         else:
             return False, "Cluster check action failed or cancelled"
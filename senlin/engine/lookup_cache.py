@@ -0,0 +1,46 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Lookup Cache.
+
+The lookup cache is an engine wide cache for the results of resolving
+resource names or IDs, e.g. flavors or networks, through the drivers. All
+nodes created from one profile resolve the same names, so results are kept
+for a short time and shared. A lookup that finds nothing is cached for a
+shorter time.
+"""
+
+from oslo_config import cfg
+
+from senlin.common import cache
+from senlin.common import exception as exc
+
+# Maximum number of entries kept in the cache
+MAX_ENTRIES = 1024
+
+_cache = None
+
+
+def _not_found(ex):
+    return isinstance(ex, exc.InternalError) and ex.code == 404
+
+
+def global_cache():
+    global _cache
+
+    if _cache is None:
+        _cache = cache.TTLCache(
+            'lookup',
+            ttl=lambda: cfg.CONF.lookup_cache_ttl,
+            negative_ttl=lambda: cfg.CONF.lookup_cache_negative_ttl,
+            cache_error=_not_found, max_entries=MAX_ENTRIES)
+    return _cache
@@ -164,7 +164,16 @@ class Message(base.Receiver):
 
         return cluster
 
-    def _build_action(self, context, message):
+    def _build_action(self, context, message, clusters=None):
+        """Build the arguments of the action requested by a message.
+
+        :param context: The request context.
+        :param message: A message claimed from the queue.
+        :param clusters: An optional dict for caching clusters found by
+                         their identity.
+        :returns: A tuple of the cluster ID, the action name and a dict of
+                  keyword arguments for creating the action.
+        """
         body = message.get('body', None)
         if not body:
             msg = _('Message body is empty.')
@@ -181,8 +190,12 @@ class Message(base.Receiver):
         # Cluster existence check
         # TODO(YanyanHu): Or maybe we can relax this constraint to allow
         # user to trigger CLUSTER_CREATE action by sending message?
+        if clusters is None:
+            clusters = {}
         try:
-            cluster_obj = self._find_cluster(context, cluster)
+            if cluster not in clusters:
+                clusters[cluster] = self._find_cluster(context, cluster)
+            cluster_obj = clusters[cluster]
         except exc.ResourceNotFound:
             msg = _('Cluster (%(cid)s) cannot be found.'
                     ) % {'cid': cluster}
@@ -209,12 +222,11 @@ class Message(base.Receiver):
             'name': 'receiver_%s_%s' % (self.id[:8], message['id'][:8]),
             'cause': consts.CAUSE_RPC,
             'status': action_mod.Action.READY,
+            'timeout': cluster_obj.timeout,
             'inputs': params
         }
-        action_id = action_mod.Action.create(context, cluster_obj.id,
-                                             action, **kwargs)
 
-        return action_id
+        return cluster_obj.id, action, kwargs
 
     def initialize_channel(self, context):
         self.notifier_roles = context.roles
@@ -247,41 +259,69 @@ class Message(base.Receiver):
                                         message=six.text_type(ex))
 
     def notify(self, context, params=None):
-        queue_name = self.channel['queue_name']
-        # Claim message(s) from queue
-        # TODO(Yanyanhu) carefully handling claim ttl to avoid
-        # potential race condition.
-        try:
-            claim = self.zaqar().claim_create(queue_name)
-            messages = claim.messages
-        except exc.InternalError as ex:
-            LOG.error('Failed in claiming message: %s', ex)
-            return
+        """Drain the queue and build actions for the messages claimed.
 
-        # Build actions
-        actions = []
-        if messages:
-            for message in messages:
-                try:
-                    action_id = self._build_action(context, message)
-                    actions.append(action_id)
-                except exc.InternalError as ex:
-                    LOG.error('Failed in building action: %s', ex)
-                try:
-                    self.zaqar().message_delete(queue_name, message['id'],
-                                                claim.id)
-                except exc.InternalError as ex:
-                    LOG.error('Failed in deleting message %(id)s: %(reason)s',
-                              {'id': message['id'], 'reason': ex})
-
-            self.zaqar().claim_delete(queue_name, claim.id)
+        Messages are claimed in batches of up to `claim_limit` messages,
+        until the queue is empty or `max_claims` claims are made. The
+        actions for a claim are created in one go and the messages of a
+        claim are deleted with a single request.
+
+        :returns: A list of IDs of the actions built, or None if no message
+                  could be claimed.
+        """
+        queue_name = self.channel['queue_name']
+        limit = CONF.receiver.claim_limit
+        actions = None
+        clusters = {}
+        for i in range(CONF.receiver.max_claims):
+            # TODO(Yanyanhu) carefully handling claim ttl to avoid
+            # potential race condition.
+            try:
+                claim = self.zaqar().claim_create(queue_name, limit=limit)
+                messages = claim.messages
+            except exc.InternalError as ex:
+                LOG.error('Failed in claiming message: %s', ex)
+                break
+
+            if actions is None:
+                actions = []
+            if not messages:
+                break
+
+            actions.extend(self._process_claim(context, queue_name, claim,
+                                               messages, clusters))
+            if len(messages) < limit:
+                break
+
+        if actions:
             LOG.info('Actions %(actions)s were successfully built.',
                      {'actions': actions})
-
             dispatcher.start_action()
 
         return actions
 
+    def _process_claim(self, context, queue_name, claim, messages, clusters):
+        specs = []
+        for message in messages:
+            try:
+                specs.append(self._build_action(context, message, clusters))
+            except exc.InternalError as ex:
+                LOG.error('Failed in building action: %s', ex)
+
+        actions = []
+        if specs:
+            actions = action_mod.Action.create_many(context, specs)
+
+        ids = [m['id'] for m in messages]
+        try:
+            self.zaqar().message_delete_many(queue_name, ids, claim.id)
+        except exc.InternalError as ex:
+            LOG.error('Failed in deleting messages %(ids)s: %(reason)s',
+                      {'ids': ids, 'reason': ex})
+
+        self.zaqar().claim_delete(queue_name, claim.id)
+        return actions
+
     def to_dict(self):
         message = super(Message, self).to_dict()
         # Pop subscription from channel info since it
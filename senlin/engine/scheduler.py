@@ -11,6 +11,7 @@
 # under the License.
 
 import time
+import weakref
 
 import eventlet
 from oslo_config import cfg
@@ -19,7 +20,9 @@ from oslo_log import log as logging
 from oslo_service import threadgroup
 from osprofiler import profiler
 
+from senlin.common import consts
 from senlin.common import context
+from senlin.common import metrics
 from senlin.engine.actions import base as action_mod
 from senlin.objects import action as ao
 
@@ -27,6 +30,46 @@ LOG = logging.getLogger(__name__)
 
 wallclock = time.time
 
+# Thread group managers of this process, for the thread pool gauge
+_managers = weakref.WeakSet()
+
+QUEUED_STATUSES = (consts.ACTION_READY, consts.ACTION_RUNNING,
+                   consts.ACTION_WAITING)
+
+
+def _action_queue():
+    ctx = context.get_admin_context()
+    depth = dict(((status, c), 0) for status in QUEUED_STATUSES
+                 for c in ('CLUSTER', 'NODE', 'CUSTOM'))
+    for status, action, count in ao.Action.count_by_status(ctx,
+                                                           QUEUED_STATUSES):
+        kind = action.split('_')[0]
+        if kind not in ('CLUSTER', 'NODE'):
+            kind = 'CUSTOM'
+        depth[(status, kind)] += count
+    return depth
+
+
+def _thread_pools():
+    running = size = 0
+    for tgm in _managers:
+        running += tgm.group.pool.running()
+        size += tgm.group.pool.size
+    return {('running',): running, ('free',): size - running}
+
+
+ACTION_QUEUE = metrics.gauge(
+    'senlin_action_queue_depth',
+    'Number of actions in each queued status by class of action.',
+    labels=('status', 'class'), collect=_action_queue)
+CLAIM_SECONDS = metrics.histogram(
+    'senlin_action_claim_seconds',
+    'Seconds spent claiming an action for execution.')
+THREAD_POOL = metrics.gauge(
+    'senlin_thread_pool_threads',
+    'Number of green threads in the pools of thread group managers.',
+    labels=('state',), collect=_thread_pools)
+
 
 class ThreadGroupManager(object):
     '''Thread group manager.'''
@@ -42,6 +85,7 @@ class ThreadGroupManager(object):
         # TODO(Yanyan Hu): Build a DB session with full privilege
         # for DB accessing in scheduler module
         self.db_session = context.RequestContext(is_admin=True)
+        _managers.add(self)
 
     def _service_task(self):
         '''Dummy task which gets queued on the service.Service threadgroup.
@@ -96,16 +140,18 @@ class ThreadGroupManager(object):
 
         if action_id is not None:
             timestamp = wallclock()
-            action = ao.Action.acquire(self.db_session, action_id, worker_id,
-                                       timestamp)
+            with CLAIM_SECONDS.time():
+                action = ao.Action.acquire(self.db_session, action_id,
+                                           worker_id, timestamp)
             if action:
                 self.start(action_mod.ActionProc, self.db_session, action.id)
                 actions_launched += 1
 
         while True:
             timestamp = wallclock()
-            action = ao.Action.acquire_first_ready(self.db_session, worker_id,
-                                                   timestamp)
+            with CLAIM_SECONDS.time():
+                action = ao.Action.acquire_first_ready(self.db_session,
+                                                       worker_id, timestamp)
             if not action:
                 break
 
@@ -18,6 +18,8 @@ from oslo_config import cfg
 from oslo_log import log as logging
 
 from senlin.common.i18n import _
+from senlin.common import metrics
+from senlin.common import timing
 from senlin.common import utils
 from senlin import objects
 from senlin.objects import action as ao
@@ -29,6 +31,14 @@ CONF = cfg.CONF
 CONF.import_opt('lock_retry_times', 'senlin.common.config')
 CONF.import_opt('lock_retry_interval', 'senlin.common.config')
 
+LOCK_ACQUIRE = metrics.counter(
+    'senlin_lock_acquire_total',
+    'Attempts to acquire a cluster or node lock by result.',
+    labels=('lock', 'result'))
+LOCK_RETRIES = metrics.counter(
+    'senlin_lock_retries_total',
+    'Retries of acquiring a cluster lock held by another action.')
+
 LOG = logging.getLogger(__name__)
 
 LOCK_SCOPES = (
@@ -37,7 +47,12 @@ LOCK_SCOPES = (
     -1, 1,
 )
 
+# Key in the data of a derived action naming the parent action which holds
+# the lock of the node on its behalf
+NODE_LOCK_OWNER = 'node_lock_owner'
+
 
+@timing.timed(timing.LOCK_WAIT)
 def cluster_lock_acquire(context, cluster_id, action_id, engine=None,
                          scope=CLUSTER_SCOPE, forced=False):
     """Try to lock the specified cluster.
@@ -58,12 +73,15 @@ def cluster_lock_acquire(context, cluster_id, action_id, engine=None,
     for retries in range(3):
         owners = cl_obj.ClusterLock.acquire(cluster_id, action_id, scope)
         if action_id in owners:
+            LOCK_ACQUIRE.inc(lock='cluster', result='acquired')
             return True
+        LOCK_RETRIES.inc()
         eventlet.sleep(random.randrange(1, 3))
 
     # Step 2: Last resort is 'forced locking', only needed when retry failed
     if forced:
         owners = cl_obj.ClusterLock.steal(cluster_id, action_id)
+        LOCK_ACQUIRE.inc(lock='cluster', result='stolen')
         return action_id in owners
 
     # Step 3: check if the owner is a dead engine, if so, steal the lock.
@@ -76,6 +94,7 @@ def cluster_lock_acquire(context, cluster_id, action_id, engine=None,
                  {'c': cluster_id, 'a': owners[0]})
         dead_engine = action.owner
         owners = cl_obj.ClusterLock.steal(cluster_id, action_id)
+        LOCK_ACQUIRE.inc(lock='cluster', result='stolen')
         # Cleanse locks affected by the dead engine
         objects.Service.gc_by_engine(dead_engine)
         return action_id in owners
@@ -86,6 +105,7 @@ def cluster_lock_acquire(context, cluster_id, action_id, engine=None,
     LOG.warning('Cluster is already locked by action %(old)s, '
                 'action %(new)s failed grabbing the lock',
                 {'old': str(lock_owners), 'new': action_id[:8]})
+    LOCK_ACQUIRE.inc(lock='cluster', result='busy')
 
     return False
 
@@ -100,8 +120,9 @@ def cluster_lock_release(cluster_id, action_id, scope):
     return cl_obj.ClusterLock.release(cluster_id, action_id, scope)
 
 
+@timing.timed(timing.LOCK_WAIT)
 def node_lock_acquire(context, node_id, action_id, engine=None,
-                      forced=False):
+                      forced=False, parent=None):
     """Try to lock the specified node.
 
     :param context: the context used for DB operations.
@@ -110,17 +131,27 @@ def node_lock_acquire(context, node_id, action_id, engine=None,
     :param engine: ID of the engine that attempts to lock the node.
     :param forced: set to True to cancel current action that owns the lock,
                    if any.
+    :param parent: ID of the parent action which may hold the lock on behalf
+                   of the action, if any.
     :returns: True if lock is acquired, or False otherwise.
     """
     # Step 1: try lock the node - if the returned owner_id is the
     #         action id, it was a success
     owner = nl_obj.NodeLock.acquire(node_id, action_id)
     if action_id == owner:
+        LOCK_ACQUIRE.inc(lock='node', result='acquired')
+        return True
+
+    # The lock held by the parent action is used as it is, the parent
+    # releases it when it completes
+    if parent is not None and parent == owner:
+        LOCK_ACQUIRE.inc(lock='node', result='inherited')
         return True
 
     # Step 2: Last resort is 'forced locking', only needed when retry failed
     if forced:
         owner = nl_obj.NodeLock.steal(node_id, action_id)
+        LOCK_ACQUIRE.inc(lock='node', result='stolen')
         return action_id == owner
 
     # Step 3: Try to steal a lock if it's owner is a dead engine.
@@ -134,11 +165,13 @@ def node_lock_acquire(context, node_id, action_id, engine=None,
         reason = _('Engine died when executing this action.')
         nl_obj.NodeLock.steal(node_id, action_id)
         ao.Action.mark_failed(context, action.id, time.time(), reason)
+        LOCK_ACQUIRE.inc(lock='node', result='stolen')
         return True
 
     LOG.error('Node is already locked by action %(old)s, '
               'action %(new)s failed grabbing the lock',
               {'old': owner, 'new': action_id})
+    LOCK_ACQUIRE.inc(lock='node', result='busy')
 
     return False
 
@@ -150,3 +183,33 @@ def node_lock_release(node_id, action_id):
     :param action_id: ID of the action that attempts to release the node.
     """
     return nl_obj.NodeLock.release(node_id, action_id)
+
+
+@timing.timed(timing.LOCK_WAIT)
+def node_lock_acquire_many(context, node_ids, action_id):
+    """Try to lock a set of nodes for the derived actions of an action.
+
+    The free nodes are locked with a single insert. The derived actions on
+    these nodes inherit the lock instead of locking the node themselves.
+    The nodes locked by other actions are left to be locked by the derived
+    actions as usual.
+
+    :param context: the context used for DB operations.
+    :param node_ids: IDs of the nodes to be locked.
+    :param action_id: ID of the action that attempts to lock the nodes.
+    :returns: A set of the IDs of the nodes locked.
+    """
+    owners = nl_obj.NodeLock.acquire_many(node_ids, action_id)
+    locked = set(n for n, owner in owners.items() if owner == action_id)
+    LOCK_ACQUIRE.inc(len(locked), lock='node', result='acquired')
+    return locked
+
+
+def node_lock_release_many(action_id, handover=None):
+    """Release all the node locks held by an action.
+
+    :param action_id: ID of the action that attempts to release the nodes.
+    :param handover: An optional dict mapping the IDs of nodes to the IDs of
+                     the actions taking over the locks of these nodes.
+    """
+    return nl_obj.NodeLock.release_many(action_id, handover=handover)
@@ -10,7 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
 import copy
+import datetime
 import functools
 
 from oslo_config import cfg
@@ -27,8 +29,10 @@ from senlin.common import context as senlin_context
 from senlin.common import exception
 from senlin.common.i18n import _
 from senlin.common import messaging as rpc_messaging
+from senlin.common import metrics
 from senlin.common import scaleutils as su
 from senlin.common import schema
+from senlin.common import timing
 from senlin.common import utils
 from senlin.engine.actions import base as action_mod
 from senlin.engine.actions import cluster_action as cluster_action_mod
@@ -45,6 +49,7 @@ from senlin.objects import base as obj_base
 from senlin.objects import cluster as co
 from senlin.objects import cluster_policy as cp_obj
 from senlin.objects import credential as cred_obj
+from senlin.objects import dependency as dep_obj
 from senlin.objects import event as event_obj
 from senlin.objects import node as node_obj
 from senlin.objects import policy as policy_obj
@@ -57,6 +62,15 @@ from senlin.profiles import base as profile_base
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 
+# Inputs added up when webhook triggers are coalesced into one action
+COALESCE_SUM_KEYS = {
+    consts.CLUSTER_SCALE_OUT: ['count'],
+    consts.CLUSTER_SCALE_IN: ['count'],
+}
+
+# Counters of webhook triggers received and merged into existing actions
+webhook_counters = collections.Counter()
+
 
 def request_context(func):
     @functools.wraps(func)
@@ -75,6 +89,19 @@ def request_context(func):
     return wrapped
 
 
+def stale_reads(func):
+    """Mark a read-only request as tolerating stale reads.
+
+    The database reads for the request may be served by the read replica,
+    unless the request asks for reading from the primary database.
+    """
+    @functools.wraps(func)
+    def wrapped(self, ctx, req):
+        ctx.stale_reads = True
+        return func(self, ctx, req)
+    return wrapped
+
+
 @profiler.trace_cls("rpc")
 class EngineService(service.Service):
     """Lifecycle manager for a running service engine.
@@ -101,6 +128,8 @@ class EngineService(service.Service):
         self._rpc_server = None
         self.cleanup_timer = None
         self.cleanup_count = 0
+        # Number of action_get calls waiting for an action
+        self.action_waiters = 0
 
         # Initialize the global environment
         environment.initialize()
@@ -141,6 +170,10 @@ class EngineService(service.Service):
         LOG.info("Starting health manager for engine %s", self.engine_id)
         self.health_mgr.start()
 
+        if CONF.metrics.engine_port:
+            metrics.serve(CONF.metrics.bind_host, CONF.metrics.engine_port,
+                          tries=CONF.num_engine_workers)
+
         # we may want to make the clean-up attempts configurable.
         self.cleanup_timer = self.TG.add_timer(2 * CONF.periodic_interval,
                                                self.service_manage_cleanup)
@@ -673,6 +706,7 @@ class EngineService(service.Service):
         return policy.to_dict()
 
     @request_context
+    @stale_reads
     def cluster_list(self, ctx, req):
         """List clusters matching the specified criteria.
 
@@ -702,6 +736,7 @@ class EngineService(service.Service):
         return [c.to_dict() for c in co.Cluster.get_all(ctx, **query)]
 
     @request_context
+    @stale_reads
     def cluster_get(self, context, req):
         """Retrieve the cluster specified.
 
@@ -1029,19 +1064,20 @@ class EngineService(service.Service):
         not_found = []
         bad_nodes = []
         depended_nodes = []
+        db_nodes = node_obj.Node.find_many(ctx, req.nodes)
         for node in req.nodes:
-            try:
-                db_node = node_obj.Node.find(ctx, node)
-                dep_nodes = db_node.dependents.get('nodes', None)
-                if db_node.cluster_id != db_cluster.id:
-                    bad_nodes.append(db_node.id)
-                elif dep_nodes is not None:
-                    depended_nodes.append(db_node.id)
-                else:
-                    found.append(db_node.id)
-            except (exception.ResourceNotFound, exception.MultipleChoices):
+            db_node = db_nodes.get(node)
+            if db_node is None:
                 not_found.append(node)
-                pass
+                continue
+
+            dep_nodes = db_node.dependents.get('nodes', None)
+            if db_node.cluster_id != db_cluster.id:
+                bad_nodes.append(db_node.id)
+            elif dep_nodes is not None:
+                depended_nodes.append(db_node.id)
+            else:
+                found.append(db_node.id)
 
         msg = []
         if len(depended_nodes):
@@ -1109,16 +1145,16 @@ class EngineService(service.Service):
         not_found_old = []
         bad_nodes = []
         not_match_nodes = []
+        db_nodes = node_obj.Node.find_many(
+            ctx, list(nodes.keys()) + list(nodes.values()))
         for (old_node, new_node) in nodes.items():
-            try:
-                db_old_node = node_obj.Node.find(ctx, old_node)
-            except (exception.ResourceNotFound, exception.MultipleChoices):
+            db_old_node = db_nodes.get(old_node)
+            if db_old_node is None:
                 not_found_old.append(old_node)
                 continue
 
-            try:
-                db_new_node = node_obj.Node.find(ctx, new_node)
-            except (exception.ResourceNotFound, exception.MultipleChoices):
+            db_new_node = db_nodes.get(new_node)
+            if db_new_node is None:
                 not_found_new.append(new_node)
                 continue
 
@@ -1372,14 +1408,36 @@ class EngineService(service.Service):
         # validate 'path' string and return a parser,
         # The function may raise a BadRequest exception.
         parser = utils.get_path_parser(req.path)
+        fields = utils.get_path_fields(parser)
         cluster = co.Cluster.find(ctx, req.identity)
         nodes = node_obj.Node.get_all_by_cluster(ctx, cluster.id)
+
+        if fields is None:
+            with_details = 'details' in req.path
+        else:
+            with_details = 'details' in fields
+            if fields == {'details'}:
+                # only nodes with a physical object have details
+                nodes = [n for n in nodes if n.physical_id]
+
+        details = {}
+        if with_details:
+            # details are fetched in bulk for the nodes of each profile
+            by_profile = collections.OrderedDict()
+            for node in nodes:
+                if node.physical_id:
+                    by_profile.setdefault(node.profile_id, []).append(node)
+            for profile_id, objs in by_profile.items():
+                details.update(profile_base.Profile.get_details_many(
+                    ctx, profile_id, objs))
+
         attrs = []
         for node in nodes:
             info = node.to_dict()
-            if node.physical_id and 'details' in req.path:
-                obj = node_mod.Node.load(ctx, db_node=node)
-                info['details'] = obj.get_details(ctx)
+            if fields is not None:
+                info = dict((k, v) for k, v in info.items() if k in fields)
+            if node.id in details:
+                info['details'] = details[node.id]
 
             matches = [m.value for m in parser.find(info)]
             if matches:
@@ -1550,6 +1608,7 @@ class EngineService(service.Service):
         return {'action': action_id}
 
     @request_context
+    @stale_reads
     def node_list(self, ctx, req):
         """List node records matching the specified criteria.
 
@@ -1677,6 +1736,7 @@ class EngineService(service.Service):
         return result
 
     @request_context
+    @stale_reads
     def node_get(self, ctx, req):
         """Retrieve the node specified.
 
@@ -1906,6 +1966,434 @@ class EngineService(service.Service):
                  {'rid': req.identity, 'id': node.id})
         return node.to_dict()
 
+    @staticmethod
+    def _batch_check(items):
+        if len(items) > CONF.max_nodes_per_batch:
+            msg = _("The number of nodes (%(n)s) exceeds the maximum of "
+                    "%(m)s per batch.") % {'n': len(items),
+                                           'm': CONF.max_nodes_per_batch}
+            raise exception.BadRequest(msg=msg)
+
+    @staticmethod
+    def _batch_error(ex):
+        return {'error': {'type': ex.__class__.__name__,
+                          'message': six.text_type(ex)}}
+
+    @staticmethod
+    def _batch_lookup(cache, key, finder):
+        """Look up an object once for all the nodes of a batch.
+
+        Failures are remembered as well, so that they are reported for each
+        node referring to the same object.
+        """
+        if key not in cache:
+            try:
+                cache[key] = finder(key)
+            except exception.SenlinException as ex:
+                cache[key] = ex
+        if isinstance(cache[key], Exception):
+            raise cache[key]
+        return cache[key]
+
+    def _batch_find_nodes(self, ctx, items, results):
+        """Find the nodes of a batch with a single query.
+
+        :returns: A list of tuples of the position of an item and its node.
+                  The items whose node cannot be found get an error in
+                  `results`.
+        """
+        found = node_obj.Node.find_many(ctx, [i.identity for i in items])
+        nodes = []
+        for pos, item in enumerate(items):
+            try:
+                node = found.get(item.identity)
+                if node is None:
+                    # report why the identity did not match exactly one node
+                    node = node_obj.Node.find(ctx, item.identity)
+            except exception.SenlinException as ex:
+                results[pos] = self._batch_error(ex)
+                continue
+            nodes.append((pos, node))
+        return nodes
+
+    def _batch_check_names(self, ctx, names, results):
+        """Check the uniqueness of the names of nodes in a batch.
+
+        :param names: A list of tuples of the position of an item and the
+                      name of its node.
+        :returns: The tuples of the names that are usable.
+        """
+        if not CONF.name_unique:
+            return names
+
+        taken = set()
+        if names:
+            existing = node_obj.Node.get_all(
+                ctx, filters={'name': list(set(n for _p, n in names))})
+            taken = set(n.name for n in existing)
+        usable = []
+        for pos, name in names:
+            if name in taken:
+                msg = _("The node named (%(name)s) already exists."
+                        ) % {"name": name}
+                results[pos] = self._batch_error(
+                    exception.BadRequest(msg=msg))
+                continue
+            taken.add(name)
+            usable.append((pos, name))
+        return usable
+
+    @request_context
+    def node_batch_create(self, ctx, req):
+        """Create a batch of nodes.
+
+        The nodes are checked together, loading each profile and cluster
+        once. All the valid nodes and their actions are created in one
+        transaction, along with an action of the batch depending on them,
+        and the actions are dispatched once.
+
+        :param ctx: An instance of the request context.
+        :param req: An instance of the NodeBatchCreateRequest object.
+        :return: A list with a result for each node of the request, in the
+                 same order. A result contains either the details of the
+                 node created, the ID of its action and the ID of the action
+                 of the whole batch, or an error.
+        """
+        self._batch_check(req.nodes)
+        results = [None] * len(req.nodes)
+        profiles = {}
+        clusters = {}
+
+        def find_profile(identity):
+            try:
+                return profile_obj.Profile.find(ctx, identity)
+            except exception.ResourceNotFound as ex:
+                msg = ex.enhance_msg('specified', ex)
+                raise exception.BadRequest(msg=msg)
+
+        def find_cluster(identity):
+            try:
+                return co.Cluster.find(ctx, identity)
+            except (exception.ResourceNotFound,
+                    exception.MultipleChoices) as ex:
+                msg = ex.enhance_msg('specified', ex)
+                raise exception.BadRequest(msg=msg)
+
+        valid = []
+        for pos, item in enumerate(req.nodes):
+            item.obj_set_defaults()
+            try:
+                profile = self._batch_lookup(profiles, item.profile_id,
+                                             find_profile)
+                cluster = None
+                if item.cluster_id:
+                    cluster = self._batch_lookup(clusters, item.cluster_id,
+                                                 find_cluster)
+                    cluster_profile = self._batch_lookup(
+                        profiles, cluster.profile_id, find_profile)
+                    if profile.type != cluster_profile.type:
+                        msg = _('Node and cluster have different profile '
+                                'type, operation aborted.')
+                        raise exception.BadRequest(msg=msg)
+            except exception.SenlinException as ex:
+                results[pos] = self._batch_error(ex)
+                continue
+            valid.append((pos, item, profile, cluster))
+
+        # reserve the indexes of the new nodes of each cluster at once
+        counts = collections.Counter(c.id for _p, _i, _pr, c in valid if c)
+        indexes = {}
+        for cluster_id, count in counts.items():
+            indexes[cluster_id] = co.Cluster.get_next_index(ctx, cluster_id,
+                                                            count=count)
+
+        names = []
+        node_indexes = {}
+        for pos, item, profile, cluster in valid:
+            # we use requested name only when cluster is not specified
+            if cluster is None:
+                names.append((pos, item.name))
+                continue
+            index = node_indexes[pos] = indexes[cluster.id]
+            indexes[cluster.id] += 1
+            name_format = cluster.config.get("node.name.format", "")
+            names.append((pos, utils.format_node_name(name_format, cluster,
+                                                      index)))
+        names = dict(self._batch_check_names(ctx, names, results))
+
+        now = timeutils.utcnow(True)
+        values = []
+        specs = []
+        created = []
+        for pos, item, profile, cluster in valid:
+            if pos not in names:
+                continue
+            node_id = uuidutils.generate_uuid()
+            values.append({
+                'id': node_id,
+                'name': names[pos],
+                'profile_id': profile.id,
+                'cluster_id': cluster.id if cluster else '',
+                'physical_id': None,
+                'index': node_indexes.get(pos, -1),
+                'role': item.role or '',
+                'metadata': item.metadata or {},
+                'status': consts.NS_INIT,
+                'status_reason': 'Initializing',
+                'data': {},
+                'dependents': {},
+                'init_at': now,
+                'user': ctx.user_id,
+                'project': ctx.project_id,
+                'domain': ctx.domain_id,
+            })
+            specs.append((node_id, consts.NODE_CREATE, {
+                'name': 'node_create_%s' % node_id[:8],
+                'cause': consts.CAUSE_RPC,
+                'status': action_mod.Action.READY,
+            }))
+            created.append(pos)
+
+        if not values:
+            return results
+
+        LOG.info("Creating %s nodes in a batch.", len(values))
+        # the batch action only waits for the actions of the nodes, it
+        # completes with them without being executed; it targets itself
+        # and keeps the IDs of the nodes in its inputs
+        batch_id = uuidutils.generate_uuid()
+        specs.append((batch_id, consts.BATCH_NODE_CREATE, {
+            'name': 'batch_node_create_%s' % batch_id[:8],
+            'cause': consts.CAUSE_RPC,
+            'status': action_mod.Action.WAITING,
+            'status_reason': 'Waiting for depended actions.',
+            'inputs': {'nodes': [v['id'] for v in values]},
+        }))
+        actions = action_mod.Action.build_records(ctx, specs)
+        batch = actions.pop()
+        batch['id'] = batch_id
+        node_obj.Node.create_many(ctx, values, actions=actions, parent=batch)
+        dispatcher.start_action()
+
+        nodes = node_obj.Node.get_all(
+            ctx, filters={'id': [v['id'] for v in values]})
+        nodes = dict((n.id, n) for n in nodes)
+        for pos, v, action in zip(created, values, actions):
+            result = nodes[v['id']].to_dict()
+            result['action'] = action['id']
+            result['batch_action'] = batch_id
+            results[pos] = result
+        return results
+
+    @request_context
+    def node_batch_adopt(self, ctx, req):
+        """Adopt a batch of physical resources into senlin's management.
+
+        The names of the nodes are checked with one query and all the nodes
+        adopted are created in one transaction. The profiles created for the
+        nodes are deleted when the nodes fail to be created.
+
+        :param ctx: An instance of the request context.
+        :param req: An instance of the NodeBatchAdoptRequest object.
+        :return: A list with a result for each node of the request, in the
+                 same order. A result contains either the details of the
+                 node created or an error.
+        """
+        self._batch_check(req.nodes)
+        results = [None] * len(req.nodes)
+
+        names = []
+        for pos, item in enumerate(req.nodes):
+            if item.obj_attr_is_set('name') and item.name:
+                names.append((pos, item.name))
+            else:
+                names.append((pos, 'node-' + utils.random_name()))
+        names = self._batch_check_names(ctx, names, results)
+
+        now = timeutils.utcnow(True)
+        values = []
+        created = []
+        for pos, name in names:
+            item = req.nodes[pos]
+            try:
+                profile_cls, spec = self._node_adopt_preview(ctx, item)
+                profile = profile_cls.create(ctx, "prof-%s" % name, spec)
+            except exception.SenlinException as ex:
+                results[pos] = self._batch_error(ex)
+                continue
+            values.append({
+                'id': uuidutils.generate_uuid(),
+                'name': name,
+                'data': {},
+                'dependents': {},
+                'profile_id': profile.id,
+                'cluster_id': '',
+                'physical_id': item.identity,
+                'index': -1,
+                'role': '',
+                'metadata': (item.metadata
+                             if item.obj_attr_is_set('metadata') else {}),
+                'status': consts.NS_ACTIVE,
+                'status_reason': 'Node adopted successfully',
+                'init_at': now,
+                'created_at': now,
+                'user': ctx.user_id,
+                'project': ctx.project_id,
+                'domain': ctx.domain_id,
+            })
+            created.append(pos)
+
+        if not values:
+            return results
+
+        try:
+            node_obj.Node.create_many(ctx, values)
+        except Exception:
+            # the profiles have been committed one by one, they would be
+            # left without any node
+            LOG.error("Failed in adopting %s nodes in a batch, deleting "
+                      "their profiles.", len(values))
+            for v in values:
+                profile_obj.Profile.delete(ctx, v['profile_id'])
+            raise
+        LOG.info("Adopted %s nodes in a batch.", len(values))
+
+        nodes = node_obj.Node.get_all(
+            ctx, filters={'id': [v['id'] for v in values]})
+        nodes = dict((n.id, n) for n in nodes)
+        for pos, v in zip(created, values):
+            results[pos] = nodes[v['id']].to_dict()
+        return results
+
+    def _batch_start_actions(self, ctx, specs, results):
+        """Create the actions of a batch in one insert and dispatch them.
+
+        :param specs: A list of tuples of the position of an item, its node
+                      and the spec of its action as accepted by
+                      `Action.create_many`.
+        """
+        if not specs:
+            return results
+
+        action_ids = action_mod.Action.create_many(
+            ctx, [spec for _p, _n, spec in specs])
+        dispatcher.start_action()
+        for (pos, node, spec), action_id in zip(specs, action_ids):
+            results[pos] = {'id': node.id, 'action': action_id}
+        LOG.info("%(n)s node actions queued in a batch: %(a)s.",
+                 {'n': len(action_ids), 'a': action_ids})
+        return results
+
+    @request_context
+    def node_batch_delete(self, ctx, req):
+        """Delete a batch of nodes.
+
+        The nodes are found with one query and their actions are created
+        with one insert and dispatched once.
+
+        :param ctx: An instance of the request context.
+        :param req: An instance of the NodeBatchDeleteRequest object.
+        :return: A list with a result for each node of the request, in the
+                 same order. A result contains either the IDs of the node
+                 and of its action, or an error.
+        """
+        self._batch_check(req.nodes)
+        results = [None] * len(req.nodes)
+
+        specs = []
+        seen = set()
+        for pos, node in self._batch_find_nodes(ctx, req.nodes, results):
+            item = req.nodes[pos]
+            force = False
+            if item.obj_attr_is_set(consts.NODE_DELETE_FORCE):
+                force = item.force
+            try:
+                if node.id in seen:
+                    msg = _("The node (%s) is given more than once."
+                            ) % item.identity
+                    raise exception.BadRequest(msg=msg)
+                if (not force and
+                    node.status in [consts.NS_CREATING,
+                                    consts.NS_UPDATING,
+                                    consts.NS_DELETING,
+                                    consts.NS_RECOVERING]):
+                    raise exception.ActionInProgress(
+                        type='node', id=item.identity, status=node.status)
+                dependents = node.dependents.get('nodes', None)
+                if dependents is not None and len(dependents) > 0:
+                    reason = _("still depended by other clusters and/or "
+                               "nodes")
+                    raise exception.ResourceInUse(
+                        type='node', id=item.identity, reason=reason)
+            except exception.SenlinException as ex:
+                results[pos] = self._batch_error(ex)
+                continue
+
+            seen.add(node.id)
+            specs.append((pos, node, (node.id, consts.NODE_DELETE, {
+                'name': 'node_delete_%s' % node.id[:8],
+                'cause': consts.CAUSE_RPC,
+                'status': action_mod.Action.READY,
+            })))
+
+        return self._batch_start_actions(ctx, specs, results)
+
+    @request_context
+    def node_batch_op(self, ctx, req):
+        """Perform operations on a batch of nodes.
+
+        The nodes are found with one query, the profile of the nodes is
+        loaded once for each profile and the actions are created with one
+        insert and dispatched once.
+
+        :param ctx: An instance of the request context.
+        :param req: An instance of the NodeBatchOperationRequest object.
+        :return: A list with a result for each node of the request, in the
+                 same order. A result contains either the IDs of the node
+                 and of its action, or an error.
+        """
+        self._batch_check(req.nodes)
+        results = [None] * len(req.nodes)
+        profiles = {}
+
+        def load_profile(profile_id):
+            return profile_base.Profile.load(ctx, profile_id=profile_id,
+                                             project_safe=False)
+
+        specs = []
+        for pos, node in self._batch_find_nodes(ctx, req.nodes, results):
+            item = req.nodes[pos]
+            params = {}
+            try:
+                profile = self._batch_lookup(profiles, node.profile_id,
+                                             load_profile)
+                if item.operation not in profile.OPERATIONS:
+                    msg = _("The requested operation '%(o)s' is not "
+                            "supported by the profile type '%(t)s'."
+                            ) % {'o': item.operation, 't': profile.type}
+                    raise exception.BadRequest(msg=msg)
+                if item.obj_attr_is_set('params') and item.params:
+                    params = item.params
+                    try:
+                        profile.OPERATIONS[item.operation].validate(params)
+                    except exception.ESchema as ex:
+                        raise exception.BadRequest(msg=six.text_type(ex))
+            except exception.SenlinException as ex:
+                results[pos] = self._batch_error(ex)
+                continue
+
+            specs.append((pos, node, (node.id, consts.NODE_OPERATION, {
+                'name': 'node_%s_%s' % (item.operation, node.id[:8]),
+                'cause': consts.CAUSE_RPC,
+                'status': action_mod.Action.READY,
+                'inputs': {
+                    'operation': item.operation,
+                    'params': params
+                }
+            })))
+
+        return self._batch_start_actions(ctx, specs, results)
+
     @request_context
     def node_check(self, ctx, req):
         """Check the health status of specified node.
@@ -2191,6 +2679,7 @@ class EngineService(service.Service):
         return {'action': action_id}
 
     @request_context
+    @stale_reads
     def action_list(self, ctx, req):
         """List action records matching the specified criteria.
 
@@ -2220,11 +2709,20 @@ class EngineService(service.Service):
             filters['target'] = req.target
         if req.obj_attr_is_set('status'):
             filters['status'] = req.status
+        if req.obj_attr_is_set('ids') and req.ids is not None:
+            filters['id'] = req.ids
         if filters:
             query['filters'] = filters
 
         actions = action_obj.Action.get_all(ctx, **query)
-        return [a.to_dict() for a in actions]
+        # load the dependencies of all actions at once
+        depends_on = collections.defaultdict(list)
+        depended_by = collections.defaultdict(list)
+        for dep in dep_obj.Dependency.get_all(ctx, [a.id for a in actions]):
+            depends_on[dep.dependent].append(dep.depended)
+            depended_by[dep.depended].append(dep.dependent)
+        return [a.to_dict(depends_on=depends_on[a.id],
+                          depended_by=depended_by[a.id]) for a in actions]
 
     @request_context
     def action_create(self, ctx, req):
@@ -2262,6 +2760,7 @@ class EngineService(service.Service):
         return {'action': action_id}
 
     @request_context
+    @stale_reads
     def action_get(self, ctx, req):
         """Retrieve the action specified.
 
@@ -2272,7 +2771,27 @@ class EngineService(service.Service):
                  action could be found.
         """
         action = action_obj.Action.find(ctx, req.identity)
-        return action.to_dict()
+        wait = req.wait if req.obj_attr_is_set('wait') else None
+        if wait and self.action_waiters < CONF.max_action_waiters:
+            statuses = list(consts.ACTION_TERMINAL_STATUSES)
+            if req.obj_attr_is_set('until') and req.until:
+                statuses.append(req.until)
+            if action.status not in statuses:
+                # the status waited for is read from the primary database
+                ctx.stale_reads = False
+                self.action_waiters += 1
+                try:
+                    action = dispatcher.wait_for_action(
+                        ctx, action.id, statuses,
+                        min(wait, CONF.max_action_wait)) or action
+                finally:
+                    self.action_waiters -= 1
+
+        result = action.to_dict()
+        recorded = (action.data or {}).get('timing')
+        if recorded:
+            result['timing'] = timing.summarize(recorded)
+        return result
 
     @request_context
     def action_delete(self, ctx, req):
@@ -2512,8 +3031,18 @@ class EngineService(service.Service):
         if params:
             data.update(params)
 
+        name = 'webhook_%s' % receiver.id[:8]
+        webhook_counters['triggers'] += 1
+        action = self._coalesce_trigger(ctx, cluster.id, receiver.action,
+                                        name, data)
+        if action is not None:
+            webhook_counters['coalesced'] += 1
+            LOG.info("Webhook %(w)s triggered, merged into action %(a)s.",
+                     {'w': identity, 'a': action.id})
+            return {'action': action.id}
+
         kwargs = {
-            'name': 'webhook_%s' % receiver.id[:8],
+            'name': name,
             'cause': consts.CAUSE_RPC,
             'status': action_mod.Action.READY,
             'inputs': data
@@ -2527,7 +3056,23 @@ class EngineService(service.Service):
 
         return {'action': action_id}
 
+    def _coalesce_trigger(self, ctx, cluster_id, action, name, inputs):
+        """Merge a webhook trigger into a pending action of the receiver.
+
+        :returns: The action merged into, or None if coalescing is disabled
+                  or no compatible action is waiting to be executed.
+        """
+        window = CONF.receiver.coalesce_window
+        if window <= 0:
+            return None
+
+        since = timeutils.utcnow(True) - datetime.timedelta(seconds=window)
+        return action_obj.Action.coalesce(
+            ctx, cluster_id, action, name, since, inputs,
+            COALESCE_SUM_KEYS.get(action))
+
     @request_context
+    @stale_reads
     def event_list(self, ctx, req):
         """List event records matching the specified criteria.
 
@@ -2560,13 +3105,10 @@ class EngineService(service.Service):
         if req.obj_attr_is_set('level'):
             filters['level'] = req.level
         if req.obj_attr_is_set('cluster_id'):
-            cluster_ids = []
-            for cid in req.cluster_id:
-                try:
-                    cluster = co.Cluster.find(ctx, cid)
-                    cluster_ids.append(cluster.id)
-                except exception.ResourceNotFound:
-                    return []
+            clusters = co.Cluster.find_many(ctx, req.cluster_id)
+            if len(clusters) < len(set(req.cluster_id)):
+                return []
+            cluster_ids = [clusters[cid].id for cid in req.cluster_id]
             if len(cluster_ids) > 0:
                 filters['cluster_id'] = cluster_ids
         if filters:
@@ -2590,6 +3132,54 @@ class EngineService(service.Service):
         return results
 
     @request_context
+    def event_feed(self, ctx, req):
+        """Get the events recorded after a cursor, in the order recorded.
+
+        :param ctx: An instance of the request context.
+        :param req: An instance of the EventFeedRequest object.
+        :return: A dict with the cursor to read the following events from
+                 and a list of `Event` object representations, each with
+                 its sequence number. Without a cursor in the request, no
+                 event is returned and the cursor is that of the latest
+                 event.
+        """
+        req.obj_set_defaults()
+        if not req.project_safe and not ctx.is_admin:
+            raise exception.Forbidden()
+
+        if req.limit < 1:
+            msg = _("The limit of the event feed must be at least 1")
+            raise exception.BadRequest(msg=msg)
+
+        if req.cursor is None:
+            return {consts.EVENT_CURSOR: event_obj.Event.last_sequence(ctx),
+                    'events': []}
+
+        filters = {}
+        for key in (consts.EVENT_OBJ_ID, consts.EVENT_OBJ_TYPE,
+                    consts.EVENT_ACTION, consts.EVENT_CLUSTER_ID):
+            if req.obj_attr_is_set(key) and getattr(req, key):
+                filters[key] = getattr(req, key)
+        if req.obj_attr_is_set('level') and req.level:
+            value = utils.parse_level_values(req.level)
+            if value is not None:
+                filters[consts.EVENT_LEVEL] = value
+
+        cursor, rows = event_obj.Event.feed(
+            ctx, req.cursor, req.limit, filters=filters,
+            project_safe=req.project_safe)
+
+        results = []
+        for seq, event in rows:
+            evt = event.as_dict()
+            evt['level'] = utils.level_from_number(evt['level'])
+            evt[consts.EVENT_SEQ] = seq
+            results.append(evt)
+
+        return {consts.EVENT_CURSOR: cursor, 'events': results}
+
+    @request_context
+    @stale_reads
     def event_get(self, ctx, req):
         """Retrieve the event specified.
 
@@ -56,6 +56,10 @@ class Action(base.SenlinObject, base.VersionedObjectDictCompat):
         obj = db_api.action_create(context, values)
         return cls._from_db_object(context, cls(context), obj)
 
+    @classmethod
+    def create_many(cls, context, values):
+        db_api.action_create_many(context, values)
+
     @classmethod
     def find(cls, context, identity, **kwargs):
         """Find an action with the given identity.
@@ -98,32 +102,46 @@ class Action(base.SenlinObject, base.VersionedObjectDictCompat):
     @classmethod
     def get_all(cls, context, **kwargs):
         objs = db_api.action_get_all(context, **kwargs)
-        return [cls._from_db_object(context, cls(), obj) for obj in objs]
+        # The stored context is not loaded when listing actions
+        return [cls._from_db_object(context, cls(), obj, exclude=['context'])
+                for obj in objs]
 
     @classmethod
     def get_all_by_owner(cls, context, owner):
         objs = db_api.action_get_all_by_owner(context, owner)
         return [cls._from_db_object(context, cls(), obj) for obj in objs]
 
+    @classmethod
+    def count_by_status(cls, context, statuses):
+        """Count actions in the given status by status and action name.
+
+        :returns: A list of tuples of status, action name and count.
+        """
+        return db_api.action_count_by_status(context, statuses)
+
     @classmethod
     def check_status(cls, context, action_id, timestamp):
         return db_api.action_check_status(context, action_id, timestamp)
 
     @classmethod
-    def mark_succeeded(cls, context, action_id, timestamp):
-        return db_api.action_mark_succeeded(context, action_id, timestamp)
+    def mark_succeeded(cls, context, action_id, timestamp, data=None):
+        return db_api.action_mark_succeeded(context, action_id, timestamp,
+                                            data=data)
 
     @classmethod
     def mark_ready(cls, context, action_id, timestamp):
         return db_api.action_mark_ready(context, action_id, timestamp)
 
     @classmethod
-    def mark_failed(cls, context, action_id, timestamp, reason=None):
-        return db_api.action_mark_failed(context, action_id, timestamp, reason)
+    def mark_failed(cls, context, action_id, timestamp, reason=None,
+                    data=None):
+        return db_api.action_mark_failed(context, action_id, timestamp, reason,
+                                         data=data)
 
     @classmethod
-    def mark_cancelled(cls, context, action_id, timestamp):
-        return db_api.action_mark_cancelled(context, action_id, timestamp)
+    def mark_cancelled(cls, context, action_id, timestamp, data=None):
+        return db_api.action_mark_cancelled(context, action_id, timestamp,
+                                            data=data)
 
     @classmethod
     def acquire(cls, context, action_id, owner, timestamp):
@@ -141,6 +159,15 @@ class Action(base.SenlinObject, base.VersionedObjectDictCompat):
     def abandon(cls, context, action_id, values=None):
         return db_api.action_abandon(context, action_id, values)
 
+    @classmethod
+    def coalesce(cls, context, target, action, name, since, inputs,
+                 sum_keys=None):
+        obj = db_api.action_coalesce(context, target, action, name, since,
+                                     inputs, sum_keys)
+        if obj is None:
+            return None
+        return cls._from_db_object(context, cls(), obj)
+
     @classmethod
     def signal(cls, context, action_id, value):
         return db_api.action_signal(context, action_id, value)
@@ -176,10 +203,20 @@ class Action(base.SenlinObject, base.VersionedObjectDictCompat):
                                               action_excluded=action_excluded,
                                               status=status)
 
-    def to_dict(self):
-        if self.id:
-            dep_on = dobj.Dependency.get_depended(self.context, self.id)
-            dep_by = dobj.Dependency.get_dependents(self.context, self.id)
+    def to_dict(self, depends_on=None, depended_by=None):
+        """Get a dict representation of the action.
+
+        :param depends_on: Optional IDs of the actions this action depends
+                           on, when already loaded by the caller.
+        :param depended_by: Optional IDs of the actions depending on this
+                            action, when already loaded by the caller.
+        """
+        if depends_on is not None and depended_by is not None:
+            dep_on = depends_on
+            dep_by = depended_by
+        elif self.id:
+            dep_on = dobj.Dependency.get_depended(self._context, self.id)
+            dep_by = dobj.Dependency.get_dependents(self._context, self.id)
         else:
             dep_on = []
             dep_by = []
@@ -43,10 +43,17 @@ class SenlinObject(base.VersionedObject):
     VERSION_MAP = {}
 
     @staticmethod
-    def _from_db_object(context, obj, db_obj):
+    def _from_db_object(context, obj, db_obj, exclude=None):
+        """Build an object from a DB record.
+
+        :param exclude: Optional names of fields not loaded from the DB.
+                        These fields are left unset on the object.
+        """
         if db_obj is None:
             return None
         for field in obj.fields:
+            if exclude and field in exclude:
+                continue
             if field == 'metadata':
                 obj['metadata'] = db_obj['meta_data']
             else:
@@ -57,6 +64,42 @@ class SenlinObject(base.VersionedObject):
 
         return obj
 
+    @classmethod
+    def _identity_cache(cls, context, project_safe=True):
+        """Get the cache of objects resolved during the current request.
+
+        The cache is kept on the request context, so it is discarded along
+        with the request. An empty dict is returned when the context does
+        not support caching.
+        """
+        cache = getattr(context, 'identity_cache', None)
+        if not isinstance(cache, dict):
+            return {}
+        return cache.setdefault((cls.obj_name(), project_safe), {})
+
+    @classmethod
+    def _find_many(cls, context, identities, lookup, project_safe=True):
+        """Resolve a list of identities into objects.
+
+        :param context: The request context.
+        :param identities: A list of IDs, names or short IDs.
+        :param lookup: A DB API function resolving identities in bulk.
+        :param project_safe: Whether only objects from the requesting
+                             project are qualified.
+        :returns: A dict mapping identities to objects. Identities that
+                  match no object or more than one object are left out.
+        """
+        cache = cls._identity_cache(context, project_safe)
+        missing = [i for i in set(identities) if i not in cache]
+        if missing:
+            records = lookup(context, missing, project_safe=project_safe)
+            for identity, matches in records.items():
+                if len(matches) == 1:
+                    cache[identity] = cls._from_db_object(context, cls(),
+                                                          matches[0])
+
+        return dict((i, cache[i]) for i in identities if i in cache)
+
     @staticmethod
     def _transpose_metadata(values):
         """Utility function to translate metadata field."""
@@ -60,6 +60,10 @@ class Cluster(base.SenlinObject, base.VersionedObjectDictCompat):
 
     @classmethod
     def find(cls, context, identity, project_safe=True):
+        cache = cls._identity_cache(context, project_safe)
+        if identity in cache:
+            return cache[identity]
+
         cluster = None
         if uuidutils.is_uuid_like(identity):
             cluster = cls.get(context, identity, project_safe=project_safe)
@@ -77,8 +81,25 @@ class Cluster(base.SenlinObject, base.VersionedObjectDictCompat):
         if not cluster:
             raise exc.ResourceNotFound(type='cluster', id=identity)
 
+        cache[identity] = cluster
         return cluster
 
+    @classmethod
+    def find_many(cls, context, identities, project_safe=True):
+        """Find clusters with the given identities using a single query.
+
+        :param context: An instance of the request context.
+        :param identities: A list of UUIDs, names or short-ids of clusters.
+        :param project_safe: A boolean indicating whether only clusters from
+                             the requesting project are qualified.
+        :return: A dict mapping identities to Cluster objects. Identities
+                 which match no cluster or more than one cluster are not
+                 included.
+        """
+        return cls._find_many(context, identities,
+                              db_api.cluster_get_by_identities,
+                              project_safe=project_safe)
+
     @classmethod
     def get(cls, context, cluster_id, **kwargs):
         obj = db_api.cluster_get(context, cluster_id, **kwargs)
@@ -100,8 +121,8 @@ class Cluster(base.SenlinObject, base.VersionedObjectDictCompat):
         return [cls._from_db_object(context, cls(), obj) for obj in objs]
 
     @classmethod
-    def get_next_index(cls, context, cluster_id):
-        return db_api.cluster_next_index(context, cluster_id)
+    def get_next_index(cls, context, cluster_id, count=1):
+        return db_api.cluster_next_index(context, cluster_id, count=count)
 
     @classmethod
     def count_all(cls, context, **kwargs):
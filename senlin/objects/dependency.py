@@ -38,3 +38,9 @@ class Dependency(base.SenlinObject, base.VersionedObjectDictCompat):
     @classmethod
     def get_dependents(cls, context, action_id):
         return db_api.dependency_get_dependents(context, action_id)
+
+    @classmethod
+    def get_all(cls, context, action_ids):
+        """Get the dependencies from or to any of the given actions."""
+        objs = db_api.dependency_get_all(context, action_ids)
+        return [cls._from_db_object(context, cls(), obj) for obj in objs]
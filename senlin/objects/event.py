@@ -85,3 +85,11 @@ class Event(base.SenlinObject, base.VersionedObjectDictCompat):
     def get_all_by_cluster(cls, context, cluster_id, **kwargs):
         objs = db_api.event_get_all_by_cluster(context, cluster_id, **kwargs)
         return [cls._from_db_object(context, cls(), obj) for obj in objs]
+
+    @classmethod
+    def feed(cls, context, cursor, limit, **kwargs):
+        return db_api.event_feed(context, cursor, limit, **kwargs)
+
+    @classmethod
+    def last_sequence(cls, context):
+        return db_api.event_sequence_last(context)
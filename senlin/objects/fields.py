@@ -34,6 +34,7 @@ DateTimeField = fields.DateTimeField
 DictOfStringsField = fields.DictOfStringsField
 ListOfStringsField = fields.ListOfStringsField
 ListOfEnumField = fields.ListOfEnumField
+EnumField = fields.EnumField
 
 
 class Boolean(fields.FieldType):
@@ -414,6 +415,14 @@ class ObjectField(fields.AutoTypedField):
         super(ObjectField, self).__init__(**kwargs)
 
 
+class ListOfObjectsField(fields.AutoTypedField):
+
+    def __init__(self, objtype, subclasses=False, **kwargs):
+        self.AUTO_TYPE = fields.List(Object(objtype, subclasses))
+        self.objname = objtype
+        super(ListOfObjectsField, self).__init__(**kwargs)
+
+
 class JsonField(fields.AutoTypedField):
     AUTO_TYPE = Json()
 
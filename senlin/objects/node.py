@@ -79,6 +79,22 @@ class Node(base.SenlinObject, base.VersionedObjectDictCompat):
         obj = db_api.node_get(context, obj.id)
         return cls._from_db_object(context, cls(), obj)
 
+    @classmethod
+    def create_many(cls, context, values, actions=None, parent=None):
+        """Create a batch of nodes, and optionally the actions on them.
+
+        :param context: An instance of the request context.
+        :param values: A list of dicts of values for the nodes, each with the
+                       ID of the node.
+        :param actions: An optional list of dicts of values for actions on
+                        the nodes, created in the same transaction.
+        :param parent: An optional dict of values for an action depending on
+                       all the actions, created in the same transaction.
+        """
+        values = [cls._transpose_metadata(v) for v in values]
+        db_api.node_create_many(context, values, actions=actions,
+                                parent=parent)
+
     @classmethod
     def find(cls, context, identity, project_safe=True):
         """Find a node with the given identity.
@@ -93,6 +109,10 @@ class Node(base.SenlinObject, base.VersionedObjectDictCompat):
                  or an exception of ``MultipleChoices`` more than one node
                  found matching the criteria.
         """
+        cache = cls._identity_cache(context, project_safe)
+        if identity in cache:
+            return cache[identity]
+
         node = None
         if uuidutils.is_uuid_like(identity):
             node = cls.get(context, identity, project_safe=project_safe)
@@ -109,8 +129,25 @@ class Node(base.SenlinObject, base.VersionedObjectDictCompat):
         if node is None:
             raise exception.ResourceNotFound(type='node', id=identity)
 
+        cache[identity] = node
         return node
 
+    @classmethod
+    def find_many(cls, context, identities, project_safe=True):
+        """Find nodes with the given identities using a single query.
+
+        :param context: An instance of the request context.
+        :param identities: A list of UUIDs, names or short-ids of nodes.
+        :param project_safe: A boolean indicating whether only nodes from the
+                             same project as the requesting one are qualified
+                             to be returned.
+        :return: A dict mapping identities to Node objects. Identities which
+                 match no node or more than one node are not included.
+        """
+        return cls._find_many(context, identities,
+                              db_api.node_get_by_identities,
+                              project_safe=project_safe)
+
     @classmethod
     def get(cls, context, node_id, **kwargs):
         obj = db_api.node_get(context, node_id, **kwargs)
@@ -143,6 +180,14 @@ class Node(base.SenlinObject, base.VersionedObjectDictCompat):
         """An internal API for retrieving node ids only."""
         return db_api.node_ids_by_cluster(context, cluster_id, filters=filters)
 
+    @classmethod
+    def summaries_by_cluster(cls, context, cluster_id, filters=None,
+                             project_safe=True):
+        """An internal API for retrieving lightweight node summaries."""
+        rows = db_api.node_summary_get_all_by_cluster(
+            context, cluster_id, filters=filters, project_safe=project_safe)
+        return [NodeSummary.from_row(r) for r in rows]
+
     @classmethod
     def count_by_cluster(cls, context, cluster_id, **kwargs):
         return db_api.node_count_by_cluster(context, cluster_id, **kwargs)
@@ -152,6 +197,17 @@ class Node(base.SenlinObject, base.VersionedObjectDictCompat):
         values = cls._transpose_metadata(values)
         db_api.node_update(context, obj_id, values)
 
+    @classmethod
+    def update_many(cls, context, updates):
+        """Update a batch of nodes in one go.
+
+        :param context: The request context.
+        :param updates: A dict mapping node IDs to the values to update.
+        """
+        updates = dict((node_id, cls._transpose_metadata(values))
+                       for node_id, values in updates.items())
+        db_api.node_update_many(context, updates)
+
     @classmethod
     def migrate(cls, context, obj_id, to_cluster, timestamp, role=None):
         return db_api.node_migrate(context, obj_id, to_cluster, timestamp,
@@ -183,3 +239,46 @@ class Node(base.SenlinObject, base.VersionedObjectDictCompat):
             'dependents': self.dependents,
             'profile_name': self.profile_name,
         }
+
+
+class NodeSummary(object):
+    """A compact, read-only view of a node.
+
+    Node summaries carry only the fields needed for placement calculation
+    and victim selection, so that they can be kept in memory for very large
+    clusters at a fraction of the cost of a full ``Node`` object.
+
+    Unlike ``Node``, a summary has no ``profile_created_at`` field, which
+    would cost a profile lookup per node. Callers ordering nodes by profile
+    age look the ages up once with ``Profile.created_at_by_ids`` and pass
+    them to ``scaleutils.nodes_by_profile_age``.
+    """
+
+    __slots__ = ('id', 'status', 'created_at', 'profile_id', 'placement',
+                 'lb_member')
+
+    def __init__(self, id, status, created_at=None, profile_id=None,
+                 placement=None, lb_member=None):
+        self.id = id
+        self.status = status
+        self.created_at = created_at
+        self.profile_id = profile_id
+        self.placement = placement or {}
+        self.lb_member = lb_member
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a summary from a narrow row of node columns."""
+        node_id, status, created_at, profile_id, data = row
+        data = data or {}
+        return cls(node_id, status, created_at=created_at,
+                   profile_id=profile_id, placement=data.get('placement'),
+                   lb_member=data.get('lb_member'))
+
+    @classmethod
+    def from_node(cls, node):
+        """Build a summary from a node object already in memory."""
+        data = node.data or {}
+        return cls(node.id, node.status, created_at=node.created_at,
+                   profile_id=node.profile_id, placement=data.get('placement'),
+                   lb_member=data.get('lb_member'))
@@ -37,3 +37,11 @@ class NodeLock(base.SenlinObject, base.VersionedObjectDictCompat):
     @classmethod
     def steal(cls, node_id, action_id):
         return db_api.node_lock_steal(node_id, action_id)
+
+    @classmethod
+    def acquire_many(cls, node_ids, action_id):
+        return db_api.node_lock_acquire_many(node_ids, action_id)
+
+    @classmethod
+    def release_many(cls, action_id, handover=None):
+        return db_api.node_lock_release_many(action_id, handover=handover)
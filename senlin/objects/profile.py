@@ -57,6 +57,11 @@ class Profile(base.SenlinObject, base.VersionedObjectDictCompat):
         :return: A DB object of profile or an exception `ResourceNotFound`
                  if no matching object is found.
         """
+        cache = cls._identity_cache(context,
+                                    kwargs.get('project_safe', True))
+        if identity in cache:
+            return cache[identity]
+
         if uuidutils.is_uuid_like(identity):
             profile = cls.get(context, identity, **kwargs)
             if not profile:
@@ -69,8 +74,26 @@ class Profile(base.SenlinObject, base.VersionedObjectDictCompat):
         if not profile:
             raise exception.ResourceNotFound(type='profile', id=identity)
 
+        cache[identity] = profile
         return profile
 
+    @classmethod
+    def find_many(cls, context, identities, project_safe=True):
+        """Find profiles with the given identities using a single query.
+
+        :param context: An instance of the request context.
+        :param identities: A list of UUIDs, names or short-ids of profiles.
+        :param project_safe: A boolean indicating whether profiles from
+                             projects other than the requesting one can be
+                             returned.
+        :return: A dict mapping identities to Profile objects. Identities
+                 which match no profile or more than one profile are not
+                 included.
+        """
+        return cls._find_many(context, identities,
+                              db_api.profile_get_by_identities,
+                              project_safe=project_safe)
+
     @classmethod
     def get(cls, context, profile_id, **kwargs):
         obj = db_api.profile_get(context, profile_id, **kwargs)
@@ -89,7 +112,14 @@ class Profile(base.SenlinObject, base.VersionedObjectDictCompat):
     @classmethod
     def get_all(cls, context, **kwargs):
         objs = db_api.profile_get_all(context, **kwargs)
-        return [cls._from_db_object(context, cls(), obj) for obj in objs]
+        # The stored context is not loaded when listing profiles
+        return [cls._from_db_object(context, cls(), obj, exclude=['context'])
+                for obj in objs]
+
+    @classmethod
+    def created_at_by_ids(cls, context, profile_ids):
+        """An internal API for retrieving profile creation time in bulk."""
+        return db_api.profile_created_at_by_ids(context, profile_ids)
 
     @classmethod
     def update(cls, context, obj_id, values):
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from oslo_utils import versionutils
+
 from senlin.common import consts
 from senlin.objects import base
 from senlin.objects import fields
@@ -38,7 +40,15 @@ class ActionListRequest(base.SenlinObject):
     action_name_list = list(consts.CLUSTER_ACTION_NAMES)
     action_name_list.extend(list(consts.NODE_ACTION_NAMES))
 
+    # VERSION 1.0: Initial version
+    # VERSION 1.1: Added field 'ids'
+    VERSION = '1.1'
+    VERSION_MAP = {
+        '1.11': '1.1',
+    }
+
     fields = {
+        'ids': fields.ListOfStringsField(nullable=True),
         'name': fields.ListOfStringsField(nullable=True),
         'action': fields.ListOfEnumField(
             valid_values=action_name_list, nullable=True),
@@ -52,14 +62,41 @@ class ActionListRequest(base.SenlinObject):
         'project_safe': fields.FlexibleBooleanField(default=True)
     }
 
+    def obj_make_compatible(self, primitive, target_version):
+        super(ActionListRequest, self).obj_make_compatible(
+            primitive, target_version)
+        target_version = versionutils.convert_version_to_tuple(target_version)
+        if target_version < (1, 1):
+            if 'ids' in primitive['senlin_object.data']:
+                del primitive['senlin_object.data']['ids']
+
 
 @base.SenlinObjectRegistry.register
 class ActionGetRequest(base.SenlinObject):
 
+    # VERSION 1.0: Initial version
+    # VERSION 1.1: Added fields 'wait' and 'until'
+    VERSION = '1.1'
+    VERSION_MAP = {
+        '1.11': '1.1',
+    }
+
     fields = {
         'identity': fields.StringField(),
+        'wait': fields.NonNegativeIntegerField(nullable=True),
+        'until': fields.EnumField(
+            valid_values=list(consts.ACTION_STATUSES), nullable=True),
     }
 
+    def obj_make_compatible(self, primitive, target_version):
+        super(ActionGetRequest, self).obj_make_compatible(
+            primitive, target_version)
+        target_version = versionutils.convert_version_to_tuple(target_version)
+        if target_version < (1, 1):
+            for field in ('wait', 'until'):
+                if field in primitive['senlin_object.data']:
+                    del primitive['senlin_object.data'][field]
+
 
 @base.SenlinObjectRegistry.register
 class ActionDeleteRequest(base.SenlinObject):
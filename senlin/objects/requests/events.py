@@ -38,6 +38,25 @@ class EventListRequest(base.SenlinObject):
     }
 
 
+@base.SenlinObjectRegistry.register
+class EventFeedRequest(base.SenlinObject):
+
+    action_name_list = EventListRequest.action_name_list
+
+    fields = {
+        'cursor': fields.NonNegativeIntegerField(nullable=True, default=None),
+        'oid': fields.ListOfStringsField(nullable=True),
+        'otype': fields.ListOfStringsField(nullable=True),
+        'action': fields.ListOfEnumField(
+            valid_values=action_name_list, nullable=True),
+        'cluster_id': fields.ListOfStringsField(nullable=True),
+        'level': fields.ListOfEnumField(
+            valid_values=list(consts.EVENT_LEVELS.keys()), nullable=True),
+        'limit': fields.NonNegativeIntegerField(default=100),
+        'project_safe': fields.FlexibleBooleanField(default=True)
+    }
+
+
 @base.SenlinObjectRegistry.register
 class EventGetRequest(base.SenlinObject):
 
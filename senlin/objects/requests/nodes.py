@@ -149,3 +149,35 @@ class NodeAdoptPreviewRequest(base.SenlinObject):
         'overrides': fields.JsonField(nullable=True),
         'snapshot': fields.BooleanField(nullable=True, default=False)
     }
+
+
+@base.SenlinObjectRegistry.register
+class NodeBatchCreateRequest(base.SenlinObject):
+
+    fields = {
+        'nodes': fields.ListOfObjectsField('NodeCreateRequestBody')
+    }
+
+
+@base.SenlinObjectRegistry.register
+class NodeBatchAdoptRequest(base.SenlinObject):
+
+    fields = {
+        'nodes': fields.ListOfObjectsField('NodeAdoptRequest')
+    }
+
+
+@base.SenlinObjectRegistry.register
+class NodeBatchDeleteRequest(base.SenlinObject):
+
+    fields = {
+        'nodes': fields.ListOfObjectsField('NodeDeleteRequest')
+    }
+
+
+@base.SenlinObjectRegistry.register
+class NodeBatchOperationRequest(base.SenlinObject):
+
+    fields = {
+        'nodes': fields.ListOfObjectsField('NodeOperationRequest')
+    }
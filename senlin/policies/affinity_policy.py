@@ -256,7 +256,7 @@ class AffinityPolicy(base.Policy):
             count = 1
         else:  # CLUSTER_RESIZE
             cluster = action.entity
-            current = len(cluster.nodes)
+            current = len(cluster.node_summaries)
             su.parse_resize_params(action, cluster, current)
             if 'creation' not in action.data:
                 return
@@ -35,6 +35,22 @@ Output:
        ]
      }
    }
+
+When 'rolling' is enabled, the update is not performed batch by batch.
+Instead, the nodes are updated in a sliding window and the 'update' data
+contains the settings of the window and the nodes in the order they are to
+be updated:
+
+     'update': {
+       'pause_time': 2,
+       'plan': [...],
+       'rolling': {
+         'width': 2,
+         'min_in_service': 1,
+         'max_failures': 0,
+         'nodes': ['node-id-1', 'node-id-2', ..., 'node-id-5']
+       }
+     }
 """
 import math
 
@@ -65,9 +81,10 @@ class BatchPolicy(base.Policy):
     ]
 
     KEYS = (
-        MIN_IN_SERVICE, MAX_BATCH_SIZE, PAUSE_TIME,
+        MIN_IN_SERVICE, MAX_BATCH_SIZE, PAUSE_TIME, ROLLING, MAX_FAILURES,
     ) = (
-        'min_in_service', 'max_batch_size', 'pause_time',
+        'min_in_service', 'max_batch_size', 'pause_time', 'rolling',
+        'max_failures',
     )
 
     properties_schema = {
@@ -82,7 +99,18 @@ class BatchPolicy(base.Policy):
         PAUSE_TIME: schema.Integer(
             _('Interval in seconds between update batches if any.'),
             default=60,
-        )
+        ),
+        ROLLING: schema.Boolean(
+            _('Whether nodes are updated in a sliding window instead of in '
+              'batches. A node is started as soon as the update of another '
+              'one is done and pause_time is not used.'),
+            default=False,
+        ),
+        MAX_FAILURES: schema.Integer(
+            _('Maximum number of nodes that may fail to be updated before a '
+              'rolling update is aborted.'),
+            default=0,
+        ),
     }
 
     def __init__(self, name, spec, **kwargs):
@@ -91,6 +119,8 @@ class BatchPolicy(base.Policy):
         self.min_in_service = self.properties[self.MIN_IN_SERVICE]
         self.max_batch_size = self.properties[self.MAX_BATCH_SIZE]
         self.pause_time = self.properties[self.PAUSE_TIME]
+        self.rolling = self.properties[self.ROLLING]
+        self.max_failures = self.properties[self.MAX_FAILURES]
 
     def _get_batch_size(self, total):
         """Get batch size for update operation.
@@ -115,23 +145,31 @@ class BatchPolicy(base.Policy):
 
         return batch_size, batch_num
 
-    def _pick_nodes(self, nodes, batch_size, batch_num):
-        """Select nodes based on size and number of batches.
+    def _order_nodes(self, nodes):
+        """Order nodes for update.
 
         :param nodes: list of node objects.
-        :param batch_size: the number of nodes of each batch.
-        :param batch_num: the number of batches.
-        :returns: a list of sets containing the nodes' IDs we
-                  selected based on the input params.
+        :returns: a list of the nodes' IDs in the order of update.
         """
         candidates, good = su.filter_error_nodes(nodes)
-        result = []
         # NOTE: we leave the nodes known to be good (ACTIVE) at the end of the
         # list so that we have a better chance to ensure 'min_in_service'
         # constraint
         for n in good:
             candidates.append(n.id)
+        return candidates
 
+    def _pick_nodes(self, nodes, batch_size, batch_num):
+        """Select nodes based on size and number of batches.
+
+        :param nodes: list of node objects.
+        :param batch_size: the number of nodes of each batch.
+        :param batch_num: the number of batches.
+        :returns: a list of sets containing the nodes' IDs we
+                  selected based on the input params.
+        """
+        candidates = self._order_nodes(nodes)
+        result = []
         for start in range(0, len(candidates), batch_size):
             end = start + batch_size
             result.append(set(candidates[start:end]))
@@ -148,6 +186,14 @@ class BatchPolicy(base.Policy):
 
         batch_size, batch_num = self._get_batch_size(len(nodes))
         plan['plan'] = self._pick_nodes(nodes, batch_size, batch_num)
+        if self.rolling:
+            # the batch size is the width of the sliding window
+            plan['rolling'] = {
+                'width': batch_size,
+                'min_in_service': self.min_in_service,
+                'max_failures': self.max_failures,
+                'nodes': self._order_nodes(nodes),
+            }
 
         return True, plan
 
@@ -23,6 +23,7 @@ from senlin.common import consts
 from senlin.common.i18n import _
 from senlin.common import scaleutils as su
 from senlin.common import schema
+from senlin.objects import profile as po
 from senlin.policies import base
 
 LOG = logging.getLogger(__name__)
@@ -145,38 +146,24 @@ class DeletionPolicy(base.Policy):
             self.REDUCE_DESIRED_CAPACITY]
         self.hooks = self.properties[self.HOOKS]
 
-    def _victims_by_regions(self, cluster, regions):
+    def _victims_by_regions(self, cluster, regions, profile_ages=None):
         victims = []
         for region in sorted(regions.keys()):
             count = regions[region]
             nodes = cluster.nodes_by_region(region)
-            if self.criteria == self.RANDOM:
-                candidates = su.nodes_by_random(nodes, count)
-            elif self.criteria == self.OLDEST_PROFILE_FIRST:
-                candidates = su.nodes_by_profile_age(nodes, count)
-            elif self.criteria == self.OLDEST_FIRST:
-                candidates = su.nodes_by_age(nodes, count, True)
-            else:
-                candidates = su.nodes_by_age(nodes, count, False)
-
+            candidates = su.select_victims(nodes, count, self.criteria,
+                                           profile_ages=profile_ages)
             victims.extend(candidates)
 
         return victims
 
-    def _victims_by_zones(self, cluster, zones):
+    def _victims_by_zones(self, cluster, zones, profile_ages=None):
         victims = []
         for zone in sorted(zones.keys()):
             count = zones[zone]
             nodes = cluster.nodes_by_zone(zone)
-            if self.criteria == self.RANDOM:
-                candidates = su.nodes_by_random(nodes, count)
-            elif self.criteria == self.OLDEST_PROFILE_FIRST:
-                candidates = su.nodes_by_profile_age(nodes, count)
-            elif self.criteria == self.OLDEST_FIRST:
-                candidates = su.nodes_by_age(nodes, count, True)
-            else:
-                candidates = su.nodes_by_age(nodes, count, False)
-
+            candidates = su.select_victims(nodes, count, self.criteria,
+                                           profile_ages=profile_ages)
             victims.extend(candidates)
 
         return victims
@@ -233,7 +220,7 @@ class DeletionPolicy(base.Policy):
 
         # No policy decision, check action itself: RESIZE
         else:
-            current = len(cluster.nodes)
+            current = len(cluster.node_summaries)
             res, reason = su.parse_resize_params(action, cluster, current)
             if res == base.CHECK_ERROR:
                 action.data['status'] = base.CHECK_ERROR
@@ -245,29 +232,31 @@ class DeletionPolicy(base.Policy):
                 return
             count = action.data['deletion']['count']
 
+        nodes = cluster.node_summaries
+        profile_ages = None
+        if self.criteria == self.OLDEST_PROFILE_FIRST:
+            # Look up all profile timestamps at once instead of per node
+            profile_ages = po.Profile.created_at_by_ids(
+                action.context, set(n.profile_id for n in nodes))
+
         # Cross-region
         if regions:
-            victims = self._victims_by_regions(cluster, regions)
+            victims = self._victims_by_regions(cluster, regions,
+                                               profile_ages=profile_ages)
             self._update_action(action, victims)
             return
 
         # Cross-AZ
         if zones:
-            victims = self._victims_by_zones(cluster, zones)
+            victims = self._victims_by_zones(cluster, zones,
+                                             profile_ages=profile_ages)
             self._update_action(action, victims)
             return
 
-        if count > len(cluster.nodes):
-            count = len(cluster.nodes)
-
-        if self.criteria == self.RANDOM:
-            victims = su.nodes_by_random(cluster.nodes, count)
-        elif self.criteria == self.OLDEST_PROFILE_FIRST:
-            victims = su.nodes_by_profile_age(cluster.nodes, count)
-        elif self.criteria == self.OLDEST_FIRST:
-            victims = su.nodes_by_age(cluster.nodes, count, True)
-        else:
-            victims = su.nodes_by_age(cluster.nodes, count, False)
+        if count > len(nodes):
+            count = len(nodes)
 
+        victims = su.select_victims(nodes, count, self.criteria,
+                                    profile_ages=profile_ages)
         self._update_action(action, victims)
         return
@@ -239,7 +239,7 @@ class HealthPolicy(base.Policy):
                 return True
 
             cluster = action.entity
-            current = len(cluster.nodes)
+            current = len(cluster.node_summaries)
             res, reason = scaleutils.parse_resize_params(action, cluster,
                                                          current)
             if res == base.CHECK_ERROR:
@@ -285,7 +285,7 @@ class HealthPolicy(base.Policy):
                 return True
 
             cluster = action.entity
-            current = len(cluster.nodes)
+            current = len(cluster.node_summaries)
             res, reason = scaleutils.parse_resize_params(action, cluster,
                                                          current)
             if res == base.CHECK_ERROR:
@@ -364,21 +364,24 @@ class LoadBalancingPolicy(base.Policy):
         port = self.pool_spec.get(self.POOL_PROTOCOL_PORT)
         subnet = self.pool_spec.get(self.POOL_SUBNET)
 
-        for node in cluster.nodes:
-            member_id = lb_driver.member_add(node, data['loadbalancer'],
-                                             data['pool'], port, subnet)
-            if member_id is None:
-                # When failed in adding member, remove all lb resources that
+        nodes = cluster.nodes
+        if nodes:
+            members = lb_driver.members_add(nodes, data['loadbalancer'],
+                                            data['pool'], port, subnet)
+            if None in members.values():
+                # When failed in adding members, remove all lb resources that
                 # were created and return the failure reason.
-                # TODO(anyone): May need to "roll-back" changes caused by any
-                # successful member_add() calls.
+                # TODO(anyone): May need to "roll-back" the members that were
+                # added successfully.
                 if not self.lb:
                     lb_driver.lb_delete(**data)
                 return False, 'Failed in adding node into lb pool'
 
-            node.data.update({'lb_member': member_id})
-            values = {'data': node.data}
-            no.Node.update(oslo_context.get_current(), node.id, values)
+            updates = {}
+            for node in nodes:
+                node.data.update({'lb_member': members[node.id]})
+                updates[node.id] = {'data': node.data}
+            no.Node.update_many(oslo_context.get_current(), updates)
 
         cluster_data_lb = cluster.data.get('loadbalancers', {})
         cluster_data_lb[self.id] = {'vip_address': data.pop('vip_address')}
@@ -455,7 +458,7 @@ class LoadBalancingPolicy(base.Policy):
             elif action.action == consts.CLUSTER_RESIZE:
                 # Calculate deletion count based on action input
                 cluster = action.entity
-                current = len(cluster.nodes)
+                current = len(cluster.node_summaries)
                 scaleutils.parse_resize_params(action, cluster, current)
                 if 'deletion' not in action.data:
                     return []
@@ -472,7 +475,7 @@ class LoadBalancingPolicy(base.Policy):
         if candidates is None:
             if count == 0:
                 return []
-            nodes = action.entity.nodes
+            nodes = action.entity.node_summaries
             if count > len(nodes):
                 count = len(nodes)
             candidates = scaleutils.nodes_by_random(nodes, count)
@@ -492,19 +495,38 @@ class LoadBalancingPolicy(base.Policy):
         lb_id = policy_data['loadbalancer']
         pool_id = policy_data['pool']
 
-        failed_nodes = []
-        for node_id in candidates:
-            node = no.Node.get(context, node_id=node_id)
+        members = {}
+        nodes = no.Node.get_all(context, filters={'id': candidates})
+        for node in nodes:
             node_data = node.data or {}
             member_id = node_data.get('lb_member', None)
             if member_id is None:
                 LOG.warning('Node %(n)s not found in lb pool %(p)s.',
-                            {'n': node_id, 'p': pool_id})
+                            {'n': node.id, 'p': pool_id})
                 continue
+            members[node.id] = member_id
+
+        if not members:
+            return []
+
+        # A single member is removed on its own so that concurrent node
+        # actions never overwrite the pool with a stale member list.
+        if len(members) == 1:
+            member_id = list(members.values())[0]
+            results = {
+                member_id: driver.member_remove(lb_id, pool_id, member_id)
+            }
+        else:
+            results = driver.members_remove(lb_id, pool_id,
+                                            list(members.values()))
 
-            res = driver.member_remove(lb_id, pool_id, member_id)
+        failed_nodes = []
+        updates = {}
+        for node in nodes:
+            if node.id not in members:
+                continue
             values = {}
-            if res is not True and handle_err is True:
+            if results.get(members[node.id]) is not True and handle_err:
                 failed_nodes.append(node.id)
                 values['status'] = consts.NS_WARNING
                 values['status_reason'] = _(
@@ -512,7 +534,8 @@ class LoadBalancingPolicy(base.Policy):
             else:
                 node.data.pop('lb_member', None)
                 values['data'] = node.data
-            no.Node.update(context, node_id, values)
+            updates[node.id] = values
+        no.Node.update_many(context, updates)
 
         return failed_nodes
 
@@ -524,17 +547,32 @@ class LoadBalancingPolicy(base.Policy):
         port = self.pool_spec.get(self.POOL_PROTOCOL_PORT)
         subnet = self.pool_spec.get(self.POOL_SUBNET)
 
-        failed_nodes = []
-        for node_id in candidates:
-            node = no.Node.get(context, node_id=node_id)
+        nodes = []
+        for node in no.Node.get_all(context, filters={'id': candidates}):
             node_data = node.data or {}
-            member_id = node_data.get('lb_member', None)
-            if member_id:
+            if node_data.get('lb_member', None):
                 LOG.warning('Node %(n)s already in lb pool %(p)s.',
-                            {'n': node_id, 'p': pool_id})
+                            {'n': node.id, 'p': pool_id})
                 continue
+            nodes.append(node)
+
+        if not nodes:
+            return []
+
+        # A single member is added on its own so that concurrent node
+        # actions never overwrite the pool with a stale member list.
+        if len(nodes) == 1:
+            members = {
+                nodes[0].id: driver.member_add(nodes[0], lb_id, pool_id,
+                                               port, subnet)
+            }
+        else:
+            members = driver.members_add(nodes, lb_id, pool_id, port, subnet)
 
-            member_id = driver.member_add(node, lb_id, pool_id, port, subnet)
+        failed_nodes = []
+        updates = {}
+        for node in nodes:
+            member_id = members.get(node.id)
             values = {}
             if member_id is None:
                 failed_nodes.append(node.id)
@@ -544,7 +582,8 @@ class LoadBalancingPolicy(base.Policy):
             else:
                 node.data.update({'lb_member': member_id})
                 values['data'] = node.data
-            no.Node.update(context, node_id, values)
+            updates[node.id] = values
+        no.Node.update_many(context, updates)
 
         return failed_nodes
 
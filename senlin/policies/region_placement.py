@@ -204,7 +204,7 @@ class RegionPlacementPolicy(base.Policy):
                 return action.data['creation']['count']
 
             cluster = action.entity
-            curr = len(cluster.nodes)
+            curr = len(cluster.node_summaries)
             res = scaleutils.parse_resize_params(action, cluster, curr)
             if res[0] == base.CHECK_ERROR:
                 action.data['status'] = base.CHECK_ERROR
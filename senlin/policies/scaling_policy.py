@@ -189,7 +189,7 @@ class ScalingPolicy(base.Policy):
         # Use action input if count is provided
         count_value = action.inputs.get('count', None)
         cluster = action.entity
-        current = len(cluster.nodes)
+        current = len(cluster.node_summaries)
 
         if count_value is None:
             # count not specified, calculate it
@@ -13,6 +13,8 @@
 import copy
 import inspect
 
+import eventlet
+from oslo_config import cfg
 from oslo_context import context as oslo_context
 from oslo_log import log as logging
 from oslo_utils import timeutils
@@ -264,6 +266,80 @@ class Profile(object):
         profile = cls.load(ctx, profile_id=obj.profile_id)
         return profile.do_get_details(obj)
 
+    @classmethod
+    @profiler.trace('Profile.get_details_many', hide_args=False)
+    def get_details_many(cls, ctx, profile_id, objs):
+        """Get details of many objects in one pass.
+
+        :param ctx: Request context.
+        :param profile_id: ID of the profile shared by the objects.
+        :param objs: A list of node objects created from the profile.
+        :returns: A dict with node IDs as keys and detail dicts as values.
+        """
+        profile = cls.load(ctx, profile_id=profile_id)
+        try:
+            result = profile.do_get_details_many(objs)
+        except NotImplementedError:
+            result = {}
+
+        # Objects not covered by a bulk query are queried concurrently
+        rest = [obj for obj in objs if obj.id not in result]
+        pool = eventlet.GreenPool(cfg.CONF.collect_concurrency)
+        for obj, details in zip(rest, pool.imap(profile.do_get_details,
+                                                rest)):
+            result[obj.id] = details
+        return result
+
+    @classmethod
+    @profiler.trace('Profile.get_placements', hide_args=False)
+    def get_placements(cls, ctx, profile_id, objs):
+        """Get placement of many objects in one pass.
+
+        :param ctx: Request context.
+        :param profile_id: ID of the profile shared by the objects.
+        :param objs: A list of node objects created from the profile.
+        :returns: A dict with node IDs as keys and placement dicts as values,
+            e.g. {'zone': 'az1'}. Nodes whose placement cannot be resolved
+            are omitted.
+        """
+        profile = cls.load(ctx, profile_id=profile_id)
+        try:
+            return profile.do_get_placements(objs)
+        except NotImplementedError:
+            pass
+
+        result = {}
+        for obj in objs:
+            details = profile.do_get_details(obj)
+            zone = details.get('OS-EXT-AZ:availability_zone', None)
+            if zone:
+                result[obj.id] = {'zone': zone}
+        return result
+
+    @classmethod
+    @profiler.trace('Profile.prepare_objects', hide_args=False)
+    def prepare_objects(cls, ctx, profile_id, objs):
+        """Prepare resources shared by many objects before creation.
+
+        :param ctx: Request context.
+        :param profile_id: ID of the profile shared by the objects.
+        :param objs: A list of node objects to be created from the profile.
+        """
+        profile = cls.load(ctx, profile_id=profile_id)
+        return profile.do_prepare(objs)
+
+    @classmethod
+    @profiler.trace('Profile.release_objects', hide_args=False)
+    def release_objects(cls, ctx, profile_id, objs):
+        """Release resources prepared for objects which are not created.
+
+        :param ctx: Request context.
+        :param profile_id: ID of the profile shared by the objects.
+        :param objs: A list of node objects prepared by `prepare_objects`.
+        """
+        profile = cls.load(ctx, profile_id=profile_id)
+        return profile.do_release(objs)
+
     @classmethod
     @profiler.trace('Profile.adopt_node', hide_args=False)
     def adopt_node(cls, ctx, obj, type_name, overrides=None, snapshot=False):
@@ -464,6 +540,22 @@ class Profile(object):
         LOG.warning("Get_details operation not supported.")
         return {}
 
+    def do_get_details_many(self, objs):
+        """For subclass to override."""
+        raise NotImplementedError
+
+    def do_get_placements(self, objs):
+        """For subclass to override."""
+        raise NotImplementedError
+
+    def do_prepare(self, objs):
+        """For subclass to override."""
+        return
+
+    def do_release(self, objs):
+        """For subclass to override."""
+        return
+
     def do_adopt(self, obj, overrides=None, snapshot=False):
         """For subclass to override."""
         LOG.warning("Adopt operation not supported.")
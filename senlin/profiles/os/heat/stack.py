@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from oslo_config import cfg
 from oslo_log import log as logging
 import six
 
@@ -272,6 +273,9 @@ class StackProfile(base.Profile):
             return False
 
         hc = self.orchestration(obj)
+        if cfg.CONF.stack_check_mode == 'status':
+            return self._check_status(hc, stack_id)
+
         try:
             # Timeout = None means we will use the 'default_action_timeout'
             # It can be overridden by the TIMEOUT profile properties
@@ -287,6 +291,26 @@ class StackProfile(base.Profile):
 
         return True
 
+    def _check_status(self, hc, stack_id):
+        """Check a stack by its status in the shared stack listing.
+
+        :param hc: The orchestration driver.
+        :param stack_id: ID of the stack to check.
+        :returns: True if the stack is not failed or being deleted, or False
+                  otherwise.
+        """
+        try:
+            stack = hc.stack_status(stack_id)
+        except exc.InternalError as ex:
+            raise exc.EResourceOperation(op='checking', type='stack',
+                                         id=stack_id,
+                                         message=six.text_type(ex))
+
+        if stack is None:
+            return False
+        status = (stack.status or '').upper()
+        return not (status.endswith('_FAILED') or status.startswith('DELETE'))
+
     def do_get_details(self, obj):
         if not obj.physical_id:
             return {}
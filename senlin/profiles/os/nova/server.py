@@ -13,6 +13,8 @@
 import base64
 import copy
 
+import eventlet
+from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import encodeutils
 import six
@@ -23,6 +25,7 @@ from senlin.common import context
 from senlin.common import exception as exc
 from senlin.common.i18n import _
 from senlin.common import schema
+from senlin.engine import lookup_cache
 from senlin.objects import node as node_obj
 from senlin.profiles import base
 
@@ -334,9 +337,27 @@ class ServerProfile(base.Profile):
         super(ServerProfile, self).__init__(type_name, name, **kwargs)
         self.server_id = None
 
+    def _lookup(self, obj, rtype, name_or_id, loader):
+        """Resolve a resource through the engine wide lookup cache.
+
+        :param obj: The node object.
+        :param rtype: The type of the resource, e.g. 'flavor'.
+        :param name_or_id: The name or ID of the resource.
+        :param loader: A callable doing the lookup on a cache miss.
+        :returns: The value returned from the loader.
+        """
+        region = (self.context.get('region_name') or
+                  cfg.CONF.default_region_name)
+        # keypairs are owned by users rather than projects
+        owner = obj.user if rtype == 'keypair' else obj.project
+        key = (owner, region, rtype, name_or_id)
+        return lookup_cache.global_cache().get(key, loader)
+
     def _validate_az(self, obj, az_name, reason=None):
         try:
-            res = self.compute(obj).validate_azs([az_name])
+            res = self._lookup(
+                obj, 'availability_zone', az_name,
+                lambda: self.compute(obj).validate_azs([az_name]))
         except exc.InternalError as ex:
             if reason == 'create':
                 raise exc.EResourceCreation(type='server',
@@ -358,7 +379,9 @@ class ServerProfile(base.Profile):
         flavor = None
         msg = ''
         try:
-            flavor = self.compute(obj).flavor_find(name_or_id, False)
+            flavor = self._lookup(
+                obj, 'flavor', name_or_id,
+                lambda: self.compute(obj).flavor_find(name_or_id, False))
         except exc.InternalError as ex:
             msg = six.text_type(ex)
             if reason is None:  # reason is 'validate'
@@ -385,7 +408,9 @@ class ServerProfile(base.Profile):
 
     def _validate_image(self, obj, name_or_id, reason=None):
         try:
-            return self.compute(obj).image_find(name_or_id, False)
+            return self._lookup(
+                obj, 'image', name_or_id,
+                lambda: self.compute(obj).image_find(name_or_id, False))
         except exc.InternalError as ex:
             if reason == 'create':
                 raise exc.EResourceCreation(type='server',
@@ -402,7 +427,9 @@ class ServerProfile(base.Profile):
 
     def _validate_keypair(self, obj, name_or_id, reason=None):
         try:
-            return self.compute(obj).keypair_find(name_or_id, False)
+            return self._lookup(
+                obj, 'keypair', name_or_id,
+                lambda: self.compute(obj).keypair_find(name_or_id, False))
         except exc.InternalError as ex:
             if reason == 'create':
                 raise exc.EResourceCreation(type='server',
@@ -482,10 +509,10 @@ class ServerProfile(base.Profile):
 
         return bdm
 
-    def _check_security_groups(self, nc, net_spec, result):
+    def _check_security_groups(self, obj, net_spec, result):
         """Check security groups.
 
-        :param nc: network driver connection.
+        :param obj: the node object.
         :param net_spec: the specification to check.
         :param result: the result that is used as return value.
         :returns: None if succeeded or an error message if things go wrong.
@@ -497,7 +524,9 @@ class ServerProfile(base.Profile):
         res = []
         try:
             for sg in sgs:
-                sg_obj = nc.security_group_find(sg)
+                sg_obj = self._lookup(
+                    obj, 'security_group', sg,
+                    lambda: self.network(obj).security_group_find(sg))
                 res.append(sg_obj.id)
         except exc.InternalError as ex:
             return six.text_type(ex)
@@ -505,10 +534,10 @@ class ServerProfile(base.Profile):
         result[self.PORT_SECURITY_GROUPS] = res
         return
 
-    def _check_network(self, nc, net, result):
+    def _check_network(self, obj, net, result):
         """Check the specified network.
 
-        :param nc: network driver connection.
+        :param obj: the node object.
         :param net: the name or ID of network to check.
         :param result: the result that is used as return value.
         :returns: None if succeeded or an error message if things go wrong.
@@ -516,7 +545,8 @@ class ServerProfile(base.Profile):
         if net is None:
             return
         try:
-            net_obj = nc.network_get(net)
+            net_obj = self._lookup(obj, 'network', net,
+                                   lambda: self.network(obj).network_get(net))
             result[self.NETWORK] = net_obj.id
         except exc.InternalError as ex:
             return six.text_type(ex)
@@ -542,10 +572,10 @@ class ServerProfile(base.Profile):
         except exc.InternalError as ex:
             return six.text_type(ex)
 
-    def _check_floating_ip(self, nc, net_spec, result):
+    def _check_floating_ip(self, obj, net_spec, result):
         """Check floating IP and network, if specified.
 
-        :param nc: network driver connection.
+        :param obj: the node object.
         :param net_spec: the specification to check.
         :param result: the result that is used as return value.
         :returns: None if succeeded or an error message if things go wrong.
@@ -553,7 +583,9 @@ class ServerProfile(base.Profile):
         net = net_spec.get(self.FLOATING_NETWORK)
         if net:
             try:
-                net_obj = nc.network_get(net)
+                net_obj = self._lookup(
+                    obj, 'network', net,
+                    lambda: self.network(obj).network_get(net))
                 result[self.FLOATING_NETWORK] = net_obj.id
             except exc.InternalError as ex:
                 return six.text_type(ex)
@@ -564,7 +596,7 @@ class ServerProfile(base.Profile):
 
         try:
             # Find floating ip with this address
-            fip = nc.floatingip_find(flt_ip)
+            fip = self.network(obj).floatingip_find(flt_ip)
             if fip:
                 if fip.status == 'ACTIVE':
                     return _('the floating IP %s has been used.') % flt_ip
@@ -598,7 +630,7 @@ class ServerProfile(base.Profile):
 
         # check network
         net = net_spec.get(self.NETWORK)
-        error = self._check_network(nc, net, result)
+        error = self._check_network(obj, net, result)
         _verify(error)
 
         # check port
@@ -619,11 +651,11 @@ class ServerProfile(base.Profile):
             result[self.FIXED_IP] = fixed_ip
 
         # Check security_groups
-        error = self._check_security_groups(nc, net_spec, result)
+        error = self._check_security_groups(obj, net_spec, result)
         _verify(error)
 
         # Check floating IP
-        error = self._check_floating_ip(nc, net_spec, result)
+        error = self._check_floating_ip(obj, net_spec, result)
         _verify(error)
 
         return result
@@ -727,7 +759,18 @@ class ServerProfile(base.Profile):
         if not networks:
             return []
 
-        for net_spec in networks:
+        prepared = None
+        if action_type == 'create':
+            prepared = obj.data.pop('prepared_ports', None)
+            if prepared and len(prepared) != len(networks):
+                prepared = None
+
+        for index, net_spec in enumerate(networks):
+            # Use the port allocated for this node by do_prepare
+            if prepared and prepared[index]:
+                internal_ports.append(prepared[index])
+                continue
+
             net = self._validate_network(obj, net_spec, action_type)
             # Create port
             port, ex = self._get_port(obj, net)
@@ -769,6 +812,126 @@ class ServerProfile(base.Profile):
             node_obj.Node.update(self.context, obj.id, {'data': node_data})
         return internal_ports
 
+    def _remove_ports(self, obj, ports):
+        """Remove ports and floating IPs created by senlin.
+
+        Errors are logged and ignored so that all ports are tried.
+
+        :param obj: The node object.
+        :param ports: A list of port attributes as saved in node data.
+        """
+        nc = self.network(obj)
+        for port in ports:
+            try:
+                floating = port.get('floating', None)
+                if floating and floating.get('remove', False):
+                    nc.floatingip_delete(floating['id'])
+                nc.port_delete(port['id'])
+            except exc.InternalError as ex:
+                LOG.warning("Failed in removing port %(p)s: %(ex)s",
+                            {'p': port['id'], 'ex': ex})
+
+    def _is_poolable(self, net_spec):
+        """Check if ports of a network spec can be created in bulk.
+
+        Ports that are looked up, or carry an address that can only be
+        used once, have to be handled by each node individually.
+        """
+        return (net_spec.get(self.NETWORK) is not None and
+                net_spec.get(self.PORT) is None and
+                not net_spec.get(self.FIXED_IP) and
+                not net_spec.get(self.FLOATING_IP))
+
+    def do_prepare(self, objs):
+        """Allocate ports for many nodes before they are created.
+
+        Each network of the profile is validated only once. The ports of
+        all nodes on a network are created with a single bulk request and
+        saved into node data as 'prepared_ports', a list aligned with the
+        networks property, for `do_create` to pick up. Networks that cannot
+        be shared by the nodes are left to `do_create`. Any failure here is
+        logged, removes the ports created and leaves all networks to
+        `do_create`.
+
+        :param objs: A list of node objects to be created from the profile.
+        """
+        networks = self.properties[self.NETWORKS]
+        if not networks or len(objs) < 2:
+            return
+
+        obj = objs[0]
+        nc = self.network(obj)
+        prepared = dict((o.id, [None] * len(networks)) for o in objs)
+        created = []
+        try:
+            for index, net_spec in enumerate(networks):
+                if not self._is_poolable(net_spec):
+                    continue
+
+                net = self._validate_network(obj, net_spec, 'create')
+                port_attr = {'network_id': net[self.NETWORK]}
+                security_groups = net.get(self.PORT_SECURITY_GROUPS, [])
+                if security_groups:
+                    port_attr['security_groups'] = security_groups
+                ports = nc.port_create_bulk([dict(port_attr) for o in objs])
+
+                for node, port in zip(objs, ports):
+                    port_attrs = {
+                        'id': port.id,
+                        'network_id': port.network_id,
+                        'security_group_ids': port.security_group_ids,
+                        'fixed_ips': port.fixed_ips,
+                        'remove': True,
+                    }
+                    created.append(port_attrs)
+                    prepared[node.id][index] = port_attrs
+
+                if self.FLOATING_NETWORK not in net:
+                    continue
+                # There is no bulk API for floating IPs
+                for node in objs:
+                    port_attrs = prepared[node.id][index]
+                    fip, ex = self._get_floating_ip(obj, net,
+                                                    port_attrs['id'])
+                    if ex:
+                        raise ex
+                    port_attrs['floating'] = {
+                        'id': fip.id,
+                        'floating_ip_address': fip.floating_ip_address,
+                        'floating_network_id': fip.floating_network_id,
+                        'remove': True,
+                    }
+
+            if not created:
+                return
+
+            updates = {}
+            for node in objs:
+                data = dict(node.data, prepared_ports=prepared[node.id])
+                updates[node.id] = {'data': data}
+            node_obj.Node.update_many(self.context, updates)
+        except Exception as ex:
+            LOG.warning("Failed in preparing ports for %(n)s nodes, they "
+                        "will be created per node: %(ex)s",
+                        {'n': len(objs), 'ex': ex})
+            self._remove_ports(obj, created)
+            return
+
+        for node in objs:
+            node.data['prepared_ports'] = prepared[node.id]
+
+    def do_release(self, objs):
+        """Remove the ports prepared by `do_prepare` for nodes not created.
+
+        :param objs: A list of node objects which have no server.
+        """
+        for obj in objs:
+            prepared = obj.data.pop('prepared_ports', None)
+            if prepared:
+                self._remove_ports(obj, [p for p in prepared if p])
+                node_obj.Node.update(self.context, obj.id,
+                                     {'data': obj.data})
+
     def _build_metadata(self, obj, usermeta):
         """Build custom metadata for server.
 
@@ -879,8 +1042,7 @@ class ServerProfile(base.Profile):
         resource_id = None
         try:
             server = self.compute(obj).server_create(**kwargs)
-            self.compute(obj).wait_for_server(server.id)
-            server = self.compute(obj).server_get(server.id)
+            server = self.compute(obj).wait_for_server(server.id)
             # Update zone placement info if available
             self._update_zone_info(obj, server)
             return server.id
@@ -903,6 +1065,8 @@ class ServerProfile(base.Profile):
         """
         server_id = obj.physical_id
         if not server_id:
+            # Release ports prepared for a server that was never created
+            self.do_release([obj])
             return True
 
         ignore_missing = params.get('ignore_missing', True)
@@ -1259,6 +1423,41 @@ class ServerProfile(base.Profile):
         return True
 
     def do_get_details(self, obj):
+        if obj.physical_id is None or obj.physical_id == '':
+            return {}
+
+        driver = self.compute(obj)
+        try:
+            server = driver.server_get(obj.physical_id)
+        except exc.InternalError as ex:
+            return {
+                'Error': {
+                    'code': ex.code,
+                    'message': six.text_type(ex)
+                }
+            }
+
+        if server is None:
+            return {}
+        return self._server_details(server)
+
+    def do_get_details_many(self, objs):
+        """Get details of many servers.
+
+        :param objs: A list of node objects created from this profile.
+        :returns: A dict with node IDs as keys and detail dicts as values.
+            Servers that are not found are omitted.
+        """
+        try:
+            servers = self._get_servers(objs)
+        except exc.InternalError as ex:
+            LOG.warning('Failed listing servers: %s', ex)
+            return {}
+
+        return dict((node_id, self._server_details(server))
+                    for node_id, server in servers.items())
+
+    def _server_details(self, server):
         known_keys = {
             'OS-DCF:diskConfig',
             'OS-EXT-AZ:availability_zone',
@@ -1279,22 +1478,6 @@ class ServerProfile(base.Profile):
             'status',
             'updated'
         }
-        if obj.physical_id is None or obj.physical_id == '':
-            return {}
-
-        driver = self.compute(obj)
-        try:
-            server = driver.server_get(obj.physical_id)
-        except exc.InternalError as ex:
-            return {
-                'Error': {
-                    'code': ex.code,
-                    'message': six.text_type(ex)
-                }
-            }
-
-        if server is None:
-            return {}
         server_data = server.to_dict()
         if 'id' in server_data['image']:
             image_id = server_data['image']['id']
@@ -1347,6 +1530,59 @@ class ServerProfile(base.Profile):
 
         return dict((k, details[k]) for k in sorted(details))
 
+    def _get_servers(self, objs):
+        """Get the servers of many nodes.
+
+        The servers of no more nodes than `collect_concurrency` are fetched
+        concurrently one by one, which takes about as long as a single
+        listing. The servers of more nodes are found by listing the servers
+        of the project, which stops at the page holding the last of them.
+        Nova only allows administrators to filter servers by ID.
+
+        :param objs: A list of node objects created from this profile.
+        :returns: A dict with node IDs as keys and servers as values.
+            Servers that are not found are omitted.
+        :raises: `InternalError` if listing the servers failed.
+        """
+        servers = dict((o.physical_id, o.id) for o in objs if o.physical_id)
+        if not servers:
+            return {}
+
+        driver = self.compute(objs[0])
+        if len(servers) <= cfg.CONF.collect_concurrency:
+            def get_server(physical_id):
+                try:
+                    return driver.server_get(physical_id)
+                except exc.InternalError as ex:
+                    LOG.warning('Failed getting server %(s)s: %(ex)s',
+                                {'s': physical_id, 'ex': ex})
+                    return None
+
+            pool = eventlet.GreenPool(len(servers))
+            found = pool.imap(get_server, list(servers))
+        else:
+            found = driver.server_list(details=True)
+
+        result = {}
+        for server in found:
+            node_id = servers.get(server.id, None) if server else None
+            if node_id:
+                result[node_id] = server
+                if len(result) == len(servers):
+                    break
+        return result
+
+    def do_get_placements(self, objs):
+        """Get availability zones of many servers.
+
+        :param objs: A list of node objects created from this profile.
+        :returns: A dict with node IDs as keys and placement dicts as values.
+        """
+        servers = self._get_servers(objs)
+        return dict((node_id, {'zone': server.availability_zone})
+                    for node_id, server in servers.items()
+                    if server.availability_zone)
+
     def _get_image_id(self, obj, server, op):
         """Get image id.
 
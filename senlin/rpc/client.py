@@ -40,16 +40,23 @@ class EngineClient(object):
     def make_msg(method, **kwargs):
         return method, kwargs
 
-    def call(self, ctxt, method, req, version=None):
+    def call(self, ctxt, method, req, version=None, timeout=None):
         """The main entry for invoking engine service.
 
         :param ctxt: The request context object.
         :param method: The name of the method to be invoked.
         :param req: A dict containing a request object.
         :param version: The engine RPC API version requested.
+        :param timeout: Seconds to wait for a response, overriding the
+                        default RPC response timeout.
         """
+        options = {}
         if version is not None:
-            client = self._client.prepare(version=version)
+            options['version'] = version
+        if timeout is not None:
+            options['timeout'] = timeout
+        if options:
+            client = self._client.prepare(**options)
         else:
             client = self._client
 
@@ -0,0 +1,131 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark for compute API calls made while waiting on new servers.
+
+Run with::
+
+    python -m senlin.tests.benchmark.server_watch [--nodes 100,500]
+
+Each node creates a server through the fake compute driver and waits for
+it to become ACTIVE, either by polling the server on its own or through
+the shared server watcher. Time is scaled down so that one polling
+interval lasts a few milliseconds. The result is printed as a JSON
+document with the number of compute API calls for each scale-out size.
+"""
+
+import argparse
+import collections
+import json
+import random
+import sys
+import time
+
+import eventlet
+from oslo_utils import uuidutils
+
+from senlin.common import consts
+from senlin.drivers.os_test import nova_v2
+from senlin.drivers import sdk
+from senlin.drivers import server_watcher
+
+DEFAULT_NODES = (100, 500)
+INTERVAL = 0.005
+BUILD_INTERVALS = (5, 30)
+
+
+class FakeCompute(nova_v2.NovaClient):
+    """Fake compute driver with servers that take time to build."""
+
+    def __init__(self, cloud, params):
+        super(FakeCompute, self).__init__(params)
+        self.conn_params = params
+        self.cloud = cloud
+
+    def _server(self, server_id):
+        ready_at = self.cloud.servers[server_id]
+        status = 'ACTIVE' if time.time() >= ready_at else 'BUILD'
+        return sdk.FakeResourceObject({'id': server_id, 'status': status})
+
+    def server_create(self, **attrs):
+        self.cloud.calls['server_create'] += 1
+        server_id = uuidutils.generate_uuid()
+        build = random.uniform(*BUILD_INTERVALS) * INTERVAL
+        self.cloud.servers[server_id] = time.time() + build
+        return sdk.FakeResourceObject({'id': server_id, 'status': 'BUILD'})
+
+    def server_get(self, server):
+        self.cloud.calls['server_get'] += 1
+        return self._server(server)
+
+    def server_list(self, details=True, **query):
+        self.cloud.calls['server_list'] += 1
+        return [self._server(s) for s in self.cloud.servers]
+
+
+class FakeCloud(object):
+
+    def __init__(self):
+        self.servers = {}
+        self.calls = collections.Counter()
+
+
+def poll(driver):
+    """Wait on a server the way the SDK does, with one GET per interval."""
+    server = driver.server_create(name='node')
+    while driver.server_get(server.id).status != consts.VS_ACTIVE:
+        eventlet.sleep(INTERVAL)
+    return driver.server_get(server.id)
+
+
+def watch(driver):
+    server = driver.server_create(name='node')
+    return server_watcher.global_watcher().wait(driver, server.id,
+                                                timeout=60)
+
+
+def run(nodes):
+    server_watcher._watcher = server_watcher.ServerWatcher(interval=INTERVAL)
+    results = []
+    for count in nodes:
+        for name, func in (('poll', poll), ('watch', watch)):
+            cloud = FakeCloud()
+            pool = eventlet.GreenPool(count)
+            start = time.time()
+            for i in range(count):
+                # every node action builds its own driver instance
+                pool.spawn(func, FakeCompute(cloud, {'trust_id': 'TRUST'}))
+            pool.waitall()
+            results.append({
+                'mode': name,
+                'nodes': count,
+                'calls': sum(cloud.calls.values()),
+                'calls_per_node': round(
+                    sum(cloud.calls.values()) / float(count), 2),
+                'seconds': round(time.time() - start, 3),
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', default=','.join(map(str, DEFAULT_NODES)),
+                        help='Comma separated list of scale-out sizes.')
+    args = parser.parse_args(argv)
+
+    nodes = [int(n) for n in args.nodes.split(',') if n]
+    json.dump({'server_watch': run(nodes)}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
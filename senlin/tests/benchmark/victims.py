@@ -0,0 +1,89 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark for victim selection in large clusters.
+
+Run with::
+
+    python -m senlin.tests.benchmark.victims [--sizes 10000,100000]
+
+The result is printed as a JSON document with the best time in seconds
+for each criterion, cluster size and victim count.
+"""
+
+import argparse
+import datetime
+import json
+import random
+import sys
+import timeit
+
+from senlin.common import consts
+from senlin.common import scaleutils as su
+from senlin.objects import node as no
+
+DEFAULT_SIZES = (10000, 100000)
+ZONES = ('AZ1', 'AZ2', 'AZ3')
+PROFILES = 10
+
+
+def make_nodes(size):
+    base = datetime.datetime(2018, 1, 1)
+    nodes = []
+    for i in range(size):
+        created_at = base + datetime.timedelta(seconds=random.randrange(size))
+        status = consts.NS_ERROR if i % 1000 == 0 else consts.NS_ACTIVE
+        nodes.append(no.NodeSummary(
+            'node-%s' % i, status, created_at=created_at,
+            profile_id='profile-%s' % (i % PROFILES),
+            placement={'zone': ZONES[i % len(ZONES)]}))
+    return nodes
+
+
+def run(sizes, repeat=3):
+    base = datetime.datetime(2018, 1, 1)
+    profile_ages = dict(('profile-%s' % i, base + datetime.timedelta(days=i))
+                        for i in range(PROFILES))
+    results = []
+    for size in sizes:
+        nodes = make_nodes(size)
+        kwargs = {'profile_ages': profile_ages}
+        for count in (1, max(1, size // 100), size // 10):
+            for criterion in consts.VICTIM_CRITERIA:
+                timer = timeit.Timer(
+                    lambda: su.select_victims(nodes, count, criterion,
+                                              **kwargs))
+                best = min(timer.repeat(repeat=repeat, number=1))
+                results.append({
+                    'criterion': criterion,
+                    'nodes': size,
+                    'count': count,
+                    'seconds': round(best, 6),
+                })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='Comma separated list of cluster sizes.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of repetitions for each measurement.')
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    json.dump({'victims': run(sizes, args.repeat)}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
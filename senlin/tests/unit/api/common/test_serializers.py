@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+
 from oslo_config import cfg
 from oslo_serialization import jsonutils
 from oslo_utils import encodeutils
@@ -200,3 +202,61 @@ class JSONResponseSerializerTest(base.SenlinTestCase):
         self.assertEqual('application/json', response.content_type)
         self.assertEqual('{"key": "value"}',
                          encodeutils.safe_decode(response.body))
+
+    def test_to_json_not_sorted(self):
+        fixture = collections.OrderedDict([("b", 1), ("a", 2)])
+        serializer = serializers.JSONResponseSerializer(sort_keys=False)
+        self.assertEqual('{"b": 1, "a": 2}', serializer.to_json(fixture))
+
+    def test_default_streamed_list(self):
+        pages = iter([[{"id": 1}, {"id": 2}], [], [{"id": 3}]])
+        fixture = {"nodes": serializers.StreamedList(pages)}
+        response = webob.Response()
+
+        serializers.JSONResponseSerializer().default(response, fixture)
+
+        self.assertEqual('application/json', response.content_type)
+        chunks = list(response.app_iter)
+        self.assertEqual(3, len(chunks))
+        self.assertEqual({"nodes": [{"id": 1}, {"id": 2}, {"id": 3}]},
+                         jsonutils.loads(b''.join(chunks)))
+
+    def test_default_streamed_list_first_page_failed(self):
+        def pages():
+            raise exception.ResourceNotFound(type='node', id='FAKE')
+            yield []
+
+        fixture = {"nodes": serializers.StreamedList(pages())}
+        response = webob.Response()
+
+        # raised before the response is started
+        self.assertRaises(exception.ResourceNotFound,
+                          serializers.JSONResponseSerializer().default,
+                          response, fixture)
+
+    def test_default_streamed_list_failed(self):
+        def pages():
+            yield [{"id": 1}, {"id": 2}]
+            raise exception.ResourceNotFound(type='node', id='FAKE')
+
+        fixture = {"nodes": serializers.StreamedList(pages())}
+        response = webob.Response()
+
+        serializers.JSONResponseSerializer().default(response, fixture)
+
+        self.assertEqual(200, response.status_int)
+        # the document is complete and tells the list is incomplete
+        res = jsonutils.loads(b''.join(response.app_iter))
+        self.assertEqual([{"id": 1}, {"id": 2}], res['nodes'])
+        self.assertEqual(500, res['error']['code'])
+        self.assertEqual('ResourceNotFound', res['error']['type'])
+        self.assertEqual("The node 'FAKE' could not be found.",
+                         res['error']['message'])
+
+    def test_default_streamed_list_empty(self):
+        fixture = {"nodes": serializers.StreamedList(iter([[]]))}
+        response = webob.Response()
+
+        serializers.JSONResponseSerializer().default(response, fixture)
+
+        self.assertEqual(b'{"nodes": []}', response.body)
@@ -12,9 +12,11 @@
 
 import jsonschema
 import mock
+from oslo_config import cfg
 import six
 from webob import exc
 
+from senlin.api.common import serializers
 from senlin.api.common import util
 from senlin.api.common import wsgi
 from senlin.common import context
@@ -228,3 +230,45 @@ class TestParseBool(base.SenlinTestCase):
         for value in ('foo', 't', 'f', 'yes', 'no', 'y', 'n', '1', '0', None):
             self.assertRaises(exc.HTTPBadRequest,
                               util.parse_bool_param, name, value)
+
+
+class TestStreamList(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestStreamList, self).setUp()
+        self.req = mock.Mock(context=utils.dummy_context())
+        self.rpc_client = mock.Mock()
+        cfg.CONF.set_override('list_page_size', 2, group='senlin_api')
+
+    def test_stream_list_one_page(self):
+        obj = mock.Mock()
+        self.rpc_client.call.return_value = [{'id': 'A'}]
+
+        res = util.stream_list(self.req, self.rpc_client, 'node_list', obj)
+
+        self.assertEqual([{'id': 'A'}], res)
+        self.assertEqual(2, obj.limit)
+        self.rpc_client.call.assert_called_once_with(
+            self.req.context, 'node_list', obj)
+
+    def test_stream_list_pages(self):
+        obj = mock.Mock()
+        markers = []
+        pages = [[{'id': 'A'}, {'id': 'B'}], [{'id': 'C'}, {'id': 'D'}], []]
+
+        def call(context, method, req):
+            markers.append(getattr(req, 'marker', None))
+            return pages.pop(0)
+
+        obj.marker = None
+        self.rpc_client.call.side_effect = call
+
+        res = util.stream_list(self.req, self.rpc_client, 'node_list', obj)
+
+        self.assertIsInstance(res, serializers.StreamedList)
+        # only the first page is read before the response is written
+        self.assertEqual(1, self.rpc_client.call.call_count)
+        self.assertEqual([[{'id': 'A'}, {'id': 'B'}],
+                          [{'id': 'C'}, {'id': 'D'}], []],
+                         list(res.pages))
+        self.assertEqual([None, 'B', 'D'], markers)
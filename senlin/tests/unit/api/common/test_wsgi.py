@@ -209,6 +209,25 @@ class ResourceTest(base.SenlinTestCase):
         self.assertEqual(expected, resp.headers['OpenStack-API-Version'])
         self.assertEqual('OpenStack-API-Version', resp.headers['Vary'])
 
+    def test_resource_call_with_response(self):
+        class Controller(object):
+            def stream(self, req):
+                response = webob.Response(content_type='text/plain')
+                response.app_iter = iter([b'foo\n', b'bar\n'])
+                return response
+
+        actions = {'action': 'stream'}
+        env = {'wsgiorg.routing_args': [None, actions]}
+        request = wsgi.Request.blank('/tests/123', environ=env)
+        request.version_request = vr.APIVersionRequest('1.12')
+
+        resource = wsgi.Resource(Controller())
+        resp = resource(request)
+        self.assertEqual(b'foo\nbar\n', resp.body)
+        self.assertEqual('text/plain', resp.content_type)
+        self.assertEqual('clustering 1.12',
+                         resp.headers['OpenStack-API-Version'])
+
 
 class ControllerTest(base.SenlinTestCase):
 
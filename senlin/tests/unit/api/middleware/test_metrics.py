@@ -0,0 +1,61 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+from oslo_config import cfg
+import webob
+
+from senlin.api.middleware import metrics as mw
+from senlin.common import metrics
+from senlin.tests.unit.common import base
+
+
+class TestMetricsMiddleware(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestMetricsMiddleware, self).setUp()
+        self.app = mock.Mock(return_value=webob.Response(status=202))
+        self.app = webob.dec.wsgify(self.app)
+        self.middleware = mw.MetricsMiddleware(self.app)
+        self.histogram = metrics.Histogram('test_seconds', 'Test.',
+                                           ('method', 'status'))
+        self.patchobject(mw, 'REQUEST_SECONDS', new=self.histogram)
+
+    def test_request_timed(self):
+        req = webob.Request.blank('/v1/clusters', method='POST')
+
+        resp = req.get_response(self.middleware)
+
+        self.assertEqual(202, resp.status_int)
+        samples = list(self.histogram.samples())
+        self.assertIn(('_count', ('POST', '202'), {}, 1), samples)
+
+    def test_metrics_route_disabled(self):
+        req = webob.Request.blank('/metrics')
+
+        resp = req.get_response(self.middleware)
+
+        self.assertEqual(202, resp.status_int)
+        self.assertEqual(1, self.app.func.call_count)
+
+    def test_metrics_route(self):
+        cfg.CONF.set_override('api_route', True, group='metrics')
+        self.patchobject(metrics, 'render', return_value='metric 1.0\n')
+        req = webob.Request.blank('/metrics')
+
+        resp = req.get_response(self.middleware)
+
+        self.assertEqual(200, resp.status_int)
+        self.assertEqual(metrics.CONTENT_TYPE, resp.headers['Content-Type'])
+        self.assertEqual(b'metric 1.0\n', resp.body)
+        self.assertEqual(0, self.app.func.call_count)
+        self.assertEqual([], list(self.histogram.samples()))
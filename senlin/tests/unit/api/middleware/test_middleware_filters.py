@@ -16,6 +16,7 @@ from oslo_middleware import ssl
 from senlin.api import middleware as mw
 from senlin.api.middleware import context
 from senlin.api.middleware import fault
+from senlin.api.middleware import metrics
 from senlin.api.middleware import trust
 from senlin.api.middleware import version_negotiation as vn
 from senlin.api.middleware import webhook
@@ -91,3 +92,13 @@ class MiddlewareFilterTest(base.SenlinTestCase):
 
         self.assertEqual(exp, actual)
         mock_wh.assert_called_once_with(self.app)
+
+    @mock.patch.object(metrics, 'MetricsMiddleware')
+    def test_metricsmiddleware_filter(self, mock_metrics):
+        exp = mock.Mock()
+        mock_metrics.return_value = exp
+
+        actual = mw.metrics_filter(self.app, self.conf, **self.local_conf)
+
+        self.assertEqual(exp, actual)
+        mock_metrics.assert_called_once_with(self.app)
@@ -10,10 +10,14 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import time
+
 import mock
+from oslo_config import cfg
 import six
 
 from senlin.api.middleware import trust
+from senlin.common import cache
 from senlin.common import context
 from senlin.common import exception
 from senlin.objects.requests import credentials as vorc
@@ -215,3 +219,53 @@ class TestTrustMiddleware(base.SenlinTestCase):
             uid='FAKE_ID', passwd='FAKE_PASS')
         mock_keystone.trust_get_by_trustor.assert_called_once_with(
             self.context.user_id, 'FAKE_ADMIN_ID', self.context.project_id)
+
+    @mock.patch.object(trust.TrustMiddleware, '_get_trust')
+    def test_process_request(self, mock_get):
+        mock_get.return_value = 'FAKE_TRUST_ID'
+
+        self.middleware.process_request(self.req)
+        self.middleware.process_request(self.req)
+
+        self.assertEqual('FAKE_TRUST_ID', self.context.trusts)
+        mock_get.assert_called_once_with(self.req)
+        self.assertEqual([(self.context.user_id, self.context.project_id)],
+                         list(trust.trust_cache()._entries))
+
+    @mock.patch.object(trust.TrustMiddleware, '_get_trust')
+    def test_process_request_cache_disabled(self, mock_get):
+        cfg.CONF.set_override('trust_cache_ttl', 0, group='senlin_api')
+        mock_get.return_value = 'FAKE_TRUST_ID'
+
+        self.middleware.process_request(self.req)
+        self.middleware.process_request(self.req)
+
+        self.assertEqual(2, mock_get.call_count)
+
+
+class TestTrustCache(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestTrustCache, self).setUp()
+        self.mock_time = self.patchobject(time, 'time', return_value=100)
+
+    def test_trust_cache(self):
+        res = trust.trust_cache()
+
+        self.assertIsInstance(res, cache.TTLCache)
+        self.assertEqual('trust', res.name)
+        self.assertEqual(trust.MAX_ENTRIES, res.max_entries)
+        self.assertIs(res, trust.trust_cache())
+
+    def test_get_expired(self):
+        cfg.CONF.set_override('trust_cache_ttl', 60, group='senlin_api')
+        loader = mock.Mock(side_effect=['OLD', 'NEW'])
+
+        res = trust.trust_cache()
+        self.assertEqual('OLD', res.get(('U', 'P'), loader))
+        self.mock_time.return_value = 159
+        self.assertEqual('OLD', res.get(('U', 'P'), loader))
+        self.mock_time.return_value = 160
+        self.assertEqual('NEW', res.get(('U', 'P'), loader))
+
+        self.assertEqual(2, loader.call_count)
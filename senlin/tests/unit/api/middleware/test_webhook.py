@@ -10,15 +10,20 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import mock
+import datetime
+import time
 
+import iso8601
+import mock
 from oslo_config import cfg
+from oslo_utils import timeutils
 import six
 import webob
 
 from senlin.api.common import util as common_util
 from senlin.api.common import version_request as vr
 from senlin.api.middleware import webhook as webhook_middleware
+from senlin.common import cache
 from senlin.common import context
 from senlin.common import exception
 from senlin.drivers import base as driver_base
@@ -122,18 +127,18 @@ class TestWebhookMiddleware(base.SenlinTestCase):
                 self.auth_token = auth_token
 
         sd = mock.Mock()
-        sd.identity.get_token.return_value = 'TEST_TOKEN'
+        sd.identity.get_token_info.return_value = ('TEST_TOKEN', 'EXPIRES')
         mock_senlindriver.return_value = sd
 
-        token = self.middleware._get_token(**self.credential)
-        self.assertEqual('TEST_TOKEN', token)
+        res = self.middleware._get_token(**self.credential)
+        self.assertEqual(('TEST_TOKEN', 'EXPIRES'), res)
 
     @mock.patch.object(driver_base, 'SenlinDriver')
     def test_get_token_failed(self, mock_senlindriver):
         self.credential['webhook_id'] = 'WEBHOOK_ID'
 
         sd = mock.Mock()
-        sd.identity.get_token.side_effect = Exception()
+        sd.identity.get_token_info.side_effect = Exception()
         mock_senlindriver.return_value = sd
 
         self.assertRaises(exception.Forbidden, self.middleware._get_token,
@@ -156,6 +161,7 @@ class TestWebhookMiddleware(base.SenlinTestCase):
         req.url = 'http://url1'
         req.params = {'key': 'FAKE_KEY'}
         req.headers = {}
+        req.environ = {}
         req.version_request = vr.APIVersionRequest('1.0')
 
         rpcc = mock.Mock()
@@ -170,12 +176,15 @@ class TestWebhookMiddleware(base.SenlinTestCase):
 
         obj = mock.Mock()
         mock_parse.return_value = obj
+        hits = utils.metric_value(cache.LOOKUPS, 'webhook_token', 'hit')
+        misses = utils.metric_value(cache.LOOKUPS, 'webhook_token', 'miss')
 
         fake_return = ('WEBHOOK', {})
         mock_extract = self.patchobject(self.middleware, '_parse_url',
                                         return_value=fake_return)
+        expires = timeutils.utcnow() + datetime.timedelta(hours=1)
         mock_token = self.patchobject(self.middleware, '_get_token',
-                                      return_value='FAKE_TOKEN')
+                                      return_value=('FAKE_TOKEN', expires))
 
         res = self.middleware.process_request(req)
         self.assertIsNone(res)
@@ -190,6 +199,63 @@ class TestWebhookMiddleware(base.SenlinTestCase):
                                            {'identity': 'WEBHOOK'})
         rpcc.call.assert_called_with(dbctx, 'receiver_get', obj)
 
+        # the token is served from cache for the next request
+        req.headers = {}
+        self.middleware.process_request(req)
+
+        self.assertEqual('FAKE_TOKEN', req.headers['X-Auth-Token'])
+        self.assertEqual(1, mock_token.call_count)
+        self.assertEqual(1, rpcc.call.call_count)
+        self.assertEqual('WEBHOOK',
+                         req.environ[webhook_middleware.ENV_RECEIVER])
+        self.assertEqual(
+            hits + 1,
+            utils.metric_value(cache.LOOKUPS, 'webhook_token', 'hit'))
+        self.assertEqual(
+            misses + 1,
+            utils.metric_value(cache.LOOKUPS, 'webhook_token', 'miss'))
+
+    def _call(self, status, receiver_id=None):
+        def app(environ, start_response):
+            start_response(status, [('Content-Type', 'text/plain')])
+            return [b'']
+
+        self.middleware.application = app
+        self.patchobject(self.middleware, 'process_request',
+                         return_value=None)
+        req = webob.Request.blank('/v1/webhooks/R1/trigger?V=1',
+                                  method='POST')
+        if receiver_id is not None:
+            req.environ[webhook_middleware.ENV_RECEIVER] = receiver_id
+        return req.get_response(self.middleware)
+
+    def test_call_unauthorized_invalidates_token(self):
+        cache = webhook_middleware.receiver_cache()
+        mock_invalidate = self.patchobject(cache, 'invalidate')
+
+        res = self._call('401 Unauthorized', 'R1')
+
+        self.assertEqual(401, res.status_int)
+        mock_invalidate.assert_called_once_with('R1')
+
+    def test_call_unauthorized_token_not_cached(self):
+        cache = webhook_middleware.receiver_cache()
+        mock_invalidate = self.patchobject(cache, 'invalidate')
+
+        res = self._call('401 Unauthorized')
+
+        self.assertEqual(401, res.status_int)
+        self.assertEqual(0, mock_invalidate.call_count)
+
+    def test_call_accepted(self):
+        cache = webhook_middleware.receiver_cache()
+        mock_invalidate = self.patchobject(cache, 'invalidate')
+
+        res = self._call('202 Accepted', 'R1')
+
+        self.assertEqual(202, res.status_int)
+        self.assertEqual(0, mock_invalidate.call_count)
+
     def test_process_request_method_not_post(self):
         # Request method is not POST
         req = mock.Mock()
@@ -210,3 +276,109 @@ class TestWebhookMiddleware(base.SenlinTestCase):
         self.assertIsNone(res)
         mock_extract.assert_called_once_with(req.url)
         self.assertNotIn('X-Auth-Token', req.headers)
+
+
+class TestReceiverCache(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestReceiverCache, self).setUp()
+        self.cache = webhook_middleware.ReceiverCache()
+        self.now = timeutils.utcnow()
+        self.patchobject(timeutils, 'utcnow', return_value=self.now)
+        self.mock_time = self.patchobject(time, 'time', return_value=100)
+
+    def _later(self, seconds):
+        return self.now + datetime.timedelta(seconds=seconds)
+
+    def _token(self, token, expires_at):
+        return mock.Mock(return_value=(token, expires_at))
+
+    def test_receiver_cache(self):
+        res = webhook_middleware.receiver_cache()
+
+        self.assertIsInstance(res, webhook_middleware.ReceiverCache)
+        self.assertIs(res, webhook_middleware.receiver_cache())
+
+    def test_actor(self):
+        cfg.CONF.set_override('cache_ttl', 10, group='receiver')
+        loader = mock.Mock(side_effect=[{'trust_id': 'T1'},
+                                        {'trust_id': 'T2'}])
+
+        self.assertEqual({'trust_id': 'T1'},
+                         self.cache.get_actor('R1', loader))
+        self.assertEqual({'trust_id': 'T1'},
+                         self.cache.get_actor('R1', loader))
+        self.mock_time.return_value = 110
+        self.assertEqual({'trust_id': 'T2'},
+                         self.cache.get_actor('R1', loader))
+
+        self.assertEqual(2, loader.call_count)
+
+    def test_token_expiry(self):
+        loader = self._token('TOKEN', self._later(120))
+
+        self.assertEqual('TOKEN', self.cache.get_token('R1', loader))
+        self.mock_time.return_value = 159
+        self.assertEqual('TOKEN', self.cache.get_token('R1', loader))
+        self.assertEqual(1, loader.call_count)
+        self.mock_time.return_value = 160
+        self.assertEqual('TOKEN', self.cache.get_token('R1', loader))
+        self.assertEqual(2, loader.call_count)
+
+    def test_token_expiry_with_timezone(self):
+        expires = self._later(3600).replace(tzinfo=iso8601.UTC)
+        loader = self._token('TOKEN', expires)
+
+        self.cache.get_token('R1', loader)
+        self.cache.get_token('R1', loader)
+
+        self.assertEqual(1, loader.call_count)
+
+    def test_token_no_expiry(self):
+        loader = self._token('TOKEN', None)
+
+        self.cache.get_token('R1', loader)
+        self.cache.get_token('R1', loader)
+
+        self.assertEqual(2, loader.call_count)
+
+    def test_token_bounded_by_ttl(self):
+        cfg.CONF.set_override('cache_ttl', 10, group='receiver')
+        loader = self._token('TOKEN', self._later(3600))
+
+        self.cache.get_token('R1', loader)
+        self.mock_time.return_value = 109
+        self.cache.get_token('R1', loader)
+        self.assertEqual(1, loader.call_count)
+        self.mock_time.return_value = 110
+        self.cache.get_token('R1', loader)
+        self.assertEqual(2, loader.call_count)
+
+    def test_disabled(self):
+        cfg.CONF.set_override('cache_ttl', 0, group='receiver')
+        actor = mock.Mock(return_value={'trust_id': 'T1'})
+        token = self._token('TOKEN', self._later(3600))
+
+        for i in range(2):
+            self.cache.get_actor('R1', actor)
+            self.cache.get_token('R1', token)
+
+        self.assertEqual(2, actor.call_count)
+        self.assertEqual(2, token.call_count)
+
+    def test_invalidate(self):
+        token = self._token('TOKEN', self._later(3600))
+        for r in ('R1', 'R2'):
+            self.cache.get_actor(r, lambda: {'trust_id': 'T'})
+            self.cache.get_token(r, token)
+
+        self.cache.invalidate('R1')
+
+        self.cache.get_token('R1', token)
+        self.cache.get_token('R2', token)
+        self.assertEqual(3, token.call_count)
+
+        self.cache.invalidate()
+
+        self.cache.get_token('R2', token)
+        self.assertEqual(4, token.call_count)
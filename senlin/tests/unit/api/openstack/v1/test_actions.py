@@ -11,6 +11,7 @@
 # under the License.
 
 import mock
+from oslo_config import cfg
 import six
 from webob import exc
 
@@ -113,6 +114,24 @@ class ActionControllerTest(shared.ControllerTest, base.SenlinTestCase):
         mock_call.assert_called_once_with(
             req.context, 'action_list', obj)
 
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_action_index_ids(self, mock_call, mock_parse, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'index', True)
+        req = self._get('/actions', params={'ids': 'A1,A2,'},
+                        version='1.11')
+
+        mock_call.return_value = []
+        obj = mock.Mock()
+        mock_parse.return_value = obj
+
+        result = self.controller.index(req)
+
+        self.assertEqual([], result['actions'])
+        mock_parse.assert_called_once_with(
+            'ActionListRequest', req,
+            {'ids': ['A1', 'A2'], 'project_safe': True})
+
     @mock.patch.object(util, 'parse_request')
     @mock.patch.object(rpc_client.EngineClient, 'call')
     def test_action_index_whitelists_invalid_params(self, mock_call,
@@ -274,6 +293,57 @@ class ActionControllerTest(shared.ControllerTest, base.SenlinTestCase):
         mock_call.assert_called_once_with(
             req.context, 'action_get', obj)
 
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_action_get_wait(self, mock_call, mock_parse, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'get', True)
+        cfg.CONF.set_override('rpc_response_timeout', 30)
+        action_id = 'aaaa-bbbb-cccc'
+        req = self._get('/actions/%s' % action_id,
+                        params={'wait': '300', 'until': 'RUNNING'},
+                        version='1.11')
+        obj = mock.Mock(wait=300)
+        mock_parse.return_value = obj
+        mock_call.return_value = {'status': 'RUNNING'}
+
+        response = self.controller.get(req, action_id=action_id)
+
+        self.assertEqual({'status': 'RUNNING'}, response['action'])
+        mock_parse.assert_called_once_with(
+            'ActionGetRequest', req,
+            {'identity': action_id, 'wait': '300', 'until': 'RUNNING'})
+        # the wait ends before the RPC call times out
+        self.assertEqual(25, obj.wait)
+        mock_call.assert_called_once_with(req.context, 'action_get', obj)
+
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_action_get_wait_max(self, mock_call, mock_parse, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'get', True)
+        cfg.CONF.set_override('rpc_response_timeout', 120)
+        cfg.CONF.set_override('max_action_wait', 40)
+        action_id = 'aaaa-bbbb-cccc'
+        req = self._get('/actions/%s' % action_id, params={'wait': '300'},
+                        version='1.11')
+        obj = mock.Mock(wait=300)
+        mock_parse.return_value = obj
+
+        self.controller.get(req, action_id=action_id)
+
+        self.assertEqual(40, obj.wait)
+        mock_call.assert_called_once_with(req.context, 'action_get', obj)
+
+    def test_action_get_bad_wait(self, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'get', True)
+        req = self._get('/actions/aaaa-bbbb-cccc', params={'wait': 'soon'},
+                        version='1.11')
+
+        ex = self.assertRaises(exc.HTTPBadRequest,
+                               self.controller.get,
+                               req, action_id='aaaa-bbbb-cccc')
+
+        self.assertIn('soon', six.text_type(ex))
+
     @mock.patch.object(util, 'parse_request')
     @mock.patch.object(rpc_client.EngineClient, 'call')
     def test_action_get_not_found(self, mock_call, mock_parse,
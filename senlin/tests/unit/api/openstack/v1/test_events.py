@@ -10,7 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import eventlet
 import mock
+from oslo_config import cfg
 import six
 from webob import exc
 
@@ -304,3 +306,84 @@ class EventControllerTest(shared.ControllerTest, base.SenlinTestCase):
 
         self.assertEqual(403, resp.status_int)
         self.assertIn('403 Forbidden', six.text_type(resp))
+
+    @mock.patch.object(eventlet, 'sleep')
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_event_feed(self, mock_call, mock_parse, mock_sleep,
+                        mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'feed', True)
+        cfg.CONF.set_override('event_feed_duration', 1, group='senlin_api')
+        req = self._get('/events/feed', params={'cursor': '3'},
+                        version='1.12')
+        obj = mock.Mock(cursor=3, limit=100)
+        mock_parse.return_value = obj
+        mock_call.side_effect = [
+            {'cursor': 5, 'events': [{'seq': 4}, {'seq': 5}]},
+            {'cursor': 8, 'events': []},
+        ]
+
+        with mock.patch('time.time') as mock_time:
+            mock_time.side_effect = [100, 100, 100, 100, 100, 101]
+            resp = self.controller.feed(req)
+            lines = list(resp.app_iter)
+
+        self.assertEqual('application/x-ndjson', resp.content_type)
+        self.assertEqual([b'{"seq": 4}\n', b'{"seq": 5}\n',
+                          b'{"cursor": 8}\n'], lines)
+        mock_parse.assert_called_once_with(
+            'EventFeedRequest', req, {'cursor': '3', 'project_safe': True})
+        self.assertEqual(2, mock_call.call_count)
+        mock_call.assert_called_with(req.context, 'event_feed', obj)
+        self.assertEqual(8, obj.cursor)
+        self.assertEqual(1, mock_sleep.call_count)
+
+    @mock.patch.object(eventlet, 'sleep')
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_event_feed_heartbeat(self, mock_call, mock_parse, mock_sleep,
+                                  mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'feed', True)
+        cfg.CONF.set_override('event_feed_heartbeat', 30, group='senlin_api')
+        req = self._get('/events/feed', params={'cursor': '3'},
+                        version='1.12')
+        obj = mock.Mock(cursor=3, limit=100)
+        mock_parse.return_value = obj
+        mock_call.side_effect = [
+            {'cursor': 3, 'events': []},
+            Exception('Boom'),
+        ]
+
+        with mock.patch('time.time') as mock_time:
+            mock_time.side_effect = [100, 100, 130, 130]
+            resp = self.controller.feed(req)
+            lines = list(resp.app_iter)
+
+        # the stream is ended when the engine cannot be reached
+        self.assertEqual([b'\n'], lines)
+        self.assertEqual(2, mock_call.call_count)
+
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_event_feed_invalid_param(self, mock_call, mock_parse,
+                                      mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'feed', True)
+        req = self._get('/events/feed', params={'marker': 'M1'},
+                        version='1.12')
+
+        ex = self.assertRaises(exc.HTTPBadRequest,
+                               self.controller.feed, req)
+
+        self.assertEqual('Invalid parameter marker', six.text_type(ex))
+        self.assertFalse(mock_parse.called)
+        self.assertFalse(mock_call.called)
+
+    def test_event_feed_version_mismatch(self, mock_enforce):
+        # NOTE: the api version check comes before the policy enforcement
+        req = self._get('/events/feed', version='1.11')
+
+        ex = self.assertRaises(senlin_exc.MethodVersionNotFound,
+                               self.controller.feed, req)
+
+        self.assertEqual('API version \'1.11\' is not supported on '
+                         'this method.', six.text_type(ex))
@@ -14,13 +14,16 @@ import mock
 import six
 from webob import exc
 
+from oslo_config import cfg
 from oslo_serialization import jsonutils
 
+from senlin.api.common import serializers
 from senlin.api.common import util
 from senlin.api.middleware import fault
 from senlin.api.openstack.v1 import nodes
 from senlin.common import exception as senlin_exc
 from senlin.common import policy
+from senlin.objects.requests import nodes as vorn
 from senlin.rpc import client as rpc_client
 from senlin.tests.unit.api import shared
 from senlin.tests.unit.common import base
@@ -76,6 +79,26 @@ class NodeControllerTest(shared.ControllerTest, base.SenlinTestCase):
         mock_call.assert_called_once_with(
             req.context, 'node_list', obj)
 
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_node_index_streamed(self, mock_call, mock_parse, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'index', True)
+        cfg.CONF.set_override('list_page_size', 2, group='senlin_api')
+        req = self._get('/nodes')
+
+        obj = mock.Mock()
+        mock_parse.return_value = obj
+        mock_call.side_effect = [[{'id': 'N1'}, {'id': 'N2'}], [{'id': 'N3'}]]
+
+        result = self.controller.index(req)
+
+        self.assertIsInstance(result['nodes'], serializers.StreamedList)
+        self.assertEqual([[{'id': 'N1'}, {'id': 'N2'}], [{'id': 'N3'}]],
+                         list(result['nodes'].pages))
+        self.assertEqual(2, obj.limit)
+        self.assertEqual('N2', obj.marker)
+        self.assertEqual(2, mock_call.call_count)
+
     @mock.patch.object(util, 'parse_request')
     @mock.patch.object(rpc_client.EngineClient, 'call')
     def test_node_index_whitelists_params(self, mock_call,
@@ -475,6 +498,161 @@ class NodeControllerTest(shared.ControllerTest, base.SenlinTestCase):
         mock_call.assert_called_once_with(req.context, 'node_adopt_preview',
                                           mock.ANY)
 
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_node_batch_create(self, mock_call, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', True)
+        body = {
+            'create': [
+                {'name': 'node1', 'profile_id': 'PROFILE'},
+                {'name': 'node2', 'profile_id': 'PROFILE',
+                 'cluster_id': 'CLUSTER', 'role': 'ROLE'},
+            ]
+        }
+        engine_response = [
+            {'id': 'NODE1', 'action': 'ACTION1'},
+            {'error': {'type': 'BadRequest', 'message': 'Boom.'}},
+        ]
+        req = self._post('/nodes/batch', jsonutils.dumps(body),
+                         version='1.13')
+        mock_call.return_value = engine_response
+
+        resp = self.controller.batch(req, body=body)
+
+        self.assertEqual({'nodes': engine_response}, resp)
+        mock_call.assert_called_once_with(req.context, 'node_batch_create',
+                                          mock.ANY)
+        obj = mock_call.call_args[0][2]
+        self.assertIsInstance(obj, vorn.NodeBatchCreateRequest)
+        self.assertEqual(['node1', 'node2'], [n.name for n in obj.nodes])
+        self.assertEqual('CLUSTER', obj.nodes[1].cluster_id)
+        self.assertEqual('ROLE', obj.nodes[1].role)
+
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_node_batch_operations(self, mock_call, mock_parse,
+                                   mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', True, 3)
+        item = mock.Mock()
+        item.obj_to_primitive.return_value = 'ITEM'
+        batch = mock.Mock()
+        mock_parse.side_effect = [item, batch] * 3
+        mock_call.return_value = []
+
+        for op, item_name, batch_name, method, parsed in [
+                ('adopt', 'NodeAdoptRequest', 'NodeBatchAdoptRequest',
+                 'node_batch_adopt', {'identity': 'NODE'}),
+                ('delete', 'NodeDeleteRequest', 'NodeBatchDeleteRequest',
+                 'node_batch_delete', {'identity': 'NODE', 'force': False}),
+                ('operation', 'NodeOperationRequest',
+                 'NodeBatchOperationRequest', 'node_batch_op',
+                 {'identity': 'NODE'})]:
+            mock_parse.reset_mock()
+            mock_call.reset_mock()
+            body = {op: [{'identity': 'NODE'}]}
+            req = self._post('/nodes/batch', jsonutils.dumps(body),
+                             version='1.13')
+
+            resp = self.controller.batch(req, body=body)
+
+            self.assertEqual({'nodes': []}, resp)
+            mock_parse.assert_has_calls([
+                mock.call(item_name, req, parsed),
+                mock.call(batch_name, req, {'nodes': ['ITEM']})
+            ])
+            mock_call.assert_called_once_with(req.context, method, batch)
+
+    def test_node_batch_bad_body(self, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', True, 6)
+        for body, msg in [
+                ({}, 'No operation specified'),
+                ({'create': [], 'delete': []},
+                 'Multiple operations specified'),
+                ({'dance': [{}]}, "Unrecognized operation 'dance' specified"),
+                ({'delete': []}, "The nodes for operation 'delete' must be "
+                                 "a non-empty list."),
+                ({'delete': {'identity': 'NODE'}},
+                 "The nodes for operation 'delete' must be a non-empty "
+                 "list."),
+                ({'delete': ['NODE']},
+                 "The nodes for operation 'delete' must be a non-empty "
+                 "list.")]:
+            req = self._post('/nodes/batch', jsonutils.dumps(body),
+                             version='1.13')
+
+            ex = self.assertRaises(exc.HTTPBadRequest,
+                                   self.controller.batch,
+                                   req, body=body)
+
+            self.assertEqual(msg, six.text_type(ex))
+
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_node_batch_bad_item(self, mock_call, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', True)
+        body = {'delete': [{'identity': 'NODE1'}, {'force': True}]}
+        req = self._post('/nodes/batch', jsonutils.dumps(body),
+                         version='1.13')
+
+        ex = self.assertRaises(exc.HTTPBadRequest,
+                               self.controller.batch,
+                               req, body=body)
+
+        self.assertIn("'identity' is a required property", six.text_type(ex))
+        self.assertEqual(0, mock_call.call_count)
+
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_node_batch_delete_force(self, mock_call, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', True)
+        body = {'delete': [{'identity': 'NODE1'},
+                           {'identity': 'NODE2', 'force': 'true'}]}
+        req = self._post('/nodes/batch', jsonutils.dumps(body),
+                         version='1.13')
+        req.context.api_version = '1.13'
+        mock_call.return_value = []
+
+        self.controller.batch(req, body=body)
+
+        obj = mock_call.call_args[0][2]
+        self.assertIsInstance(obj, vorn.NodeBatchDeleteRequest)
+        self.assertEqual([False, True], [n.force for n in obj.nodes])
+
+    def test_node_batch_delete_bad_force(self, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', True)
+        body = {'delete': [{'identity': 'NODE1', 'force': 'bogus'}]}
+        req = self._post('/nodes/batch', jsonutils.dumps(body),
+                         version='1.13')
+
+        ex = self.assertRaises(exc.HTTPBadRequest,
+                               self.controller.batch,
+                               req, body=body)
+
+        self.assertEqual("Invalid value 'bogus' specified for 'force'",
+                         six.text_type(ex))
+
+    def test_node_batch_version_mismatch(self, mock_enforce):
+        body = {'delete': [{'identity': 'NODE1'}]}
+        req = self._post('/nodes/batch', jsonutils.dumps(body),
+                         version='1.12')
+
+        ex = self.assertRaises(senlin_exc.MethodVersionNotFound,
+                               self.controller.batch,
+                               req, body=body)
+
+        self.assertEqual("API version '1.12' is not supported on this "
+                         "method.", six.text_type(ex))
+
+    def test_node_batch_denied_policy(self, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'batch', False)
+        body = {'delete': [{'identity': 'NODE1'}]}
+        req = self._post('/nodes/batch', jsonutils.dumps(body),
+                         version='1.13')
+
+        resp = shared.request_with_middleware(fault.FaultWrapper,
+                                              self.controller.batch,
+                                              req, body=body)
+
+        self.assertEqual(403, resp.status_int)
+        self.assertIn('403 Forbidden', six.text_type(resp))
+
     @mock.patch.object(util, 'parse_request')
     @mock.patch.object(rpc_client.EngineClient, 'call')
     def test_node_get_success(self, mock_call, mock_parse, mock_enforce):
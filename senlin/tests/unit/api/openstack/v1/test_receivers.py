@@ -18,6 +18,7 @@ from oslo_serialization import jsonutils
 
 from senlin.api.common import util
 from senlin.api.middleware import fault
+from senlin.api.middleware import webhook
 from senlin.api.openstack.v1 import receivers
 from senlin.common import exception as senlin_exc
 from senlin.common import policy
@@ -639,6 +640,35 @@ class ReceiverControllerTest(shared.ControllerTest, base.SenlinTestCase):
         mock_call.assert_called_once_with(
             req.context, 'receiver_delete', obj)
 
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_receiver_delete_invalidates_cache(self, mock_call, mock_parse,
+                                               mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'delete', True)
+        wid = 'a1b2c3d4-e5f6-4a5b-8c9d-0e1f2a3b4c5d'
+        mock_invalidate = self.patchobject(webhook.receiver_cache(),
+                                           'invalidate')
+        req = self._delete('/receivers/%(receiver_id)s' % {'receiver_id': wid})
+
+        self.assertRaises(exc.HTTPNoContent,
+                          self.controller.delete, req, receiver_id=wid)
+
+        mock_invalidate.assert_called_once_with(wid)
+
+    @mock.patch.object(util, 'parse_request')
+    @mock.patch.object(rpc_client.EngineClient, 'call')
+    def test_receiver_delete_by_name_clears_cache(self, mock_call,
+                                                  mock_parse, mock_enforce):
+        self._mock_enforce_setup(mock_enforce, 'delete', True)
+        mock_invalidate = self.patchobject(webhook.receiver_cache(),
+                                           'invalidate')
+        req = self._delete('/receivers/NAME')
+
+        self.assertRaises(exc.HTTPNoContent,
+                          self.controller.delete, req, receiver_id='NAME')
+
+        mock_invalidate.assert_called_once_with()
+
     @mock.patch.object(util, 'parse_request')
     @mock.patch.object(rpc_client.EngineClient, 'call')
     def test_receiver_delete_err_malformed_receiver_id(self, mock_call,
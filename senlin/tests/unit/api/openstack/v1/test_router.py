@@ -282,6 +282,13 @@ class RoutesTest(base.SenlinTestCase):
             'adopt_preview',
             'NodeController')
 
+        self.assertRoute(
+            self.m,
+            '/nodes/batch',
+            'POST',
+            'batch',
+            'NodeController')
+
         self.assertRoute(
             self.m,
             '/nodes/bbbb',
@@ -67,6 +67,12 @@ class SenlinTestCase(testscenarios.WithScenarios,
         self.useFixture(fixtures.MonkeyPatch(
             'senlin.common.exception._FATAL_EXCEPTION_FORMAT_ERRORS',
             True))
+        self.useFixture(fixtures.MonkeyPatch(
+            'senlin.engine.lookup_cache._cache', None))
+        self.useFixture(fixtures.MonkeyPatch(
+            'senlin.api.middleware.webhook._cache', None))
+        self.useFixture(fixtures.MonkeyPatch(
+            'senlin.api.middleware.trust._cache', None))
 
         def enable_sleep():
             scheduler.ENABLE_SLEEP = True
@@ -139,3 +139,11 @@ def create_policy(context, policy_id, name=None):
         'project': context.project_id,
     }
     return objects.Policy.create(context, values)
+
+
+def metric_value(metric, *labels):
+    """Get the value of a counter or gauge for the given label values."""
+    for _suffix, key, _extra, value in metric.samples():
+        if key == labels:
+            return value
+    return 0
@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
 import six
 import time
 
@@ -229,6 +230,24 @@ class DBAPIActionTest(base.SenlinTestCase):
                                                            'fake-owner')
         self.assertEqual(0, len(action_fake_owner))
 
+    def test_action_count_by_status(self):
+        specs = [
+            {'name': 'A01', 'action': 'CLUSTER_CREATE', 'status': 'READY'},
+            {'name': 'A02', 'action': 'NODE_CREATE', 'status': 'READY'},
+            {'name': 'A03', 'action': 'NODE_CREATE', 'status': 'READY'},
+            {'name': 'A04', 'action': 'NODE_CREATE', 'status': 'RUNNING'},
+            {'name': 'A05', 'action': 'NODE_CREATE', 'status': 'SUCCEEDED'},
+        ]
+        for spec in specs:
+            _create_action(self.ctx, **spec)
+
+        res = db_api.action_count_by_status(self.ctx, ['READY', 'RUNNING'])
+
+        self.assertEqual([('READY', 'CLUSTER_CREATE', 1),
+                          ('READY', 'NODE_CREATE', 2),
+                          ('RUNNING', 'NODE_CREATE', 1)],
+                         sorted(tuple(r) for r in res))
+
     def test_action_get_all(self):
         specs = [
             {'name': 'A01', 'target': 'cluster_001'},
@@ -365,6 +384,29 @@ class DBAPIActionTest(base.SenlinTestCase):
     def test_dependency_add_dependent_list(self):
         self._check_dependency_add_dependent_list()
 
+    def test_dependency_get_all(self):
+        id_of = self._check_dependency_add_dependent_list()
+
+        res = db_api.dependency_get_all(self.ctx, [id_of['A01']])
+        self.assertEqual(3, len(res))
+        for dep in res:
+            self.assertEqual(id_of['A01'], dep.depended)
+
+        res = db_api.dependency_get_all(self.ctx, [id_of['A02']])
+        self.assertEqual([(id_of['A01'], id_of['A02'])],
+                         [(d.depended, d.dependent) for d in res])
+
+        self.assertEqual([], db_api.dependency_get_all(self.ctx, []))
+
+    def test_dependency_get_all_batched(self):
+        self.patchobject(db_api, 'DEPENDENCY_BATCH_SIZE', new=1)
+        id_of = self._check_dependency_add_dependent_list()
+
+        res = db_api.dependency_get_all(self.ctx, [id_of['A01'],
+                                                   id_of['A02']])
+
+        self.assertEqual(3, len(res))
+
     def test_action_mark_succeeded(self):
         timestamp = time.time()
         id_of = self._check_dependency_add_dependent_list()
@@ -382,6 +424,50 @@ class DBAPIActionTest(base.SenlinTestCase):
             res = db_api.dependency_get_dependents(self.ctx, aid)
             self.assertEqual(0, len(res))
 
+    def test_action_mark_succeeded_data(self):
+        action = _create_action(self.ctx)
+
+        db_api.action_mark_succeeded(self.ctx, action.id, time.time(),
+                                     data={'timing': {'queries': 3}})
+
+        action = db_api.action_get(self.ctx, action.id)
+        self.assertEqual(consts.ACTION_SUCCEEDED, action.status)
+        self.assertEqual({'timing': {'queries': 3}}, action.data)
+
+    def test_action_mark_succeeded_completes_batch(self):
+        specs = [
+            {'name': 'A01', 'target': 'batch_001',
+             'action': consts.BATCH_NODE_CREATE},
+            {'name': 'A02', 'target': 'node_001'},
+            {'name': 'A03', 'target': 'node_002'},
+            {'name': 'A04', 'target': 'cluster_002'},
+        ]
+        id_of = {}
+        for spec in specs:
+            action = _create_action(self.ctx, **spec)
+            id_of[spec['name']] = action.id
+        db_api.dependency_add(self.ctx, [id_of['A02'], id_of['A03']],
+                              id_of['A01'])
+        db_api.dependency_add(self.ctx, id_of['A02'], id_of['A04'])
+
+        timestamp = time.time()
+        db_api.action_mark_succeeded(self.ctx, id_of['A02'], timestamp)
+
+        # waiting for the other depended action
+        action = db_api.action_get(self.ctx, id_of['A01'])
+        self.assertEqual(consts.ACTION_WAITING, action.status)
+        # an ordinary action is left for a worker to execute
+        action = db_api.action_get(self.ctx, id_of['A04'])
+        self.assertEqual(consts.ACTION_WAITING, action.status)
+
+        db_api.action_mark_succeeded(self.ctx, id_of['A03'], timestamp)
+
+        action = db_api.action_get(self.ctx, id_of['A01'])
+        self.assertEqual(consts.ACTION_SUCCEEDED, action.status)
+        self.assertEqual('All depended actions completed.',
+                         action.status_reason)
+        self.assertEqual(round(timestamp, 6), float(action.end_time))
+
     def _prepare_action_mark_failed_cancel(self):
         specs = [
             {'name': 'A01', 'status': 'INIT', 'target': 'cluster_001'},
@@ -654,6 +740,86 @@ class DBAPIActionTest(base.SenlinTestCase):
         actions = db_api.action_get_all(self.ctx)
         self.assertEqual(3, len(actions))
 
+    def _coalesce_action(self, **kwargs):
+        values = {
+            'target': 'CLUSTER', 'action': 'CLUSTER_SCALE_OUT',
+            'name': 'webhook_01234567', 'status': consts.ACTION_READY,
+            'inputs': {'count': '2'}, 'created_at': tu.utcnow(True),
+        }
+        values.update(kwargs)
+        return shared.create_action(self.ctx, **values)
+
+    def test_action_coalesce(self):
+        action = self._coalesce_action()
+        since = tu.utcnow(True) - datetime.timedelta(seconds=30)
+
+        res = db_api.action_coalesce(self.ctx, 'CLUSTER', 'CLUSTER_SCALE_OUT',
+                                     'webhook_01234567', since,
+                                     {'count': 3, 'foo': 'bar'}, ['count'])
+        self.assertEqual(action.id, res.id)
+        res = db_api.action_coalesce(self.ctx, 'CLUSTER', 'CLUSTER_SCALE_OUT',
+                                     'webhook_01234567', since,
+                                     {'count': 1}, ['count'])
+        self.assertEqual(action.id, res.id)
+
+        action = db_api.action_get(self.ctx, action.id,
+                                   project_safe=False)
+        self.assertEqual({'count': 6, 'foo': 'bar'}, action.inputs)
+        self.assertEqual({'coalesced': 2}, action.data)
+
+    def test_action_coalesce_count_missing(self):
+        since = tu.utcnow(True) - datetime.timedelta(seconds=30)
+        action = self._coalesce_action()
+
+        for inputs in ({}, {'count': None}, {'count': 'many'}):
+            res = db_api.action_coalesce(
+                self.ctx, 'CLUSTER', 'CLUSTER_SCALE_OUT', 'webhook_01234567',
+                since, inputs, ['count'])
+            self.assertIsNone(res)
+
+        action = db_api.action_get(self.ctx, action.id, project_safe=False)
+        self.assertEqual({'count': '2'}, action.inputs)
+        self.assertIsNone(action.data)
+
+    def test_action_coalesce_count_missing_in_action(self):
+        since = tu.utcnow(True) - datetime.timedelta(seconds=30)
+        action = self._coalesce_action(inputs={})
+
+        res = db_api.action_coalesce(self.ctx, 'CLUSTER', 'CLUSTER_SCALE_OUT',
+                                     'webhook_01234567', since, {'count': 3},
+                                     ['count'])
+
+        self.assertIsNone(res)
+        action = db_api.action_get(self.ctx, action.id, project_safe=False)
+        self.assertEqual({}, action.inputs)
+
+    def test_action_coalesce_replace(self):
+        action = self._coalesce_action()
+        since = tu.utcnow(True) - datetime.timedelta(seconds=30)
+
+        db_api.action_coalesce(self.ctx, 'CLUSTER', 'CLUSTER_SCALE_OUT',
+                               'webhook_01234567', since, {'count': 3})
+
+        action = db_api.action_get(self.ctx, action.id,
+                                   project_safe=False)
+        self.assertEqual({'count': 3}, action.inputs)
+
+    def test_action_coalesce_not_found(self):
+        since = tu.utcnow(True) - datetime.timedelta(seconds=30)
+        old = since - datetime.timedelta(seconds=1)
+        self._coalesce_action(status=consts.ACTION_RUNNING)
+        self._coalesce_action(owner='WORKER')
+        self._coalesce_action(created_at=old)
+        self._coalesce_action(name='webhook_abcdefgh')
+        self._coalesce_action(action='CLUSTER_SCALE_IN')
+        self._coalesce_action(target='OTHER')
+
+        res = db_api.action_coalesce(self.ctx, 'CLUSTER', 'CLUSTER_SCALE_OUT',
+                                     'webhook_01234567', since, {'count': 3},
+                                     ['count'])
+
+        self.assertIsNone(res)
+
     def test_action_abandon(self):
         spec = {
             "owner": "test_owner",
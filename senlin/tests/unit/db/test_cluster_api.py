@@ -14,6 +14,7 @@ import mock
 
 from oslo_db.sqlalchemy import utils as sa_utils
 from oslo_utils import timeutils as tu
+from sqlalchemy import orm
 
 from senlin.common import exception
 from senlin.db.sqlalchemy import api as db_api
@@ -165,6 +166,46 @@ class DBAPIClusterTest(base.SenlinTestCase):
         res = db_api.cluster_get_by_short_id(ctx_new, UUID1[:11])
         self.assertIsNone(res)
 
+    def test_cluster_get_by_identities(self):
+        cluster1 = shared.create_cluster(self.ctx, self.profile,
+                                         id=UUID1, name='cluster-1')
+        cluster2 = shared.create_cluster(self.ctx, self.profile,
+                                         name=UUID1)
+
+        res = db_api.cluster_get_by_identities(
+            self.ctx, [UUID1, 'cluster-1', cluster2.id[:11], 'bogus'])
+
+        # ID is matched before name for UUID-like identities
+        self.assertEqual([cluster1.id], [c.id for c in res[UUID1]])
+        self.assertEqual([cluster1.id], [c.id for c in res['cluster-1']])
+        self.assertEqual([cluster2.id],
+                         [c.id for c in res[cluster2.id[:11]]])
+        self.assertEqual([], res['bogus'])
+
+    def test_cluster_get_by_identities_short_id_bounded(self):
+        for i in range(4):
+            shared.create_cluster(self.ctx, self.profile,
+                                  id='abc%s-%s' % (i, UUID2[5:]))
+        cluster = shared.create_cluster(self.ctx, self.profile,
+                                        id='bcd0-%s' % UUID2[5:])
+        loaded = []
+        query_all = orm.Query.all
+
+        def _all(query):
+            rows = query_all(query)
+            loaded.extend(rows)
+            return rows
+
+        self.patchobject(orm.Query, 'all', new=_all)
+
+        res = db_api.cluster_get_by_identities(self.ctx, ['abc', 'bcd'])
+
+        # at most two rows are loaded for an ambiguous short ID
+        self.assertEqual(3, len(loaded))
+        self.assertEqual(2, len(res['abc']))
+        self.assertTrue(all(c.id.startswith('abc') for c in res['abc']))
+        self.assertEqual([cluster.id], [c.id for c in res['bcd']])
+
     def test_cluster_get_all(self):
         values = [
             {'name': 'cluster1'},
@@ -314,6 +355,16 @@ class DBAPIClusterTest(base.SenlinTestCase):
         res = db_api.cluster_get(self.ctx, cluster_id)
         self.assertEqual(3, res.next_index)
 
+    def test_cluster_next_index_count(self):
+        cluster = shared.create_cluster(self.ctx, self.profile)
+        cluster_id = cluster.id
+        res = db_api.cluster_next_index(self.ctx, cluster_id, count=3)
+        self.assertEqual(1, res)
+        res = db_api.cluster_get(self.ctx, cluster_id)
+        self.assertEqual(4, res.next_index)
+        res = db_api.cluster_next_index(self.ctx, cluster_id)
+        self.assertEqual(4, res)
+
     def test_cluster_count_all(self):
         clusters = [shared.create_cluster(self.ctx, self.profile)
                     for i in range(3)]
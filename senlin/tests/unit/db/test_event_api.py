@@ -548,3 +548,79 @@ class DBAPIEventTest(base.SenlinTestCase):
         db_api.event_purge(project=None, granularity='days', age=5)
         res = db_api.event_get_all_by_cluster(self.ctx, cluster1.id)
         self.assertEqual(1, len(res))
+        cursor, rows = db_api.event_feed(self.ctx, 0, 10)
+        self.assertEqual([5], [r[0] for r in rows])
+
+    def test_event_feed(self):
+        cluster1 = shared.create_cluster(self.ctx, self.profile)
+        cluster2 = shared.create_cluster(self.ctx, self.profile)
+        e1 = self.create_event(self.ctx, entity=cluster1)
+        e2 = self.create_event(self.ctx, entity=cluster2)
+        e3 = self.create_event(self.ctx, entity=cluster1)
+        self.assertEqual(3, db_api.event_sequence_last(self.ctx))
+
+        cursor, rows = db_api.event_feed(self.ctx, 0, 10)
+        self.assertEqual(3, cursor)
+        self.assertEqual([(1, e1.id), (2, e2.id), (3, e3.id)],
+                         [(s, e.id) for s, e in rows])
+
+        cursor, rows = db_api.event_feed(self.ctx, 1, 1)
+        self.assertEqual(2, cursor)
+        self.assertEqual([e2.id], [e.id for s, e in rows])
+
+        cursor, rows = db_api.event_feed(self.ctx, 3, 10)
+        self.assertEqual(3, cursor)
+        self.assertEqual([], rows)
+
+        cursor, rows = db_api.event_feed(self.ctx, 0, 0)
+        self.assertEqual(0, cursor)
+        self.assertEqual([], rows)
+
+    def test_event_feed_filters(self):
+        cluster1 = shared.create_cluster(self.ctx, self.profile)
+        cluster2 = shared.create_cluster(self.ctx, self.profile)
+        e1 = self.create_event(self.ctx, entity=cluster1)
+        self.create_event(self.ctx, entity=cluster2)
+
+        # the cursor moves past the events not matching the filters
+        cursor, rows = db_api.event_feed(
+            self.ctx, 0, 10, filters={'cluster_id': [cluster1.id]})
+        self.assertEqual(2, cursor)
+        self.assertEqual([e1.id], [e.id for s, e in rows])
+
+    def test_event_feed_project_safe(self):
+        self.create_event(self.ctx)
+        ctx_new = utils.dummy_context(project='a-different-project')
+
+        cursor, rows = db_api.event_feed(ctx_new, 0, 10)
+        self.assertEqual(1, cursor)
+        self.assertEqual([], rows)
+
+        cursor, rows = db_api.event_feed(ctx_new, 0, 10, project_safe=False)
+        self.assertEqual(1, len(rows))
+
+    def test_event_feed_sequence_committed_order(self):
+        e1 = self.create_event(self.ctx)
+        e2 = self.create_event(self.ctx, timestamp=tu.utcnow())
+
+        # numbered by the order of commits, not of the timestamps
+        cursor, rows = db_api.event_feed(self.ctx, 0, 10)
+        self.assertEqual(2, cursor)
+        self.assertEqual([(1, e1.id), (2, e2.id)],
+                         [(s, e.id) for s, e in rows])
+
+        e3 = self.create_event(self.ctx)
+        cursor, rows = db_api.event_feed(self.ctx, cursor, 10)
+        self.assertEqual(3, cursor)
+        self.assertEqual([(3, e3.id)], [(s, e.id) for s, e in rows])
+
+    def test_event_prune_sequence(self):
+        cluster1 = shared.create_cluster(self.ctx, self.profile)
+        cluster2 = shared.create_cluster(self.ctx, self.profile)
+        self.create_event(self.ctx, entity=cluster1)
+        e2 = self.create_event(self.ctx, entity=cluster2)
+
+        db_api.event_prune(self.ctx, cluster1.id)
+
+        cursor, rows = db_api.event_feed(self.ctx, 0, 10)
+        self.assertEqual([(2, e2.id)], [(s, e.id) for s, e in rows])
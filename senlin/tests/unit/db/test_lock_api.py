@@ -221,6 +221,39 @@ class DBAPILockTest(base.SenlinTestCase):
         observed = db_api.node_lock_release(self.node.id, UUID2)
         self.assertTrue(observed)
 
+    def test_node_lock_acquire_release_many(self):
+        node2 = shared.create_node(self.ctx, self.cluster, self.profile)
+        node3 = shared.create_node(self.ctx, self.cluster, self.profile)
+        observed = db_api.node_lock_acquire(node3.id, UUID2)
+        self.assertEqual(UUID2, observed)
+
+        observed = db_api.node_lock_acquire_many(
+            [self.node.id, node2.id, node3.id], UUID1)
+        self.assertEqual({self.node.id: UUID1, node2.id: UUID1,
+                          node3.id: UUID2}, observed)
+
+        observed = db_api.node_lock_acquire(node2.id, UUID2)
+        self.assertEqual(UUID1, observed)
+
+        db_api.node_lock_release_many(UUID1, handover={node2.id: UUID3})
+
+        observed = db_api.node_lock_acquire(self.node.id, UUID2)
+        self.assertEqual(UUID2, observed)
+        observed = db_api.node_lock_acquire(node2.id, UUID2)
+        self.assertEqual(UUID3, observed)
+        observed = db_api.node_lock_release(node2.id, UUID3)
+        self.assertTrue(observed)
+
+    def test_node_lock_acquire_many_batched(self):
+        self.patchobject(db_api, 'NODE_LOCK_BATCH_SIZE', new=1)
+        node2 = shared.create_node(self.ctx, self.cluster, self.profile)
+        observed = db_api.node_lock_acquire(node2.id, UUID2)
+        self.assertEqual(UUID2, observed)
+
+        observed = db_api.node_lock_acquire_many([self.node.id, node2.id],
+                                                 UUID1)
+        self.assertEqual({self.node.id: UUID1, node2.id: UUID2}, observed)
+
 
 class GCByEngineTest(base.SenlinTestCase):
 
@@ -54,6 +54,67 @@ class DBAPINodeTest(base.SenlinTestCase):
         self.assertEqual(self.cluster.id, node.cluster_id)
         self.assertEqual(self.profile.id, node.profile_id)
 
+    def test_node_create_many(self):
+        values = [{
+            'id': 'NODE_%s' % i,
+            'name': 'node-%s' % i,
+            'profile_id': self.profile.id,
+            'cluster_id': self.cluster.id,
+            'index': i,
+            'status': 'INIT',
+            'user': self.ctx.user_id,
+            'project': self.ctx.project_id,
+        } for i in range(3)]
+        actions = [{
+            'id': 'ACTION_%s' % i,
+            'name': 'node_create_%s' % i,
+            'target': 'NODE_%s' % i,
+            'action': 'NODE_CREATE',
+            'user': self.ctx.user_id,
+            'project': self.ctx.project_id,
+        } for i in range(3)]
+
+        db_api.node_create_many(self.ctx, values, actions=actions)
+
+        nodes = db_api.node_get_all(self.ctx, sort='index')
+        self.assertEqual(['NODE_0', 'NODE_1', 'NODE_2'],
+                         [n.id for n in nodes])
+        self.assertEqual([0, 1, 2], [n.index for n in nodes])
+        for i in range(3):
+            action = db_api.action_get(self.ctx, 'ACTION_%s' % i)
+            self.assertEqual('NODE_%s' % i, action.target)
+
+    def test_node_create_many_parent(self):
+        values = [{'id': 'NODE_%s' % i, 'name': 'node-%s' % i,
+                   'profile_id': self.profile.id,
+                   'project': self.ctx.project_id} for i in range(2)]
+        actions = [{'id': 'ACTION_%s' % i, 'target': 'NODE_%s' % i,
+                    'action': 'NODE_CREATE',
+                    'project': self.ctx.project_id} for i in range(2)]
+        parent = {'id': 'PARENT', 'target': 'NODE_0',
+                  'action': 'BATCH_NODE_CREATE', 'status': 'WAITING',
+                  'project': self.ctx.project_id}
+
+        db_api.node_create_many(self.ctx, values, actions=actions,
+                                parent=parent)
+
+        action = db_api.action_get(self.ctx, 'PARENT')
+        self.assertEqual('WAITING', action.status)
+        self.assertEqual(['ACTION_0', 'ACTION_1'],
+                         sorted(db_api.dependency_get_depended(self.ctx,
+                                                               'PARENT')))
+
+    def test_node_create_many_no_actions(self):
+        values = [{'id': 'NODE_%s' % i, 'name': 'node-%s' % i,
+                   'profile_id': self.profile.id,
+                   'project': self.ctx.project_id} for i in range(2)]
+
+        db_api.node_create_many(self.ctx, values)
+
+        nodes = db_api.node_get_all(self.ctx)
+        self.assertEqual(2, len(nodes))
+        self.assertEqual([], db_api.action_get_all(self.ctx))
+
     def test_node_get(self):
         res = shared.create_node(self.ctx, self.cluster, self.profile)
 
@@ -159,6 +220,40 @@ class DBAPINodeTest(base.SenlinTestCase):
                                           project_safe=False)
         self.assertIsNotNone(res)
 
+    def test_node_get_by_identities(self):
+        node1 = shared.create_node(self.ctx, None, self.profile,
+                                   id='same-part-unique-part', name='node-1')
+        node2 = shared.create_node(self.ctx, None, self.profile,
+                                   id='same-part-part-unique', name='dup')
+        node3 = shared.create_node(self.ctx, None, self.profile, name='dup')
+        node4 = shared.create_node(self.ctx, None, self.profile,
+                                   name='node-4')
+
+        res = db_api.node_get_by_identities(
+            self.ctx, ['node-1', 'same-part-p', 'same-', 'dup', node4.id,
+                       'bogus'])
+
+        self.assertEqual([node1.id], [n.id for n in res['node-1']])
+        self.assertEqual([node2.id], [n.id for n in res['same-part-p']])
+        self.assertEqual(2, len(res['same-']))
+        self.assertEqual(set([node2.id, node3.id]),
+                         set(n.id for n in res['dup']))
+        self.assertEqual([node4.id], [n.id for n in res[node4.id]])
+        self.assertEqual([], res['bogus'])
+
+    def test_node_get_by_identities_diff_project(self):
+        shared.create_node(self.ctx, None, self.profile, name='node-1')
+
+        ctx_new = utils.dummy_context(project='a_different_project')
+        res = db_api.node_get_by_identities(ctx_new, ['node-1'])
+        self.assertEqual([], res['node-1'])
+        res = db_api.node_get_by_identities(ctx_new, ['node-1'],
+                                            project_safe=False)
+        self.assertEqual(1, len(res['node-1']))
+
+    def test_node_get_by_identities_empty(self):
+        self.assertEqual({}, db_api.node_get_by_identities(self.ctx, []))
+
     def test_node_get_all(self):
         values = [{'name': 'node1'}, {'name': 'node2'}, {'name': 'node3'}]
         [shared.create_node(self.ctx, None, self.profile, **v) for v in values]
@@ -535,6 +630,48 @@ class DBAPINodeTest(base.SenlinTestCase):
         self.assertEqual(1, len(results))
         self.assertEqual(node0.id, results[0])
 
+    def test_node_summary_get_all_by_cluster(self):
+        placement = {'zone': 'AZ1'}
+        node1 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                   data={'placement': placement,
+                                         'lb_member': 'M1'},
+                                   status='ERROR')
+        node2 = shared.create_node(self.ctx, self.cluster, self.profile)
+        shared.create_node(self.ctx, None, self.profile)
+
+        results = db_api.node_summary_get_all_by_cluster(self.ctx,
+                                                         self.cluster.id)
+        self.assertEqual(2, len(results))
+        rows = dict((r[0], r) for r in results)
+        self.assertEqual(set([node1.id, node2.id]), set(rows.keys()))
+        self.assertEqual(('ERROR', None, self.profile.id),
+                         rows[node1.id][1:4])
+        self.assertEqual({'placement': placement, 'lb_member': 'M1'},
+                         rows[node1.id][4])
+
+    def test_node_summary_get_all_by_cluster_with_filters(self):
+        shared.create_node(self.ctx, self.cluster, self.profile,
+                           role='master')
+        node2 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                   role='slave')
+
+        results = db_api.node_summary_get_all_by_cluster(
+            self.ctx, self.cluster.id, filters={'role': 'slave'})
+        self.assertEqual(1, len(results))
+        self.assertEqual(node2.id, results[0][0])
+
+    def test_node_summary_get_all_by_cluster_project_safe(self):
+        shared.create_node(self.ctx, self.cluster, self.profile)
+        self.ctx.project_id = 'a-different-project'
+
+        results = db_api.node_summary_get_all_by_cluster(self.ctx,
+                                                         self.cluster.id)
+        self.assertEqual(0, len(results))
+
+        results = db_api.node_summary_get_all_by_cluster(
+            self.ctx, self.cluster.id, project_safe=False)
+        self.assertEqual(1, len(results))
+
     def test_node_update(self):
         node = shared.create_node(self.ctx, self.cluster, self.profile)
         new_attributes = {
@@ -581,6 +718,45 @@ class DBAPINodeTest(base.SenlinTestCase):
         reason = 'Node new_name: Something is wrong'
         self.assertEqual(reason, cluster.status_reason)
 
+    def test_node_update_many(self):
+        node1 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                   name='node1')
+        node2 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                   name='node2')
+        node3 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                   name='node3')
+
+        db_api.node_update_many(self.ctx, {
+            node1.id: {'data': {'lb_member': 'M1'}},
+            node2.id: {'data': {'lb_member': 'M2'}},
+            node3.id: {'status': 'WARNING', 'status_reason': 'Bad'},
+        })
+
+        self.assertEqual({'lb_member': 'M1'},
+                         db_api.node_get(self.ctx, node1.id).data)
+        self.assertEqual({'lb_member': 'M2'},
+                         db_api.node_get(self.ctx, node2.id).data)
+        node3 = db_api.node_get(self.ctx, node3.id)
+        self.assertEqual('WARNING', node3.status)
+        self.assertEqual('Bad', node3.status_reason)
+        cluster = db_api.cluster_get(self.ctx, self.cluster.id)
+        self.assertEqual('INIT', cluster.status)
+        self.assertEqual('Node node3: Bad', cluster.status_reason)
+
+    def test_node_update_many_cluster_status_updated(self):
+        node = shared.create_node(self.ctx, self.cluster, self.profile,
+                                  name='node1')
+
+        db_api.node_update_many(self.ctx, {
+            node.id: {'status': 'ERROR', 'status_reason': 'Boom'}})
+
+        cluster = db_api.cluster_get(self.ctx, self.cluster.id)
+        self.assertEqual('WARNING', cluster.status)
+        self.assertEqual('Node node1: Boom', cluster.status_reason)
+
+    def test_node_update_many_empty(self):
+        self.assertIsNone(db_api.node_update_many(self.ctx, {}))
+
     def test_node_migrate_from_none(self):
         node_orphan = shared.create_node(self.ctx, None, self.profile)
         timestamp = tu.utcnow(True)
@@ -131,6 +131,19 @@ class DBAPIProfileTest(base.SenlinTestCase):
         res = db_api.profile_get_by_short_id(self.ctx, 'non-existent')
         self.assertIsNone(res)
 
+    def test_profile_get_by_identities(self):
+        p1 = shared.create_profile(self.ctx, id='same-part-unique-part',
+                                   name='profile-1')
+        p2 = shared.create_profile(self.ctx, id='same-part-part-unique',
+                                   name='profile-2')
+
+        res = db_api.profile_get_by_identities(
+            self.ctx, ['profile-1', 'same-part-p', 'same-part-'])
+
+        self.assertEqual([p1.id], [p.id for p in res['profile-1']])
+        self.assertEqual([p2.id], [p.id for p in res['same-part-p']])
+        self.assertEqual(2, len(res['same-part-']))
+
     def test_profile_get_by_short_id_diff_project(self):
         profile_id = 'same-part-unique-part'
         shared.create_profile(self.ctx, id=profile_id)
@@ -298,6 +311,18 @@ class DBAPIProfileTest(base.SenlinTestCase):
         results = db_api.profile_get_all(self.ctx, filters=filters)
         self.assertEqual(2, len(results))
 
+    def test_profile_created_at_by_ids(self):
+        p1 = shared.create_profile(self.ctx, name='profile1')
+        p2 = shared.create_profile(self.ctx, name='profile2')
+        shared.create_profile(self.ctx, name='profile3')
+
+        res = db_api.profile_created_at_by_ids(self.ctx,
+                                               [p1.id, p2.id, p1.id, 'bogus'])
+        self.assertEqual({p1.id: p1.created_at, p2.id: p2.created_at}, res)
+
+    def test_profile_created_at_by_ids_empty(self):
+        self.assertEqual({}, db_api.profile_created_at_by_ids(self.ctx, []))
+
     def test_profile_update(self):
         new_fields = {
             'name': 'test_profile_name_2',
@@ -0,0 +1,318 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import contextlib
+
+from sqlalchemy import event
+
+from senlin.db.sqlalchemy import api as db_api
+from senlin.tests.unit.common import base
+from senlin.tests.unit.common import utils
+from senlin.tests.unit.db import shared
+
+
+@contextlib.contextmanager
+def count_queries():
+    """Count the SQL statements issued to the database."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        # Skip the liveness ping oslo.db issues when checking out connections
+        if statement.strip() == 'SELECT 1':
+            return
+        if statement.split(None, 1)[0].upper() in ('SELECT', 'INSERT',
+                                                   'UPDATE', 'DELETE'):
+            statements.append(statement)
+
+    engine = db_api.get_engine()
+    event.listen(engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', _record)
+
+
+def _node_with_profile(node):
+    # The node object always reads the profile of a node
+    return node.profile.name
+
+
+def _nodes_with_profile(nodes):
+    return [n.profile.name for n in nodes]
+
+
+def _binding_with_relations(binding):
+    # The binding reports the names of its cluster and policy
+    return binding.cluster.name, binding.policy.name
+
+
+def _bindings_with_relations(bindings):
+    return [_binding_with_relations(b) for b in bindings]
+
+
+def _events_with_cluster(events):
+    return [e.cluster.name for e in events]
+
+
+class DBAPIQueryCountTest(base.SenlinTestCase):
+    """Regression tests for the number of queries of DB API calls.
+
+    Each scenario invokes one DB API function against a small data set and
+    asserts the number of statements issued, including the statements
+    needed to read the relationships the object layer consumes.
+    """
+
+    scenarios = [
+        ('cluster_get', dict(
+            call=lambda t: db_api.cluster_get(t.ctx, t.cluster.id),
+            expected=1)),
+        ('cluster_get_by_name', dict(
+            call=lambda t: db_api.cluster_get_by_name(t.ctx, 'c1'),
+            expected=1)),
+        ('cluster_get_by_short_id', dict(
+            call=lambda t: db_api.cluster_get_by_short_id(
+                t.ctx, t.cluster.id[:8]),
+            expected=1)),
+        ('cluster_get_by_identities', dict(
+            call=lambda t: db_api.cluster_get_by_identities(
+                t.ctx, ['c1', t.cluster.id, 'bogus']),
+            expected=1)),
+        ('cluster_get_all', dict(
+            call=lambda t: db_api.cluster_get_all(t.ctx),
+            expected=1)),
+        ('cluster_get_all_with_marker', dict(
+            call=lambda t: db_api.cluster_get_all(t.ctx,
+                                                  marker=t.cluster.id),
+            expected=2)),
+        ('cluster_count_all', dict(
+            call=lambda t: db_api.cluster_count_all(t.ctx),
+            expected=1)),
+        ('node_get', dict(
+            call=lambda t: _node_with_profile(
+                db_api.node_get(t.ctx, t.node1.id)),
+            expected=1)),
+        ('node_get_by_name', dict(
+            call=lambda t: _node_with_profile(
+                db_api.node_get_by_name(t.ctx, 'n1')),
+            expected=1)),
+        ('node_get_by_short_id', dict(
+            call=lambda t: _node_with_profile(
+                db_api.node_get_by_short_id(t.ctx, t.node1.id[:8])),
+            expected=1)),
+        ('node_get_by_identities', dict(
+            call=lambda t: [_node_with_profile(r[0]) for r in
+                            db_api.node_get_by_identities(
+                                t.ctx, ['n1', 'n2']).values()],
+            expected=1)),
+        ('node_get_all', dict(
+            call=lambda t: _nodes_with_profile(db_api.node_get_all(t.ctx)),
+            expected=1)),
+        ('node_get_all_by_cluster', dict(
+            call=lambda t: _nodes_with_profile(
+                db_api.node_get_all_by_cluster(t.ctx, t.cluster.id)),
+            expected=1)),
+        ('node_ids_by_cluster', dict(
+            call=lambda t: db_api.node_ids_by_cluster(t.ctx, t.cluster.id),
+            expected=1)),
+        ('node_summary_get_all_by_cluster', dict(
+            call=lambda t: db_api.node_summary_get_all_by_cluster(
+                t.ctx, t.cluster.id),
+            expected=1)),
+        ('node_count_by_cluster', dict(
+            call=lambda t: db_api.node_count_by_cluster(t.ctx, t.cluster.id),
+            expected=1)),
+        ('policy_get', dict(
+            call=lambda t: db_api.policy_get(t.ctx, t.policy.id),
+            expected=1)),
+        ('policy_get_by_name', dict(
+            call=lambda t: db_api.policy_get_by_name(t.ctx, 'p1'),
+            expected=1)),
+        ('policy_get_by_short_id', dict(
+            call=lambda t: db_api.policy_get_by_short_id(
+                t.ctx, t.policy.id[:8]),
+            expected=1)),
+        ('policy_get_all', dict(
+            call=lambda t: db_api.policy_get_all(t.ctx),
+            expected=1)),
+        ('cluster_policy_get', dict(
+            call=lambda t: _binding_with_relations(db_api.cluster_policy_get(
+                t.ctx, t.cluster.id, t.policy.id)),
+            expected=1)),
+        ('cluster_policy_get_all', dict(
+            call=lambda t: _bindings_with_relations(
+                db_api.cluster_policy_get_all(t.ctx, t.cluster.id)),
+            expected=1)),
+        ('cluster_policy_ids_by_cluster', dict(
+            call=lambda t: db_api.cluster_policy_ids_by_cluster(
+                t.ctx, t.cluster.id),
+            expected=1)),
+        ('cluster_policy_get_by_type', dict(
+            call=lambda t: _bindings_with_relations(
+                db_api.cluster_policy_get_by_type(
+                    t.ctx, t.cluster.id, 'senlin.policy.scaling')),
+            expected=1)),
+        ('cluster_policy_get_by_name', dict(
+            call=lambda t: _bindings_with_relations(
+                db_api.cluster_policy_get_by_name(t.ctx, t.cluster.id, 'p1')),
+            expected=1)),
+        ('profile_get', dict(
+            call=lambda t: db_api.profile_get(t.ctx, t.profile.id),
+            expected=1)),
+        ('profile_get_by_name', dict(
+            call=lambda t: db_api.profile_get_by_name(t.ctx, 'prof'),
+            expected=1)),
+        ('profile_get_by_short_id', dict(
+            call=lambda t: db_api.profile_get_by_short_id(
+                t.ctx, t.profile.id[:8]),
+            expected=1)),
+        ('profile_get_by_identities', dict(
+            call=lambda t: db_api.profile_get_by_identities(
+                t.ctx, ['prof', t.profile.id]),
+            expected=1)),
+        ('profile_get_all', dict(
+            call=lambda t: db_api.profile_get_all(t.ctx),
+            expected=1)),
+        ('profile_created_at_by_ids', dict(
+            call=lambda t: db_api.profile_created_at_by_ids(
+                t.ctx, [t.profile.id]),
+            expected=1)),
+        ('cred_get', dict(
+            call=lambda t: db_api.cred_get(t.ctx, 'USER', 'PROJECT'),
+            expected=1)),
+        ('event_get', dict(
+            call=lambda t: _events_with_cluster(
+                [db_api.event_get(t.ctx, t.event.id)]),
+            expected=1)),
+        ('event_get_by_short_id', dict(
+            call=lambda t: _events_with_cluster(
+                [db_api.event_get_by_short_id(t.ctx, t.event.id[:8])]),
+            expected=1)),
+        ('event_get_all', dict(
+            call=lambda t: _events_with_cluster(db_api.event_get_all(t.ctx)),
+            expected=1)),
+        ('event_count_by_cluster', dict(
+            call=lambda t: db_api.event_count_by_cluster(t.ctx,
+                                                         t.cluster.id),
+            expected=1)),
+        ('event_get_all_by_cluster', dict(
+            call=lambda t: _events_with_cluster(
+                db_api.event_get_all_by_cluster(t.ctx, t.cluster.id)),
+            expected=1)),
+        ('event_feed', dict(
+            call=lambda t: _events_with_cluster(
+                [e for _, e in db_api.event_feed(t.ctx, 0, 10)[1]]),
+            expected=2)),
+        ('action_get', dict(
+            call=lambda t: db_api.action_get(t.ctx, t.action1.id),
+            expected=1)),
+        ('action_get_refresh', dict(
+            call=lambda t: db_api.action_get(t.ctx, t.action1.id,
+                                             refresh=True),
+            expected=1)),
+        ('action_get_by_name', dict(
+            call=lambda t: db_api.action_get_by_name(t.ctx, 'a1'),
+            expected=1)),
+        ('action_get_by_short_id', dict(
+            call=lambda t: db_api.action_get_by_short_id(
+                t.ctx, t.action1.id[:8]),
+            expected=1)),
+        ('action_get_all_by_owner', dict(
+            call=lambda t: db_api.action_get_all_by_owner(t.ctx, 'ENGINE'),
+            expected=1)),
+        ('action_get_all', dict(
+            call=lambda t: db_api.action_get_all(t.ctx),
+            expected=1)),
+        ('dependency_get_depended', dict(
+            call=lambda t: db_api.dependency_get_depended(t.ctx,
+                                                          t.action2.id),
+            expected=1)),
+        ('dependency_get_dependents', dict(
+            call=lambda t: db_api.dependency_get_dependents(t.ctx,
+                                                            t.action1.id),
+            expected=1)),
+        ('action_signal_query', dict(
+            call=lambda t: db_api.action_signal_query(t.ctx, t.action1.id),
+            expected=1)),
+        ('action_lock_check', dict(
+            call=lambda t: db_api.action_lock_check(t.ctx, t.action1.id),
+            expected=1)),
+        ('receiver_get', dict(
+            call=lambda t: db_api.receiver_get(t.ctx, t.receiver.id),
+            expected=1)),
+        ('receiver_get_by_name', dict(
+            call=lambda t: db_api.receiver_get_by_name(t.ctx, 'r1'),
+            expected=1)),
+        ('receiver_get_by_short_id', dict(
+            call=lambda t: db_api.receiver_get_by_short_id(
+                t.ctx, t.receiver.id[:8]),
+            expected=1)),
+        ('receiver_get_all', dict(
+            call=lambda t: db_api.receiver_get_all(t.ctx),
+            expected=1)),
+        ('service_get', dict(
+            call=lambda t: db_api.service_get('SERVICE'),
+            expected=1)),
+        ('service_get_all', dict(
+            call=lambda t: db_api.service_get_all(),
+            expected=1)),
+        ('registry_get', dict(
+            call=lambda t: db_api.registry_get(t.ctx, t.cluster.id),
+            expected=1)),
+        ('registry_get_by_param', dict(
+            call=lambda t: db_api.registry_get_by_param(
+                t.ctx, {'cluster_id': t.cluster.id}),
+            expected=1)),
+    ]
+
+    def setUp(self):
+        super(DBAPIQueryCountTest, self).setUp()
+        self.ctx = utils.dummy_context()
+        self.profile = shared.create_profile(self.ctx, name='prof')
+        self.cluster = shared.create_cluster(self.ctx, self.profile,
+                                             name='c1')
+        self.node1 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                        name='n1')
+        self.node2 = shared.create_node(self.ctx, self.cluster, self.profile,
+                                        name='n2')
+        self.policy = shared.create_policy(self.ctx, name='p1')
+        db_api.cluster_policy_attach(self.ctx, self.cluster.id,
+                                     self.policy.id, {'enabled': True})
+        self.event = shared.create_event(self.ctx,
+                                         cluster_id=self.cluster.id)
+        self.action1 = shared.create_action(self.ctx, name='a1',
+                                            target=self.cluster.id,
+                                            owner='ENGINE',
+                                            context={'user': 'USER'})
+        self.action2 = shared.create_action(self.ctx, name='a2',
+                                            target=self.cluster.id,
+                                            context={'user': 'USER'})
+        db_api.dependency_add(self.ctx, self.action1.id, self.action2.id)
+        self.receiver = db_api.receiver_create(self.ctx, {
+            'name': 'r1',
+            'type': 'webhook',
+            'cluster_id': self.cluster.id,
+            'user': self.ctx.user_id,
+            'project': self.ctx.project_id,
+        })
+        db_api.cred_create(self.ctx, {'user': 'USER', 'project': 'PROJECT',
+                                      'cred': {'foo': 'bar'}})
+        db_api.service_create('SERVICE', host='HOST', binary='BINARY',
+                              topic='TOPIC')
+        db_api.registry_create(self.ctx, self.cluster.id, 'NODE_STATUS',
+                               60, {}, 'ENGINE', enabled=True)
+
+    def test_query_count(self):
+        with count_queries() as statements:
+            self.call(self)
+
+        self.assertEqual(self.expected, len(statements),
+                         '\n'.join(statements))
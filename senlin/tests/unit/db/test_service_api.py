@@ -10,11 +10,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
+
+import mock
+from oslo_config import cfg
+from oslo_utils import timeutils
 from oslo_utils import uuidutils
 
 from senlin.db.sqlalchemy import api as db_api
+from senlin.db.sqlalchemy import models
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
+from senlin.tests.unit.db import shared
 
 
 class DBAPIServiceTest(base.SenlinTestCase):
@@ -81,3 +88,102 @@ class DBAPIServiceTest(base.SenlinTestCase):
 
         res = db_api.service_get(service.id)
         self.assertIsNone(res)
+
+
+class DBAPIReplicaTest(base.SenlinTestCase):
+    def setUp(self):
+        super(DBAPIReplicaTest, self).setUp()
+        self.ctx = utils.dummy_context()
+        self.ctx.stale_reads = True
+        cfg.CONF.set_override('slave_connection', 'sqlite://',
+                              group='database')
+        self.patchobject(db_api, '_replica_state',
+                         new={'checked': None, 'lagging': False})
+
+    def _create_service(self, updated_at):
+        service = db_api.service_create(uuidutils.generate_uuid())
+        with db_api.session_for_write() as session:
+            session.query(models.Service).filter_by(id=service.id).update(
+                {'updated_at': updated_at})
+
+    @mock.patch.object(db_api, '_replica_lagging')
+    def test_read_from_replica(self, mock_lagging):
+        mock_lagging.return_value = False
+
+        self.assertTrue(db_api._read_from_replica(self.ctx))
+
+    def test_read_from_replica_not_stale(self):
+        self.ctx.stale_reads = False
+
+        self.assertFalse(db_api._read_from_replica(self.ctx))
+        self.assertFalse(db_api._read_from_replica(None))
+
+    def test_read_from_replica_read_primary(self):
+        self.ctx.read_primary = True
+
+        self.assertFalse(db_api._read_from_replica(self.ctx))
+
+    def test_read_from_replica_no_replica(self):
+        cfg.CONF.set_override('slave_connection', None, group='database')
+
+        self.assertFalse(db_api._read_from_replica(self.ctx))
+
+    @mock.patch.object(db_api, '_replica_lagging')
+    def test_read_from_replica_lagging(self, mock_lagging):
+        mock_lagging.return_value = True
+
+        self.assertFalse(db_api._read_from_replica(self.ctx))
+
+    @mock.patch.object(db_api, '_replica_lagging')
+    def test_session_for_read_replica(self, mock_lagging):
+        mock_lagging.return_value = False
+        cluster = shared.create_cluster(self.ctx,
+                                        shared.create_profile(self.ctx))
+
+        res = db_api.cluster_get(self.ctx, cluster.id)
+
+        self.assertEqual(cluster.id, res.id)
+        mock_lagging.assert_called_once_with()
+
+    def test_replica_lagging(self):
+        self._create_service(timeutils.utcnow())
+
+        self.assertFalse(db_api._replica_lagging())
+
+    def test_replica_lagging_old_heartbeat(self):
+        cfg.CONF.set_override('periodic_interval', 60)
+        cfg.CONF.set_override('database_replica_max_lag', 10)
+        self._create_service(timeutils.utcnow() -
+                             datetime.timedelta(seconds=90))
+
+        self.assertTrue(db_api._replica_lagging())
+
+    def test_replica_lagging_cache_period(self):
+        cfg.CONF.set_override('periodic_interval', 60)
+        cfg.CONF.set_override('database_replica_max_lag', 10)
+        # within the bound now, but not until the next check
+        self._create_service(timeutils.utcnow() -
+                             datetime.timedelta(seconds=67))
+
+        self.assertTrue(db_api._replica_lagging())
+
+    def test_replica_lagging_no_cache(self):
+        cfg.CONF.set_override('database_replica_max_lag', 0)
+        self._create_service(timeutils.utcnow())
+
+        self.assertFalse(db_api._replica_lagging())
+        db_api._replica_state['lagging'] = True
+        # checked again on each call
+        self.assertFalse(db_api._replica_lagging())
+
+    def test_replica_lagging_no_heartbeat(self):
+        self.assertTrue(db_api._replica_lagging())
+
+    def test_replica_lagging_cached(self):
+        self.assertTrue(db_api._replica_lagging())
+        self._create_service(timeutils.utcnow())
+
+        self.assertTrue(db_api._replica_lagging())
+
+        db_api._replica_state['checked'] -= db_api.REPLICA_CHECK_INTERVAL
+        self.assertFalse(db_api._replica_lagging())
@@ -13,6 +13,7 @@
 import mock
 from oslo_config import cfg
 
+from senlin.common import timing
 from senlin.drivers import base as driver_base
 from senlin.engine import environment
 from senlin.tests.unit.common import base
@@ -44,3 +45,36 @@ class TestSenlinDriver(base.SenlinTestCase):
 
         self.assertEqual('Compute2', sd.compute)
         self.assertEqual('Orchestration2', sd.orchestration)
+
+
+class FakeDriver(driver_base.DriverBase):
+
+    def server_get(self, server_id):
+        return server_id
+
+    def server_list(self):
+        return [self.server_get('S1'), self.server_get('S2')]
+
+    def _helper(self):
+        return 'HELPER'
+
+
+class TestDriverBase(base.SenlinTestCase):
+
+    def test_calls_counted(self):
+        driver = FakeDriver({})
+        recorder = timing.start()
+        self.addCleanup(timing.stop)
+
+        self.assertEqual('S1', driver.server_get('S1'))
+        self.assertEqual(['S1', 'S2'], driver.server_list())
+        self.assertEqual('HELPER', driver._helper())
+
+        # nested calls and private methods are not counted
+        self.assertEqual(2, recorder.driver_calls)
+
+    def test_calls_not_recording(self):
+        driver = FakeDriver({})
+
+        self.assertEqual(['S1', 'S2'], driver.server_list())
+        self.assertIsNone(timing.current())
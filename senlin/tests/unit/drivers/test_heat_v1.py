@@ -11,10 +11,10 @@
 # under the License.
 
 import mock
-from oslo_config import cfg
 
 from senlin.drivers.os import heat_v1
 from senlin.drivers import sdk
+from senlin.drivers import stack_watcher
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
 
@@ -84,52 +84,41 @@ class TestHeatV1(base.SenlinTestCase):
         self.hc.stack_get_template('stack_id')
         self.orch.get_stack_template.assert_called_once_with('stack_id')
 
-    def test_wait_for_stack(self):
-        self.hc.wait_for_stack('FAKE_ID', 'STATUS', [], 100, 200)
-        self.orch.find_stack.assert_called_once_with('FAKE_ID', False)
-        stk = self.orch.find_stack.return_value
-        self.orch.wait_for_status.assert_called_once_with(
-            stk, 'STATUS', [], 100, 200)
-
-    def test_wait_for_stack_failures_not_specified(self):
-        self.hc.wait_for_stack('FAKE_ID', 'STATUS', None, 100, 200)
-        self.orch.find_stack.assert_called_once_with('FAKE_ID', False)
-        stk = self.orch.find_stack.return_value
-        self.orch.wait_for_status.assert_called_once_with(
-            stk, 'STATUS', [], 100, 200)
-
-    def test_wait_for_stack_default_timeout(self):
-        cfg.CONF.set_override('default_action_timeout', 361)
-
-        self.hc.wait_for_stack('FAKE_ID', 'STATUS', None, 100, None)
-        self.orch.find_stack.assert_called_once_with('FAKE_ID', False)
-        stk = self.orch.find_stack.return_value
-        self.orch.wait_for_status.assert_called_once_with(
-            stk, 'STATUS', [], 100, 361)
-
-    def test_wait_for_stack_delete_successful(self):
-        fake_stack = mock.Mock(id='stack_id')
-        self.orch.find_stack.return_value = fake_stack
-        self.hc.wait_for_stack_delete('stack_id')
-        self.orch.find_stack.assert_called_once_with('stack_id', True)
-        self.orch.wait_for_delete.assert_called_once_with(fake_stack,
-                                                          wait=3600)
-
-    def test_wait_for_stack_not_found(self):
-        self.orch.find_stack.return_value = None
-        self.hc.wait_for_stack('FAKE_ID', 'STATUS', [], 100, 200)
-        self.assertEqual(0, self.orch.wait_for_status.call_count)
-
-    def test_wait_for_stack_delete_with_resource_not_found(self):
-        self.orch.find_stack.return_value = None
-        self.hc.wait_for_stack_delete('stack_id')
-        self.orch.find_stack.assert_called_once_with('stack_id', True)
-
-    def test_wait_for_server_delete_with_timeout(self):
-        cfg.CONF.set_override('default_action_timeout', 360)
-        fake_stack = mock.Mock(id='stack_id')
-        self.orch.find_stack.return_value = fake_stack
-
-        self.hc.wait_for_stack_delete('stack_id')
-        self.orch.wait_for_delete.assert_called_once_with(fake_stack,
-                                                          wait=360)
+    @mock.patch.object(stack_watcher, 'global_watcher')
+    def test_stack_status(self, mock_watcher):
+        watcher = mock_watcher.return_value
+
+        res = self.hc.stack_status('FAKE_ID')
+
+        self.assertEqual(watcher.wait.return_value, res)
+        watcher.wait.assert_called_once_with(self.hc, 'FAKE_ID', None)
+
+    @mock.patch.object(stack_watcher, 'global_watcher')
+    def test_wait_for_stack(self, mock_watcher):
+        watcher = mock_watcher.return_value
+
+        res = self.hc.wait_for_stack('FAKE_ID', 'STATUS', ['FAILED'], 200)
+
+        self.assertEqual(watcher.wait.return_value, res)
+        watcher.wait.assert_called_once_with(
+            self.hc, 'FAKE_ID', status='STATUS', failures=['FAILED'],
+            timeout=200)
+
+    @mock.patch.object(stack_watcher, 'global_watcher')
+    def test_wait_for_stack_default_value(self, mock_watcher):
+        watcher = mock_watcher.return_value
+
+        self.hc.wait_for_stack('FAKE_ID', 'STATUS')
+
+        watcher.wait.assert_called_once_with(
+            self.hc, 'FAKE_ID', status='STATUS', failures=None, timeout=None)
+
+    @mock.patch.object(stack_watcher, 'global_watcher')
+    def test_wait_for_stack_delete(self, mock_watcher):
+        watcher = mock_watcher.return_value
+
+        res = self.hc.wait_for_stack_delete('stack_id', 360)
+
+        self.assertIsNone(res)
+        watcher.wait.assert_called_once_with(
+            self.hc, 'stack_id', status='DELETE_COMPLETE', timeout=360)
@@ -126,6 +126,17 @@ class TestKeystoneV3(base.SenlinTestCase):
         mock_auth.assert_called_once_with(key='value')
         self.assertEqual('123', token)
 
+    @mock.patch.object(sdk, 'authenticate')
+    def test_get_token_info(self, mock_auth, mock_create):
+        access_info = {'token': '123', 'user_id': 'abc', 'project_id': 'xyz',
+                       'expires_at': 'EXPIRES'}
+        mock_auth.return_value = access_info
+
+        res = kv3.KeystoneClient.get_token_info(key='value')
+
+        mock_auth.assert_called_once_with(key='value')
+        self.assertEqual(('123', 'EXPIRES'), res)
+
     @mock.patch.object(sdk, 'authenticate')
     def test_get_user_id(self, mock_auth, mock_create):
         access_info = {'token': '123', 'user_id': 'abc', 'project_id': 'xyz'}
@@ -13,6 +13,7 @@
 import eventlet
 import mock
 
+from openstack.load_balancer.v2 import member as sdk_member
 from oslo_context import context as oslo_context
 
 from senlin.common import exception
@@ -124,7 +125,24 @@ class TestOctaviaLBaaSDriver(base.SenlinTestCase):
         res = self.lb_driver._wait_for_lb_ready(lb_id)
 
         self.assertFalse(res)
-        mock_sleep.assert_called_once_with(10)
+        self.assertEqual([mock.call(1), mock.call(2), mock.call(4),
+                          mock.call(8)], mock_sleep.call_args_list)
+
+    @mock.patch.object(eventlet, 'sleep')
+    def test_wait_for_lb_ready_backoff(self, mock_sleep):
+        self.lb_driver.lb_status_timeout = 600
+        pending = mock.Mock(provisioning_status='PENDING_UPDATE',
+                            operating_status='ONLINE')
+        ready = mock.Mock(provisioning_status='ACTIVE',
+                          operating_status='ONLINE')
+        self.oc.loadbalancer_get.side_effect = [pending] * 6 + [ready]
+
+        res = self.lb_driver._wait_for_lb_ready('LB_ID')
+
+        self.assertTrue(res)
+        self.assertEqual([mock.call(1), mock.call(2), mock.call(4),
+                          mock.call(8), mock.call(10), mock.call(10)],
+                         mock_sleep.call_args_list)
 
     def test_lb_create_succeeded(self):
         lb_obj = mock.Mock()
@@ -655,3 +673,128 @@ class TestOctaviaLBaaSDriver(base.SenlinTestCase):
         self.assertIsNone(res)
         self.lb_driver._wait_for_lb_ready.assert_has_calls(
             [mock.call('LB_ID'), mock.call('LB_ID')])
+
+    @mock.patch.object(nodem.Node, 'load')
+    @mock.patch.object(oslo_context, 'get_current')
+    def test_members_add_succeeded(self, mock_get_current, mock_load):
+        node1 = mock.Mock(id='NODE1')
+        node2 = mock.Mock(id='NODE2')
+        node3 = mock.Mock(id='NODE3')
+        node_objs = [mock.Mock(), mock.Mock(), mock.Mock()]
+        node_objs[0].get_details.return_value = {
+            'addresses': {'network1': [{'addr': '10.0.0.1'}]}}
+        node_objs[1].get_details.return_value = {
+            'addresses': {'network1': [{'addr': '10.0.0.2'}]}}
+        node_objs[2].get_details.return_value = {
+            'addresses': {'network2': [{'addr': '10.0.1.3'}]}}
+        mock_load.side_effect = node_objs
+        self.nc.subnet_get.return_value = mock.Mock(id='SUBNET_ID',
+                                                    network_id='NETWORK_ID')
+        network_obj = mock.Mock(id='NETWORK_ID')
+        network_obj.name = 'network1'
+        self.nc.network_get.return_value = network_obj
+        old = sdk_member.Member(id='OLD', name='', address='10.0.0.9',
+                                protocol_port=80, subnet_id='SUBNET_ID',
+                                weight=2, is_admin_state_up=False,
+                                monitor_address='10.0.0.99',
+                                monitor_port=8080, backup=True)
+        new1 = mock.Mock(id='MEMBER1', address='10.0.0.1', protocol_port=80)
+        new2 = mock.Mock(id='MEMBER2', address='10.0.0.2', protocol_port=80)
+        self.oc.pool_member_list.side_effect = [[old],
+                                                [old, new1, new2]]
+        self.lb_driver._wait_for_lb_ready = mock.Mock(return_value=True)
+
+        res = self.lb_driver.members_add([node1, node2, node3], 'LB_ID',
+                                         'POOL_ID', 80, 'subnet')
+
+        self.assertEqual({'NODE1': 'MEMBER1', 'NODE2': 'MEMBER2',
+                          'NODE3': None}, res)
+        self.nc.subnet_get.assert_called_once_with('subnet')
+        self.nc.network_get.assert_called_once_with('NETWORK_ID')
+        self.oc.pool_members_update.assert_called_once_with('POOL_ID', [
+            {'name': '', 'address': '10.0.0.9', 'protocol_port': 80,
+             'subnet_id': 'SUBNET_ID', 'weight': 2, 'admin_state_up': False,
+             'monitor_address': '10.0.0.99', 'monitor_port': 8080,
+             'backup': True},
+            {'address': '10.0.0.1', 'protocol_port': 80,
+             'subnet_id': 'SUBNET_ID'},
+            {'address': '10.0.0.2', 'protocol_port': 80,
+             'subnet_id': 'SUBNET_ID'},
+        ])
+        self.assertEqual(0, self.oc.pool_member_create.call_count)
+        self.lb_driver._wait_for_lb_ready.assert_has_calls(
+            [mock.call('LB_ID'), mock.call('LB_ID')])
+
+    def test_members_add_subnet_get_failed(self):
+        self.nc.subnet_get.side_effect = exception.InternalError(
+            code=500, message="Can't find subnet1")
+
+        res = self.lb_driver.members_add([mock.Mock(id='NODE1')], 'LB_ID',
+                                         'POOL_ID', 80, 'subnet1')
+
+        self.assertEqual({'NODE1': None}, res)
+        self.assertEqual(0, self.oc.pool_members_update.call_count)
+
+    @mock.patch.object(nodem.Node, 'load')
+    @mock.patch.object(oslo_context, 'get_current')
+    def test_members_add_update_failed(self, mock_get_current, mock_load):
+        mock_load.return_value.get_details.return_value = {
+            'addresses': {'network1': [{'addr': '10.0.0.1'}]}}
+        network_obj = mock.Mock()
+        network_obj.name = 'network1'
+        self.nc.network_get.return_value = network_obj
+        self.oc.pool_member_list.return_value = []
+        self.oc.pool_members_update.side_effect = exception.InternalError(
+            code=500, message='')
+        self.lb_driver._wait_for_lb_ready = mock.Mock(return_value=True)
+
+        res = self.lb_driver.members_add([mock.Mock(id='NODE1')], 'LB_ID',
+                                         'POOL_ID', 80, 'subnet')
+
+        self.assertEqual({'NODE1': None}, res)
+        self.lb_driver._wait_for_lb_ready.assert_called_once_with('LB_ID')
+
+    @mock.patch.object(nodem.Node, 'load')
+    @mock.patch.object(oslo_context, 'get_current')
+    def test_members_add_lb_unready(self, mock_get_current, mock_load):
+        mock_load.return_value.get_details.return_value = {
+            'addresses': {'network1': [{'addr': '10.0.0.1'}]}}
+        network_obj = mock.Mock()
+        network_obj.name = 'network1'
+        self.nc.network_get.return_value = network_obj
+        self.lb_driver._wait_for_lb_ready = mock.Mock(return_value=False)
+
+        res = self.lb_driver.members_add([mock.Mock(id='NODE1')], 'LB_ID',
+                                         'POOL_ID', 80, 'subnet')
+
+        self.assertEqual({'NODE1': None}, res)
+        self.assertEqual(0, self.oc.pool_members_update.call_count)
+
+    def test_members_remove_succeeded(self):
+        keep = sdk_member.Member(id='KEEP', name='keep', address='10.0.0.1',
+                                 protocol_port=80, weight=1,
+                                 is_admin_state_up=True, monitor_port=8080)
+        gone = sdk_member.Member(id='GONE', address='10.0.0.2',
+                                 protocol_port=80)
+        self.oc.pool_member_list.return_value = [keep, gone]
+        self.lb_driver._wait_for_lb_ready = mock.Mock(return_value=True)
+
+        res = self.lb_driver.members_remove('LB_ID', 'POOL_ID',
+                                            ['GONE', 'MISSING'])
+
+        self.assertEqual({'GONE': True, 'MISSING': True}, res)
+        self.oc.pool_members_update.assert_called_once_with('POOL_ID', [
+            {'name': 'keep', 'address': '10.0.0.1', 'protocol_port': 80,
+             'weight': 1, 'admin_state_up': True, 'monitor_port': 8080},
+        ])
+        self.lb_driver._wait_for_lb_ready.assert_has_calls(
+            [mock.call('LB_ID'), mock.call('LB_ID')])
+
+    def test_members_remove_wait_for_lb_timeout(self):
+        self.oc.pool_member_list.return_value = []
+        self.lb_driver._wait_for_lb_ready = mock.Mock(
+            side_effect=[True, False])
+
+        res = self.lb_driver.members_remove('LB_ID', 'POOL_ID', ['M1', 'M2'])
+
+        self.assertEqual({'M1': None, 'M2': None}, res)
@@ -11,8 +11,10 @@
 # under the License.
 
 import mock
+from openstack import exceptions as sdk_exc
 from oslo_utils import uuidutils
 
+from senlin.common import exception as exc
 from senlin.drivers.os import neutron_v2
 from senlin.drivers import sdk
 from senlin.tests.unit.common import base
@@ -92,6 +94,33 @@ class TestNeutronV2Driver(base.SenlinTestCase):
         self.conn.network.create_port.assert_called_once_with(
             network_id='foo')
 
+    def test_port_create_bulk(self):
+        res = mock.Mock(status_code=201)
+        res.json.return_value = {'ports': [
+            {'id': 'P1', 'network_id': 'NET', 'security_groups': ['SG']},
+            {'id': 'P2', 'network_id': 'NET', 'security_groups': ['SG']},
+        ]}
+        self.conn.network.post.return_value = res
+        ports = [{'network_id': 'NET'}, {'network_id': 'NET'}]
+
+        ports = self.nc.port_create_bulk(ports)
+
+        self.conn.network.post.assert_called_once_with(
+            '/ports', json={'ports': [{'network_id': 'NET'},
+                                      {'network_id': 'NET'}]})
+        self.assertEqual(['P1', 'P2'], [p.id for p in ports])
+        self.assertEqual(['SG'], ports[0].security_group_ids)
+
+    @mock.patch.object(sdk_exc, 'raise_from_response')
+    def test_port_create_bulk_failed(self, mock_raise):
+        mock_raise.side_effect = sdk_exc.HttpException(message='Quota',
+                                                       http_status=409)
+
+        ex = self.assertRaises(exc.InternalError, self.nc.port_create_bulk,
+                               [{'network_id': 'NET'}])
+
+        self.assertEqual(409, ex.code)
+
     def test_port_delete(self):
         self.nc.port_delete(port='foo')
         self.conn.network.delete_port.assert_called_once_with(
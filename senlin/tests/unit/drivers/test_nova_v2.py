@@ -11,10 +11,12 @@
 # under the License.
 
 import mock
-from oslo_config import cfg
+import six
 
+from senlin.common import exception as exc
 from senlin.drivers.os import nova_v2
 from senlin.drivers import sdk
+from senlin.drivers import server_watcher
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
 
@@ -104,6 +106,12 @@ class TestNovaV2(base.SenlinTestCase):
         d.server_get('foo')
         self.compute.get_server.assert_called_once_with('foo')
 
+    def test_server_list(self):
+        d = nova_v2.NovaClient(self.conn_params)
+        d.server_list(details=True, project_id='PROJ')
+        self.compute.servers.assert_called_once_with(details=True,
+                                                     project_id='PROJ')
+
     def test_server_update(self):
         d = nova_v2.NovaClient(self.conn_params)
         attrs = {'mem': 2}
@@ -320,55 +328,48 @@ class TestNovaV2(base.SenlinTestCase):
         self.assertEqual(target.return_value, res)
         target.assert_called_once_with(server, 'snapshot', 'meta')
 
-    def test_wait_for_server(self):
-        self.compute.find_server.return_value = 'foo'
+    @mock.patch.object(server_watcher, 'global_watcher')
+    def test_wait_for_server(self, mock_watcher):
+        watcher = mock_watcher.return_value
 
         d = nova_v2.NovaClient(self.conn_params)
-        d.wait_for_server('foo', 'STATUS1', ['STATUS2'], 5, 10)
-        self.compute.wait_for_server.assert_called_once_with(
-            'foo', status='STATUS1', failures=['STATUS2'], interval=5, wait=10)
+        res = d.wait_for_server('foo', 'STATUS1', ['STATUS2'], 10)
 
-    def test_wait_for_server_default_value(self):
-        self.compute.find_server.return_value = 'foo'
-
-        d = nova_v2.NovaClient(self.conn_params)
-        d.wait_for_server('foo', timeout=10)
-        self.compute.wait_for_server.assert_called_once_with(
-            'foo', status='ACTIVE', failures=['ERROR'], interval=2, wait=10)
+        self.assertEqual(watcher.wait.return_value, res)
+        watcher.wait.assert_called_once_with(
+            d, 'foo', status='STATUS1', failures=['STATUS2'], timeout=10)
 
-    def test_wait_for_server_with_default_timeout(self):
-        self.compute.find_server.return_value = 'foo'
-        timeout = cfg.CONF.default_action_timeout
+    @mock.patch.object(server_watcher, 'global_watcher')
+    def test_wait_for_server_default_value(self, mock_watcher):
+        watcher = mock_watcher.return_value
 
         d = nova_v2.NovaClient(self.conn_params)
         d.wait_for_server('foo')
-        self.compute.wait_for_server.assert_called_once_with(
-            'foo', status='ACTIVE', failures=['ERROR'], interval=2,
-            wait=timeout)
 
-    def test_wait_for_server_delete(self):
-        self.compute.find_server.return_value = 'FOO'
+        watcher.wait.assert_called_once_with(
+            d, 'foo', status='ACTIVE', failures=['ERROR'], timeout=None)
 
-        d = nova_v2.NovaClient(self.conn_params)
-        d.wait_for_server_delete('foo', 120)
-        self.compute.find_server.assert_called_once_with('foo', True)
-        self.compute.wait_for_delete.assert_called_once_with('FOO', wait=120)
-
-    def test_wait_for_server_delete_with_default_timeout(self):
-        cfg.CONF.set_override('default_action_timeout', 360)
-        self.compute.find_server.return_value = 'FOO'
+    @mock.patch.object(server_watcher, 'global_watcher')
+    def test_wait_for_server_failed(self, mock_watcher):
+        watcher = mock_watcher.return_value
+        watcher.wait.side_effect = exc.InternalError(code=408,
+                                                     message='TIMEOUT')
 
         d = nova_v2.NovaClient(self.conn_params)
-        d.wait_for_server_delete('foo')
-        self.compute.find_server.assert_called_once_with('foo', True)
-        self.compute.wait_for_delete.assert_called_once_with('FOO', wait=360)
+        ex = self.assertRaises(exc.InternalError, d.wait_for_server, 'foo')
 
-    def test_wait_for_server_delete_server_doesnt_exist(self):
-        self.compute.find_server.return_value = None
+        self.assertEqual('TIMEOUT', six.text_type(ex))
+
+    @mock.patch.object(server_watcher, 'global_watcher')
+    def test_wait_for_server_delete(self, mock_watcher):
+        watcher = mock_watcher.return_value
 
         d = nova_v2.NovaClient(self.conn_params)
-        res = d.wait_for_server_delete('foo')
+        res = d.wait_for_server_delete('foo', 120)
+
         self.assertIsNone(res)
+        watcher.wait.assert_called_once_with(d, 'foo', status='DELETED',
+                                             timeout=120)
 
     def test_server_interface_create(self):
         server = mock.Mock()
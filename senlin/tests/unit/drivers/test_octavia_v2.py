@@ -11,7 +11,9 @@
 # under the License.
 
 import mock
+from openstack import exceptions as sdk_exc
 
+from senlin.common import exception as exc
 from senlin.drivers.os import octavia_v2
 from senlin.drivers import sdk
 from senlin.tests.unit.common import base
@@ -262,3 +264,33 @@ class TestOctaviaV2Driver(base.SenlinTestCase):
         self.oc.healthmonitor_delete(healthmonitor_id)
         self.conn.load_balancer.delete_health_monitor.assert_called_with(
             healthmonitor_id, ignore_missing=True)
+
+    def test_pool_member_list(self):
+        self.conn.load_balancer.members.return_value = iter(['M1', 'M2'])
+
+        res = self.oc.pool_member_list('POOL_ID', address='10.0.0.1')
+
+        self.assertEqual(['M1', 'M2'], res)
+        self.conn.load_balancer.members.assert_called_once_with(
+            'POOL_ID', address='10.0.0.1')
+
+    def test_pool_members_update(self):
+        members = [{'address': '10.0.0.1', 'protocol_port': 80}]
+        self.conn.load_balancer.put.return_value = mock.Mock(status_code=202)
+
+        self.oc.pool_members_update('POOL_ID', members)
+
+        self.conn.load_balancer.put.assert_called_once_with(
+            '/v2.0/lbaas/pools/POOL_ID/members', json={'members': members})
+
+    @mock.patch.object(sdk_exc, 'raise_from_response')
+    def test_pool_members_update_failed(self, mock_raise):
+        mock_raise.side_effect = sdk_exc.HttpException(message='Conflict',
+                                                       http_status=409)
+
+        ex = self.assertRaises(exc.InternalError,
+                               self.oc.pool_members_update, 'POOL_ID', [])
+
+        self.assertEqual(409, ex.code)
+        mock_raise.assert_called_once_with(
+            self.conn.load_balancer.put.return_value)
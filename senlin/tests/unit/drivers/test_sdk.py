@@ -150,6 +150,26 @@ class OpenStackSDKTest(base.SenlinTestCase):
         self.assertEqual(500, ex.code)
         self.assertEqual('BOOM', ex.message)
 
+    def test_translate_exception_observe_kind(self):
+        mock_observe = self.patchobject(sdk.DRIVER_SECONDS, 'observe')
+
+        @sdk.translate_exception
+        def server_get(driver):
+            return 'SERVER'
+
+        @sdk.translate_exception
+        def wait_for_server(driver):
+            return 'ACTIVE'
+
+        driver = mock.Mock()
+        self.assertEqual('SERVER', server_get(driver))
+        self.assertEqual('ACTIVE', wait_for_server(driver))
+
+        mock_observe.assert_has_calls([
+            mock.call(mock.ANY, service='mock', kind=sdk.CALL_API),
+            mock.call(mock.ANY, service='mock', kind=sdk.CALL_WAIT),
+        ])
+
     @mock.patch.object(connection, 'Connection')
     def test_create_connection_token(self, mock_conn):
         x_conn = mock.Mock()
@@ -225,10 +245,13 @@ class OpenStackSDKTest(base.SenlinTestCase):
         x_conn.session.get_token.return_value = 'TOKEN'
         x_conn.session.get_user_id.return_value = 'test-user-id'
         x_conn.session.get_project_id.return_value = 'test-project-id'
+        x_access = x_conn.session.auth.get_access.return_value
+        x_access.expires = 'EXPIRES'
         access_info = {
             'token': 'TOKEN',
             'user_id': 'test-user-id',
-            'project_id': 'test-project-id'
+            'project_id': 'test-project-id',
+            'expires_at': 'EXPIRES'
         }
 
         res = sdk.authenticate(foo='bar')
@@ -0,0 +1,204 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+
+import eventlet
+import mock
+from oslo_config import cfg
+from oslo_utils import timeutils
+import six
+
+from senlin.common import exception as exc
+from senlin.drivers import server_watcher as sw
+from senlin.drivers import watcher
+from senlin.tests.unit.common import base
+
+
+class TestServerWatcher(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestServerWatcher, self).setUp()
+        self.mock_spawn = self.patchobject(eventlet, 'spawn')
+        self.watcher = sw.ServerWatcher(interval=1)
+
+    def _driver(self, params=None):
+        driver = mock.Mock(conn_params=params or {'trust_id': 'TRUST'})
+        driver.server_list.return_value = []
+        return driver
+
+    def test_global_watcher(self):
+        self.patchobject(sw, '_watcher', new=None)
+
+        res = sw.global_watcher()
+
+        self.assertIsInstance(res, sw.ServerWatcher)
+        self.assertIs(res, sw.global_watcher())
+
+    def test_interval_default(self):
+        cfg.CONF.set_override('server_watch_interval', 5)
+
+        self.assertEqual(5, sw.ServerWatcher().interval)
+        self.assertEqual(1, self.watcher.interval)
+
+    def test_watch_starts_runner_once(self):
+        driver = self._driver()
+
+        self.watcher.watch(driver, 'S1')
+        self.watcher.watch(driver, 'S2')
+
+        self.mock_spawn.assert_called_once_with(self.watcher._run)
+
+    def test_tick_batches_per_credential(self):
+        d1 = self._driver({'trust_id': 'T1'})
+        d1_copy = self._driver({'trust_id': 'T1'})
+        d2 = self._driver({'trust_id': 'T2'})
+        d1.server_list.return_value = [mock.Mock(id='S1', status='ACTIVE'),
+                                       mock.Mock(id='S2', status='BUILD')]
+        d2.server_list.return_value = [mock.Mock(id='S3', status='ACTIVE')]
+        w1 = self.watcher.watch(d1, 'S1')
+        w2 = self.watcher.watch(d1_copy, 'S2')
+        w3 = self.watcher.watch(d2, 'S3')
+
+        self.watcher.tick()
+
+        self.assertEqual(1, d1.server_list.call_count)
+        self.assertEqual(0, d1_copy.server_list.call_count)
+        self.assertEqual(1, d2.server_list.call_count)
+        self.assertTrue(w1.event.ready())
+        self.assertEqual('S1', w1.wait().id)
+        self.assertFalse(w2.event.ready())
+        self.assertTrue(w3.event.ready())
+        self.assertEqual([w2], self.watcher._groups.popitem()[1][1])
+
+    def test_tick_changes_since(self):
+        driver = self._driver()
+        driver.server_list.return_value = [
+            mock.Mock(id='S1', status='BUILD')]
+        now = timeutils.utcnow(True)
+        margin = datetime.timedelta(seconds=watcher.CHANGES_MARGIN)
+        first = now + datetime.timedelta(seconds=2)
+        second = now + datetime.timedelta(seconds=4)
+        self.patchobject(timeutils, 'utcnow',
+                         side_effect=[now, first, second])
+        waiter = self.watcher.watch(driver, 'S1')
+
+        self.watcher.tick()
+        self.watcher.tick()
+
+        self.assertEqual([
+            mock.call(changes_since=(now - margin).isoformat()),
+            mock.call(changes_since=(first - margin).isoformat()),
+        ], driver.server_list.call_args_list)
+        self.assertFalse(waiter.event.ready())
+
+    def test_tick_failure_status(self):
+        driver = self._driver()
+        driver.server_list.return_value = [
+            mock.Mock(id='S1', status='ERROR')]
+        waiter = self.watcher.watch(driver, 'S1', failures=['ERROR'])
+
+        self.watcher.tick()
+
+        ex = self.assertRaises(exc.InternalError, waiter.wait)
+        self.assertEqual("Server S1 transitioned to status 'ERROR' while "
+                         "waiting for status 'ACTIVE'.", six.text_type(ex))
+        self.assertEqual({}, self.watcher._groups)
+
+    def test_tick_deleted(self):
+        driver = self._driver()
+        server = mock.Mock(id='S1', status='DELETED')
+        driver.server_list.return_value = [server]
+        w1 = self.watcher.watch(driver, 'S1', status=sw.DELETED)
+        w2 = self.watcher.watch(driver, 'S1')
+
+        self.watcher.tick()
+
+        self.assertEqual(server, w1.wait())
+        self.assertRaises(exc.InternalError, w2.wait)
+
+    def test_tick_verify_unchanged_server(self):
+        driver = self._driver()
+        driver.server_get.return_value = mock.Mock(id='S1', status='ACTIVE')
+        waiter = self.watcher.watch(driver, 'S1')
+
+        self.watcher.tick()
+
+        driver.server_get.assert_called_once_with('S1')
+        self.assertEqual('S1', waiter.wait().id)
+
+    def test_tick_verify_only_once(self):
+        driver = self._driver()
+        driver.server_get.return_value = mock.Mock(id='S1', status='BUILD')
+        waiter = self.watcher.watch(driver, 'S1')
+
+        self.watcher.tick()
+        self.watcher.tick()
+
+        driver.server_get.assert_called_once_with('S1')
+        self.assertEqual(2, driver.server_list.call_count)
+        self.assertFalse(waiter.event.ready())
+
+    def test_tick_verify_missing_server(self):
+        driver = self._driver()
+        driver.server_get.side_effect = exc.InternalError(code=404,
+                                                          message='Boom')
+        w1 = self.watcher.watch(driver, 'S1', status=sw.DELETED)
+        w2 = self.watcher.watch(driver, 'S2')
+
+        self.watcher.tick()
+
+        self.assertIsNone(w1.wait())
+        ex = self.assertRaises(exc.InternalError, w2.wait)
+        self.assertEqual(404, ex.code)
+
+    def test_tick_list_failed(self):
+        driver = self._driver()
+        driver.server_list.side_effect = exc.InternalError(message='Boom')
+        waiter = self.watcher.watch(driver, 'S1')
+        since = waiter.since
+
+        self.watcher.tick()
+
+        self.assertFalse(waiter.event.ready())
+        self.assertEqual(since, waiter.since)
+        self.assertEqual(0, driver.server_get.call_count)
+
+    def test_tick_timeout(self):
+        driver = self._driver()
+        driver.server_list.return_value = [
+            mock.Mock(id='S1', status='BUILD')]
+        waiter = self.watcher.watch(driver, 'S1', timeout=0)
+
+        self.watcher.tick()
+
+        ex = self.assertRaises(exc.InternalError, waiter.wait)
+        self.assertEqual(408, ex.code)
+        self.assertEqual("Timeout waiting for server S1 to transition to "
+                         "status 'ACTIVE'.", six.text_type(ex))
+        self.assertEqual({}, self.watcher._groups)
+
+    def test_run(self):
+        driver = self._driver()
+        mock_sleep = self.patchobject(eventlet, 'sleep')
+        driver.server_list.side_effect = [
+            [mock.Mock(id='S1', status='BUILD')],
+            [mock.Mock(id='S1', status='ACTIVE')],
+        ]
+        waiter = self.watcher.watch(driver, 'S1')
+
+        self.watcher._run()
+
+        self.assertEqual([mock.call(1), mock.call(1)],
+                         mock_sleep.call_args_list)
+        self.assertEqual('ACTIVE', waiter.wait().status)
+        self.assertIsNone(self.watcher._runner)
@@ -0,0 +1,105 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import eventlet
+import mock
+from oslo_config import cfg
+import six
+
+from senlin.common import exception as exc
+from senlin.drivers import stack_watcher as sw
+from senlin.tests.unit.common import base
+
+
+class TestStackWatcher(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestStackWatcher, self).setUp()
+        self.patchobject(eventlet, 'spawn')
+        self.watcher = sw.StackWatcher(interval=1)
+        self.driver = mock.Mock(conn_params={'trust_id': 'TRUST'})
+        self.driver.stack_list.return_value = []
+
+    def test_global_watcher(self):
+        self.patchobject(sw, '_watcher', new=None)
+
+        res = sw.global_watcher()
+
+        self.assertIsInstance(res, sw.StackWatcher)
+        self.assertIs(res, sw.global_watcher())
+
+    def test_interval_default(self):
+        cfg.CONF.set_override('stack_watch_interval', 5)
+
+        self.assertEqual(5, sw.StackWatcher().interval)
+
+    def test_tick(self):
+        self.driver.stack_list.return_value = [
+            mock.Mock(id='S1', status='CREATE_COMPLETE'),
+            mock.Mock(id='S2', status='CREATE_IN_PROGRESS'),
+            mock.Mock(id='S3', status='UPDATE_FAILED'),
+        ]
+        w1 = self.watcher.watch(self.driver, 'S1', 'CREATE_COMPLETE')
+        w2 = self.watcher.watch(self.driver, 'S2', 'CREATE_COMPLETE')
+        w3 = self.watcher.watch(self.driver, 'S3', 'UPDATE_COMPLETE',
+                                failures=['UPDATE_FAILED'])
+
+        self.watcher.tick()
+
+        self.driver.stack_list.assert_called_once_with()
+        self.assertEqual('S1', w1.wait().id)
+        self.assertFalse(w2.event.ready())
+        ex = self.assertRaises(exc.InternalError, w3.wait)
+        self.assertEqual("Stack S3 transitioned to status 'UPDATE_FAILED' "
+                         "while waiting for status 'UPDATE_COMPLETE'.",
+                         six.text_type(ex))
+        self.assertEqual(0, self.driver.stack_get.call_count)
+
+    def test_tick_any_status(self):
+        self.driver.stack_list.return_value = [
+            mock.Mock(id='S1', status='CHECK_FAILED')]
+        w1 = self.watcher.watch(self.driver, 'S1', None)
+        w2 = self.watcher.watch(self.driver, 'S2', None)
+        self.driver.stack_get.side_effect = exc.InternalError(code=404,
+                                                              message='Boom')
+
+        self.watcher.tick()
+
+        self.assertEqual('CHECK_FAILED', w1.wait().status)
+        self.assertIsNone(w2.wait())
+
+    def test_tick_verify_deleted_stack(self):
+        self.driver.stack_list.side_effect = [
+            [mock.Mock(id='S1', status='DELETE_IN_PROGRESS')],
+            [],
+        ]
+        self.driver.stack_get.return_value = mock.Mock(
+            id='S1', status='DELETE_COMPLETE')
+        waiter = self.watcher.watch(self.driver, 'S1', sw.DELETED)
+
+        self.watcher.tick()
+        self.assertFalse(waiter.event.ready())
+        self.watcher.tick()
+
+        self.assertEqual('DELETE_COMPLETE', waiter.wait().status)
+        self.driver.stack_get.assert_called_once_with('S1')
+
+    def test_tick_verify_every_time(self):
+        self.driver.stack_get.return_value = mock.Mock(
+            id='S1', status='CREATE_IN_PROGRESS')
+        waiter = self.watcher.watch(self.driver, 'S1', 'CREATE_COMPLETE')
+
+        self.watcher.tick()
+        self.watcher.tick()
+
+        self.assertEqual(2, self.driver.stack_get.call_count)
+        self.assertFalse(waiter.event.ready())
@@ -14,6 +14,7 @@ import mock
 
 from openstack import exceptions as sdk_exc
 
+from senlin.common import exception as exc
 from senlin.drivers.os import zaqar_v2
 from senlin.drivers import sdk
 from senlin.tests.unit.common import base
@@ -139,6 +140,32 @@ class TestZaqarV2(base.SenlinTestCase):
         self.message.delete_message.assert_called_once_with(
             'foo', 'MESSAGE_ID', 'CLAIM_ID', True)
 
+    def test_message_delete_many(self):
+        zc = zaqar_v2.ZaqarClient(self.conn_params)
+        self.mock_conn.session.get_project_id.return_value = 'PROJECT'
+        res = mock.Mock(status_code=204)
+        self.message.delete.return_value = res
+
+        zc.message_delete_many('foo', ['M1', 'M2'], 'CLAIM_ID')
+
+        self.message.delete.assert_called_once_with(
+            '/queues/foo/messages',
+            params={'ids': 'M1,M2', 'claim_ids': 'CLAIM_ID'},
+            headers={'Client-ID': mock.ANY, 'X-PROJECT-ID': 'PROJECT'})
+
+    @mock.patch.object(sdk_exc, 'raise_from_response')
+    def test_message_delete_many_failed(self, mock_raise):
+        zc = zaqar_v2.ZaqarClient(self.conn_params)
+        mock_raise.side_effect = sdk_exc.HttpException(message='Boom',
+                                                       http_status=403)
+
+        ex = self.assertRaises(exc.InternalError, zc.message_delete_many,
+                               'foo', ['M1'])
+
+        self.assertEqual(403, ex.code)
+        params = self.message.delete.call_args[1]['params']
+        self.assertEqual({'ids': 'M1'}, params)
+
     def test_message_post(self):
         zc = zaqar_v2.ZaqarClient(self.conn_params)
         zc.message_post('foo', 'MESSAGE')
@@ -11,7 +11,9 @@
 # under the License.
 
 import copy
+import datetime
 import eventlet
+import iso8601
 
 import mock
 from oslo_config import cfg
@@ -245,6 +247,45 @@ class ActionBaseTest(base.SenlinTestCase):
         self.assertEqual('FAKE_ID', result)
         mock_store.assert_called_once_with(self.ctx)
 
+    @mock.patch.object(cluster_mod.Cluster, 'load')
+    def test_action_create_many(self, mock_load):
+        specs = [
+            (CLUSTER_ID, 'CLUSTER_SCALE_OUT',
+             {'name': 'A1', 'timeout': 60, 'inputs': {'count': 1}}),
+            (CLUSTER_ID, 'CLUSTER_SCALE_IN', {'name': 'A2'}),
+        ]
+
+        res = ab.Action.create_many(self.ctx, specs)
+
+        self.assertEqual(2, len(res))
+        a1 = ao.Action.get(self.ctx, res[0])
+        self.assertEqual('A1', a1.name)
+        self.assertEqual('CLUSTER_SCALE_OUT', a1.action)
+        self.assertEqual(CLUSTER_ID, a1.target)
+        self.assertEqual(60, a1.timeout)
+        self.assertEqual({'count': 1}, a1.inputs)
+        self.assertEqual(USER_ID, a1.context['user_id'])
+        self.assertIsNotNone(a1.created_at)
+        a2 = ao.Action.get(self.ctx, res[1])
+        self.assertEqual('CLUSTER_SCALE_IN', a2.action)
+        self.assertEqual(cfg.CONF.default_action_timeout, a2.timeout)
+        self.assertEqual(0, mock_load.call_count)
+
+    def test_values_from_kwargs(self):
+        kwargs = {'name': 'A1', 'cause': 'RPC', 'inputs': {'count': 1}}
+
+        res = ab.Action._values_from_kwargs(self.ctx, OBJID, 'CLUSTER_DANCE',
+                                            kwargs)
+
+        # same values as stored for an action object
+        obj = ab.Action(OBJID, 'CLUSTER_DANCE', self.ctx, **kwargs)
+        self.assertEqual(obj._to_values(), res)
+
+    @mock.patch.object(ao.Action, 'create_many')
+    def test_action_create_many_empty(self, mock_create):
+        self.assertEqual([], ab.Action.create_many(self.ctx, []))
+        mock_create.assert_called_once_with(self.ctx, [])
+
     def test_action_delete(self):
         result = ab.Action.delete(self.ctx, 'non-existent')
         self.assertIsNone(result)
@@ -408,6 +449,28 @@ class ActionBaseTest(base.SenlinTestCase):
         mark_fail.assert_called_once_with(action.context, 'FAKE_ID', mock.ANY,
                                           'BUSY')
 
+    @mock.patch.object(EVENT, 'error')
+    @mock.patch.object(EVENT, 'warning')
+    @mock.patch.object(ao.Action, 'mark_failed')
+    @mock.patch.object(ao.Action, 'abandon')
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(eventlet, 'sleep')
+    def test_set_status_timing(self, mock_sleep, mock_start, mock_abandon,
+                               mark_fail, mock_warning, mock_error):
+        action = ab.Action(OBJID, 'OBJECT_ACTION', self.ctx, id='FAKE_ID')
+        action.entity = mock.Mock()
+        recorded = {'phases': {'execute': 1.0}}
+
+        # not kept for an action to be retried
+        action.set_status(action.RES_RETRY, 'BUSY', timing=recorded)
+        mock_abandon.assert_called_once_with(
+            action.context, 'FAKE_ID', {'data': {'retries': 1}})
+
+        action.set_status(action.RES_ERROR, 'FAKE_ERROR', timing=recorded)
+        mark_fail.assert_called_once_with(
+            action.context, 'FAKE_ID', mock.ANY, 'FAKE_ERROR',
+            data={'retries': 1, 'timing': recorded})
+
     @mock.patch.object(EVENT, 'info')
     @mock.patch.object(EVENT, 'error')
     @mock.patch.object(EVENT, 'warning')
@@ -871,7 +934,8 @@ class ActionProcTest(base.SenlinTestCase):
         mock_load.assert_called_once_with(self.ctx, action_id='ACTION_ID',
                                           project_safe=False)
         mock_event_info.assert_called_once_with(action, 'start', 'ACTION_I')
-        mock_status.assert_called_once_with(action.RES_OK, 'BIG SUCCESS')
+        mock_status.assert_called_once_with(action.RES_OK, 'BIG SUCCESS',
+                                            timing=mock.ANY)
 
     @mock.patch.object(EVENT, 'info')
     @mock.patch.object(ab.Action, 'load')
@@ -890,4 +954,116 @@ class ActionProcTest(base.SenlinTestCase):
         mock_load.assert_called_once_with(self.ctx, action_id='ACTION',
                                           project_safe=False)
         mock_info.assert_called_once_with(action, 'start', 'ACTION')
-        mock_status.assert_called_once_with(action.RES_ERROR, 'Boom!')
+        mock_status.assert_called_once_with(action.RES_ERROR, 'Boom!',
+                                            timing=mock.ANY)
+
+    @mock.patch.object(EVENT, 'info')
+    @mock.patch.object(ab.Action, 'load')
+    @mock.patch.object(ao.Action, 'update')
+    @mock.patch.object(ao.Action, 'mark_succeeded')
+    def test_action_proc_timing(self, mock_mark, mock_update, mock_load,
+                                mock_info):
+        created_at = datetime.datetime(2018, 1, 1, tzinfo=iso8601.UTC)
+        action = ab.Action(OBJID, 'OBJECT_ACTION', self.ctx, id=ACTION_ID,
+                           created_at=created_at, data={'k': 'v'})
+        # 2018-01-01 00:00:05 UTC
+        action.start_time = 1514764805
+        self.patchobject(action, 'execute',
+                         return_value=(action.RES_OK, 'BIG SUCCESS'))
+        mock_load.return_value = action
+
+        res = ab.ActionProc(self.ctx, 'ACTION_ID')
+
+        self.assertTrue(res)
+        # the timing is written with the status
+        self.assertEqual(0, mock_update.call_count)
+        mock_mark.assert_called_once_with(self.ctx, ACTION_ID, mock.ANY,
+                                          data=action.data)
+        self.assertEqual('v', action.data['k'])
+        recorded = action.data['timing']
+        self.assertEqual({'queued', 'execute'}, set(recorded['phases']))
+        self.assertEqual(5, recorded['phases']['queued'])
+        self.assertEqual(0, recorded['driver_calls'])
+
+    @mock.patch.object(EVENT, 'info')
+    @mock.patch.object(ab.Action, 'load')
+    @mock.patch.object(ao.Action, 'update')
+    def test_action_proc_timing_retry(self, mock_update, mock_load,
+                                      mock_info):
+        action = ab.Action(OBJID, 'OBJECT_ACTION', self.ctx, id=ACTION_ID)
+        self.patchobject(action, 'execute',
+                         return_value=(action.RES_RETRY, 'Locked'))
+        self.patchobject(action, 'set_status')
+        mock_load.return_value = action
+
+        res = ab.ActionProc(self.ctx, 'ACTION_ID')
+
+        self.assertFalse(res)
+        self.assertEqual(0, mock_update.call_count)
+        self.assertNotIn('timing', action.data)
+
+    @mock.patch.object(EVENT, 'info')
+    @mock.patch.object(ab.Action, 'load')
+    @mock.patch.object(ao.Action, 'update')
+    @mock.patch.object(ao.Action, 'mark_succeeded')
+    def test_action_proc_timing_disabled(self, mock_mark, mock_update,
+                                         mock_load, mock_info):
+        cfg.CONF.set_override('action_timing', False)
+        action = ab.Action(OBJID, 'OBJECT_ACTION', self.ctx, id=ACTION_ID)
+        self.patchobject(action, 'execute',
+                         return_value=(action.RES_OK, 'BIG SUCCESS'))
+        mock_load.return_value = action
+
+        res = ab.ActionProc(self.ctx, 'ACTION_ID')
+
+        self.assertTrue(res)
+        self.assertEqual(0, mock_update.call_count)
+        mock_mark.assert_called_once_with(self.ctx, ACTION_ID, mock.ANY)
+        self.assertNotIn('timing', action.data)
+
+    @mock.patch.object(dispatcher, 'action_done')
+    @mock.patch.object(dispatcher, 'wake_waiters')
+    @mock.patch.object(EVENT, 'info')
+    @mock.patch.object(ab.Action, 'load')
+    def test_action_proc_notify_waiters(self, mock_load, mock_info,
+                                        mock_wake, mock_done):
+        cfg.CONF.set_override('action_timing', False)
+        action = ab.Action(OBJID, 'OBJECT_ACTION', self.ctx, id=ACTION_ID,
+                           cause=consts.CAUSE_RPC)
+        self.patchobject(action, 'execute',
+                         return_value=(action.RES_OK, 'BIG SUCCESS'))
+
+        def set_status(result, reason, timing=None):
+            action.status = action.SUCCEEDED
+
+        self.patchobject(action, 'set_status', side_effect=set_status)
+        mock_load.return_value = action
+
+        ab.ActionProc(self.ctx, ACTION_ID)
+
+        mock_wake.assert_has_calls([mock.call(ACTION_ID),
+                                    mock.call(ACTION_ID)])
+        mock_done.assert_called_once_with(ACTION_ID)
+
+    @mock.patch.object(dispatcher, 'action_done')
+    @mock.patch.object(dispatcher, 'wake_waiters')
+    @mock.patch.object(EVENT, 'info')
+    @mock.patch.object(ab.Action, 'load')
+    def test_action_proc_notify_waiters_derived(self, mock_load, mock_info,
+                                                mock_wake, mock_done):
+        cfg.CONF.set_override('action_timing', False)
+        action = ab.Action(OBJID, 'OBJECT_ACTION', self.ctx, id=ACTION_ID,
+                           cause=consts.CAUSE_DERIVED)
+        self.patchobject(action, 'execute',
+                         return_value=(action.RES_OK, 'BIG SUCCESS'))
+
+        def set_status(result, reason, timing=None):
+            action.status = action.SUCCEEDED
+
+        self.patchobject(action, 'set_status', side_effect=set_status)
+        mock_load.return_value = action
+
+        ab.ActionProc(self.ctx, ACTION_ID)
+
+        self.assertEqual(2, mock_wake.call_count)
+        self.assertEqual(0, mock_done.call_count)
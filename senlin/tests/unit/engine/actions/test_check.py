@@ -29,6 +29,7 @@ class ClusterCheckTest(base.SenlinTestCase):
     def setUp(self):
         super(ClusterCheckTest, self).setUp()
         self.ctx = utils.dummy_context()
+        self.patchobject(ca.ClusterAction, '_lock_nodes')
 
     @mock.patch.object(ao.Action, 'update')
     @mock.patch.object(ab.Action, 'create')
@@ -19,6 +19,7 @@ from senlin.engine.actions import cluster_action as ca
 from senlin.engine import cluster as cm
 from senlin.engine import dispatcher
 from senlin.engine import senlin_lock
+from senlin.objects import action as ao
 from senlin.policies import base as pb
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
@@ -186,6 +187,97 @@ class ClusterActionTest(base.SenlinTestCase):
         res = action.cancel()
         self.assertEqual(action.RES_OK, res)
 
+    @mock.patch.object(senlin_lock, 'cluster_lock_acquire')
+    @mock.patch.object(senlin_lock, 'cluster_lock_release')
+    def test_execute_release_nodes(self, mock_release, mock_acquire,
+                                   mock_load):
+        action = ca.ClusterAction('FAKE_CLUSTER', 'CLUSTER_FLY', self.ctx)
+        action.id = 'ACTION_ID'
+        mock_acquire.return_value = action
+        self.patchobject(action, '_execute',
+                         side_effect=Exception('boom'))
+        mock_release_nodes = self.patchobject(action, '_release_nodes')
+
+        self.assertRaises(Exception, action.execute)
+
+        mock_release_nodes.assert_called_once_with()
+        mock_release.assert_called_once_with(
+            'FAKE_CLUSTER', 'ACTION_ID', senlin_lock.CLUSTER_SCOPE)
+
+    @mock.patch.object(senlin_lock, 'cluster_lock_acquire')
+    @mock.patch.object(senlin_lock, 'cluster_lock_release')
+    def test_execute_release_nodes_failed(self, mock_release, mock_acquire,
+                                          mock_load):
+        action = ca.ClusterAction('FAKE_CLUSTER', 'CLUSTER_FLY', self.ctx)
+        action.id = 'ACTION_ID'
+        mock_acquire.return_value = action
+        self.patchobject(action, '_execute',
+                         return_value=(action.RES_OK, 'success'))
+        self.patchobject(action, '_release_nodes',
+                         side_effect=Exception('DB error'))
+
+        self.assertRaises(Exception, action.execute)
+
+        # the cluster lock is released anyway
+        mock_release.assert_called_once_with(
+            'FAKE_CLUSTER', 'ACTION_ID', senlin_lock.CLUSTER_SCOPE)
+
+    @mock.patch.object(senlin_lock, 'node_lock_acquire_many')
+    @mock.patch.object(ab.Action, 'create')
+    def test_create_node_action(self, mock_create, mock_acquire, mock_load):
+        action = ca.ClusterAction('FAKE_CLUSTER', 'CLUSTER_FLY', self.ctx)
+        action.id = 'ACTION_ID'
+        mock_acquire.return_value = {'NODE_1'}
+        mock_create.side_effect = ['CHILD_1', 'CHILD_2']
+
+        action._lock_nodes(['NODE_1', 'NODE_2'])
+        res1 = action._create_node_action('NODE_1', 'NODE_FLY',
+                                          data={'foo': 'bar'})
+        res2 = action._create_node_action('NODE_2', 'NODE_FLY')
+
+        self.assertEqual('CHILD_1', res1)
+        self.assertEqual('CHILD_2', res2)
+        mock_acquire.assert_called_once_with(self.ctx, ['NODE_1', 'NODE_2'],
+                                             'ACTION_ID')
+        mock_create.assert_has_calls([
+            mock.call(self.ctx, 'NODE_1', 'NODE_FLY',
+                      data={'foo': 'bar',
+                            senlin_lock.NODE_LOCK_OWNER: 'ACTION_ID'}),
+            mock.call(self.ctx, 'NODE_2', 'NODE_FLY'),
+        ])
+        self.assertEqual({'NODE_1': 'CHILD_1'}, action._node_locks)
+
+    @mock.patch.object(senlin_lock, 'node_lock_release_many')
+    @mock.patch.object(ao.Action, 'get_all')
+    def test_release_nodes(self, mock_get_all, mock_release, mock_load):
+        action = ca.ClusterAction('FAKE_CLUSTER', 'CLUSTER_FLY', self.ctx)
+        action.id = 'ACTION_ID'
+        action._node_locks = {'NODE_1': 'CHILD_1', 'NODE_2': 'CHILD_2',
+                              'NODE_3': None}
+        mock_get_all.return_value = [
+            mock.Mock(id='CHILD_1', status=consts.ACTION_SUCCEEDED),
+            mock.Mock(id='CHILD_2', status=consts.ACTION_READY),
+        ]
+
+        action._release_nodes()
+
+        mock_get_all.assert_called_once_with(
+            self.ctx, filters={'id': mock.ANY}, project_safe=False)
+        self.assertEqual(
+            {'CHILD_1', 'CHILD_2'},
+            set(mock_get_all.call_args[1]['filters']['id']))
+        mock_release.assert_called_once_with(
+            'ACTION_ID', handover={'NODE_2': 'CHILD_2'})
+        self.assertEqual({}, action._node_locks)
+
+    @mock.patch.object(senlin_lock, 'node_lock_release_many')
+    def test_release_nodes_none_locked(self, mock_release, mock_load):
+        action = ca.ClusterAction('FAKE_CLUSTER', 'CLUSTER_FLY', self.ctx)
+
+        action._release_nodes()
+
+        self.assertEqual(0, mock_release.call_count)
+
 
 class CompleteLifecycleProcTest(base.SenlinTestCase):
 
@@ -11,6 +11,7 @@
 # under the License.
 
 import mock
+import six
 
 from senlin.common import consts
 from senlin.engine.actions import base as ab
@@ -21,6 +22,7 @@ from senlin.engine import node as nm
 from senlin.objects import action as ao
 from senlin.objects import cluster as co
 from senlin.objects import dependency as dobj
+from senlin.profiles import base as pb
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
 
@@ -102,6 +104,7 @@ class ClusterCreateTest(base.SenlinTestCase):
         self.assertEqual(action.RES_OK, res_code)
         self.assertEqual('', res_msg)
 
+    @mock.patch.object(pb.Profile, 'prepare_objects')
     @mock.patch.object(ao.Action, 'update')
     @mock.patch.object(ab.Action, 'create')
     @mock.patch.object(co.Cluster, 'get_next_index')
@@ -111,8 +114,8 @@ class ClusterCreateTest(base.SenlinTestCase):
     @mock.patch.object(ca.ClusterAction, '_wait_for_dependents')
     def test__create_nodes_multiple(self, mock_wait, mock_start, mock_dep,
                                     mock_node, mock_index, mock_action,
-                                    mock_update, mock_load):
-        cluster = mock.Mock(id='01234567-123434',
+                                    mock_update, mock_prepare, mock_load):
+        cluster = mock.Mock(id='01234567-123434', profile_id='PROFILE',
                             config={"node.name.format": "node-$3I"})
         node1 = mock.Mock(id='01234567-abcdef',
                           data={'placement': {'region': 'regionOne'}})
@@ -150,6 +153,8 @@ class ClusterCreateTest(base.SenlinTestCase):
         node1.store.assert_called_once_with(action.context)
         node2.store.assert_called_once_with(action.context)
         self.assertEqual(2, mock_action.call_count)
+        mock_prepare.assert_called_once_with(action.context, 'PROFILE',
+                                             [node1, node2])
         self.assertEqual(1, mock_dep.call_count)
 
         update_calls = [
@@ -177,6 +182,101 @@ class ClusterCreateTest(base.SenlinTestCase):
         cluster.add_node.assert_has_calls([
             mock.call(node1), mock.call(node2)])
 
+    @mock.patch.object(pb.Profile, 'prepare_objects')
+    @mock.patch.object(ao.Action, 'update')
+    @mock.patch.object(ab.Action, 'create')
+    @mock.patch.object(co.Cluster, 'get_next_index')
+    @mock.patch.object(nm, 'Node')
+    @mock.patch.object(dobj.Dependency, 'create')
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(ca.ClusterAction, '_wait_for_dependents')
+    def test__create_nodes_multiple_prepare_failed(
+            self, mock_wait, mock_start, mock_dep, mock_node, mock_index,
+            mock_action, mock_update, mock_prepare, mock_load):
+        cluster = mock.Mock(id='01234567-123434', profile_id='PROFILE',
+                            config={})
+        node1 = mock.Mock(id='01234567-abcdef', data={})
+        node2 = mock.Mock(id='abcdefab-123456', data={})
+        mock_node.side_effect = [node1, node2]
+        mock_index.side_effect = [1, 2]
+        mock_load.return_value = cluster
+        action = ca.ClusterAction(cluster.id, 'CLUSTER_ACTION', self.ctx)
+        action.id = 'CLUSTER_ACTION_ID'
+        mock_wait.return_value = (action.RES_OK, 'All dependents completed')
+        mock_action.side_effect = ['NODE_ACTION_1', 'NODE_ACTION_2']
+        mock_prepare.side_effect = Exception('Profile not found')
+        manager = mock.Mock()
+        manager.attach_mock(mock_prepare, 'prepare')
+        manager.attach_mock(mock_action, 'create')
+
+        res_code, res_msg = action._create_nodes(2)
+
+        self.assertEqual(action.RES_OK, res_code)
+        # the nodes are prepared before any action is created for them
+        self.assertEqual(['prepare', 'create', 'create'],
+                         [c[0] for c in manager.mock_calls])
+        mock_dep.assert_called_once_with(
+            action.context, ['NODE_ACTION_1', 'NODE_ACTION_2'],
+            'CLUSTER_ACTION_ID')
+        mock_update.assert_has_calls([
+            mock.call(action.context, 'NODE_ACTION_1', {'status': 'READY'}),
+            mock.call(action.context, 'NODE_ACTION_2', {'status': 'READY'})
+        ])
+
+    @mock.patch.object(pb.Profile, 'release_objects')
+    @mock.patch.object(pb.Profile, 'prepare_objects')
+    @mock.patch.object(ab.Action, 'create')
+    @mock.patch.object(co.Cluster, 'get_next_index')
+    @mock.patch.object(nm, 'Node')
+    @mock.patch.object(dobj.Dependency, 'create')
+    def test__create_nodes_multiple_action_failed(
+            self, mock_dep, mock_node, mock_index, mock_action, mock_prepare,
+            mock_release, mock_load):
+        cluster = mock.Mock(id='01234567-123434', profile_id='PROFILE',
+                            config={})
+        node1 = mock.Mock(id='01234567-abcdef', data={})
+        node2 = mock.Mock(id='abcdefab-123456', data={})
+        mock_node.side_effect = [node1, node2]
+        mock_index.side_effect = [1, 2]
+        mock_load.return_value = cluster
+        action = ca.ClusterAction(cluster.id, 'CLUSTER_ACTION', self.ctx)
+        action.id = 'CLUSTER_ACTION_ID'
+        mock_action.side_effect = ['NODE_ACTION_1', Exception('DB error')]
+        mock_release.side_effect = Exception('Port not found')
+
+        ex = self.assertRaises(Exception, action._create_nodes, 2)
+
+        # the original failure is raised after releasing the nodes
+        self.assertEqual('DB error', six.text_type(ex))
+        mock_prepare.assert_called_once_with(action.context, 'PROFILE',
+                                             [node1, node2])
+        mock_release.assert_called_once_with(action.context, 'PROFILE',
+                                             [node1, node2])
+        self.assertEqual(0, mock_dep.call_count)
+
+    @mock.patch.object(pb.Profile, 'release_objects')
+    @mock.patch.object(pb.Profile, 'prepare_objects')
+    @mock.patch.object(ab.Action, 'create')
+    @mock.patch.object(co.Cluster, 'get_next_index')
+    @mock.patch.object(nm, 'Node')
+    def test__create_nodes_multiple_action_failed_not_prepared(
+            self, mock_node, mock_index, mock_action, mock_prepare,
+            mock_release, mock_load):
+        cluster = mock.Mock(id='01234567-123434', profile_id='PROFILE',
+                            config={})
+        mock_node.side_effect = [mock.Mock(id='01234567-abcdef', data={}),
+                                 mock.Mock(id='abcdefab-123456', data={})]
+        mock_index.side_effect = [1, 2]
+        mock_load.return_value = cluster
+        action = ca.ClusterAction(cluster.id, 'CLUSTER_ACTION', self.ctx)
+        mock_prepare.side_effect = Exception('Profile not found')
+        mock_action.side_effect = Exception('DB error')
+
+        self.assertRaises(Exception, action._create_nodes, 2)
+
+        self.assertEqual(0, mock_release.call_count)
+
+    @mock.patch.object(pb.Profile, 'prepare_objects')
     @mock.patch.object(ao.Action, 'update')
     @mock.patch.object(co.Cluster, 'get')
     @mock.patch.object(nm, 'Node')
@@ -185,7 +285,8 @@ class ClusterCreateTest(base.SenlinTestCase):
     @mock.patch.object(ca.ClusterAction, '_wait_for_dependents')
     def test__create_nodes_multiple_failed_wait(self, mock_wait, mock_start,
                                                 mock_dep, mock_node, mock_get,
-                                                mock_update, mock_load):
+                                                mock_update, mock_prepare,
+                                                mock_load):
         cluster = mock.Mock(id='01234567-123434', config={})
         db_cluster = mock.Mock(next_index=1)
         mock_get.return_value = db_cluster
@@ -669,7 +669,7 @@ class NodeActionTest(base.SenlinTestCase):
         self.assertEqual(0, mock_cl_release.call_count)
         mock_nl_acquire.assert_called_once_with(self.ctx, node_id,
                                                 action.id, action.owner,
-                                                False)
+                                                False, parent=None)
         mock_nl_release.assert_called_once_with(node_id, action.id)
         mock_exec.assert_called_once_with()
         self.assertEqual(0, mock_check.call_count)
@@ -711,7 +711,8 @@ class NodeActionTest(base.SenlinTestCase):
                                              lock.NODE_SCOPE)
         mock_check.assert_called_once_with('FAKE_CLUSTER', 'BEFORE')
         mock_acquire_node.assert_called_once_with(self.ctx, 'NODE_ID',
-                                                  'ACTION_ID', None, False)
+                                                  'ACTION_ID', None, False,
+                                                  parent=None)
         mock_release_node.assert_called_once_with('NODE_ID', 'ACTION_ID')
 
     @mock.patch.object(lock, 'cluster_lock_acquire')
@@ -755,7 +756,8 @@ class NodeActionTest(base.SenlinTestCase):
         mock_release.assert_called_once_with('FAKE_CLUSTER', 'ACTION_ID',
                                              lock.NODE_SCOPE)
         mock_acquire_node.assert_called_once_with(self.ctx, 'NODE_ID',
-                                                  'ACTION_ID', None, False)
+                                                  'ACTION_ID', None, False,
+                                                  parent=None)
         mock_release_node.assert_called_once_with('NODE_ID', 'ACTION_ID')
         check_calls = [
             mock.call('FAKE_CLUSTER', 'BEFORE'),
@@ -763,6 +765,28 @@ class NodeActionTest(base.SenlinTestCase):
         ]
         mock_check.assert_has_calls(check_calls)
 
+    @mock.patch.object(lock, 'node_lock_acquire')
+    @mock.patch.object(lock, 'node_lock_release')
+    def test_execute_inherited_lock(self, mock_release_node,
+                                    mock_acquire_node, mock_load):
+        node = mock.Mock(id='NODE_ID', cluster_id='FAKE_CLUSTER')
+        mock_load.return_value = node
+        action = node_action.NodeAction(node.id, 'NODE_FLY', self.ctx,
+                                        cause=consts.CAUSE_DERIVED)
+        action.id = 'ACTION_ID'
+        action.data = {lock.NODE_LOCK_OWNER: 'PARENT_ID'}
+        self.patchobject(action, '_execute',
+                         return_value=(action.RES_OK, 'Execution ok'))
+
+        res_code, res_msg = action.execute()
+
+        self.assertEqual(action.RES_OK, res_code)
+        self.assertEqual('Execution ok', res_msg)
+        mock_acquire_node.assert_called_once_with(
+            self.ctx, 'NODE_ID', 'ACTION_ID', None, False, parent='PARENT_ID')
+        # a lock handed over by the parent is released by the action
+        mock_release_node.assert_called_once_with('NODE_ID', 'ACTION_ID')
+
     @mock.patch.object(lock, 'cluster_lock_acquire')
     @mock.patch.object(lock, 'cluster_lock_release')
     @mock.patch.object(base_action.Action, 'policy_check')
@@ -801,7 +825,8 @@ class NodeActionTest(base.SenlinTestCase):
         mock_release.assert_called_once_with('FAKE_CLUSTER', 'ACTION_ID',
                                              lock.NODE_SCOPE)
         mock_acquire_node.assert_called_once_with(self.ctx, 'NODE_ID',
-                                                  'ACTION_ID', None, False)
+                                                  'ACTION_ID', None, False,
+                                                  parent=None)
         mock_release_node.assert_called_once_with('NODE_ID', 'ACTION_ID')
         mock_check.assert_called_once_with('FAKE_CLUSTER', 'BEFORE')
 
@@ -859,5 +884,6 @@ class NodeActionTest(base.SenlinTestCase):
         ]
         mock_check.assert_has_calls(check_calls)
         mock_acquire_node.assert_called_once_with(self.ctx, 'NODE_ID',
-                                                  'ACTION_ID', None, False)
+                                                  'ACTION_ID', None, False,
+                                                  parent=None)
         mock_release_node.assert_called_once_with('NODE_ID', 'ACTION_ID')
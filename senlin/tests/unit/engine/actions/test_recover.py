@@ -32,6 +32,7 @@ class ClusterRecoverTest(base.SenlinTestCase):
     def setUp(self):
         super(ClusterRecoverTest, self).setUp()
         self.ctx = utils.dummy_context()
+        self.patchobject(ca.ClusterAction, '_lock_nodes')
 
     @mock.patch.object(ao.Action, 'update')
     @mock.patch.object(ab.Action, 'create')
@@ -372,7 +373,7 @@ class ClusterRecoverTest(base.SenlinTestCase):
         cluster = mock.Mock(id='FAKE_ID', RECOVERING='RECOVERING',
                             desired_capacity=2)
         mock_load.return_value = cluster
-        cluster.nodes = [node1]
+        cluster.node_summaries = [node1]
 
         action = ca.ClusterAction(cluster.id, 'CLUSTER_RECOVER', self.ctx)
 
@@ -381,7 +382,7 @@ class ClusterRecoverTest(base.SenlinTestCase):
         mock_create.assert_called_once_with(1)
 
     @mock.patch.object(su, 'nodes_by_random')
-    @mock.patch.object(no.Node, 'get_all_by_cluster')
+    @mock.patch.object(no.Node, 'summaries_by_cluster')
     @mock.patch.object(ca.ClusterAction, '_delete_nodes')
     def test__check_capacity_delete(self, mock_delete, mock_get,
                                     mock_su, mock_load):
@@ -391,7 +392,7 @@ class ClusterRecoverTest(base.SenlinTestCase):
         cluster = mock.Mock(id='FAKE_ID', RECOVERING='RECOVERING',
                             desired_capacity=1)
         mock_load.return_value = cluster
-        cluster.nodes = [node1, node2]
+        cluster.node_summaries = [node1, node2]
         mock_get.return_value = [node1, node2]
         mock_su.return_value = [node2.id]
 
@@ -59,10 +59,10 @@ class ClusterResizeTest(base.SenlinTestCase):
     @mock.patch.object(ca.ClusterAction, '_delete_nodes')
     def test_do_resize_shrink(self, mock_delete, mock_sleep, mock_select,
                               mock_size, mock_count, mock_load):
-        cluster = mock.Mock(id='CID', nodes=[], RESIZING='RESIZING')
+        cluster = mock.Mock(id='CID', node_summaries=[], RESIZING='RESIZING')
         for n in range(10):
             node = mock.Mock(id='NODE-ID-%s' % (n + 1))
-            cluster.nodes.append(node)
+            cluster.node_summaries.append(node)
         mock_load.return_value = cluster
         mock_count.return_value = 10
         action = ca.ClusterAction(
@@ -84,7 +84,7 @@ class ClusterResizeTest(base.SenlinTestCase):
         self.assertEqual(action.RES_OK, res_code)
         self.assertEqual('Cluster resize succeeded.', res_msg)
 
-        mock_select.assert_called_once_with(cluster.nodes, 2)
+        mock_select.assert_called_once_with(cluster.node_summaries, 2)
         mock_size.assert_called_once_with(8)
         mock_sleep.assert_called_once_with(2)
         mock_delete.assert_called_once_with(mock_select.return_value)
@@ -106,10 +106,10 @@ class ClusterResizeTest(base.SenlinTestCase):
             action.data = {'deletion': {'count': 1}}
             return action.RES_OK, ''
 
-        cluster = mock.Mock(id='CID', nodes=[], RESIZING='RESIZING')
+        cluster = mock.Mock(id='CID', node_summaries=[], RESIZING='RESIZING')
         for n in range(10):
             node = mock.Mock(id='NODE-ID-%s' % (n + 1))
-            cluster.nodes.append(node)
+            cluster.node_summaries.append(node)
         mock_count.return_value = 10
         mock_load.return_value = cluster
         mock_parse.side_effect = fake_parse
@@ -122,7 +122,7 @@ class ClusterResizeTest(base.SenlinTestCase):
 
         self.assertEqual({'deletion': {'count': 1}}, action.data)
         mock_parse.assert_called_once_with(action, cluster, 10)
-        mock_select.assert_called_once_with(cluster.nodes, 1)
+        mock_select.assert_called_once_with(cluster.node_summaries, 1)
         mock_size.assert_called_once_with(9)
         mock_sleep.assert_called_once_with(0)
         mock_delete.assert_called_once_with(mock_select.return_value)
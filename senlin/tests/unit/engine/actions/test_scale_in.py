@@ -50,7 +50,7 @@ class ClusterScaleInTest(base.SenlinTestCase):
         # deleting 1 nodes
         mock_count.assert_called_once_with(action.context, 'CID')
         mock_delete.assert_called_once_with(mock.ANY)
-        mock_select.assert_called_once_with(cluster.nodes, 1)
+        mock_select.assert_called_once_with(cluster.node_summaries, 1)
         cluster.set_status.assert_called_once_with(
             action.context, consts.CS_RESIZING, 'Cluster scale in started.',
             desired_capacity=9)
@@ -118,7 +118,7 @@ class ClusterScaleInTest(base.SenlinTestCase):
         # deleting 3 nodes
         mock_count.assert_called_once_with(action.context, 'CID')
         mock_delete.assert_called_once_with(mock.ANY)
-        mock_select.assert_called_once_with(cluster.nodes, 3)
+        mock_select.assert_called_once_with(cluster.node_summaries, 3)
         cluster.set_status.assert_called_once_with(
             action.context, consts.CS_RESIZING, 'Cluster scale in started.',
             desired_capacity=8)
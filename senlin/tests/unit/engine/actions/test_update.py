@@ -19,6 +19,7 @@ from senlin.engine import cluster as cm
 from senlin.engine import dispatcher
 from senlin.objects import action as ao
 from senlin.objects import dependency as dobj
+from senlin.objects import node as no
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
 
@@ -239,3 +240,204 @@ class ClusterUpdateTest(base.SenlinTestCase):
         mock_start.assert_called_once_with()
         cluster.eval_status.assert_called_once_with(
             action.context, consts.CLUSTER_UPDATE)
+
+    @mock.patch.object(ca.ClusterAction, '_update_nodes_rolling')
+    def test__update_nodes_rolling_policy(self, mock_rolling, mock_load):
+        cluster = mock.Mock(id='FAKE_ID')
+        mock_load.return_value = cluster
+        action = ca.ClusterAction(cluster.id, 'CLUSTER_ACTION', self.ctx)
+        rolling = {'width': 2, 'min_in_service': 1, 'max_failures': 0,
+                   'nodes': ['node_id1', 'node_id2']}
+        action.data = {
+            'update': {
+                'pause_time': 0,
+                'plan': [{'node_id1', 'node_id2'}],
+                'rolling': rolling,
+            }
+        }
+        mock_rolling.return_value = (action.RES_OK, 'Cluster update done.')
+
+        res = action._update_nodes('FAKE_PROFILE', [])
+
+        self.assertEqual((action.RES_OK, 'Cluster update done.'), res)
+        mock_rolling.assert_called_once_with('FAKE_PROFILE', rolling)
+
+
+@mock.patch.object(ca.ClusterAction, 'is_timeout', return_value=False)
+@mock.patch.object(ca.ClusterAction, 'is_cancelled', return_value=False)
+@mock.patch.object(ca.ClusterAction, '_wait_for_any_child')
+@mock.patch.object(dispatcher, 'start_action')
+@mock.patch.object(ab.Action, 'create')
+@mock.patch.object(no.Node, 'summaries_by_cluster')
+@mock.patch.object(cm.Cluster, 'load')
+class ClusterRollingUpdateTest(base.SenlinTestCase):
+
+    def setUp(self):
+        super(ClusterRollingUpdateTest, self).setUp()
+        self.ctx = utils.dummy_context()
+        self.patchobject(ca.ClusterAction, '_lock_nodes')
+        self.cluster = mock.Mock(id='FAKE_ID')
+
+    def _action(self, mock_load):
+        mock_load.return_value = self.cluster
+        action = ca.ClusterAction(self.cluster.id, 'CLUSTER_ACTION',
+                                  self.ctx)
+        action.id = 'CLUSTER_ACTION_ID'
+        return action
+
+    def _nodes(self, *statuses):
+        return [mock.Mock(id='node_id%s' % (i + 1), status=s)
+                for i, s in enumerate(statuses)]
+
+    def _rolling(self, count, width=2, min_in_service=1, max_failures=0):
+        return {
+            'width': width,
+            'min_in_service': min_in_service,
+            'max_failures': max_failures,
+            'nodes': ['node_id%s' % (i + 1) for i in range(count)],
+        }
+
+    def test_sliding_window(self, mock_load, mock_nodes, mock_create,
+                            mock_start, mock_wait, mock_cancel,
+                            mock_timeout):
+        action = self._action(mock_load)
+        mock_nodes.return_value = self._nodes('ACTIVE', 'ACTIVE', 'ACTIVE')
+        mock_create.side_effect = ['ACTION1', 'ACTION2', 'ACTION3']
+        mock_wait.side_effect = [
+            {'ACTION1': consts.ACTION_SUCCEEDED},
+            {'ACTION2': consts.ACTION_SUCCEEDED},
+            {'ACTION3': consts.ACTION_SUCCEEDED},
+        ]
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(3))
+
+        self.assertEqual(action.RES_OK, res_code)
+        self.assertEqual('Cluster update completed.', reason)
+        self.assertEqual(3, mock_create.call_count)
+        mock_create.assert_any_call(
+            action.context, 'node_id3', consts.NODE_UPDATE,
+            name='node_update_node_id3', cause=consts.CAUSE_DERIVED,
+            status=ab.Action.READY,
+            inputs={'new_profile_id': 'FAKE_PROFILE'})
+        # the third node is started as soon as the first one is done
+        self.assertEqual([['ACTION1', 'ACTION2'], ['ACTION2', 'ACTION3'],
+                          ['ACTION3']],
+                         [sorted(c[0][0]) for c in mock_wait.call_args_list])
+        self.assertEqual(2, mock_start.call_count)
+        self.assertEqual('FAKE_PROFILE', self.cluster.profile_id)
+        self.cluster.eval_status.assert_called_once_with(
+            action.context, consts.CLUSTER_UPDATE, profile_id='FAKE_PROFILE',
+            updated_at=mock.ANY)
+
+    def test_min_in_service(self, mock_load, mock_nodes, mock_create,
+                            mock_start, mock_wait, mock_cancel,
+                            mock_timeout):
+        action = self._action(mock_load)
+        mock_nodes.return_value = self._nodes('ACTIVE', 'ACTIVE')
+        mock_create.side_effect = ['ACTION1', 'ACTION2']
+        mock_wait.side_effect = [
+            {'ACTION1': consts.ACTION_SUCCEEDED},
+            {'ACTION2': consts.ACTION_SUCCEEDED},
+        ]
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(2, width=2, min_in_service=1))
+
+        self.assertEqual(action.RES_OK, res_code)
+        # only one node is out of service at any time
+        self.assertEqual([mock.call(['ACTION1']), mock.call(['ACTION2'])],
+                         mock_wait.call_args_list)
+        self.assertEqual(2, mock_start.call_count)
+
+    def test_error_nodes_not_counted(self, mock_load, mock_nodes,
+                                     mock_create, mock_start, mock_wait,
+                                     mock_cancel, mock_timeout):
+        action = self._action(mock_load)
+        mock_nodes.return_value = self._nodes('ERROR', 'ACTIVE', 'ACTIVE')
+        mock_create.side_effect = ['ACTION1', 'ACTION2', 'ACTION3']
+        mock_wait.side_effect = [
+            {'ACTION1': consts.ACTION_SUCCEEDED,
+             'ACTION2': consts.ACTION_SUCCEEDED},
+            {'ACTION3': consts.ACTION_SUCCEEDED},
+        ]
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(3, width=2, min_in_service=1))
+
+        self.assertEqual(action.RES_OK, res_code)
+        # updating the node in error does not take any node out of service
+        self.assertEqual([['ACTION1', 'ACTION2'], ['ACTION3']],
+                         [sorted(c[0][0]) for c in mock_wait.call_args_list])
+
+    def test_failure_budget_exhausted(self, mock_load, mock_nodes,
+                                      mock_create, mock_start, mock_wait,
+                                      mock_cancel, mock_timeout):
+        action = self._action(mock_load)
+        mock_nodes.return_value = self._nodes('ACTIVE', 'ACTIVE', 'ACTIVE')
+        mock_create.side_effect = ['ACTION1', 'ACTION2']
+        mock_wait.side_effect = [
+            {'ACTION1': consts.ACTION_FAILED},
+            {'ACTION2': consts.ACTION_SUCCEEDED},
+        ]
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(3, width=2, min_in_service=0))
+
+        self.assertEqual(action.RES_ERROR, res_code)
+        self.assertEqual('Failed in updating nodes: 1 nodes failed while at '
+                         'most 0 failures are tolerated.', reason)
+        # the update in progress is left to finish, no node is started
+        self.assertEqual(2, mock_create.call_count)
+        self.assertEqual(2, mock_wait.call_count)
+        self.cluster.eval_status.assert_called_once_with(
+            action.context, consts.CLUSTER_UPDATE)
+
+    def test_failures_tolerated(self, mock_load, mock_nodes, mock_create,
+                                mock_start, mock_wait, mock_cancel,
+                                mock_timeout):
+        action = self._action(mock_load)
+        mock_nodes.return_value = self._nodes('ACTIVE', 'ACTIVE')
+        mock_create.side_effect = ['ACTION1', 'ACTION2']
+        mock_wait.side_effect = [
+            {'ACTION1': consts.ACTION_FAILED},
+            {'ACTION2': consts.ACTION_SUCCEEDED},
+        ]
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(2, width=1, max_failures=1))
+
+        self.assertEqual(action.RES_OK, res_code)
+        self.assertEqual('Cluster update completed, 1 nodes failed.', reason)
+        self.assertEqual(2, mock_create.call_count)
+        self.cluster.eval_status.assert_called_once_with(
+            action.context, consts.CLUSTER_UPDATE, profile_id='FAKE_PROFILE',
+            updated_at=mock.ANY)
+
+    def test_cancelled(self, mock_load, mock_nodes, mock_create, mock_start,
+                       mock_wait, mock_cancel, mock_timeout):
+        action = self._action(mock_load)
+        mock_nodes.return_value = self._nodes('ACTIVE', 'ACTIVE')
+        mock_create.side_effect = ['ACTION1']
+        mock_wait.return_value = {}
+        mock_cancel.side_effect = [False, True]
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(2, width=1))
+
+        self.assertEqual(action.RES_CANCEL, res_code)
+        self.assertEqual('Failed in updating nodes.', reason)
+        self.assertEqual(1, mock_create.call_count)
+        self.cluster.eval_status.assert_called_once_with(
+            action.context, consts.CLUSTER_UPDATE)
+
+    def test_timeout(self, mock_load, mock_nodes, mock_create, mock_start,
+                     mock_wait, mock_cancel, mock_timeout):
+        action = self._action(mock_load)
+        mock_timeout.return_value = True
+
+        res_code, reason = action._update_nodes_rolling(
+            'FAKE_PROFILE', self._rolling(2))
+
+        self.assertEqual(action.RES_TIMEOUT, res_code)
+        self.assertEqual(0, mock_create.call_count)
@@ -496,9 +496,11 @@ class TestMessage(base.SenlinTestCase):
         mock_get_name.assert_called_once_with(self.context, 'bogus')
 
     @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
     @mock.patch.object(mmod.Message, '_build_action')
     @mock.patch.object(mmod.Message, 'zaqar')
-    def test_notify(self, mock_zaqar, mock_build_action, mock_start_action):
+    def test_notify(self, mock_zaqar, mock_build_action, mock_create,
+                    mock_start_action):
         mock_zc = mock.Mock()
         mock_zaqar.return_value = mock_zc
         mock_claim = mock.Mock()
@@ -513,25 +515,80 @@ class TestMessage(base.SenlinTestCase):
         }
         mock_claim.messages = [message1, message2]
         mock_zc.claim_create.return_value = mock_claim
-        mock_build_action.side_effect = ['action_id1', 'action_id2']
+        mock_build_action.side_effect = ['spec1', 'spec2']
+        mock_create.return_value = ['action_id1', 'action_id2']
 
         message = mmod.Message('message', None, None, id=UUID)
         message.channel = {'queue_name': 'queue1'}
         res = message.notify(self.context)
         self.assertEqual(['action_id1', 'action_id2'], res)
-        mock_zc.claim_create.assert_called_once_with('queue1')
+        mock_zc.claim_create.assert_called_once_with('queue1', limit=20)
         mock_zc.claim_delete.assert_called_once_with('queue1', 'claim_id')
         mock_calls = [
-            mock.call(self.context, message1),
-            mock.call(self.context, message2)
+            mock.call(self.context, message1, {}),
+            mock.call(self.context, message2, {})
         ]
         mock_build_action.assert_has_calls(mock_calls)
+        mock_create.assert_called_once_with(self.context, ['spec1', 'spec2'])
         mock_start_action.assert_called_once_with()
-        mock_calls2 = [
-            mock.call('queue1', 'ID1', 'claim_id'),
-            mock.call('queue1', 'ID2', 'claim_id')
+        mock_zc.message_delete_many.assert_called_once_with(
+            'queue1', ['ID1', 'ID2'], 'claim_id')
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
+    @mock.patch.object(mmod.Message, '_build_action')
+    @mock.patch.object(mmod.Message, 'zaqar')
+    def test_notify_drain_queue(self, mock_zaqar, mock_build_action,
+                                mock_create, mock_start_action):
+        cfg.CONF.set_override('claim_limit', 2, group='receiver')
+        mock_zc = mock.Mock()
+        mock_zaqar.return_value = mock_zc
+        claims = [
+            mock.Mock(id='C1', messages=[{'id': 'ID1'}, {'id': 'ID2'}]),
+            mock.Mock(id='C2', messages=[{'id': 'ID3'}]),
         ]
-        mock_zc.message_delete.assert_has_calls(mock_calls2)
+        mock_zc.claim_create.side_effect = claims
+        mock_build_action.side_effect = ['spec1', 'spec2', 'spec3']
+        mock_create.side_effect = [['A1', 'A2'], ['A3']]
+
+        message = mmod.Message('message', None, None, id=UUID)
+        message.channel = {'queue_name': 'queue1'}
+        res = message.notify(self.context)
+
+        self.assertEqual(['A1', 'A2', 'A3'], res)
+        self.assertEqual(2, mock_zc.claim_create.call_count)
+        mock_zc.message_delete_many.assert_has_calls([
+            mock.call('queue1', ['ID1', 'ID2'], 'C1'),
+            mock.call('queue1', ['ID3'], 'C2'),
+        ])
+        mock_zc.claim_delete.assert_has_calls([
+            mock.call('queue1', 'C1'), mock.call('queue1', 'C2')])
+        # clusters found are shared by all claims
+        clusters = mock_build_action.call_args_list[0][0][2]
+        self.assertIs(clusters, mock_build_action.call_args_list[2][0][2])
+        mock_start_action.assert_called_once_with()
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
+    @mock.patch.object(mmod.Message, '_build_action')
+    @mock.patch.object(mmod.Message, 'zaqar')
+    def test_notify_max_claims(self, mock_zaqar, mock_build_action,
+                               mock_create, mock_start_action):
+        cfg.CONF.set_override('claim_limit', 1, group='receiver')
+        cfg.CONF.set_override('max_claims', 2, group='receiver')
+        mock_zc = mock.Mock()
+        mock_zaqar.return_value = mock_zc
+        mock_zc.claim_create.return_value = mock.Mock(id='C1',
+                                                      messages=[{'id': 'M'}])
+        mock_create.return_value = ['A1']
+
+        message = mmod.Message('message', None, None, id=UUID)
+        message.channel = {'queue_name': 'queue1'}
+        res = message.notify(self.context)
+
+        self.assertEqual(['A1', 'A1'], res)
+        self.assertEqual(2, mock_zc.claim_create.call_count)
+        mock_start_action.assert_called_once_with()
 
     @mock.patch.object(mmod.Message, 'zaqar')
     def test_notify_no_message(self, mock_zaqar):
@@ -545,13 +602,15 @@ class TestMessage(base.SenlinTestCase):
         message.channel = {'queue_name': 'queue1'}
         res = message.notify(self.context)
         self.assertEqual([], res)
-        mock_zc.claim_create.assert_called_once_with('queue1')
+        mock_zc.claim_create.assert_called_once_with('queue1', limit=20)
 
     @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
     @mock.patch.object(mmod.Message, '_build_action')
     @mock.patch.object(mmod.Message, 'zaqar')
     def test_notify_some_actions_building_failed(self, mock_zaqar,
                                                  mock_build_action,
+                                                 mock_create,
                                                  mock_start_action):
         mock_zc = mock.Mock()
         mock_zaqar.return_value = mock_zc
@@ -568,24 +627,44 @@ class TestMessage(base.SenlinTestCase):
         mock_claim.messages = [message1, message2]
         mock_zc.claim_create.return_value = mock_claim
         mock_build_action.side_effect = [exception.InternalError(),
-                                         'action_id1']
+                                         'spec2']
+        mock_create.return_value = ['action_id1']
 
         message = mmod.Message('message', None, None, id=UUID)
         message.channel = {'queue_name': 'queue1'}
         res = message.notify(self.context)
         self.assertEqual(['action_id1'], res)
-        mock_zc.claim_create.assert_called_once_with('queue1')
+        mock_zc.claim_create.assert_called_once_with('queue1', limit=20)
         mock_calls = [
-            mock.call(self.context, message1),
-            mock.call(self.context, message2)
+            mock.call(self.context, message1, {}),
+            mock.call(self.context, message2, {})
         ]
         mock_build_action.assert_has_calls(mock_calls)
+        mock_create.assert_called_once_with(self.context, ['spec2'])
         mock_start_action.assert_called_once_with()
-        mock_calls2 = [
-            mock.call('queue1', 'ID1', 'claim_id'),
-            mock.call('queue1', 'ID2', 'claim_id')
-        ]
-        mock_zc.message_delete.assert_has_calls(mock_calls2)
+        mock_zc.message_delete_many.assert_called_once_with(
+            'queue1', ['ID1', 'ID2'], 'claim_id')
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
+    @mock.patch.object(mmod.Message, '_build_action')
+    @mock.patch.object(mmod.Message, 'zaqar')
+    def test_notify_deleting_messages_failed(self, mock_zaqar,
+                                             mock_build_action, mock_create,
+                                             mock_start_action):
+        mock_zc = mock.Mock()
+        mock_zaqar.return_value = mock_zc
+        mock_zc.claim_create.return_value = mock.Mock(id='C1',
+                                                      messages=[{'id': 'M'}])
+        mock_zc.message_delete_many.side_effect = exception.InternalError()
+        mock_create.return_value = ['A1']
+
+        message = mmod.Message('message', None, None, id=UUID)
+        message.channel = {'queue_name': 'queue1'}
+        res = message.notify(self.context)
+
+        self.assertEqual(['A1'], res)
+        mock_zc.claim_delete.assert_called_once_with('queue1', 'C1')
 
     @mock.patch.object(mmod.Message, 'zaqar')
     def test_notify_claiming_message_failed(self, mock_zaqar):
@@ -597,16 +676,15 @@ class TestMessage(base.SenlinTestCase):
         message.channel = {'queue_name': 'queue1'}
         res = message.notify(self.context)
         self.assertIsNone(res)
-        mock_zc.claim_create.assert_called_once_with('queue1')
+        mock_zc.claim_create.assert_called_once_with('queue1', limit=20)
 
-    @mock.patch.object(action_mod.Action, 'create')
     @mock.patch.object(mmod.Message, '_find_cluster')
-    def test_build_action(self, mock_find_cluster, mock_action_create):
+    def test_build_action(self, mock_find_cluster):
         fake_cluster = mock.Mock()
         fake_cluster.user = 'user1'
         fake_cluster.id = 'cid1'
+        fake_cluster.timeout = 3600
         mock_find_cluster.return_value = fake_cluster
-        mock_action_create.return_value = 'action_id1'
         msg = {
             'body': {'cluster': 'c1', 'action': 'CLUSTER_SCALE_IN'},
             'id': 'ID123456'
@@ -618,15 +696,32 @@ class TestMessage(base.SenlinTestCase):
             'name': 'receiver_ID654321_ID123456',
             'cause': consts.CAUSE_RPC,
             'status': action_mod.Action.READY,
+            'timeout': 3600,
             'inputs': {}
         }
 
         res = message._build_action(self.context, msg)
-        self.assertEqual('action_id1', res)
+        self.assertEqual(('cid1', 'CLUSTER_SCALE_IN', expected_kwargs), res)
+        mock_find_cluster.assert_called_once_with(self.context, 'c1')
+
+    @mock.patch.object(mmod.Message, '_find_cluster')
+    def test_build_action_cached_cluster(self, mock_find_cluster):
+        fake_cluster = mock.Mock(user='user1', id='cid1')
+        mock_find_cluster.return_value = fake_cluster
+        msg = {
+            'body': {'cluster': 'c1', 'action': 'CLUSTER_SCALE_IN'},
+            'id': 'ID123456'
+        }
+        message = mmod.Message('message', None, None, id=UUID)
+        message.user = 'user1'
+        clusters = {}
+
+        message._build_action(self.context, msg, clusters)
+        res = message._build_action(self.context, msg, clusters)
+
+        self.assertEqual('cid1', res[0])
+        self.assertEqual({'c1': fake_cluster}, clusters)
         mock_find_cluster.assert_called_once_with(self.context, 'c1')
-        mock_action_create.assert_called_once_with(self.context, 'cid1',
-                                                   'CLUSTER_SCALE_IN',
-                                                   **expected_kwargs)
 
     def test_build_action_message_body_empty(self):
         msg = {
@@ -17,9 +17,11 @@ import six
 from senlin.common import consts
 from senlin.common import exception as exc
 from senlin.engine.actions import base as ab
+from senlin.engine import dispatcher
 from senlin.engine import service
 from senlin.objects import action as ao
 from senlin.objects import cluster as co
+from senlin.objects import dependency as dobj
 from senlin.objects.requests import actions as orao
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
@@ -35,9 +37,9 @@ class ActionTest(base.SenlinTestCase):
 
     @mock.patch.object(ao.Action, 'get_all')
     def test_action_list(self, mock_get):
-        x_1 = mock.Mock()
+        x_1 = mock.Mock(id='A1')
         x_1.to_dict.return_value = {'k': 'v1'}
-        x_2 = mock.Mock()
+        x_2 = mock.Mock(id='A2')
         x_2.to_dict.return_value = {'k': 'v2'}
         mock_get.return_value = [x_1, x_2]
 
@@ -50,9 +52,9 @@ class ActionTest(base.SenlinTestCase):
 
     @mock.patch.object(ao.Action, 'get_all')
     def test_action_list_with_params(self, mock_get):
-        x_1 = mock.Mock()
+        x_1 = mock.Mock(id='A1')
         x_1.to_dict.return_value = {'status': 'READY'}
-        x_2 = mock.Mock()
+        x_2 = mock.Mock(id='A2')
         x_2.to_dict.return_value = {'status': 'SUCCESS'}
         mock_get.return_value = [x_1, x_2]
 
@@ -72,6 +74,30 @@ class ActionTest(base.SenlinTestCase):
                                          project_safe=True
                                          )
 
+    @mock.patch.object(dobj.Dependency, 'get_all')
+    @mock.patch.object(ao.Action, 'get_all')
+    def test_action_list_with_ids(self, mock_get, mock_deps):
+        x_1 = mock.Mock(id='A1')
+        x_2 = mock.Mock(id='A2')
+        mock_get.return_value = [x_1, x_2]
+        mock_deps.return_value = [
+            mock.Mock(depended='A1', dependent='A2'),
+            mock.Mock(depended='A1', dependent='A3'),
+        ]
+
+        req = orao.ActionListRequest(ids=['A1', 'A2'])
+        result = self.eng.action_list(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual([x_1.to_dict.return_value,
+                          x_2.to_dict.return_value], result)
+        mock_get.assert_called_once_with(self.ctx, project_safe=True,
+                                         filters={'id': ['A1', 'A2']})
+        mock_deps.assert_called_once_with(self.ctx, ['A1', 'A2'])
+        x_1.to_dict.assert_called_once_with(depends_on=[],
+                                            depended_by=['A2', 'A3'])
+        x_2.to_dict.assert_called_once_with(depends_on=['A1'],
+                                            depended_by=[])
+
     def test_action_list_with_bad_params(self):
         req = orao.ActionListRequest(project_safe=False)
         ex = self.assertRaises(rpc.ExpectedException,
@@ -139,7 +165,7 @@ class ActionTest(base.SenlinTestCase):
 
     @mock.patch.object(ao.Action, 'find')
     def test_action_get(self, mock_find):
-        x_obj = mock.Mock()
+        x_obj = mock.Mock(data={})
         mock_find.return_value = x_obj
         x_obj.to_dict.return_value = {'k': 'v'}
 
@@ -148,6 +174,69 @@ class ActionTest(base.SenlinTestCase):
 
         self.assertEqual({'k': 'v'}, result)
         mock_find.assert_called_once_with(self.ctx, 'ACTION_ID')
+        self.assertTrue(self.ctx.stale_reads)
+
+    @mock.patch.object(ao.Action, 'find')
+    def test_action_get_timing(self, mock_find):
+        recorded = {'phases': {'lock_wait': 1.5, 'execute': 0.5},
+                    'queries': 12, 'driver_calls': 2}
+        x_obj = mock.Mock(data={'timing': recorded})
+        mock_find.return_value = x_obj
+        x_obj.to_dict.return_value = {'k': 'v'}
+
+        req = orao.ActionGetRequest(identity='ACTION_ID')
+        result = self.eng.action_get(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'total': 2.0, 'slowest_phase': 'lock_wait',
+                          'phases': recorded['phases'], 'queries': 12,
+                          'driver_calls': 2}, result['timing'])
+
+    @mock.patch.object(dispatcher, 'wait_for_action')
+    @mock.patch.object(ao.Action, 'find')
+    def test_action_get_wait(self, mock_find, mock_wait):
+        x_obj = mock.Mock(id='ACTION_ID', status='READY', data={})
+        mock_find.return_value = x_obj
+        x_new = mock.Mock(status='RUNNING', data={})
+        x_new.to_dict.return_value = {'status': 'RUNNING'}
+        mock_wait.return_value = x_new
+
+        req = orao.ActionGetRequest(identity='ACTION_ID', wait=300,
+                                    until='RUNNING')
+        result = self.eng.action_get(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'status': 'RUNNING'}, result)
+        mock_wait.assert_called_once_with(
+            self.ctx, 'ACTION_ID',
+            ['SUCCEEDED', 'FAILED', 'CANCELLED', 'RUNNING'], 60)
+        self.assertEqual(0, self.eng.action_waiters)
+        self.assertFalse(self.ctx.stale_reads)
+
+    @mock.patch.object(dispatcher, 'wait_for_action')
+    @mock.patch.object(ao.Action, 'find')
+    def test_action_get_wait_completed(self, mock_find, mock_wait):
+        x_obj = mock.Mock(status='SUCCEEDED', data={})
+        mock_find.return_value = x_obj
+        x_obj.to_dict.return_value = {'k': 'v'}
+
+        req = orao.ActionGetRequest(identity='ACTION_ID', wait=10)
+        result = self.eng.action_get(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'k': 'v'}, result)
+        self.assertEqual(0, mock_wait.call_count)
+
+    @mock.patch.object(dispatcher, 'wait_for_action')
+    @mock.patch.object(ao.Action, 'find')
+    def test_action_get_wait_too_many_waiters(self, mock_find, mock_wait):
+        x_obj = mock.Mock(status='RUNNING', data={})
+        mock_find.return_value = x_obj
+        x_obj.to_dict.return_value = {'k': 'v'}
+        self.eng.action_waiters = 32
+
+        req = orao.ActionGetRequest(identity='ACTION_ID', wait=10)
+        result = self.eng.action_get(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'k': 'v'}, result)
+        self.assertEqual(0, mock_wait.call_count)
 
     @mock.patch.object(ao.Action, 'find')
     def test_action_get_not_found(self, mock_find):
@@ -24,7 +24,6 @@ from senlin.common import utils as common_utils
 from senlin.engine.actions import base as am
 from senlin.engine.actions import cluster_action as ca
 from senlin.engine import dispatcher
-from senlin.engine import node as nm
 from senlin.engine import service
 from senlin.objects import action as ao
 from senlin.objects import base as obj_base
@@ -34,6 +33,7 @@ from senlin.objects import node as no
 from senlin.objects import profile as po
 from senlin.objects import receiver as ro
 from senlin.objects.requests import clusters as orco
+from senlin.profiles import base as pb
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
 
@@ -92,6 +92,7 @@ class ClusterTest(base.SenlinTestCase):
 
         self.assertEqual([{'k': 'v1'}, {'k': 'v2'}], result)
         mock_get.assert_called_once_with(self.ctx, project_safe=True)
+        self.assertTrue(self.ctx.stale_reads)
 
     @mock.patch.object(co.Cluster, 'get_all')
     def test_cluster_list_with_params(self, mock_get):
@@ -805,15 +806,16 @@ class ClusterTest(base.SenlinTestCase):
 
     @mock.patch.object(su, 'check_size_params')
     @mock.patch.object(am.Action, 'create')
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     @mock.patch.object(dispatcher, 'start_action')
     def test_cluster_del_nodes(self, notify, mock_find, mock_node,
                                mock_action, mock_check):
         x_cluster = mock.Mock(id='1234', desired_capacity=2)
         mock_find.return_value = x_cluster
-        mock_node.return_value = mock.Mock(id='NODE2', cluster_id='1234',
-                                           dependents={})
+        mock_node.return_value = {
+            'NODE1': mock.Mock(id='NODE2', cluster_id='1234', dependents={})
+        }
         mock_check.return_value = None
         mock_action.return_value = 'ACTION_ID'
         req = orco.ClusterDelNodesRequest(identity='CLUSTER', nodes=['NODE1'])
@@ -822,7 +824,7 @@ class ClusterTest(base.SenlinTestCase):
 
         self.assertEqual({'action': 'ACTION_ID'}, result)
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
-        mock_node.assert_called_once_with(self.ctx, 'NODE1')
+        mock_node.assert_called_once_with(self.ctx, ['NODE1'])
         mock_check.asset_called_once_with(x_cluster, 1, strict=True)
         mock_action.assert_called_once_with(
             self.ctx, '1234', consts.CLUSTER_DEL_NODES,
@@ -851,11 +853,11 @@ class ClusterTest(base.SenlinTestCase):
                          six.text_type(ex.exc_info[1]))
         mock_find.assert_called_once_with(self.ctx, 'Bogus')
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     def test_cluster_del_nodes_node_not_found(self, mock_find, mock_node):
         mock_find.return_value = mock.Mock()
-        mock_node.side_effect = exc.ResourceNotFound(type='node', id='NODE1')
+        mock_node.return_value = {}
         req = orco.ClusterDelNodesRequest(identity='CLUSTER', nodes=['NODE1'])
 
         ex = self.assertRaises(rpc.ExpectedException,
@@ -866,16 +868,16 @@ class ClusterTest(base.SenlinTestCase):
         self.assertIn("Nodes not found",
                       six.text_type(ex.exc_info[1]))
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
-        mock_node.assert_called_once_with(self.ctx, 'NODE1')
+        mock_node.assert_called_once_with(self.ctx, ['NODE1'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     def test_cluster_del_nodes_have_containers(self, mock_cluster, mock_node):
         mock_cluster.return_value = mock.Mock(id='CLUSTER1')
         dependents = {'nodes': ['container1']}
         node = mock.Mock(id='NODE1', dependents=dependents,
                          cluster_id='CLUSTER1')
-        mock_node.return_value = node
+        mock_node.return_value = {'NODE1': node}
         req = orco.ClusterDelNodesRequest(identity='CLUSTER', nodes=['NODE1'])
         ex = self.assertRaises(rpc.ExpectedException,
                                self.eng.cluster_del_nodes,
@@ -885,12 +887,14 @@ class ClusterTest(base.SenlinTestCase):
                     "deleted or become orphan nodes")
         self.assertIn(message, six.text_type(ex.exc_info[1]))
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     def test_cluster_del_nodes_node_in_other_cluster(self, mock_find,
                                                      mock_node):
         mock_find.return_value = mock.Mock(id='1234')
-        mock_node.return_value = mock.Mock(id='NODE2', cluster_id='5678')
+        mock_node.return_value = {
+            'NODE2': mock.Mock(id='NODE2', cluster_id='5678')
+        }
         req = orco.ClusterDelNodesRequest(identity='CLUSTER', nodes=['NODE2'])
 
         ex = self.assertRaises(rpc.ExpectedException,
@@ -901,14 +905,15 @@ class ClusterTest(base.SenlinTestCase):
         self.assertEqual("Nodes not members of specified cluster: ['NODE2'].",
                          six.text_type(ex.exc_info[1]))
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
-        mock_node.assert_called_once_with(self.ctx, 'NODE2')
+        mock_node.assert_called_once_with(self.ctx, ['NODE2'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     def test_cluster_del_nodes_mult_errors(self, mock_find, mock_node):
         mock_find.return_value = mock.Mock(id='1234')
-        mock_node.side_effect = [mock.Mock(id='NODE1', cluster_id='5678'),
-                                 exc.ResourceNotFound(type='node', id='NODE2')]
+        mock_node.return_value = {
+            'NODE1': mock.Mock(id='NODE1', cluster_id='5678')
+        }
         req = orco.ClusterDelNodesRequest(identity='CLUSTER',
                                           nodes=['NODE1', 'NODE2'])
 
@@ -922,13 +927,15 @@ class ClusterTest(base.SenlinTestCase):
         self.assertIn(msg1, six.text_type(ex.exc_info[1]))
         self.assertIn(msg2, six.text_type(ex.exc_info[1]))
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
-        self.assertEqual(2, mock_node.call_count)
+        mock_node.assert_called_once_with(self.ctx, ['NODE1', 'NODE2'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     def test_cluster_del_nodes_orphan_nodes(self, mock_find, mock_node):
         mock_find.return_value = mock.Mock(id='1234')
-        mock_node.return_value = mock.Mock(id='NODE3', cluster_id='')
+        mock_node.return_value = {
+            'NODE3': mock.Mock(id='NODE3', cluster_id='')
+        }
         req = orco.ClusterDelNodesRequest(identity='CLUSTER', nodes=['NODE3'])
 
         ex = self.assertRaises(rpc.ExpectedException,
@@ -940,17 +947,18 @@ class ClusterTest(base.SenlinTestCase):
                          six.text_type(ex.exc_info[1]))
 
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
-        mock_node.assert_called_once_with(self.ctx, 'NODE3')
+        mock_node.assert_called_once_with(self.ctx, ['NODE3'])
 
     @mock.patch.object(su, 'check_size_params')
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(co.Cluster, 'find')
     def test_cluster_del_nodes_failed_checking(self, mock_find, mock_node,
                                                mock_check):
         x_cluster = mock.Mock(id='1234', desired_capacity=2)
         mock_find.return_value = x_cluster
-        mock_node.return_value = mock.Mock(id='NODE2', cluster_id='1234',
-                                           dependents={})
+        mock_node.return_value = {
+            'NODE3': mock.Mock(id='NODE2', cluster_id='1234', dependents={})
+        }
         mock_check.return_value = 'Failed size checking.'
         req = orco.ClusterDelNodesRequest(identity='CLUSTER', nodes=['NODE3'])
 
@@ -963,7 +971,7 @@ class ClusterTest(base.SenlinTestCase):
                          six.text_type(ex.exc_info[1]))
 
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
-        mock_node.assert_called_once_with(self.ctx, 'NODE3')
+        mock_node.assert_called_once_with(self.ctx, ['NODE3'])
         mock_check.assert_called_once_with(x_cluster, 1, strict=True)
 
     @mock.patch.object(no.Node, 'count_by_cluster')
@@ -1568,37 +1576,35 @@ class ClusterTest(base.SenlinTestCase):
         )
         notify.assert_called_once_with()
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes(self, mock_profile, mock_node):
         cluster = mock.Mock(id='CID', profile_id='FAKE_ID')
         mock_profile.return_value = mock.Mock(type='FAKE_TYPE')
-        mock_node.side_effect = [
-            mock.Mock(id='OLD_ID', cluster_id='CID'),
-            mock.Mock(id='NEW_ID', cluster_id='', status=consts.NS_ACTIVE,
-                      profile_id='FAKE_ID_1')
-        ]
+        mock_node.return_value = {
+            'OLD_NODE': mock.Mock(id='OLD_ID', cluster_id='CID'),
+            'NEW_NODE': mock.Mock(id='NEW_ID', cluster_id='',
+                                  status=consts.NS_ACTIVE,
+                                  profile_id='FAKE_ID_1'),
+        }
 
         # do it
         res = self.eng._validate_replace_nodes(self.ctx, cluster,
                                                {'OLD_NODE': 'NEW_NODE'})
 
         self.assertEqual({'OLD_ID': 'NEW_ID'}, res)
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD_NODE'),
-            mock.call(self.ctx, 'NEW_NODE'),
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD_NODE', 'NEW_NODE'])
         mock_profile.assert_has_calls([
             mock.call(self.ctx, 'FAKE_ID', project_safe=True),
             mock.call(self.ctx, 'FAKE_ID_1', project_safe=True)
         ])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_old_missing(self, mock_profile,
                                                  mock_node):
         c = mock.Mock(id='CID', profile_id='FAKE_ID')
-        mock_node.side_effect = exc.ResourceNotFound(type='node', id='OLD')
+        mock_node.return_value = {}
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1606,17 +1612,14 @@ class ClusterTest(base.SenlinTestCase):
                                self.ctx, c, {'OLD': 'NEW'})
 
         self.assertIn("Original nodes not found: ['OLD']", six.text_type(ex))
-        mock_node.assert_called_once_with(self.ctx, 'OLD')
+        mock_node.assert_called_once_with(self.ctx, ['OLD', 'NEW'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_new_missing(self, mock_profile,
                                                  mock_node):
         c = mock.Mock(id='CID', profile_id='FAKE_ID')
-        mock_node.side_effect = [
-            mock.Mock(),
-            exc.ResourceNotFound(type='node', id='NEW')
-        ]
+        mock_node.return_value = {'OLD': mock.Mock()}
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1625,20 +1628,17 @@ class ClusterTest(base.SenlinTestCase):
 
         self.assertIn("Replacement nodes not found: ['NEW']",
                       six.text_type(ex))
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD'),
-            mock.call(self.ctx, 'NEW')
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD', 'NEW'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_old_not_member(self, mock_profile,
                                                     mock_node):
         c = mock.Mock(id='CID', profile_id='FAKE_ID')
-        mock_node.side_effect = [
-            mock.Mock(cluster_id='OTHER'),
-            mock.Mock(cluster_id=''),
-        ]
+        mock_node.return_value = {
+            'OLD': mock.Mock(cluster_id='OTHER'),
+            'NEW': mock.Mock(cluster_id=''),
+        }
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1647,20 +1647,17 @@ class ClusterTest(base.SenlinTestCase):
 
         self.assertIn("The specified nodes ['OLD'] to be replaced are not "
                       "members of the cluster CID.", six.text_type(ex))
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD'),
-            mock.call(self.ctx, 'NEW')
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD', 'NEW'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_new_not_orphan(self, mock_profile,
                                                     mock_node):
         c = mock.Mock(id='CID', profile_id='FAKE_ID')
-        mock_node.side_effect = [
-            mock.Mock(cluster_id='CID'),
-            mock.Mock(cluster_id='OTHER'),
-        ]
+        mock_node.return_value = {
+            'OLD': mock.Mock(cluster_id='CID'),
+            'NEW': mock.Mock(cluster_id='OTHER'),
+        }
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1669,20 +1666,17 @@ class ClusterTest(base.SenlinTestCase):
 
         self.assertIn("Nodes ['NEW'] already member of a cluster.",
                       six.text_type(ex))
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD'),
-            mock.call(self.ctx, 'NEW')
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD', 'NEW'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_new_bad_status(self, mock_profile,
                                                     mock_node):
         c = mock.Mock(id='CID', profile_id='FAKE_ID')
-        mock_node.side_effect = [
-            mock.Mock(cluster_id='CID'),
-            mock.Mock(cluster_id='', status=consts.NS_ERROR),
-        ]
+        mock_node.return_value = {
+            'OLD': mock.Mock(cluster_id='CID'),
+            'NEW': mock.Mock(cluster_id='', status=consts.NS_ERROR),
+        }
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1690,20 +1684,18 @@ class ClusterTest(base.SenlinTestCase):
                                self.ctx, c, {'OLD': 'NEW'})
 
         self.assertIn("Nodes are not ACTIVE: ['NEW'].", six.text_type(ex))
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD'),
-            mock.call(self.ctx, 'NEW')
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD', 'NEW'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_mult_err(self, mock_profile,
                                               mock_node):
         c = mock.Mock(id='CID', profile_id='FAKE_ID')
-        mock_node.side_effect = [
-            mock.Mock(id='OLD1', cluster_id='CID'),
-            mock.Mock(id='NEW1', cluster_id='OTHER', status=consts.NS_ERROR),
-        ]
+        mock_node.return_value = {
+            'OLD1': mock.Mock(id='OLD1', cluster_id='CID'),
+            'NEW1': mock.Mock(id='NEW1', cluster_id='OTHER',
+                              status=consts.NS_ERROR),
+        }
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1714,12 +1706,9 @@ class ClusterTest(base.SenlinTestCase):
         msg2 = _("Nodes are not ACTIVE: ['NEW1'].")
         self.assertIn(msg1, six.text_type(ex))
         self.assertIn(msg2, six.text_type(ex))
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD1'),
-            mock.call(self.ctx, 'NEW1'),
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD1', 'NEW1'])
 
-    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
     @mock.patch.object(po.Profile, 'get')
     def test__validate_replace_nodes_new_profile_type_mismatch(
             self, mock_profile, mock_node):
@@ -1728,11 +1717,11 @@ class ClusterTest(base.SenlinTestCase):
             mock.Mock(type='FAKE_TYPE'),  # for cluster
             mock.Mock(type='FAKE_TYPE_1'),  # for node
         ]
-        mock_node.side_effect = [
-            mock.Mock(cluster_id='CID'),
-            mock.Mock(cluster_id='', status=consts.NS_ACTIVE,
-                      profile_id='FAKE_NODE_PROFILE'),
-        ]
+        mock_node.return_value = {
+            'OLD': mock.Mock(cluster_id='CID'),
+            'NEW': mock.Mock(cluster_id='', status=consts.NS_ACTIVE,
+                             profile_id='FAKE_NODE_PROFILE'),
+        }
 
         # do it
         ex = self.assertRaises(exc.BadRequest,
@@ -1741,10 +1730,7 @@ class ClusterTest(base.SenlinTestCase):
 
         self.assertIn("Profile type of nodes ['NEW'] do not match that of "
                       "the cluster.", six.text_type(ex))
-        mock_node.assert_has_calls([
-            mock.call(self.ctx, 'OLD'),
-            mock.call(self.ctx, 'NEW')
-        ])
+        mock_node.assert_called_once_with(self.ctx, ['OLD', 'NEW'])
         mock_profile.assert_has_calls([
             mock.call(self.ctx, 'FAKE_CLUSTER_PROFILE', project_safe=True),
             mock.call(self.ctx, 'FAKE_NODE_PROFILE', project_safe=True)
@@ -1805,42 +1791,83 @@ class ClusterTest(base.SenlinTestCase):
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER')
         mock_chk.assert_called_once_with(self.ctx, cluster, nodes)
 
-    @mock.patch.object(nm.Node, 'load')
+    @mock.patch.object(pb.Profile, 'get_details_many')
     @mock.patch.object(no.Node, 'get_all_by_cluster')
     @mock.patch.object(co.Cluster, 'find')
-    def test_cluster_collect(self, mock_find, mock_get, mock_load):
+    def test_cluster_collect(self, mock_find, mock_get, mock_details):
         x_cluster = mock.Mock(id='FAKE_CLUSTER')
         mock_find.return_value = x_cluster
-        x_obj_1 = mock.Mock(id='NODE1', physical_id='PHYID1')
+        x_obj_1 = mock.Mock(id='NODE1', physical_id='PHYID1',
+                            profile_id='P1')
         x_obj_1.to_dict.return_value = {'name': 'node1'}
-        x_obj_2 = mock.Mock(id='NODE2', physical_id='PHYID2')
+        x_obj_2 = mock.Mock(id='NODE2', physical_id='PHYID2',
+                            profile_id='P2')
         x_obj_2.to_dict.return_value = {'name': 'node2'}
-        x_node_1 = mock.Mock()
-        x_node_2 = mock.Mock()
-        x_node_1.get_details.return_value = {'ip': '1.2.3.4'}
-        x_node_2.get_details.return_value = {'ip': '5.6.7.8'}
-        mock_get.return_value = [x_obj_1, x_obj_2]
-        mock_load.side_effect = [x_node_1, x_node_2]
+        x_obj_3 = mock.Mock(id='NODE3', physical_id='PHYID3',
+                            profile_id='P1')
+        x_obj_3.to_dict.return_value = {'name': 'node3'}
+        x_obj_4 = mock.Mock(id='NODE4', physical_id=None, profile_id='P1')
+        mock_get.return_value = [x_obj_1, x_obj_2, x_obj_3, x_obj_4]
+        mock_details.side_effect = [
+            {'NODE1': {'ip': '1.2.3.4'}, 'NODE3': {}},
+            {'NODE2': {'ip': '5.6.7.8'}},
+        ]
         req = orco.ClusterCollectRequest(identity='CLUSTER_ID',
                                          path='details.ip')
 
         res = self.eng.cluster_collect(self.ctx, req.obj_to_primitive())
 
-        self.assertIn('cluster_attributes', res)
-        self.assertIn({'id': 'NODE1', 'value': '1.2.3.4'},
-                      res['cluster_attributes'])
-        self.assertIn({'id': 'NODE2', 'value': '5.6.7.8'},
-                      res['cluster_attributes'])
+        self.assertEqual({'cluster_attributes': [
+            {'id': 'NODE1', 'value': '1.2.3.4'},
+            {'id': 'NODE2', 'value': '5.6.7.8'},
+        ]}, res)
         mock_find.assert_called_once_with(self.ctx, 'CLUSTER_ID')
         mock_get.assert_called_once_with(self.ctx, 'FAKE_CLUSTER')
-        mock_load.assert_has_calls([
-            mock.call(self.ctx, db_node=x_obj_1),
-            mock.call(self.ctx, db_node=x_obj_2)
+        mock_details.assert_has_calls([
+            mock.call(self.ctx, 'P1', [x_obj_1, x_obj_3]),
+            mock.call(self.ctx, 'P2', [x_obj_2]),
         ])
         x_obj_1.to_dict.assert_called_once_with()
-        x_node_1.get_details.assert_called_once_with(self.ctx)
         x_obj_2.to_dict.assert_called_once_with()
-        x_node_2.get_details.assert_called_once_with(self.ctx)
+        self.assertEqual(0, x_obj_4.to_dict.call_count)
+
+    @mock.patch.object(pb.Profile, 'get_details_many')
+    @mock.patch.object(no.Node, 'get_all_by_cluster')
+    @mock.patch.object(co.Cluster, 'find')
+    def test_cluster_collect_details_not_referenced(self, mock_find,
+                                                    mock_get, mock_details):
+        mock_find.return_value = mock.Mock(id='FAKE_CLUSTER')
+        x_obj = mock.Mock(id='NODE1', physical_id='PHYID1')
+        x_obj.to_dict.return_value = {'name': 'node1',
+                                      'metadata': {'details': 'foo'}}
+        mock_get.return_value = [x_obj]
+        req = orco.ClusterCollectRequest(identity='CLUSTER_ID',
+                                         path='metadata.details')
+
+        res = self.eng.cluster_collect(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'cluster_attributes': [
+            {'id': 'NODE1', 'value': 'foo'}]}, res)
+        self.assertEqual(0, mock_details.call_count)
+
+    @mock.patch.object(pb.Profile, 'get_details_many')
+    @mock.patch.object(no.Node, 'get_all_by_cluster')
+    @mock.patch.object(co.Cluster, 'find')
+    def test_cluster_collect_wildcard(self, mock_find, mock_get,
+                                      mock_details):
+        mock_find.return_value = mock.Mock(id='FAKE_CLUSTER')
+        x_obj = mock.Mock(id='NODE1', physical_id='PHYID1', profile_id='P1')
+        x_obj.to_dict.return_value = {'name': 'node1'}
+        mock_get.return_value = [x_obj]
+        mock_details.return_value = {'NODE1': {'details': 'bar'}}
+        req = orco.ClusterCollectRequest(identity='CLUSTER_ID',
+                                         path='*.details')
+
+        res = self.eng.cluster_collect(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'cluster_attributes': [
+            {'id': 'NODE1', 'value': 'bar'}]}, res)
+        mock_details.assert_called_once_with(self.ctx, 'P1', [x_obj])
 
     @mock.patch.object(co.Cluster, 'find')
     @mock.patch.object(common_utils, 'get_path_parser')
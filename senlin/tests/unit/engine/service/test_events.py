@@ -74,7 +74,7 @@ class EventTest(base.SenlinTestCase):
                                           marker=marker_uuid,
                                           project_safe=True)
 
-    @mock.patch.object(co.Cluster, 'find')
+    @mock.patch.object(co.Cluster, 'find_many')
     @mock.patch.object(eo.Event, 'get_all')
     def test_event_list_with_cluster_id(self, mock_load, mock_find):
         obj_1 = mock.Mock()
@@ -82,8 +82,10 @@ class EventTest(base.SenlinTestCase):
         obj_2 = mock.Mock()
         obj_2.as_dict.return_value = {'level': consts.EVENT_LEVELS['INFO']}
         mock_load.return_value = [obj_1, obj_2]
-        fake_clusters = [mock.Mock(id='FAKE1'), mock.Mock(id='FAKE2')]
-        mock_find.side_effect = fake_clusters
+        mock_find.return_value = {
+            'CLUSTERA': mock.Mock(id='FAKE1'),
+            'CLUSTER2': mock.Mock(id='FAKE2'),
+        }
 
         req = oreo.EventListRequest(cluster_id=['CLUSTERA', 'CLUSTER2'],
                                     project_safe=True)
@@ -96,18 +98,12 @@ class EventTest(base.SenlinTestCase):
         filters = {'cluster_id': ['FAKE1', 'FAKE2']}
         mock_load.assert_called_once_with(self.ctx, filters=filters,
                                           project_safe=True)
-        mock_find.assert_has_calls([
-            mock.call(self.ctx, 'CLUSTERA'),
-            mock.call(self.ctx, 'CLUSTER2')
-        ])
+        mock_find.assert_called_once_with(self.ctx, ['CLUSTERA', 'CLUSTER2'])
 
-    @mock.patch.object(co.Cluster, 'find')
+    @mock.patch.object(co.Cluster, 'find_many')
     @mock.patch.object(eo.Event, 'get_all')
     def test_event_list_with_cluster_not_found(self, mock_load, mock_find):
-        mock_find.side_effect = [
-            mock.Mock(id='FAKE1'),
-            exc.ResourceNotFound(type='cluster', id='CLUSTER2'),
-        ]
+        mock_find.return_value = {'CLUSTERA': mock.Mock(id='FAKE1')}
         req = oreo.EventListRequest(cluster_id=['CLUSTERA', 'CLUSTER2'],
                                     project_safe=True)
 
@@ -115,10 +111,7 @@ class EventTest(base.SenlinTestCase):
 
         self.assertEqual([], result)
         self.assertEqual(0, mock_load.call_count)
-        mock_find.assert_has_calls([
-            mock.call(self.ctx, 'CLUSTERA'),
-            mock.call(self.ctx, 'CLUSTER2')
-        ])
+        mock_find.assert_called_once_with(self.ctx, ['CLUSTERA', 'CLUSTER2'])
 
     def test_event_list_with_bad_params(self):
         req = oreo.EventListRequest(project_safe=False)
@@ -150,6 +143,55 @@ class EventTest(base.SenlinTestCase):
         self.assertEqual([], result)
         mock_load.assert_called_once_with(self.ctx, project_safe=False)
 
+    @mock.patch.object(eo.Event, 'last_sequence')
+    def test_event_feed_no_cursor(self, mock_last):
+        mock_last.return_value = 42
+
+        req = oreo.EventFeedRequest()
+        result = self.eng.event_feed(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'cursor': 42, 'events': []}, result)
+        mock_last.assert_called_once_with(self.ctx)
+
+    @mock.patch.object(eo.Event, 'feed')
+    def test_event_feed(self, mock_feed):
+        obj_1 = mock.Mock()
+        obj_1.as_dict.return_value = {'level': consts.EVENT_LEVELS['DEBUG']}
+        obj_2 = mock.Mock()
+        obj_2.as_dict.return_value = {'level': consts.EVENT_LEVELS['INFO']}
+        mock_feed.return_value = (9, [(3, obj_1), (7, obj_2)])
+
+        req = oreo.EventFeedRequest(cursor=2, level=['DEBUG', 'INFO'],
+                                    cluster_id=['C1'], limit=10)
+        result = self.eng.event_feed(self.ctx, req.obj_to_primitive())
+
+        expected = {
+            'cursor': 9,
+            'events': [{'level': 'DEBUG', 'seq': 3},
+                       {'level': 'INFO', 'seq': 7}],
+        }
+        self.assertEqual(expected, result)
+        mock_feed.assert_called_once_with(
+            self.ctx, 2, 10,
+            filters={'cluster_id': ['C1'], 'level': [10, 20]},
+            project_safe=True)
+
+    @mock.patch.object(eo.Event, 'feed')
+    def test_event_feed_zero_limit(self, mock_feed):
+        req = oreo.EventFeedRequest(cursor=0, limit=0)
+        ex = self.assertRaises(rpc.ExpectedException,
+                               self.eng.event_feed,
+                               self.ctx, req.obj_to_primitive())
+        self.assertEqual(exc.BadRequest, ex.exc_info[0])
+        self.assertEqual(0, mock_feed.call_count)
+
+    def test_event_feed_forbidden(self):
+        req = oreo.EventFeedRequest(cursor=0, project_safe=False)
+        ex = self.assertRaises(rpc.ExpectedException,
+                               self.eng.event_feed,
+                               self.ctx, req.obj_to_primitive())
+        self.assertEqual(exc.Forbidden, ex.exc_info[0])
+
     @mock.patch.object(eo.Event, 'find')
     def test_event_get(self, mock_find):
         x_event = mock.Mock()
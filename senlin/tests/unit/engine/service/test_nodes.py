@@ -1095,3 +1095,330 @@ class NodeTest(base.SenlinTestCase):
         mock_find.assert_called_once_with(self.ctx, 'node1')
         mock_node.assert_called_once_with(self.ctx, db_node=x_db_node)
         x_schema.validate.assert_called_once_with({'style': 'tango'})
+
+    def _fake_nodes(self, ctx, filters=None):
+        nodes = []
+        for node_id in filters['id']:
+            node = mock.Mock(id=node_id)
+            node.to_dict.return_value = {'id': node_id}
+            nodes.append(node)
+        return nodes
+
+    @mock.patch.object(common_utils, 'format_node_name')
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'create_many')
+    @mock.patch.object(co.Cluster, 'get_next_index')
+    @mock.patch.object(co.Cluster, 'find')
+    @mock.patch.object(po.Profile, 'find')
+    def test_node_batch_create(self, mock_profile, mock_cluster, mock_index,
+                               mock_create, mock_get, mock_start,
+                               mock_format):
+        mock_format.side_effect = lambda fmt, cluster, index: (
+            'node-%03d' % index)
+        profiles = {'P1': mock.Mock(id='P1_ID', type='os.nova.server-1.0'),
+                    'P2': mock.Mock(id='P2_ID', type='os.heat.stack-1.0')}
+
+        def find_profile(ctx, identity):
+            if identity not in profiles:
+                raise exc.ResourceNotFound(type='profile', id=identity)
+            return profiles[identity]
+
+        mock_profile.side_effect = find_profile
+        mock_cluster.return_value = mock.Mock(id='C1_ID', profile_id='P1',
+                                              config={})
+        mock_index.return_value = 5
+        mock_get.side_effect = self._fake_nodes
+        req = orno.NodeBatchCreateRequest(nodes=[
+            orno.NodeCreateRequestBody(name='n1', profile_id='P1'),
+            orno.NodeCreateRequestBody(name='n2', profile_id='P1',
+                                       cluster_id='C1'),
+            orno.NodeCreateRequestBody(name='n3', profile_id='Bogus'),
+            orno.NodeCreateRequestBody(name='n4', profile_id='P2',
+                                       cluster_id='C1'),
+            orno.NodeCreateRequestBody(name='n5', profile_id='P1',
+                                       cluster_id='C1', role='master'),
+        ])
+
+        result = self.eng.node_batch_create(self.ctx,
+                                            req.obj_to_primitive())
+
+        self.assertEqual(5, len(result))
+        self.assertEqual({'type': 'BadRequest',
+                          'message': "The specified profile 'Bogus' could "
+                                     "not be found."},
+                         result[2]['error'])
+        self.assertEqual({'type': 'BadRequest',
+                          'message': 'Node and cluster have different '
+                                     'profile type, operation aborted.'},
+                         result[3]['error'])
+        # profiles and clusters are looked up once each
+        self.assertEqual(3, mock_profile.call_count)
+        mock_cluster.assert_called_once_with(self.ctx, 'C1')
+        mock_index.assert_called_once_with(self.ctx, 'C1_ID', count=2)
+
+        mock_create.assert_called_once_with(self.ctx, mock.ANY,
+                                            actions=mock.ANY, parent=mock.ANY)
+        values = mock_create.call_args[0][1]
+        actions = mock_create.call_args[1]['actions']
+        batch = mock_create.call_args[1]['parent']
+        self.assertEqual(['n1', 'node-005', 'node-006'],
+                         [v['name'] for v in values])
+        self.assertEqual([-1, 5, 6], [v['index'] for v in values])
+        self.assertEqual(['', 'C1_ID', 'C1_ID'],
+                         [v['cluster_id'] for v in values])
+        self.assertEqual(['', '', 'master'], [v['role'] for v in values])
+        self.assertEqual([v['id'] for v in values],
+                         [a['target'] for a in actions])
+        self.assertEqual([consts.NODE_CREATE] * 3,
+                         [a['action'] for a in actions])
+        self.assertEqual(consts.BATCH_NODE_CREATE, batch['action'])
+        self.assertEqual(batch['id'], batch['target'])
+        self.assertEqual({'nodes': [v['id'] for v in values]},
+                         batch['inputs'])
+        self.assertEqual(consts.ACTION_WAITING, batch['status'])
+        self.assertEqual('batch_node_create_%s' % batch['id'][:8],
+                         batch['name'])
+        self.assertNotIn(batch['id'], [a['id'] for a in actions])
+        for pos, v, a in zip([0, 1, 4], values, actions):
+            self.assertEqual({'id': v['id'], 'action': a['id'],
+                              'batch_action': batch['id']}, result[pos])
+        mock_start.assert_called_once_with()
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(no.Node, 'create_many')
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(po.Profile, 'find')
+    def test_node_batch_create_name_conflict(self, mock_profile, mock_get,
+                                             mock_create, mock_start):
+        cfg.CONF.set_override('name_unique', True)
+        mock_profile.return_value = mock.Mock(id='P1_ID')
+        existing = mock.Mock()
+        existing.name = 'n1'
+
+        def get_all(ctx, filters=None):
+            if 'name' in filters:
+                return [existing]
+            return self._fake_nodes(ctx, filters=filters)
+
+        mock_get.side_effect = get_all
+        req = orno.NodeBatchCreateRequest(nodes=[
+            orno.NodeCreateRequestBody(name='n1', profile_id='P1'),
+            orno.NodeCreateRequestBody(name='n2', profile_id='P1'),
+            orno.NodeCreateRequestBody(name='n2', profile_id='P1'),
+        ])
+
+        result = self.eng.node_batch_create(self.ctx,
+                                            req.obj_to_primitive())
+
+        msg = "The node named (%s) already exists."
+        self.assertEqual(msg % 'n1', result[0]['error']['message'])
+        self.assertEqual(msg % 'n2', result[2]['error']['message'])
+        self.assertEqual(['n2'],
+                         [v['name'] for v in mock_create.call_args[0][1]])
+        filters = mock_get.call_args_list[0][1]['filters']
+        self.assertEqual(['n1', 'n2'], sorted(filters['name']))
+        self.assertEqual(result[1]['id'], mock_create.call_args[0][1][0]['id'])
+
+    @mock.patch.object(no.Node, 'create_many')
+    @mock.patch.object(po.Profile, 'find')
+    def test_node_batch_create_all_failed(self, mock_profile, mock_create):
+        mock_profile.side_effect = exc.ResourceNotFound(type='profile',
+                                                        id='Bogus')
+        req = orno.NodeBatchCreateRequest(nodes=[
+            orno.NodeCreateRequestBody(name='n1', profile_id='Bogus'),
+        ])
+
+        result = self.eng.node_batch_create(self.ctx,
+                                            req.obj_to_primitive())
+
+        self.assertEqual('BadRequest', result[0]['error']['type'])
+        self.assertEqual(0, mock_create.call_count)
+
+    def test_node_batch_create_too_many(self):
+        cfg.CONF.set_override('max_nodes_per_batch', 1)
+        req = orno.NodeBatchCreateRequest(nodes=[
+            orno.NodeCreateRequestBody(name='n1', profile_id='P1'),
+            orno.NodeCreateRequestBody(name='n2', profile_id='P1'),
+        ])
+
+        ex = self.assertRaises(rpc.ExpectedException,
+                               self.eng.node_batch_create,
+                               self.ctx, req.obj_to_primitive())
+
+        self.assertEqual(exc.BadRequest, ex.exc_info[0])
+        self.assertEqual("The number of nodes (2) exceeds the maximum of 1 "
+                         "per batch.", six.text_type(ex.exc_info[1]))
+
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'create_many')
+    @mock.patch.object(service.EngineService, '_node_adopt_preview')
+    def test_node_batch_adopt(self, mock_preview, mock_create, mock_get):
+        class FakeProfile(object):
+            @classmethod
+            def create(cls, ctx, name, spec):
+                return mock.Mock(id='PROFILE_ID')
+
+        mock_preview.side_effect = [
+            (FakeProfile, {'foo': 'bar'}),
+            exc.BadRequest(msg='Boom.'),
+        ]
+        mock_get.side_effect = self._fake_nodes
+        req = orno.NodeBatchAdoptRequest(nodes=[
+            orno.NodeAdoptRequest(identity='PHYS_1', type='FAKE_TYPE',
+                                  name='n1'),
+            orno.NodeAdoptRequest(identity='PHYS_2', type='FAKE_TYPE'),
+        ])
+
+        result = self.eng.node_batch_adopt(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'type': 'BadRequest', 'message': 'Boom.'},
+                         result[1]['error'])
+        mock_create.assert_called_once_with(self.ctx, mock.ANY)
+        values = mock_create.call_args[0][1]
+        self.assertEqual(1, len(values))
+        self.assertEqual('n1', values[0]['name'])
+        self.assertEqual('PHYS_1', values[0]['physical_id'])
+        self.assertEqual('PROFILE_ID', values[0]['profile_id'])
+        self.assertEqual(consts.NS_ACTIVE, values[0]['status'])
+        self.assertEqual({'id': values[0]['id']}, result[0])
+
+    @mock.patch.object(po.Profile, 'delete')
+    @mock.patch.object(no.Node, 'create_many')
+    @mock.patch.object(service.EngineService, '_node_adopt_preview')
+    def test_node_batch_adopt_create_failed(self, mock_preview, mock_create,
+                                            mock_delete):
+        profile_ids = iter(['PROFILE_1', 'PROFILE_2'])
+
+        class FakeProfile(object):
+            @classmethod
+            def create(cls, ctx, name, spec):
+                return mock.Mock(id=next(profile_ids))
+
+        mock_preview.return_value = (FakeProfile, {'foo': 'bar'})
+        mock_create.side_effect = exc.ResourceInUse(type='node', id='n1',
+                                                    reason='Boom.')
+        req = orno.NodeBatchAdoptRequest(nodes=[
+            orno.NodeAdoptRequest(identity='PHYS_1', type='FAKE_TYPE'),
+            orno.NodeAdoptRequest(identity='PHYS_2', type='FAKE_TYPE'),
+        ])
+
+        ex = self.assertRaises(rpc.ExpectedException,
+                               self.eng.node_batch_adopt,
+                               self.ctx, req.obj_to_primitive())
+
+        self.assertEqual(exc.ResourceInUse, ex.exc_info[0])
+        mock_delete.assert_has_calls([mock.call(self.ctx, 'PROFILE_1'),
+                                      mock.call(self.ctx, 'PROFILE_2')])
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
+    @mock.patch.object(no.Node, 'find')
+    @mock.patch.object(no.Node, 'find_many')
+    def test_node_batch_delete(self, mock_find_many, mock_find, mock_action,
+                               mock_start):
+        node1 = mock.Mock(id='NODE1_ID', status='ACTIVE', dependents={})
+        node2 = mock.Mock(id='NODE2_ID', status='CREATING', dependents={})
+        node3 = mock.Mock(id='NODE3_ID', status='ACTIVE',
+                          dependents={'nodes': ['NODE4_ID']})
+        mock_find_many.return_value = {'n1': node1, 'n2': node2, 'n3': node3}
+        mock_find.side_effect = exc.ResourceNotFound(type='node', id='Bogus')
+        mock_action.return_value = ['ACTION1_ID', 'ACTION2_ID']
+        req = orno.NodeBatchDeleteRequest(nodes=[
+            orno.NodeDeleteRequest(identity='n1'),
+            orno.NodeDeleteRequest(identity='n2'),
+            orno.NodeDeleteRequest(identity='n3'),
+            orno.NodeDeleteRequest(identity='Bogus'),
+            orno.NodeDeleteRequest(identity='n1'),
+            orno.NodeDeleteRequest(identity='n2', force=True),
+        ])
+
+        result = self.eng.node_batch_delete(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'id': 'NODE1_ID', 'action': 'ACTION1_ID'},
+                         result[0])
+        self.assertEqual('ActionInProgress', result[1]['error']['type'])
+        self.assertEqual('ResourceInUse', result[2]['error']['type'])
+        self.assertEqual({'type': 'ResourceNotFound',
+                          'message': "The node 'Bogus' could not be found."},
+                         result[3]['error'])
+        self.assertEqual({'type': 'BadRequest',
+                          'message': 'The node (n1) is given more than '
+                                     'once.'},
+                         result[4]['error'])
+        self.assertEqual({'id': 'NODE2_ID', 'action': 'ACTION2_ID'},
+                         result[5])
+        mock_find_many.assert_called_once_with(
+            self.ctx, ['n1', 'n2', 'n3', 'Bogus', 'n1', 'n2'])
+        mock_find.assert_called_once_with(self.ctx, 'Bogus')
+        mock_action.assert_called_once_with(self.ctx, [
+            ('NODE1_ID', consts.NODE_DELETE,
+             {'name': 'node_delete_NODE1_ID',
+              'cause': consts.CAUSE_RPC,
+              'status': action_mod.Action.READY}),
+            ('NODE2_ID', consts.NODE_DELETE,
+             {'name': 'node_delete_NODE2_ID',
+              'cause': consts.CAUSE_RPC,
+              'status': action_mod.Action.READY}),
+        ])
+        mock_start.assert_called_once_with()
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
+    @mock.patch.object(no.Node, 'find_many')
+    def test_node_batch_delete_none_found(self, mock_find_many, mock_action,
+                                          mock_start):
+        mock_find_many.return_value = {}
+        req = orno.NodeBatchDeleteRequest(nodes=[])
+
+        result = self.eng.node_batch_delete(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual([], result)
+        self.assertEqual(0, mock_action.call_count)
+        self.assertEqual(0, mock_start.call_count)
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(action_mod.Action, 'create_many')
+    @mock.patch.object(pb.Profile, 'load')
+    @mock.patch.object(no.Node, 'find_many')
+    def test_node_batch_op(self, mock_find_many, mock_load, mock_action,
+                           mock_start):
+        node1 = mock.Mock(id='NODE1_ID', profile_id='PROFILE_ID')
+        node2 = mock.Mock(id='NODE2_ID', profile_id='PROFILE_ID')
+        mock_find_many.return_value = {'n1': node1, 'n2': node2}
+        x_schema = mock.Mock()
+        x_schema.validate.side_effect = [None, exc.ESchema(message='Boom.')]
+        mock_load.return_value = mock.Mock(OPERATIONS={'dance': x_schema},
+                                           type='cow')
+        mock_action.return_value = ['ACTION_ID']
+        req = orno.NodeBatchOperationRequest(nodes=[
+            orno.NodeOperationRequest(identity='n1', operation='dance',
+                                      params={'style': 'tango'}),
+            orno.NodeOperationRequest(identity='n2', operation='dance',
+                                      params={'style': 'bogus'}),
+            orno.NodeOperationRequest(identity='n2', operation='swim',
+                                      params={}),
+        ])
+
+        result = self.eng.node_batch_op(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'id': 'NODE1_ID', 'action': 'ACTION_ID'},
+                         result[0])
+        self.assertEqual({'type': 'BadRequest', 'message': 'Boom.'},
+                         result[1]['error'])
+        self.assertEqual({'type': 'BadRequest',
+                          'message': "The requested operation 'swim' is not "
+                                     "supported by the profile type 'cow'."},
+                         result[2]['error'])
+        # the profile shared by the nodes is loaded once
+        mock_load.assert_called_once_with(self.ctx, profile_id='PROFILE_ID',
+                                          project_safe=False)
+        mock_action.assert_called_once_with(self.ctx, [
+            ('NODE1_ID', consts.NODE_OPERATION,
+             {'name': 'node_dance_NODE1_ID',
+              'cause': consts.CAUSE_RPC,
+              'status': action_mod.Action.READY,
+              'inputs': {'operation': 'dance',
+                         'params': {'style': 'tango'}}}),
+        ])
+        mock_start.assert_called_once_with()
@@ -10,8 +10,13 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import datetime
+
 import mock
+from oslo_config import cfg
 from oslo_messaging.rpc import dispatcher as rpc
+from oslo_utils import timeutils
 import six
 
 from senlin.common import consts
@@ -19,6 +24,7 @@ from senlin.common import exception
 from senlin.engine.actions import base as action_mod
 from senlin.engine import dispatcher
 from senlin.engine import service
+from senlin.objects import action as ao
 from senlin.objects import cluster as co
 from senlin.objects import receiver as ro
 from senlin.objects.requests import webhooks as vorw
@@ -228,3 +234,80 @@ class WebhookTest(base.SenlinTestCase):
                          six.text_type(ex.exc_info[1]))
         mock_find.assert_called_once_with(self.ctx, 'RRR')
         mock_cluster.assert_called_once_with(self.ctx, 'BOGUS')
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(ao.Action, 'coalesce')
+    @mock.patch.object(action_mod.Action, 'create')
+    @mock.patch.object(co.Cluster, 'find')
+    @mock.patch.object(ro.Receiver, 'find')
+    def test_webhook_trigger_coalesced(self, mock_get, mock_find,
+                                       mock_action, mock_coalesce, notify):
+        cfg.CONF.set_override('coalesce_window', 30, group='receiver')
+        self.patchobject(service, 'webhook_counters',
+                         new=collections.Counter())
+        now = timeutils.utcnow(True)
+        self.patchobject(timeutils, 'utcnow', return_value=now)
+        mock_find.return_value = mock.Mock(id='FAKE_CLUSTER')
+        mock_get.return_value = mock.Mock(id='01234567-abcd-efef',
+                                          cluster_id='FAKE_CLUSTER',
+                                          action=consts.CLUSTER_SCALE_OUT,
+                                          params={'count': 1})
+        mock_coalesce.return_value = mock.Mock(id='ACTION_ID')
+
+        body = vorw.WebhookTriggerRequestBody(params={})
+        req = vorw.WebhookTriggerRequest(identity='FAKE_RECEIVER',
+                                         body=body)
+        res = self.eng.webhook_trigger(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'action': 'ACTION_ID'}, res)
+        mock_coalesce.assert_called_once_with(
+            self.ctx, 'FAKE_CLUSTER', consts.CLUSTER_SCALE_OUT,
+            'webhook_01234567', now - datetime.timedelta(seconds=30),
+            {'count': 1}, ['count'])
+        self.assertEqual(0, mock_action.call_count)
+        self.assertEqual(0, notify.call_count)
+        self.assertEqual({'triggers': 1, 'coalesced': 1},
+                         service.webhook_counters)
+
+    @mock.patch.object(dispatcher, 'start_action')
+    @mock.patch.object(ao.Action, 'coalesce')
+    @mock.patch.object(action_mod.Action, 'create')
+    @mock.patch.object(co.Cluster, 'find')
+    @mock.patch.object(ro.Receiver, 'find')
+    def test_webhook_trigger_coalesce_no_action(self, mock_get, mock_find,
+                                                mock_action, mock_coalesce,
+                                                notify):
+        cfg.CONF.set_override('coalesce_window', 30, group='receiver')
+        mock_find.return_value = mock.Mock(id='FAKE_CLUSTER')
+        mock_get.return_value = mock.Mock(id='01234567-abcd-efef',
+                                          cluster_id='FAKE_CLUSTER',
+                                          action='DANCE',
+                                          params={'foo': 'bar'})
+        mock_coalesce.return_value = None
+        mock_action.return_value = 'ACTION_ID'
+
+        body = vorw.WebhookTriggerRequestBody(params={})
+        req = vorw.WebhookTriggerRequest(identity='FAKE_RECEIVER',
+                                         body=body)
+        res = self.eng.webhook_trigger(self.ctx, req.obj_to_primitive())
+
+        self.assertEqual({'action': 'ACTION_ID'}, res)
+        mock_coalesce.assert_called_once_with(
+            self.ctx, 'FAKE_CLUSTER', 'DANCE', 'webhook_01234567', mock.ANY,
+            {'foo': 'bar'}, None)
+        mock_action.assert_called_once_with(
+            self.ctx, 'FAKE_CLUSTER', 'DANCE',
+            name='webhook_01234567',
+            cause=consts.CAUSE_RPC,
+            status=action_mod.Action.READY,
+            inputs={'foo': 'bar'},
+        )
+        notify.assert_called_once_with()
+
+    @mock.patch.object(ao.Action, 'coalesce')
+    def test_coalesce_trigger_disabled(self, mock_coalesce):
+        res = self.eng._coalesce_trigger(self.ctx, 'CLUSTER', 'DANCE',
+                                         'webhook_01234567', {})
+
+        self.assertIsNone(res)
+        self.assertEqual(0, mock_coalesce.call_count)
@@ -64,7 +64,8 @@ class TestCluster(base.SenlinTestCase):
         self.assertEqual({}, cluster.metadata)
         self.assertEqual({}, cluster.dependents)
         self.assertEqual({}, cluster.config)
-        self.assertEqual({'profile': None, 'nodes': [], 'policies': []},
+        self.assertEqual({'profile': None, 'nodes': [], 'summaries': None,
+                          'placement': None, 'policies': []},
                          cluster.rt)
 
     def test_init_with_none(self):
@@ -86,9 +87,10 @@ class TestCluster(base.SenlinTestCase):
     @mock.patch.object(cpo.ClusterPolicy, 'get_all')
     @mock.patch.object(pcb.Policy, 'load')
     @mock.patch.object(pfb.Profile, 'load')
+    @mock.patch.object(no.Node, 'summaries_by_cluster')
     @mock.patch.object(no.Node, 'get_all_by_cluster')
-    def test__load_runtime_data(self, mock_nodes, mock_profile, mock_policy,
-                                mock_pb):
+    def test__load_runtime_data(self, mock_nodes, mock_summaries,
+                                mock_profile, mock_policy, mock_pb):
         x_binding = mock.Mock()
         x_binding.policy_id = POLICY_ID
         mock_pb.return_value = [x_binding]
@@ -99,6 +101,9 @@ class TestCluster(base.SenlinTestCase):
         x_node_1 = mock.Mock()
         x_node_2 = mock.Mock()
         mock_nodes.return_value = [x_node_1, x_node_2]
+        x_summary_1 = mock.Mock()
+        x_summary_2 = mock.Mock()
+        mock_summaries.return_value = [x_summary_1, x_summary_2]
 
         cluster = cm.Cluster('test-cluster', 0, PROFILE_ID)
         cluster.id = CLUSTER_ID
@@ -107,9 +112,8 @@ class TestCluster(base.SenlinTestCase):
 
         rt = cluster.rt
         self.assertEqual(x_profile, rt['profile'])
-        self.assertEqual([x_node_1, x_node_2], rt['nodes'])
-        self.assertEqual(2, len(rt['nodes']))
-        self.assertIsInstance(rt['nodes'], list)
+        self.assertIsNone(rt['nodes'])
+        self.assertEqual([x_summary_1, x_summary_2], rt['summaries'])
         self.assertEqual([x_policy], rt['policies'])
 
         mock_pb.assert_called_once_with(self.context, CLUSTER_ID)
@@ -119,6 +123,12 @@ class TestCluster(base.SenlinTestCase):
         mock_profile.assert_called_once_with(self.context,
                                              profile_id=PROFILE_ID,
                                              project_safe=False)
+        mock_summaries.assert_called_once_with(self.context, CLUSTER_ID)
+        self.assertEqual(0, mock_nodes.call_count)
+
+        # full node objects are loaded on first access
+        self.assertEqual([x_node_1, x_node_2], cluster.nodes)
+        self.assertEqual([x_node_1, x_node_2], rt['nodes'])
         mock_nodes.assert_called_once_with(self.context, CLUSTER_ID)
 
     def test__load_runtime_data_id_is_none(self):
@@ -767,6 +777,30 @@ class TestCluster(base.SenlinTestCase):
         mock_update.assert_called_once_with(
             self.context, CLUSTER_ID, POLICY_ID, {'enabled': False})
 
+    def test_node_summaries(self):
+        cluster = cm.Cluster('test-cluster', 0, PROFILE_ID)
+        node1 = mock.Mock(id='N1', status='ACTIVE',
+                          data={'placement': {'zone': 'AZ1'}})
+        node2 = mock.Mock(id='N2', status='ERROR', data={})
+        cluster.update_node([node1, node2])
+
+        res = cluster.node_summaries
+
+        self.assertEqual(['N1', 'N2'], [n.id for n in res])
+        self.assertEqual({'zone': 'AZ1'}, res[0].placement)
+        self.assertEqual('ERROR', res[1].status)
+        self.assertIs(res, cluster.node_summaries)
+
+        # summaries are kept in sync with the node cache
+        node3 = mock.Mock(id='N3', status='ACTIVE', data={})
+        cluster.add_node(node3)
+        self.assertEqual(['N1', 'N2', 'N3'],
+                         [n.id for n in cluster.node_summaries])
+        cluster.remove_node('N1')
+        self.assertEqual(['N2', 'N3'],
+                         [n.id for n in cluster.node_summaries])
+        self.assertEqual([node2, node3], cluster.nodes)
+
     def test_get_region_distribution(self):
         cluster = cm.Cluster('test-cluster', 0, PROFILE_ID)
 
@@ -791,23 +825,15 @@ class TestCluster(base.SenlinTestCase):
         self.assertEqual(1, result['R2'])
         self.assertEqual(0, result['R3'])
 
-    def test_get_zone_distribution(self):
+    @mock.patch.object(pfb.Profile, 'get_placements')
+    def test_get_zone_distribution(self, mock_placements):
         cluster = cm.Cluster('test-cluster', 0, PROFILE_ID)
-        node1 = mock.Mock()
-        node1.data = {}
-        node1.get_details.return_value = {
-            'OS-EXT-AZ:availability_zone': 'AZ1',
-        }
-        node2 = mock.Mock()
-        node2.data = {
-            'foobar': 'irrelevant'
-        }
-        node3 = mock.Mock()
-        node3.data = {
-            'placement': {
-                'zone': 'AZ2'
-            }
-        }
+        node1 = mock.Mock(id='N1', profile_id='P1', data={})
+        node2 = mock.Mock(id='N2', profile_id='P1',
+                          data={'foobar': 'irrelevant'})
+        node3 = mock.Mock(id='N3', profile_id='P2',
+                          data={'placement': {'zone': 'AZ2'}})
+        mock_placements.return_value = {'N1': {'zone': 'AZ1'}}
 
         nodes = [node1, node2, node3]
         for n in nodes:
@@ -821,7 +847,31 @@ class TestCluster(base.SenlinTestCase):
         self.assertEqual(1, result['AZ2'])
         self.assertEqual(0, result['AZ3'])
 
-        node1.get_details.assert_called_once_with(self.context)
+        # only one lookup for all nodes sharing a profile
+        mock_placements.assert_called_once_with(self.context, 'P1',
+                                                [node1, node2])
+        # resolved zones are reflected in the placement index
+        self.assertEqual(['N1'],
+                         [n.id for n in cluster.nodes_by_zone('AZ1')])
+
+    def test_placement_index(self):
+        cluster = cm.Cluster('test-cluster', 0, PROFILE_ID)
+        node1 = mock.Mock(id='N1', data={'placement': {
+            'region_name': 'R1', 'zone': 'AZ1'}})
+        node2 = mock.Mock(id='N2', data={'placement': {'zone': 'AZ1'}})
+        cluster.update_node([node1, node2])
+
+        index = cluster._placement_index()
+
+        self.assertEqual(['N1'], [n.id for n in index['region_name']['R1']])
+        self.assertEqual(['N1', 'N2'], [n.id for n in index['zone']['AZ1']])
+        self.assertIs(index, cluster._placement_index())
+
+        # index is rebuilt when membership changes
+        cluster.remove_node('N1')
+        index = cluster._placement_index()
+        self.assertEqual({}, index['region_name'])
+        self.assertEqual(['N2'], [n.id for n in index['zone']['AZ1']])
 
     def test_nodes_by_region(self):
         cluster = cm.Cluster('test-cluster', 0, PROFILE_ID)
@@ -836,11 +886,11 @@ class TestCluster(base.SenlinTestCase):
 
         result = cluster.nodes_by_region('R1')
         self.assertEqual(1, len(result))
-        self.assertEqual(node1, result[0])
+        self.assertEqual(node1.id, result[0].id)
 
         result = cluster.nodes_by_region('R2')
         self.assertEqual(1, len(result))
-        self.assertEqual(node2, result[0])
+        self.assertEqual(node2.id, result[0].id)
 
         result = cluster.nodes_by_region('R3')
         self.assertEqual(0, len(result))
@@ -858,11 +908,11 @@ class TestCluster(base.SenlinTestCase):
 
         result = cluster.nodes_by_zone('AZ1')
         self.assertEqual(1, len(result))
-        self.assertEqual(node1, result[0])
+        self.assertEqual(node1.id, result[0].id)
 
         result = cluster.nodes_by_zone('AZ2')
         self.assertEqual(1, len(result))
-        self.assertEqual(node2, result[0])
+        self.assertEqual(node2.id, result[0].id)
 
         result = cluster.nodes_by_region('AZ3')
         self.assertEqual(0, len(result))
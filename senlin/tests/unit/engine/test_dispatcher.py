@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import eventlet
 import mock
 from oslo_config import cfg
 from oslo_context import context
@@ -20,6 +21,7 @@ from senlin.common import messaging
 from senlin.engine import dispatcher
 from senlin.engine import scheduler
 from senlin.engine import service
+from senlin.objects import action as ao
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
 
@@ -161,3 +163,177 @@ class TestDispatcher(base.SenlinTestCase):
 
         mock_notify.assert_called_once_with(dispatcher.START_ACTION,
                                             'FAKE_ENGINE')
+
+    @mock.patch.object(dispatcher, 'wake_waiters')
+    def test_action_done(self, mock_wake):
+        disp = dispatcher.Dispatcher(self.svc, 'TOPIC', '1', self.thm)
+        disp.action_done(self.context, action_id='FOO')
+
+        mock_wake.assert_called_once_with('FOO')
+
+    @mock.patch.object(dispatcher, 'notify')
+    def test_action_done_function(self, mock_notify):
+        dispatcher.action_done('FOO')
+
+        mock_notify.assert_called_once_with(dispatcher.ACTION_DONE, None,
+                                            action_id='FOO')
+
+
+class TestWaitForAction(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestWaitForAction, self).setUp()
+        self.context = utils.dummy_context()
+        self.mock_get = self.patchobject(ao.Action, 'get')
+
+    def test_wait_already_in_status(self):
+        action = mock.Mock(status='SUCCEEDED')
+        self.mock_get.return_value = action
+
+        res = dispatcher.wait_for_action(self.context, 'FOO',
+                                         ['SUCCEEDED'], 10)
+
+        self.assertEqual(action, res)
+        self.mock_get.assert_called_once_with(self.context, 'FOO',
+                                              project_safe=False)
+        self.assertNotIn('FOO', dispatcher._waiters)
+
+    def test_wait_woken_up(self):
+        running = mock.Mock(status='RUNNING')
+        done = mock.Mock(status='FAILED')
+
+        def get(ctx, action_id, project_safe):
+            if self.mock_get.call_count == 1:
+                # the action completes right after being loaded
+                dispatcher.wake_waiters(action_id)
+                return running
+            return done
+
+        self.mock_get.side_effect = get
+
+        res = dispatcher.wait_for_action(self.context, 'FOO',
+                                         ['SUCCEEDED', 'FAILED'], 10)
+
+        self.assertEqual(done, res)
+        self.assertEqual(2, self.mock_get.call_count)
+        self.assertNotIn('FOO', dispatcher._waiters)
+
+    @mock.patch.object(eventlet, 'Timeout', wraps=eventlet.Timeout)
+    def test_wait_check_interval(self, mock_timeout):
+        cfg.CONF.set_override('action_wait_check_interval', 2)
+        running = mock.Mock(status='RUNNING')
+        done = mock.Mock(status='SUCCEEDED')
+
+        def get(ctx, action_id, project_safe):
+            if self.mock_get.call_count == 1:
+                dispatcher.wake_waiters(action_id)
+                return running
+            return done
+
+        self.mock_get.side_effect = get
+
+        res = dispatcher.wait_for_action(self.context, 'FOO',
+                                         ['SUCCEEDED'], 10)
+
+        self.assertEqual(done, res)
+        mock_timeout.assert_called_once_with(2, False)
+
+    def test_wait_timeout(self):
+        action = mock.Mock(status='RUNNING')
+        self.mock_get.return_value = action
+
+        res = dispatcher.wait_for_action(self.context, 'FOO',
+                                         ['SUCCEEDED'], 0.01)
+
+        self.assertEqual(action, res)
+        self.assertNotIn('FOO', dispatcher._waiters)
+
+    def test_wait_action_deleted(self):
+        self.mock_get.return_value = None
+
+        res = dispatcher.wait_for_action(self.context, 'FOO',
+                                         ['SUCCEEDED'], 10)
+
+        self.assertIsNone(res)
+
+    def test_wake_waiters(self):
+        waiter = mock.Mock()
+        waiter.ready.return_value = False
+        dispatcher._waiters['FOO'].add(waiter)
+
+        dispatcher.wake_waiters('FOO')
+        dispatcher.wake_waiters('BAR')
+
+        waiter.send.assert_called_once_with()
+        self.assertNotIn('FOO', dispatcher._waiters)
+
+    def test_wake_waiters_already_woken(self):
+        waiter = mock.Mock()
+        waiter.ready.return_value = True
+        dispatcher._waiters['FOO'].add(waiter)
+
+        dispatcher.wake_waiters('FOO')
+
+        self.assertEqual(0, waiter.send.call_count)
+
+
+class TestWaitForAnyAction(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestWaitForAnyAction, self).setUp()
+        self.context = utils.dummy_context()
+        self.mock_get = self.patchobject(ao.Action, 'get_all')
+
+    def test_wait_already_in_status(self):
+        self.mock_get.return_value = [
+            mock.Mock(id='FOO', status='RUNNING'),
+            mock.Mock(id='BAR', status='FAILED'),
+        ]
+
+        res = dispatcher.wait_for_any_action(self.context, ['FOO', 'BAR'],
+                                             ['SUCCEEDED', 'FAILED'], 10)
+
+        self.assertEqual({'BAR': 'FAILED'}, res)
+        self.mock_get.assert_called_once_with(
+            self.context, filters={'id': ['FOO', 'BAR']}, project_safe=False)
+        self.assertNotIn('FOO', dispatcher._waiters)
+        self.assertNotIn('BAR', dispatcher._waiters)
+
+    def test_wait_woken_up(self):
+        running = [mock.Mock(id='FOO', status='RUNNING'),
+                   mock.Mock(id='BAR', status='RUNNING')]
+        done = [mock.Mock(id='FOO', status='SUCCEEDED'),
+                mock.Mock(id='BAR', status='SUCCEEDED')]
+
+        def get_all(ctx, filters, project_safe):
+            if self.mock_get.call_count == 1:
+                # both actions complete right after being loaded
+                dispatcher.wake_waiters('FOO')
+                dispatcher.wake_waiters('BAR')
+                return running
+            return done
+
+        self.mock_get.side_effect = get_all
+
+        res = dispatcher.wait_for_any_action(self.context, ['FOO', 'BAR'],
+                                             ['SUCCEEDED'], 10)
+
+        self.assertEqual({'FOO': 'SUCCEEDED', 'BAR': 'SUCCEEDED'}, res)
+        self.assertEqual(2, self.mock_get.call_count)
+
+    def test_wait_timeout(self):
+        self.mock_get.return_value = [mock.Mock(id='FOO', status='RUNNING')]
+
+        res = dispatcher.wait_for_any_action(self.context, ['FOO'],
+                                             ['SUCCEEDED'], 0.01)
+
+        self.assertEqual({}, res)
+        self.assertNotIn('FOO', dispatcher._waiters)
+
+    def test_wait_action_deleted(self):
+        self.mock_get.return_value = []
+
+        res = dispatcher.wait_for_any_action(self.context, ['FOO'],
+                                             ['SUCCEEDED'], 10)
+
+        self.assertEqual({'FOO': None}, res)
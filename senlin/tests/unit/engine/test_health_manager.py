@@ -20,6 +20,7 @@ from oslo_utils import timeutils as tu
 from senlin.common import consts
 from senlin.common import context
 from senlin.common import messaging
+from senlin.engine import dispatcher
 from senlin.engine import health_manager as hm
 from senlin import objects
 from senlin.objects import cluster as obj_cluster
@@ -579,6 +580,34 @@ class TestHealthManager(base.SenlinTestCase):
             },
             self.hm.registries[1])
 
+    @mock.patch.object(dispatcher, 'wait_for_action')
+    def test__wait_for_action(self, mock_wait):
+        mock_wait.return_value = mock.Mock(status=consts.ACTION_SUCCEEDED)
+        ctx = mock.Mock()
+
+        res = self.hm._wait_for_action(ctx, 'ACTION_ID', 60)
+
+        self.assertEqual((True, ""), res)
+        mock_wait.assert_called_once_with(
+            ctx, 'ACTION_ID', consts.ACTION_TERMINAL_STATUSES, 60)
+
+    @mock.patch.object(dispatcher, 'wait_for_action')
+    def test__wait_for_action_failed(self, mock_wait):
+        mock_wait.return_value = mock.Mock(status=consts.ACTION_FAILED)
+
+        res = self.hm._wait_for_action(mock.Mock(), 'ACTION_ID', 60)
+
+        self.assertEqual((False, "Cluster check action failed or cancelled"),
+                         res)
+
+    @mock.patch.object(dispatcher, 'wait_for_action')
+    def test__wait_for_action_timeout(self, mock_wait):
+        mock_wait.return_value = mock.Mock(status=consts.ACTION_RUNNING)
+
+        res = self.hm._wait_for_action(mock.Mock(), 'ACTION_ID', 60)
+
+        self.assertEqual((False, "Timeout while polling cluster status"), res)
+
     @mock.patch.object(hm, "_chase_up")
     @mock.patch.object(obj_node.Node, 'get_all_by_cluster')
     @mock.patch.object(hm.HealthManager, "_wait_for_action")
@@ -0,0 +1,64 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import time
+
+import mock
+from oslo_config import cfg
+
+from senlin.common import cache
+from senlin.common import exception as exc
+from senlin.engine import lookup_cache as lc
+from senlin.tests.unit.common import base
+
+
+class TestLookupCache(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestLookupCache, self).setUp()
+        self.mock_time = self.patchobject(time, 'time', return_value=100)
+
+    def test_global_cache(self):
+        res = lc.global_cache()
+
+        self.assertIsInstance(res, cache.TTLCache)
+        self.assertEqual('lookup', res.name)
+        self.assertEqual(lc.MAX_ENTRIES, res.max_entries)
+        self.assertIs(res, lc.global_cache())
+
+    def test_ttl_default(self):
+        cfg.CONF.set_override('lookup_cache_ttl', 5)
+        cfg.CONF.set_override('lookup_cache_negative_ttl', 1)
+
+        res = lc.global_cache()
+
+        self.assertEqual(5, res.ttl)
+        self.assertEqual(1, res.negative_ttl)
+
+    def test_get_not_found(self):
+        loader = mock.Mock(side_effect=exc.InternalError(code=404,
+                                                         message='Boom'))
+
+        self.assertRaises(exc.InternalError, lc.global_cache().get, 'KEY',
+                          loader)
+        self.assertRaises(exc.InternalError, lc.global_cache().get, 'KEY',
+                          loader)
+
+        loader.assert_called_once_with()
+
+    def test_get_other_errors_not_cached(self):
+        loader = mock.Mock(side_effect=[
+            exc.InternalError(code=500, message='Boom'), 'FLAVOR'])
+
+        self.assertRaises(exc.InternalError, lc.global_cache().get, 'KEY',
+                          loader)
+        self.assertEqual('FLAVOR', lc.global_cache().get('KEY', loader))
@@ -286,3 +286,18 @@ class SchedulerTest(base.SenlinTestCase):
         mock_sleep = self.patchobject(eventlet, 'sleep')
         scheduler.sleep(1)
         mock_sleep.assert_called_once_with(1)
+
+    @mock.patch.object(scheduler.ao.Action, 'count_by_status')
+    def test_action_queue(self, mock_count):
+        mock_count.return_value = [('READY', 'CLUSTER_CREATE', 1),
+                                   ('READY', 'CLUSTER_SCALE_OUT', 2),
+                                   ('RUNNING', 'NODE_CREATE', 3),
+                                   ('WAITING', 'FAKE_OPERATION', 4)]
+
+        res = scheduler._action_queue()
+
+        self.assertEqual(3, res[('READY', 'CLUSTER')])
+        self.assertEqual(3, res[('RUNNING', 'NODE')])
+        self.assertEqual(4, res[('WAITING', 'CUSTOM')])
+        self.assertEqual(0, res[('READY', 'NODE')])
+        self.assertEqual(9, len(res))
@@ -188,3 +188,51 @@ class SenlinLockTest(base.SenlinTestCase):
         actual = lockm.node_lock_release('C', 'A')
         self.assertEqual(mock_release.return_value, actual)
         mock_release.assert_called_once_with('C', 'A')
+
+    @mock.patch.object(ao.Action, 'get')
+    @mock.patch.object(nlo.NodeLock, "acquire")
+    def test_node_lock_acquire_parent_owner(self, mock_acquire, mock_get):
+        mock_acquire.return_value = 'PARENT_ID'
+
+        res = lockm.node_lock_acquire(self.ctx, 'NODE_A', 'ACTION_XY',
+                                      parent='PARENT_ID')
+
+        self.assertTrue(res)
+        mock_acquire.assert_called_once_with('NODE_A', 'ACTION_XY')
+        self.assertEqual(0, mock_get.call_count)
+
+    @mock.patch.object(common_utils, 'is_engine_dead')
+    @mock.patch.object(ao.Action, 'get')
+    @mock.patch.object(nlo.NodeLock, "acquire")
+    @mock.patch.object(nlo.NodeLock, "steal")
+    def test_node_lock_acquire_completed_owner(self, mock_steal, mock_acquire,
+                                               mock_get, mock_dead):
+        mock_dead.return_value = False
+        mock_acquire.return_value = 'ACTION_ABC'
+        mock_get.return_value = mock.Mock(owner=None, status='SUCCEEDED')
+
+        res = lockm.node_lock_acquire(self.ctx, 'NODE_A', 'ACTION_XY',
+                                      parent='PARENT_ID')
+
+        self.assertFalse(res)
+        self.assertEqual(0, mock_steal.call_count)
+
+    @mock.patch.object(nlo.NodeLock, "acquire_many")
+    def test_node_lock_acquire_many(self, mock_acquire):
+        mock_acquire.return_value = {'NODE_A': 'ACTION_XY',
+                                     'NODE_B': 'ACTION_ABC',
+                                     'NODE_C': 'ACTION_XY'}
+
+        res = lockm.node_lock_acquire_many(self.ctx, ['NODE_A', 'NODE_B',
+                                                      'NODE_C'], 'ACTION_XY')
+
+        self.assertEqual({'NODE_A', 'NODE_C'}, res)
+        mock_acquire.assert_called_once_with(['NODE_A', 'NODE_B', 'NODE_C'],
+                                             'ACTION_XY')
+
+    @mock.patch.object(nlo.NodeLock, "release_many")
+    def test_node_lock_release_many(self, mock_release):
+        actual = lockm.node_lock_release_many('A', handover={'N': 'B'})
+
+        self.assertEqual(mock_release.return_value, actual)
+        mock_release.assert_called_once_with('A', handover={'N': 'B'})
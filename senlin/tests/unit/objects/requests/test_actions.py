@@ -119,6 +119,14 @@ class TestActionList(test_base.SenlinTestCase):
         sot.obj_set_defaults()
         self.assertTrue(sot.project_safe)
 
+    def test_action_list_request_ids(self):
+        sot = actions.ActionListRequest(ids=['A1', 'A2'])
+        self.assertEqual(['A1', 'A2'], sot.ids)
+
+        res = sot.obj_to_primitive()
+        sot.obj_make_compatible(res, '1.0')
+        self.assertNotIn('ids', res['senlin_object.data'])
+
 
 class TestActionGet(test_base.SenlinTestCase):
 
@@ -130,6 +138,21 @@ class TestActionGet(test_base.SenlinTestCase):
         sot = actions.ActionGetRequest(**self.body)
         self.assertEqual('test-action', sot.identity)
 
+    def test_action_get_request_wait(self):
+        sot = actions.ActionGetRequest(identity='test-action', wait='30',
+                                       until='RUNNING')
+        self.assertEqual(30, sot.wait)
+        self.assertEqual('RUNNING', sot.until)
+
+        res = sot.obj_to_primitive()
+        sot.obj_make_compatible(res, '1.0')
+        self.assertNotIn('wait', res['senlin_object.data'])
+        self.assertNotIn('until', res['senlin_object.data'])
+
+    def test_action_get_request_bad_until(self):
+        self.assertRaises(ValueError, actions.ActionGetRequest,
+                          identity='test-action', until='BOGUS')
+
 
 class TestActionDelete(test_base.SenlinTestCase):
 
@@ -48,6 +48,37 @@ class TestEventList(test_base.SenlinTestCase):
         self.assertTrue(sot.project_safe)
 
 
+class TestEventFeed(test_base.SenlinTestCase):
+
+    def test_event_feed_request_full(self):
+        params = {
+            'cursor': '12',
+            'otype': ['NODE'],
+            'action': ['NODE_CREATE'],
+            'cluster_id': ['f23ff00c-ec4f-412d-bd42-7f6e209819cb'],
+            'level': ['ERROR'],
+            'limit': 5,
+            'project_safe': False,
+        }
+        sot = events.EventFeedRequest(**params)
+        self.assertEqual(12, sot.cursor)
+        self.assertEqual(['NODE'], sot.otype)
+        self.assertEqual(['NODE_CREATE'], sot.action)
+        self.assertEqual(['ERROR'], sot.level)
+        self.assertEqual(5, sot.limit)
+        self.assertFalse(sot.project_safe)
+
+    def test_event_feed_request_default(self):
+        sot = events.EventFeedRequest()
+        sot.obj_set_defaults()
+        self.assertIsNone(sot.cursor)
+        self.assertEqual(100, sot.limit)
+        self.assertTrue(sot.project_safe)
+
+    def test_event_feed_request_invalid_cursor(self):
+        self.assertRaises(ValueError, events.EventFeedRequest, cursor=-1)
+
+
 class TestEventGet(test_base.SenlinTestCase):
 
     body = {
@@ -248,3 +248,40 @@ class TestNodeAdoptPreview(test_base.SenlinTestCase):
         self.assertEqual('test-type', sot.type)
         self.assertEqual({'foo': 'bar'}, sot.overrides)
         self.assertTrue(sot.snapshot)
+
+
+class TestNodeBatch(test_base.SenlinTestCase):
+
+    def test_node_batch_create_request(self):
+        body = {'nodes': [{'name': 'n1', 'profile_id': 'p1'},
+                          {'name': 'n2', 'profile_id': 'p2',
+                           'cluster_id': 'c1'}]}
+        sot = nodes.NodeBatchCreateRequest.obj_from_primitive(
+            nodes.NodeBatchCreateRequest(
+                nodes=[nodes.NodeCreateRequestBody(**n)
+                       for n in body['nodes']]).obj_to_primitive())
+
+        self.assertEqual(2, len(sot.nodes))
+        self.assertIsInstance(sot.nodes[0], nodes.NodeCreateRequestBody)
+        self.assertEqual('n1', sot.nodes[0].name)
+        self.assertEqual('p2', sot.nodes[1].profile_id)
+        self.assertEqual('c1', sot.nodes[1].cluster_id)
+
+    def test_node_batch_delete_request(self):
+        sot = nodes.NodeBatchDeleteRequest(
+            nodes=[nodes.NodeDeleteRequest(identity='n1'),
+                   nodes.NodeDeleteRequest(identity='n2', force=True)])
+
+        self.assertEqual(['n1', 'n2'], [n.identity for n in sot.nodes])
+        self.assertTrue(sot.nodes[1].force)
+
+    def test_node_batch_operation_request(self):
+        sot = nodes.NodeBatchOperationRequest(
+            nodes=[nodes.NodeOperationRequest(identity='n1',
+                                              operation='reboot')])
+
+        self.assertEqual('reboot', sot.nodes[0].operation)
+
+    def test_node_batch_request_invalid_item(self):
+        self.assertRaises(ValueError, nodes.NodeBatchAdoptRequest,
+                          nodes=[nodes.NodeDeleteRequest(identity='n1')])
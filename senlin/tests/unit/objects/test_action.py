@@ -11,12 +11,14 @@
 # under the License.
 
 import mock
+from oslo_utils import timeutils
 from oslo_utils import uuidutils
 import six
 import testtools
 
 from senlin.common import exception as exc
 from senlin.objects import action as ao
+from senlin.objects import dependency as dobj
 
 
 class TestAction(testtools.TestCase):
@@ -88,3 +90,22 @@ class TestAction(testtools.TestCase):
                          six.text_type(ex))
         mock_name.assert_called_once_with(self.ctx, 'BOGUS')
         mock_shortid.assert_called_once_with(self.ctx, 'BOGUS')
+
+    @mock.patch.object(dobj.Dependency, 'get_dependents')
+    @mock.patch.object(dobj.Dependency, 'get_depended')
+    def test_to_dict_with_dependencies(self, mock_depended, mock_dependents):
+        aid = uuidutils.generate_uuid()
+        action = ao.Action(self.ctx, id=aid, name='A', action='NODE_CREATE',
+                           target=aid, cause='RPC Request', owner=None,
+                           interval=-1, start_time=None, end_time=None,
+                           timeout=3600, status='READY', status_reason='',
+                           inputs={}, outputs={},
+                           created_at=timeutils.utcnow(True),
+                           updated_at=None, data={}, user='U', project='P')
+
+        result = action.to_dict(depends_on=['D1'], depended_by=[])
+
+        self.assertEqual(['D1'], result['depends_on'])
+        self.assertEqual([], result['depended_by'])
+        self.assertEqual(0, mock_depended.call_count)
+        self.assertEqual(0, mock_dependents.call_count)
@@ -96,6 +96,21 @@ class TestCluster(base.SenlinTestCase):
         mock_get_short_id.assert_called_once_with(self.ctx, 'bogus',
                                                   project_safe=True)
 
+    @mock.patch.object(db_api, 'cluster_get_by_identities')
+    def test_find_many(self, mock_get):
+        fake_cluster = mock.Mock()
+        mock_get.return_value = {'C1': [fake_cluster], 'C2': []}
+
+        with mock.patch.object(co.Cluster, '_from_db_object',
+                               return_value=fake_cluster) as mock_obj:
+            res = co.Cluster.find_many(self.ctx, ['C1', 'C2'],
+                                       project_safe=False)
+
+        self.assertEqual({'C1': fake_cluster}, res)
+        mock_obj.assert_called_once_with(self.ctx, mock.ANY, fake_cluster)
+        self.assertEqual(set(['C1', 'C2']), set(mock_get.call_args[0][1]))
+        self.assertEqual({'project_safe': False}, mock_get.call_args[1])
+
     @mock.patch.object(db_api, 'cluster_policy_ids_by_cluster')
     @mock.patch.object(db_api, 'node_ids_by_cluster')
     @mock.patch.object(db_api, 'profile_get')
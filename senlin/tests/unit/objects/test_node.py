@@ -17,6 +17,7 @@ import six
 
 from senlin.common import exception as exc
 from senlin.common import utils as common_utils
+from senlin.db import api as db_api
 from senlin.objects import node as no
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
@@ -93,6 +94,45 @@ class TestNode(base.SenlinTestCase):
         mock_shortid.assert_called_once_with(self.ctx, 'BOGUS',
                                              project_safe=True)
 
+    @mock.patch.object(no.Node, 'get_by_name')
+    def test_find_cached(self, mock_name):
+        x_node = mock.Mock()
+        mock_name.return_value = x_node
+
+        result = no.Node.find(self.ctx, 'node1')
+        self.assertEqual(x_node, result)
+        result = no.Node.find(self.ctx, 'node1')
+        self.assertEqual(x_node, result)
+
+        mock_name.assert_called_once_with(self.ctx, 'node1',
+                                          project_safe=True)
+
+    @mock.patch.object(db_api, 'node_get_by_identities')
+    def test_find_many(self, mock_get):
+        mock_get.return_value = {
+            'N1': [{'id': 'NODE1', 'name': 'N1'}],
+            'N2': [{'id': 'NODE2'}, {'id': 'NODE3'}],
+            'N3': [],
+        }
+        fake_node = mock.Mock()
+
+        with mock.patch.object(no.Node, '_from_db_object',
+                               return_value=fake_node):
+            res = no.Node.find_many(self.ctx, ['N1', 'N2', 'N3'])
+
+        self.assertEqual({'N1': fake_node}, res)
+        self.assertEqual(1, mock_get.call_count)
+        self.assertEqual(set(['N1', 'N2', 'N3']),
+                         set(mock_get.call_args[0][1]))
+
+        # resolved identities are served from the request cache
+        mock_get.reset_mock()
+        mock_get.return_value = {'N3': []}
+        res = no.Node.find_many(self.ctx, ['N1', 'N3'])
+        self.assertEqual({'N1': fake_node}, res)
+        mock_get.assert_called_once_with(self.ctx, ['N3'], project_safe=True)
+        self.assertEqual(fake_node, no.Node.find(self.ctx, 'N1'))
+
     def test_to_dict(self):
         PROFILE_ID = uuidutils.generate_uuid()
         CLUSTER_ID = uuidutils.generate_uuid()
@@ -134,3 +174,46 @@ class TestNode(base.SenlinTestCase):
         result = no.Node.get(self.ctx, node.id)
         dt = result.to_dict()
         self.assertEqual(expected, dt)
+
+    @mock.patch.object(no.db_api, 'node_summary_get_all_by_cluster')
+    def test_summaries_by_cluster(self, mock_get):
+        now = timeutils.utcnow(True)
+        mock_get.return_value = [
+            ('N1', 'ACTIVE', now, 'P1',
+             {'placement': {'zone': 'AZ1'}, 'lb_member': 'M1'}),
+            ('N2', 'ERROR', None, 'P1', None),
+        ]
+
+        res = no.Node.summaries_by_cluster(self.ctx, 'CLUSTER_ID')
+
+        self.assertEqual(2, len(res))
+        self.assertIsInstance(res[0], no.NodeSummary)
+        self.assertEqual('N1', res[0].id)
+        self.assertEqual('ACTIVE', res[0].status)
+        self.assertEqual(now, res[0].created_at)
+        self.assertEqual('P1', res[0].profile_id)
+        self.assertEqual({'zone': 'AZ1'}, res[0].placement)
+        self.assertEqual('M1', res[0].lb_member)
+        self.assertEqual({}, res[1].placement)
+        self.assertIsNone(res[1].lb_member)
+        mock_get.assert_called_once_with(self.ctx, 'CLUSTER_ID',
+                                         filters=None, project_safe=True)
+
+    def test_node_summary_slots(self):
+        summary = no.NodeSummary('N1', 'ACTIVE')
+
+        self.assertFalse(hasattr(summary, '__dict__'))
+        self.assertRaises(AttributeError, setattr, summary, 'data', {})
+
+    def test_node_summary_from_node(self):
+        node = mock.Mock(id='N1', status='ACTIVE', created_at='T1',
+                         profile_id='P1',
+                         data={'placement': {'region_name': 'R1'}})
+
+        res = no.NodeSummary.from_node(node)
+
+        self.assertEqual('N1', res.id)
+        self.assertEqual('T1', res.created_at)
+        self.assertEqual('P1', res.profile_id)
+        self.assertEqual({'region_name': 'R1'}, res.placement)
+        self.assertIsNone(res.lb_member)
@@ -625,7 +625,7 @@ class TestAffinityPolicy(base.SenlinTestCase):
             'number': 4
         }
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock()]
         x_action.entity = x_cluster
         mock_parse = self.patchobject(scaleutils, 'parse_resize_params',
                                       side_effect=fake_parse_func)
@@ -686,7 +686,7 @@ class TestAffinityPolicy(base.SenlinTestCase):
             'number': 10
         }
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock()]
         x_action.entity = x_cluster
         mock_parse = self.patchobject(scaleutils, 'parse_resize_params',
                                       side_effect=fake_parse_func)
@@ -41,6 +41,8 @@ class TestBatchPolicy(base.SenlinTestCase):
         self.assertEqual(1, policy.min_in_service)
         self.assertEqual(2, policy.max_batch_size)
         self.assertEqual(60, policy.pause_time)
+        self.assertFalse(policy.rolling)
+        self.assertEqual(0, policy.max_failures)
 
     def test__get_batch_size(self):
         policy = bp.BatchPolicy('test-batch', self.spec)
@@ -132,6 +134,29 @@ class TestBatchPolicy(base.SenlinTestCase):
         mock_cal.assert_called_once_with(3)
         mock_pick.assert_called_once_with([node1, node2, node3], 2, 2)
 
+    def test__create_plan_for_rolling_update(self):
+        action = mock.Mock(context=self.context, action='CLUSTER_UPDATE')
+        node1 = mock.Mock(id='1', status='ACTIVE')
+        node2 = mock.Mock(id='2', status='ERROR')
+        node3 = mock.Mock(id='3', status='ACTIVE')
+        action.entity = mock.Mock(id='cid', nodes=[node1, node2, node3])
+        spec = copy.deepcopy(self.spec)
+        spec['properties']['rolling'] = True
+        spec['properties']['max_failures'] = 1
+        policy = bp.BatchPolicy('test-batch', spec)
+
+        res, plan = policy._create_plan(action)
+
+        self.assertTrue(res)
+        self.assertEqual(2, len(plan['plan']))
+        expected = {
+            'width': 2,
+            'min_in_service': 1,
+            'max_failures': 1,
+            'nodes': ['2', '1', '3'],
+        }
+        self.assertEqual(expected, plan['rolling'])
+
     def test__create_plan_for_update_no_node(self):
         action = mock.Mock(context=self.context, action='CLUSTER_UPDATE')
         cluster = mock.Mock(id='cid')
@@ -15,6 +15,7 @@ import mock
 
 from senlin.common import consts
 from senlin.common import scaleutils as su
+from senlin.objects import profile as po
 from senlin.policies import deletion_policy as dp
 from senlin.tests.unit.common import base
 from senlin.tests.unit.common import utils
@@ -89,8 +90,8 @@ class TestDeletionPolicy(base.SenlinTestCase):
         res = policy._victims_by_regions(cluster, {'R1': 1, 'R2': 2})
         self.assertEqual(['1', '2', '3'], res)
         mock_select.assert_has_calls([
-            mock.call([node1], 1),
-            mock.call([node2, node3], 2)
+            mock.call([node1], 1, None),
+            mock.call([node2, node3], 2, None)
         ])
         cluster.nodes_by_region.assert_has_calls([
             mock.call('R1'), mock.call('R2')])
@@ -187,8 +188,8 @@ class TestDeletionPolicy(base.SenlinTestCase):
         self.assertEqual(['1', '2'], res)
         mock_select.assert_has_calls(
             [
-                mock.call([node1], 1),
-                mock.call([node2, node3], 1)
+                mock.call([node1], 1, None),
+                mock.call([node2, node3], 1, None)
             ],
         )
         cluster.nodes_by_zone.assert_has_calls(
@@ -325,7 +326,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
     def test_pre_op_with_count_decisions(self, mock_select, mock_update):
         action = mock.Mock(context=self.context, inputs={},
                            data={'deletion': {'count': 2}})
-        cluster = mock.Mock(nodes=['a', 'b', 'c'])
+        cluster = mock.Mock(node_summaries=['a', 'b', 'c'])
         action.entity = cluster
         mock_select.return_value = ['NODE1', 'NODE2']
         policy = dp.DeletionPolicy('test-policy', self.spec)
@@ -333,7 +334,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
         policy.pre_op('FAKE_ID', action)
 
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
-        mock_select.assert_called_once_with(cluster.nodes, 2, True)
+        mock_select.assert_called_once_with(cluster.node_summaries, 2, True)
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
     @mock.patch.object(dp.DeletionPolicy, '_victims_by_regions')
@@ -356,7 +357,8 @@ class TestDeletionPolicy(base.SenlinTestCase):
         policy.pre_op('FAKE_ID', action)
 
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
-        mock_select.assert_called_once_with(cluster, {'R1': 1, 'R2': 1})
+        mock_select.assert_called_once_with(cluster, {'R1': 1, 'R2': 1},
+                                            profile_ages=None)
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
     @mock.patch.object(dp.DeletionPolicy, '_victims_by_zones')
@@ -379,14 +381,15 @@ class TestDeletionPolicy(base.SenlinTestCase):
         policy.pre_op('FAKE_ID', action)
 
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
-        mock_select.assert_called_once_with(cluster, {'AZ1': 1, 'AZ2': 1})
+        mock_select.assert_called_once_with(cluster, {'AZ1': 1, 'AZ2': 1},
+                                            profile_ages=None)
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
     @mock.patch.object(su, 'nodes_by_age')
     def test_pre_op_scale_in_with_count(self, mock_select, mock_update):
         action = mock.Mock(context=self.context, data={}, inputs={'count': 2},
                            action=consts.CLUSTER_SCALE_IN)
-        cluster = mock.Mock(nodes=[mock.Mock()])
+        cluster = mock.Mock(node_summaries=[mock.Mock()])
         action.entity = cluster
         mock_select.return_value = ['NODE_ID']
         policy = dp.DeletionPolicy('test-policy', self.spec)
@@ -396,14 +399,14 @@ class TestDeletionPolicy(base.SenlinTestCase):
         mock_update.assert_called_once_with(action, ['NODE_ID'])
         # the following was invoked with 1 because the input count is
         # greater than the cluster size
-        mock_select.assert_called_once_with(cluster.nodes, 1, True)
+        mock_select.assert_called_once_with(cluster.node_summaries, 1, True)
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
     @mock.patch.object(su, 'nodes_by_age')
     def test_pre_op_scale_in_without_count(self, mock_select, mock_update):
         action = mock.Mock(context=self.context, data={}, inputs={},
                            action=consts.CLUSTER_SCALE_IN)
-        cluster = mock.Mock(nodes=[mock.Mock()])
+        cluster = mock.Mock(node_summaries=[mock.Mock()])
         action.entity = cluster
         mock_select.return_value = ['NODE_ID']
         policy = dp.DeletionPolicy('test-policy', self.spec)
@@ -413,14 +416,14 @@ class TestDeletionPolicy(base.SenlinTestCase):
         mock_update.assert_called_once_with(action, ['NODE_ID'])
         # the following was invoked with 1 because the input count is
         # not specified so 1 becomes the default
-        mock_select.assert_called_once_with(cluster.nodes, 1, True)
+        mock_select.assert_called_once_with(cluster.node_summaries, 1, True)
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
     @mock.patch.object(su, 'parse_resize_params')
     def test_pre_op_resize_failed_parse(self, mock_parse, mock_update):
         action = mock.Mock(context=self.context, inputs={}, data={},
                            action=consts.CLUSTER_RESIZE)
-        cluster = mock.Mock(nodes=[mock.Mock(), mock.Mock()])
+        cluster = mock.Mock(node_summaries=[mock.Mock(), mock.Mock()])
         action.entity = cluster
         mock_parse.return_value = 'ERROR', 'Failed parsing.'
         policy = dp.DeletionPolicy('test-policy', self.spec)
@@ -441,7 +444,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
 
         action = mock.Mock(context=self.context, inputs={},
                            action=consts.CLUSTER_RESIZE)
-        cluster = mock.Mock(nodes=[mock.Mock(), mock.Mock()])
+        cluster = mock.Mock(node_summaries=[mock.Mock(), mock.Mock()])
         action.entity = cluster
         mock_parse.side_effect = fake_parse
         policy = dp.DeletionPolicy('test-policy', self.spec)
@@ -468,7 +471,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
 
         action = mock.Mock(context=self.context, inputs={}, data={},
                            action=consts.CLUSTER_RESIZE)
-        cluster = mock.Mock(nodes=[mock.Mock(), mock.Mock()])
+        cluster = mock.Mock(node_summaries=[mock.Mock(), mock.Mock()])
         action.entity = cluster
         mock_parse.side_effect = fake_parse
         mock_select.return_value = ['NID']
@@ -484,7 +487,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
     def test_pre_op_do_random(self, mock_select, mock_update):
         action = mock.Mock(context=self.context, inputs={},
                            data={'deletion': {'count': 2}})
-        cluster = mock.Mock(nodes=['a', 'b', 'c'])
+        cluster = mock.Mock(node_summaries=['a', 'b', 'c'])
         action.entity = cluster
         mock_select.return_value = ['NODE1', 'NODE2']
         spec = copy.deepcopy(self.spec)
@@ -493,16 +496,21 @@ class TestDeletionPolicy(base.SenlinTestCase):
 
         policy.pre_op('FAKE_ID', action)
 
-        mock_select.assert_called_once_with(cluster.nodes, 2)
+        mock_select.assert_called_once_with(cluster.node_summaries, 2)
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
+    @mock.patch.object(po.Profile, 'created_at_by_ids')
     @mock.patch.object(su, 'nodes_by_profile_age')
-    def test_pre_op_do_oldest_profile(self, mock_select, mock_update):
+    def test_pre_op_do_oldest_profile(self, mock_select, mock_ages,
+                                      mock_update):
         action = mock.Mock(context=self.context, inputs={},
                            data={'deletion': {'count': 2}})
         mock_select.return_value = ['NODE1', 'NODE2']
-        cluster = mock.Mock(nodes=['a', 'b', 'c'])
+        mock_ages.return_value = {'P1': 1, 'P2': 2}
+        nodes = [mock.Mock(profile_id='P1'), mock.Mock(profile_id='P2'),
+                 mock.Mock(profile_id='P1')]
+        cluster = mock.Mock(node_summaries=nodes)
         action.entity = cluster
         spec = copy.deepcopy(self.spec)
         spec['properties']['criteria'] = 'OLDEST_PROFILE_FIRST'
@@ -510,7 +518,8 @@ class TestDeletionPolicy(base.SenlinTestCase):
 
         policy.pre_op('FAKE_ID', action)
 
-        mock_select.assert_called_once_with(cluster.nodes, 2)
+        mock_ages.assert_called_once_with(self.context, {'P1', 'P2'})
+        mock_select.assert_called_once_with(nodes, 2, {'P1': 1, 'P2': 2})
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
@@ -518,7 +527,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
     def test_pre_op_do_oldest_first(self, mock_select, mock_update):
         action = mock.Mock(context=self.context, inputs={},
                            data={'deletion': {'count': 2}})
-        cluster = mock.Mock(nodes=['a', 'b', 'c'])
+        cluster = mock.Mock(node_summaries=['a', 'b', 'c'])
         action.entity = cluster
         mock_select.return_value = ['NODE1', 'NODE2']
         spec = copy.deepcopy(self.spec)
@@ -527,7 +536,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
 
         policy.pre_op('FAKE_ID', action)
 
-        mock_select.assert_called_once_with(cluster.nodes, 2, True)
+        mock_select.assert_called_once_with(cluster.node_summaries, 2, True)
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
 
     @mock.patch.object(dp.DeletionPolicy, '_update_action')
@@ -535,7 +544,7 @@ class TestDeletionPolicy(base.SenlinTestCase):
     def test_pre_op_do_youngest_first(self, mock_select, mock_update):
         action = mock.Mock(context=self.context, inputs={},
                            data={'deletion': {'count': 2}})
-        cluster = mock.Mock(nodes=['a', 'b', 'c'])
+        cluster = mock.Mock(node_summaries=['a', 'b', 'c'])
         action.entity = cluster
         mock_select.return_value = ['NODE1', 'NODE2']
         spec = copy.deepcopy(self.spec)
@@ -544,5 +553,5 @@ class TestDeletionPolicy(base.SenlinTestCase):
 
         policy.pre_op('FAKE_ID', action)
 
-        mock_select.assert_called_once_with(cluster.nodes, 2, False)
+        mock_select.assert_called_once_with(cluster.node_summaries, 2, False)
         mock_update.assert_called_once_with(action, ['NODE1', 'NODE2'])
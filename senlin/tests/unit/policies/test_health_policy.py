@@ -206,7 +206,7 @@ class TestHealthPolicy(base.SenlinTestCase):
             return pb.CHECK_OK, 'good'
 
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock(), mock.Mock()]
         action = mock.Mock(context='action_context', data={},
                            action=consts.CLUSTER_RESIZE)
         action.entity = x_cluster
@@ -222,7 +222,7 @@ class TestHealthPolicy(base.SenlinTestCase):
     @mock.patch.object(health_manager, 'disable')
     def test_pre_op_resize_parse_error(self, mock_disable, mock_parse):
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock()]
         action = mock.Mock(context='action_context', data={},
                            action=consts.CLUSTER_RESIZE)
         action.entity = x_cluster
@@ -278,7 +278,7 @@ class TestHealthPolicy(base.SenlinTestCase):
             return pb.CHECK_OK, 'good'
 
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock()]
         action = mock.Mock(context='action_context', data={},
                            action=consts.CLUSTER_RESIZE)
         action.entity = x_cluster
@@ -294,7 +294,7 @@ class TestHealthPolicy(base.SenlinTestCase):
     @mock.patch.object(health_manager, 'enable')
     def test_post_op_resize_parse_error(self, mock_enable, mock_parse):
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock()]
         action = mock.Mock(context='action_context', data={},
                            action=consts.CLUSTER_RESIZE)
         action.entity = x_cluster
@@ -229,7 +229,7 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
 
     @mock.patch.object(lb_policy.LoadBalancingPolicy, '_build_policy_data')
     @mock.patch.object(policy_base.Policy, 'attach')
-    @mock.patch.object(no.Node, 'update')
+    @mock.patch.object(no.Node, 'update_many')
     def test_attach_succeeded(self, m_update, m_attach, m_build):
         cluster = mock.Mock(id='CLUSTER_ID', data={})
         node1 = mock.Mock(id='fake1', data={})
@@ -243,7 +243,8 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
             'pool': 'POOL_ID'
         }
         self.lb_driver.lb_create.return_value = (True, data)
-        self.lb_driver.member_add.side_effect = ['MEMBER1_ID', 'MEMBER2_ID']
+        self.lb_driver.members_add.return_value = {
+            'fake1': 'MEMBER1_ID', 'fake2': 'MEMBER2_ID'}
 
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy.id = 'FAKE_ID'
@@ -256,18 +257,12 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
         self.lb_driver.lb_create.assert_called_once_with(policy.vip_spec,
                                                          policy.pool_spec,
                                                          policy.hm_spec)
-        member_add_calls = [
-            mock.call(node1, 'LB_ID', 'POOL_ID', 80, 'internal-subnet'),
-            mock.call(node2, 'LB_ID', 'POOL_ID', 80, 'internal-subnet')
-        ]
-        self.lb_driver.member_add.assert_has_calls(member_add_calls)
-        node_update_calls = [
-            mock.call(mock.ANY, node1.id,
-                      {'data': {'lb_member': 'MEMBER1_ID'}}),
-            mock.call(mock.ANY, node2.id,
-                      {'data': {'lb_member': 'MEMBER2_ID'}})
-        ]
-        m_update.assert_has_calls(node_update_calls)
+        self.lb_driver.members_add.assert_called_once_with(
+            [node1, node2], 'LB_ID', 'POOL_ID', 80, 'internal-subnet')
+        m_update.assert_called_once_with(mock.ANY, {
+            'fake1': {'data': {'lb_member': 'MEMBER1_ID'}},
+            'fake2': {'data': {'lb_member': 'MEMBER2_ID'}},
+        })
         expected = {
             policy.id: {'vip_address': '192.168.1.100'}
         }
@@ -309,9 +304,10 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
         }
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy._lbaasclient = self.lb_driver
-        # lb_driver.member_add return None
+        # lb_driver.members_add failed for one node
         self.lb_driver.lb_create.return_value = (True, lb_data)
-        self.lb_driver.member_add.return_value = None
+        self.lb_driver.members_add.return_value = {'fake1': 'MEMBER1_ID',
+                                                   'fake2': None}
 
         res = policy.attach(cluster)
 
@@ -378,7 +374,7 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
         node2 = mock.Mock(id='node2')
         node3 = mock.Mock(id='node3')
         cluster = mock.Mock()
-        cluster.nodes = [node1, node2, node3]
+        cluster.node_summaries = [node1, node2, node3]
         action = mock.Mock(action=consts.CLUSTER_SCALE_IN, data={})
         action.entity = cluster
 
@@ -403,7 +399,7 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
         node2 = mock.Mock(id='node2')
         node3 = mock.Mock(id='node3')
         cluster = mock.Mock(id='cluster1')
-        cluster.nodes = [node1, node2, node3]
+        cluster.node_summaries = [node1, node2, node3]
         action = mock.Mock(action=consts.CLUSTER_RESIZE, data={})
         action.entity = cluster
 
@@ -426,7 +422,7 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
         node2 = mock.Mock(id='node2')
         node3 = mock.Mock(id='node3')
         cluster = mock.Mock(id='cluster1')
-        cluster.nodes = [node1, node2, node3]
+        cluster.node_summaries = [node1, node2, node3]
         action = mock.Mock(action=consts.CLUSTER_RESIZE, data={})
         action.entity = cluster
         action.data = {'deletion': {'count': 1}}
@@ -459,7 +455,7 @@ class TestLoadBalancingPolicy(base.SenlinTestCase):
         node2 = mock.Mock(id='node2')
         node3 = mock.Mock(id='node3')
         cluster = mock.Mock(id='cluster1')
-        cluster.nodes = [node1, node2, node3]
+        cluster.node_summaries = [node1, node2, node3]
         action = mock.Mock(action=consts.CLUSTER_RESIZE, data={})
         action.entity = cluster
         action.data = {'deletion': {'count': 4}}
@@ -695,8 +691,8 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
 
         self.assertIsNone(res)
 
-    @mock.patch.object(no.Node, 'get')
-    @mock.patch.object(no.Node, 'update')
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'update_many')
     def test__add_member(self, m_node_update, m_node_get,
                          m_extract, m_load):
         node1 = mock.Mock(id='NODE1_ID', data={})
@@ -722,8 +718,9 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
             }
         }
         cp.data = cp_data
-        self.lb_driver.member_add.side_effect = ['MEMBER1_ID', 'MEMBER2_ID']
-        m_node_get.side_effect = [node1, node2]
+        self.lb_driver.members_add.return_value = {
+            'NODE1_ID': 'MEMBER1_ID', 'NODE2_ID': None}
+        m_node_get.return_value = [node1, node2]
         m_extract.return_value = policy_data
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy._lbaasclient = self.lb_driver
@@ -734,26 +731,23 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
                                  cp, self.lb_driver)
 
         # assertions
-        self.assertEqual([], res)
+        self.assertEqual(['NODE2_ID'], res)
         m_extract.assert_called_once_with(cp_data)
-        calls_node_get = [
-            mock.call('action_context', node_id='NODE1_ID'),
-            mock.call('action_context', node_id='NODE2_ID')
-        ]
-        m_node_get.assert_has_calls(calls_node_get)
-        calls_node_update = [
-            mock.call(action.context, 'NODE1_ID', mock.ANY),
-            mock.call(action.context, 'NODE2_ID', mock.ANY)
-        ]
-        m_node_update.assert_has_calls(calls_node_update)
-        calls_member_add = [
-            mock.call(node1, 'LB_ID', 'POOL_ID', 80, 'test-subnet'),
-            mock.call(node2, 'LB_ID', 'POOL_ID', 80, 'test-subnet'),
-        ]
-        self.lb_driver.member_add.assert_has_calls(calls_member_add)
-
-    @mock.patch.object(no.Node, 'get')
-    @mock.patch.object(no.Node, 'update')
+        m_node_get.assert_called_once_with(
+            'action_context', filters={'id': ['NODE1_ID', 'NODE2_ID']})
+        self.lb_driver.members_add.assert_called_once_with(
+            [node1, node2], 'LB_ID', 'POOL_ID', 80, 'test-subnet')
+        self.assertEqual(0, self.lb_driver.member_add.call_count)
+        m_node_update.assert_called_once_with('action_context', {
+            'NODE1_ID': {'data': {'lb_member': 'MEMBER1_ID'}},
+            'NODE2_ID': {
+                'status': consts.NS_WARNING,
+                'status_reason': 'Failed in adding node into lb pool.',
+            },
+        })
+
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'update_many')
     def test__add_member_fail(self, m_node_update, m_node_get,
                               m_extract, m_load):
         node1 = mock.Mock(id='NODE1_ID', data={})
@@ -779,7 +773,7 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
         }
         cp.data = cp_data
         self.lb_driver.member_add.return_value = None
-        m_node_get.return_value = node1
+        m_node_get.return_value = [node1]
         m_extract.return_value = policy_data
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy._lbaasclient = self.lb_driver
@@ -793,11 +787,12 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
         self.assertEqual(['NODE1_ID'], res)
         m_extract.assert_called_once_with(cp_data)
         m_node_get.assert_called_once_with(
-            'action_context', node_id='NODE1_ID')
+            'action_context', filters={'id': ['NODE1_ID']})
         m_node_update.assert_called_once_with(
-            'action_context', 'NODE1_ID', mock.ANY)
+            'action_context', {'NODE1_ID': mock.ANY})
         self.lb_driver.member_add.assert_called_once_with(
             node1, 'LB_ID', 'POOL_ID', 80, 'test-subnet')
+        self.assertEqual(0, self.lb_driver.members_add.call_count)
 
     @mock.patch.object(lb_policy.LoadBalancingPolicy, '_add_member')
     @mock.patch.object(lb_policy.LoadBalancingPolicy, '_remove_member')
@@ -919,8 +914,8 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
                                       cp, self.lb_driver)
         self.assertFalse(m_remove.called)
 
-    @mock.patch.object(no.Node, 'get')
-    @mock.patch.object(no.Node, 'update')
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'update_many')
     def test__remove_member(self, m_node_update, m_node_get,
                             m_extract, m_load):
         node1 = mock.Mock(id='NODE1', data={'lb_member': 'MEM_ID1'})
@@ -946,8 +941,9 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
             }
         }
         cp.data = cp_data
-        self.lb_driver.member_remove.return_value = True
-        m_node_get.side_effect = [node1, node2]
+        self.lb_driver.members_remove.return_value = {
+            'MEM_ID1': True, 'MEM_ID2': True}
+        m_node_get.return_value = [node1, node2]
         m_extract.return_value = policy_data
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy._lbaasclient = self.lb_driver
@@ -957,25 +953,19 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
                                     cp, self.lb_driver)
 
         m_extract.assert_called_once_with(cp_data)
-        calls_node_get = [
-            mock.call(action.context, node_id='NODE1'),
-            mock.call(action.context, node_id='NODE2')
-        ]
-        m_node_get.assert_has_calls(calls_node_get)
-        calls_node_update = [
-            mock.call(action.context, 'NODE1', mock.ANY),
-            mock.call(action.context, 'NODE2', mock.ANY)
-        ]
-        m_node_update.assert_has_calls(calls_node_update)
-        calls_member_del = [
-            mock.call('LB_ID', 'POOL_ID', 'MEM_ID1'),
-            mock.call('LB_ID', 'POOL_ID', 'MEM_ID2')
-        ]
-        self.lb_driver.member_remove.assert_has_calls(calls_member_del)
+        m_node_get.assert_called_once_with(
+            action.context, filters={'id': ['NODE1', 'NODE2']})
+        m_node_update.assert_called_once_with(action.context, {
+            'NODE1': {'data': {}},
+            'NODE2': {'data': {}},
+        })
+        self.lb_driver.members_remove.assert_called_once_with(
+            'LB_ID', 'POOL_ID', ['MEM_ID1', 'MEM_ID2'])
+        self.assertEqual(0, self.lb_driver.member_remove.call_count)
         self.assertEqual([], res)
 
-    @mock.patch.object(no.Node, 'get')
-    @mock.patch.object(no.Node, 'update')
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'update_many')
     def test__remove_member_not_in_pool(self, m_node_update, m_node_get,
                                         m_extract, m_load):
         node1 = mock.Mock(id='NODE1', data={'lb_member': 'MEM_ID1'})
@@ -1002,7 +992,7 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
         }
         cp.data = cp_data
         self.lb_driver.member_remove.return_value = True
-        m_node_get.side_effect = [node1, node2]
+        m_node_get.return_value = [node1, node2]
         m_extract.return_value = policy_data
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy._lbaasclient = self.lb_driver
@@ -1012,19 +1002,16 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
                                     cp, self.lb_driver)
 
         m_extract.assert_called_once_with(cp_data)
-        calls_node_get = [
-            mock.call(action.context, node_id='NODE1'),
-            mock.call(action.context, node_id='NODE2')
-        ]
-        m_node_get.assert_has_calls(calls_node_get)
+        m_node_get.assert_called_once_with(
+            action.context, filters={'id': ['NODE1', 'NODE2']})
         m_node_update.assert_called_once_with(
-            action.context, 'NODE1', mock.ANY)
+            action.context, {'NODE1': {'data': {}}})
         self.lb_driver.member_remove.assert_called_once_with(
             'LB_ID', 'POOL_ID', 'MEM_ID1')
         self.assertEqual([], res)
 
-    @mock.patch.object(no.Node, 'get')
-    @mock.patch.object(no.Node, 'update')
+    @mock.patch.object(no.Node, 'get_all')
+    @mock.patch.object(no.Node, 'update_many')
     def test__remove_member_fail(self, m_node_update, m_node_get,
                                  m_extract, m_load):
         node1 = mock.Mock(id='NODE1', data={'lb_member': 'MEM_ID1'})
@@ -1050,7 +1037,7 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
         }
         cp.data = cp_data
         self.lb_driver.member_remove.return_value = False
-        m_node_get.return_value = node1
+        m_node_get.return_value = [node1]
         m_extract.return_value = policy_data
         policy = lb_policy.LoadBalancingPolicy('test-policy', self.spec)
         policy._lbaasclient = self.lb_driver
@@ -1060,9 +1047,14 @@ class TestLoadBalancingPolicyOperations(base.SenlinTestCase):
                                     cp, self.lb_driver)
 
         m_extract.assert_called_once_with(cp_data)
-        m_node_get.assert_called_once_with(action.context, node_id='NODE1')
-        m_node_update.assert_called_once_with(
-            action.context, 'NODE1', mock.ANY)
+        m_node_get.assert_called_once_with(
+            action.context, filters={'id': ['NODE1']})
+        m_node_update.assert_called_once_with(action.context, {
+            'NODE1': {
+                'status': consts.NS_WARNING,
+                'status_reason': 'Failed in removing node from lb pool.',
+            }
+        })
         self.lb_driver.member_remove.assert_called_once_with(
             'LB_ID', 'POOL_ID', 'MEM_ID1')
         self.assertEqual(['NODE1'], res)
@@ -175,7 +175,7 @@ class TestRegionPlacementPolicy(base.SenlinTestCase):
     @mock.patch.object(su, 'parse_resize_params')
     def test__get_count_resize_parse_error(self, mock_parse):
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock()]
         action = mock.Mock(action=consts.CLUSTER_RESIZE, data={})
         action.entity = x_cluster
         mock_parse.return_value = (pb.CHECK_ERROR, 'Something wrong.')
@@ -195,7 +195,7 @@ class TestRegionPlacementPolicy(base.SenlinTestCase):
             return pb.CHECK_OK, ''
 
         x_cluster = mock.Mock()
-        x_cluster.nodes = []
+        x_cluster.node_summaries = []
         action = mock.Mock(action=consts.CLUSTER_RESIZE, data={})
         action.entity = x_cluster
 
@@ -214,7 +214,7 @@ class TestRegionPlacementPolicy(base.SenlinTestCase):
             return pb.CHECK_OK, ''
 
         x_cluster = mock.Mock()
-        x_cluster.nodes = [mock.Mock(), mock.Mock(), mock.Mock()]
+        x_cluster.node_summaries = [mock.Mock(), mock.Mock(), mock.Mock()]
         action = mock.Mock(action=consts.CLUSTER_RESIZE, data={})
         action.entity = x_cluster
 
@@ -177,7 +177,7 @@ class TestScalingPolicy(base.SenlinTestCase):
 
     def test_pre_op_pass_without_input(self):
         nodes = self._create_nodes(3)
-        self.cluster.nodes = nodes
+        self.cluster.node_summaries = nodes
 
         action = mock.Mock()
         action.context = self.context
@@ -203,7 +203,7 @@ class TestScalingPolicy(base.SenlinTestCase):
 
     def test_pre_op_pass_with_input(self):
         nodes = self._create_nodes(3)
-        self.cluster.nodes = nodes
+        self.cluster.node_summaries = nodes
 
         action = mock.Mock()
         action.context = self.context
@@ -242,7 +242,7 @@ class TestScalingPolicy(base.SenlinTestCase):
     @mock.patch.object(sp.ScalingPolicy, '_calculate_adjustment_count')
     def test_pre_op_pass_check_effort(self, mock_adjustmentcount):
         # Cluster with maxsize and best_effort is False
-        self.cluster.nodes = [mock.Mock(), mock.Mock()]
+        self.cluster.node_summaries = [mock.Mock(), mock.Mock()]
         action = mock.Mock()
         action.context = self.context
         action.action = consts.CLUSTER_SCALE_OUT
@@ -266,7 +266,7 @@ class TestScalingPolicy(base.SenlinTestCase):
 
     def test_pre_op_fail_negative_count(self):
         nodes = self._create_nodes(3)
-        self.cluster.nodes = nodes
+        self.cluster.node_summaries = nodes
 
         action = mock.Mock()
         action.context = self.context
@@ -290,7 +290,7 @@ class TestScalingPolicy(base.SenlinTestCase):
 
     def test_pre_op_fail_below_min_size(self):
         nodes = self._create_nodes(3)
-        self.cluster.nodes = nodes
+        self.cluster.node_summaries = nodes
 
         action = mock.Mock()
         action.action = consts.CLUSTER_SCALE_IN
@@ -315,7 +315,7 @@ class TestScalingPolicy(base.SenlinTestCase):
 
     def test_pre_op_pass_best_effort(self):
         nodes = self._create_nodes(3)
-        self.cluster.nodes = nodes
+        self.cluster.node_summaries = nodes
 
         action = mock.Mock()
         action.context = self.context
@@ -344,7 +344,7 @@ class TestScalingPolicy(base.SenlinTestCase):
     def test_pre_op_with_bad_nodes(self):
         nodes = self._create_nodes(3)
         no.Node.update(self.context, nodes[0].id, {'status': 'ERROR'})
-        self.cluster.nodes = nodes
+        self.cluster.node_summaries = nodes
 
         action = mock.Mock()
         action.context = self.context
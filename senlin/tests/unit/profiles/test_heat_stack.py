@@ -13,6 +13,7 @@
 import copy
 
 import mock
+from oslo_config import cfg
 import six
 
 from senlin.common import exception as exc
@@ -616,6 +617,39 @@ class TestHeatStackProfile(base.SenlinTestCase):
         oc.wait_for_stack.assert_called_once_with(
             'FAKE_ID', 'CHECK_COMPLETE', timeout=3600)
 
+    def test_do_check_status_mode(self):
+        cfg.CONF.set_override('stack_check_mode', 'status')
+        node_obj = mock.Mock(physical_id='FAKE_ID')
+        profile = stack.StackProfile('t', self.spec)
+        oc = mock.Mock()
+        profile._orchestrationclient = oc
+        oc.stack_status.side_effect = [
+            mock.Mock(status='UPDATE_COMPLETE'),
+            mock.Mock(status='CHECK_FAILED'),
+            mock.Mock(status='DELETE_IN_PROGRESS'),
+            None,
+        ]
+
+        self.assertTrue(profile.do_check(node_obj))
+        self.assertFalse(profile.do_check(node_obj))
+        self.assertFalse(profile.do_check(node_obj))
+        self.assertFalse(profile.do_check(node_obj))
+
+        oc.stack_status.assert_called_with('FAKE_ID')
+        self.assertEqual(0, oc.stack_check.call_count)
+        self.assertEqual(0, oc.wait_for_stack.call_count)
+
+    def test_do_check_status_mode_failed(self):
+        cfg.CONF.set_override('stack_check_mode', 'status')
+        node_obj = mock.Mock(physical_id='FAKE_ID')
+        profile = stack.StackProfile('t', self.spec)
+        oc = mock.Mock()
+        profile._orchestrationclient = oc
+        oc.stack_status.side_effect = exc.InternalError(code=408,
+                                                        message='BOOM')
+
+        self.assertRaises(exc.EResourceOperation, profile.do_check, node_obj)
+
     def test_do_get_details(self):
         profile = stack.StackProfile('t', self.spec)
         oc = mock.Mock()
@@ -13,6 +13,7 @@
 import base64
 
 import mock
+from oslo_config import cfg
 from oslo_utils import encodeutils
 import six
 
@@ -147,7 +148,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         node_obj.name = 'TEST_SERVER'
         fake_server = mock.Mock(id='FAKE_ID')
         cc.server_create.return_value = fake_server
-        cc.server_get.return_value = fake_server
+        cc.wait_for_server.return_value = fake_server
 
         # do it
         server_id = profile.do_create(node_obj)
@@ -187,7 +188,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         attrs['OS-DCF:diskConfig'] = 'AUTO'
 
         cc.server_create.assert_called_once_with(**attrs)
-        cc.server_get.assert_called_once_with('FAKE_ID')
+        cc.wait_for_server.assert_called_once_with('FAKE_ID')
         mock_zone_info.assert_called_once_with(node_obj, fake_server)
         self.assertEqual('FAKE_ID', server_id)
 
@@ -394,7 +395,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         mock_zone_info = self.patchobject(profile, '_update_zone_info')
         fake_server = mock.Mock(id='FAKE_ID')
         cc.server_create.return_value = fake_server
-        cc.server_get.return_value = fake_server
+        cc.wait_for_server.return_value = fake_server
 
         # do it
         server_id = profile.do_create(node_obj)
@@ -413,7 +414,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         }
 
         cc.server_create.assert_called_once_with(**attrs)
-        cc.server_get.assert_called_once_with('FAKE_ID')
+        cc.wait_for_server.assert_called_once_with('FAKE_ID')
         mock_zone_info.assert_called_once_with(node_obj, fake_server)
         self.assertEqual('FAKE_ID', server_id)
 
@@ -440,7 +441,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         node_obj.name = None
         fake_server = mock.Mock(id='FAKE_ID')
         cc.server_create.return_value = fake_server
-        cc.server_get.return_value = fake_server
+        cc.wait_for_server.return_value = fake_server
 
         server_id = profile.do_create(node_obj)
 
@@ -453,7 +454,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         }
 
         cc.server_create.assert_called_once_with(**attrs)
-        cc.server_get.assert_called_once_with('FAKE_ID')
+        cc.wait_for_server.assert_called_once_with('FAKE_ID')
         mock_zone_info.assert_called_once_with(node_obj, fake_server)
         self.assertEqual('FAKE_ID', server_id)
 
@@ -479,7 +480,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         node_obj.name = 'TEST-SERVER'
         fake_server = mock.Mock(id='FAKE_ID')
         cc.server_create.return_value = fake_server
-        cc.server_get.return_value = fake_server
+        cc.wait_for_server.return_value = fake_server
 
         # do it
         server_id = profile.do_create(node_obj)
@@ -494,7 +495,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         }
 
         cc.server_create.assert_called_once_with(**attrs)
-        cc.server_get.assert_called_once_with('FAKE_ID')
+        cc.wait_for_server.assert_called_once_with('FAKE_ID')
         mock_zone_info.assert_called_once_with(node_obj, fake_server)
         self.assertEqual('FAKE_ID', server_id)
 
@@ -535,7 +536,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         node_obj.name = None
         fake_server = mock.Mock(id='FAKE_ID')
         cc.server_create.return_value = fake_server
-        cc.server_get.return_value = fake_server
+        cc.wait_for_server.return_value = fake_server
 
         # do it
         server_id = profile.do_create(node_obj)
@@ -564,7 +565,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
             'block_device_mapping_v2': bdm_v2
         }
         cc.server_create.assert_called_once_with(**attrs)
-        cc.server_get.assert_called_once_with('FAKE_ID')
+        cc.wait_for_server.assert_called_once_with('FAKE_ID')
         profile._validate_image.assert_called_once_with(
             node_obj, expected_volume['uuid'], 'create')
 
@@ -653,7 +654,7 @@ class TestNovaServerBasic(base.SenlinTestCase):
         cc = mock.Mock()
         profile._computeclient = cc
 
-        test_server = mock.Mock(physical_id=None)
+        test_server = mock.Mock(physical_id=None, data={})
 
         # do it
         res = profile.do_delete(test_server)
@@ -663,6 +664,26 @@ class TestNovaServerBasic(base.SenlinTestCase):
         self.assertFalse(cc.server_delete.called)
         self.assertFalse(cc.wait_for_server_delete.called)
 
+    @mock.patch.object(node_ob.Node, 'update')
+    def test_do_delete_no_physical_id_prepared_ports(self, mock_update):
+        profile = server.ServerProfile('t', self.spec)
+        nc = mock.Mock()
+        profile._networkclient = nc
+        test_server = mock.Mock(id='NODE_ID', physical_id=None, data={
+            'prepared_ports': [
+                None,
+                {'id': 'P1', 'remove': True,
+                 'floating': {'id': 'F1', 'remove': True}},
+            ]})
+
+        res = profile.do_delete(test_server)
+
+        self.assertTrue(res)
+        nc.floatingip_delete.assert_called_once_with('F1')
+        nc.port_delete.assert_called_once_with('P1')
+        mock_update.assert_called_once_with(mock.ANY, 'NODE_ID',
+                                            {'data': {}})
+
     @mock.patch.object(node_ob.Node, 'update')
     def test_do_delete_ports_ok(self, mock_node_obj):
         profile = server.ServerProfile('t', self.spec)
@@ -765,6 +786,289 @@ class TestNovaServerBasic(base.SenlinTestCase):
         cc.server_delete.assert_called_once_with('FAKE_ID', True)
         cc.wait_for_server_delete.assert_called_once_with('FAKE_ID')
 
+    def test_do_get_placements(self):
+        cfg.CONF.set_override('collect_concurrency', 1)
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+        obj1 = mock.Mock(id='N1', physical_id='S1')
+        obj2 = mock.Mock(id='N2', physical_id='S2')
+        obj3 = mock.Mock(id='N3', physical_id=None)
+        cc.server_list.return_value = [
+            mock.Mock(id='S1', availability_zone='AZ1'),
+            mock.Mock(id='S_OTHER', availability_zone='AZ2'),
+            mock.Mock(id='S2', availability_zone=None),
+        ]
+
+        res = profile.do_get_placements([obj1, obj2, obj3])
+
+        self.assertEqual({'N1': {'zone': 'AZ1'}}, res)
+        cc.server_list.assert_called_once_with(details=True)
+        self.assertEqual(0, cc.server_get.call_count)
+
+    def test_do_get_placements_few_nodes(self):
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+        obj1 = mock.Mock(id='N1', physical_id='S1')
+        obj2 = mock.Mock(id='N2', physical_id='S2')
+        cc.server_get.side_effect = [
+            mock.Mock(id='S1', availability_zone='AZ1'),
+            exc.InternalError(code=404, message='Boom'),
+        ]
+
+        res = profile.do_get_placements([obj1, obj2])
+
+        self.assertEqual({'N1': {'zone': 'AZ1'}}, res)
+        cc.server_get.assert_has_calls([mock.call('S1'), mock.call('S2')])
+        self.assertEqual(0, cc.server_list.call_count)
+
+    def test_get_servers_stops_listing(self):
+        cfg.CONF.set_override('collect_concurrency', 1)
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+        s1 = mock.Mock(id='S1')
+        s2 = mock.Mock(id='S2')
+        listed = []
+
+        def server_list(details=True):
+            for s in (s1, s2, mock.Mock(id='S_OTHER')):
+                listed.append(s.id)
+                yield s
+
+        cc.server_list.side_effect = server_list
+        objs = [mock.Mock(id='N1', physical_id='S1'),
+                mock.Mock(id='N2', physical_id='S2')]
+
+        res = profile._get_servers(objs)
+
+        self.assertEqual({'N1': s1, 'N2': s2}, res)
+        self.assertEqual(['S1', 'S2'], listed)
+
+    def test_do_get_placements_no_server(self):
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+
+        res = profile.do_get_placements([mock.Mock(physical_id='')])
+
+        self.assertEqual({}, res)
+        self.assertEqual(0, cc.server_list.call_count)
+
+    def test_do_get_details_many(self):
+        cfg.CONF.set_override('collect_concurrency', 1)
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+        obj1 = mock.Mock(id='N1', physical_id='S1')
+        obj2 = mock.Mock(id='N2', physical_id='S2')
+        obj3 = mock.Mock(id='N3', physical_id=None)
+        s1 = mock.Mock(id='S1')
+        other = mock.Mock(id='S_OTHER')
+        cc.server_list.return_value = [s1, other]
+        mock_details = self.patchobject(profile, '_server_details',
+                                        return_value={'name': 'S1'})
+
+        res = profile.do_get_details_many([obj1, obj2, obj3])
+
+        self.assertEqual({'N1': {'name': 'S1'}}, res)
+        cc.server_list.assert_called_once_with(details=True)
+        mock_details.assert_called_once_with(s1)
+        self.assertEqual(0, cc.server_get.call_count)
+
+    def test_do_get_details_many_few_nodes(self):
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+        s1 = mock.Mock(id='S1')
+        cc.server_get.return_value = s1
+        mock_details = self.patchobject(profile, '_server_details',
+                                        return_value={'name': 'S1'})
+
+        res = profile.do_get_details_many(
+            [mock.Mock(id='N1', physical_id='S1')])
+
+        self.assertEqual({'N1': {'name': 'S1'}}, res)
+        cc.server_get.assert_called_once_with('S1')
+        self.assertEqual(0, cc.server_list.call_count)
+        mock_details.assert_called_once_with(s1)
+
+    def test_do_get_details_many_list_failed(self):
+        cfg.CONF.set_override('collect_concurrency', 1)
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+        cc.server_list.side_effect = exc.InternalError(message='Boom')
+
+        res = profile.do_get_details_many(
+            [mock.Mock(physical_id='S1'), mock.Mock(physical_id='S2')])
+
+        self.assertEqual({}, res)
+
+    def test_do_get_details_many_no_server(self):
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._computeclient = cc
+
+        res = profile.do_get_details_many([mock.Mock(physical_id='')])
+
+        self.assertEqual({}, res)
+        self.assertEqual(0, cc.server_list.call_count)
+
+    @mock.patch.object(node_ob.Node, 'update_many')
+    def test_do_prepare(self, mock_update):
+        self.spec['properties']['networks'] = [
+            {'network': 'NET', 'security_groups': ['SG'],
+             'floating_network': 'PUBLIC'},
+            {'port': 'PORT'},
+        ]
+        nc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._networkclient = nc
+        mock_validate = self.patchobject(
+            profile, '_validate_network',
+            return_value={'network': 'NET_ID', 'security_groups': ['SG_ID'],
+                          'floating_network': 'PUBLIC_ID'})
+        nc.port_create_bulk.return_value = [
+            mock.Mock(id='P1', network_id='NET_ID', fixed_ips=['IP1'],
+                      security_group_ids=['SG_ID']),
+            mock.Mock(id='P2', network_id='NET_ID', fixed_ips=['IP2'],
+                      security_group_ids=['SG_ID']),
+        ]
+        nc.floatingip_create.side_effect = [
+            mock.Mock(id='F1', floating_ip_address='FIP1',
+                      floating_network_id='PUBLIC_ID'),
+            mock.Mock(id='F2', floating_ip_address='FIP2',
+                      floating_network_id='PUBLIC_ID'),
+        ]
+        obj1 = mock.Mock(id='N1', data={})
+        obj2 = mock.Mock(id='N2', data={'placement': {'zone': 'AZ1'}})
+
+        profile.do_prepare([obj1, obj2])
+
+        mock_validate.assert_called_once_with(
+            obj1, profile.properties['networks'][0], 'create')
+        nc.port_create_bulk.assert_called_once_with([
+            {'network_id': 'NET_ID', 'security_groups': ['SG_ID']},
+            {'network_id': 'NET_ID', 'security_groups': ['SG_ID']},
+        ])
+        nc.floatingip_create.assert_has_calls([
+            mock.call(port_id='P1', floating_network_id='PUBLIC_ID'),
+            mock.call(port_id='P2', floating_network_id='PUBLIC_ID'),
+        ])
+        port1 = {
+            'id': 'P1', 'network_id': 'NET_ID', 'fixed_ips': ['IP1'],
+            'security_group_ids': ['SG_ID'], 'remove': True,
+            'floating': {'id': 'F1', 'floating_ip_address': 'FIP1',
+                         'floating_network_id': 'PUBLIC_ID',
+                         'remove': True},
+        }
+        self.assertEqual([port1, None], obj1.data['prepared_ports'])
+        self.assertEqual({'zone': 'AZ1'}, obj2.data['placement'])
+        self.assertEqual('P2', obj2.data['prepared_ports'][0]['id'])
+        mock_update.assert_called_once_with(
+            profile.context, {'N1': {'data': obj1.data},
+                              'N2': {'data': obj2.data}})
+
+    @mock.patch.object(node_ob.Node, 'update_many')
+    def test_do_prepare_not_poolable(self, mock_update):
+        nc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._networkclient = nc
+        obj1 = mock.Mock(id='N1', data={})
+        obj2 = mock.Mock(id='N2', data={})
+
+        # the network in spec has a fixed IP
+        profile.do_prepare([obj1, obj2])
+
+        self.assertEqual(0, nc.port_create_bulk.call_count)
+        self.assertEqual(0, mock_update.call_count)
+        self.assertEqual({}, obj1.data)
+
+    @mock.patch.object(node_ob.Node, 'update_many')
+    def test_do_prepare_failed(self, mock_update):
+        self.spec['properties']['networks'] = [
+            {'network': 'NET1'}, {'network': 'NET2'}]
+        nc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._networkclient = nc
+        self.patchobject(profile, '_validate_network',
+                         side_effect=[{'network': 'NET1_ID'},
+                                      {'network': 'NET2_ID'}])
+        nc.port_create_bulk.side_effect = [
+            [mock.Mock(id='P1'), mock.Mock(id='P2')],
+            exc.InternalError(code=409, message='Quota exceeded'),
+        ]
+        obj1 = mock.Mock(id='N1', data={})
+        obj2 = mock.Mock(id='N2', data={})
+
+        profile.do_prepare([obj1, obj2])
+
+        nc.port_delete.assert_has_calls([mock.call('P1'), mock.call('P2')])
+        self.assertEqual(0, nc.floatingip_delete.call_count)
+        self.assertEqual(0, mock_update.call_count)
+        self.assertEqual({}, obj1.data)
+
+    @mock.patch.object(node_ob.Node, 'update_many')
+    def test_do_prepare_update_failed(self, mock_update):
+        self.spec['properties']['networks'] = [{'network': 'NET1'}]
+        nc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._networkclient = nc
+        self.patchobject(profile, '_validate_network',
+                         return_value={'network': 'NET1_ID'})
+        nc.port_create_bulk.return_value = [mock.Mock(id='P1'),
+                                            mock.Mock(id='P2')]
+        mock_update.side_effect = Exception('DB error')
+        obj1 = mock.Mock(id='N1', data={})
+        obj2 = mock.Mock(id='N2', data={})
+
+        profile.do_prepare([obj1, obj2])
+
+        nc.port_delete.assert_has_calls([mock.call('P1'), mock.call('P2')])
+        self.assertEqual({}, obj1.data)
+        self.assertEqual({}, obj2.data)
+
+    @mock.patch.object(node_ob.Node, 'update')
+    def test_do_release(self, mock_update):
+        nc = mock.Mock()
+        profile = server.ServerProfile('t', self.spec)
+        profile._networkclient = nc
+        obj1 = mock.Mock(id='N1', data={
+            'prepared_ports': [{'id': 'P1', 'remove': True}, None],
+            'placement': {'zone': 'AZ1'}})
+        obj2 = mock.Mock(id='N2', data={})
+
+        profile.do_release([obj1, obj2])
+
+        nc.port_delete.assert_called_once_with('P1')
+        mock_update.assert_called_once_with(
+            mock.ANY, 'N1', {'data': {'placement': {'zone': 'AZ1'}}})
+        self.assertEqual({}, obj2.data)
+
+    @mock.patch.object(node_ob.Node, 'update')
+    def test__create_ports_from_properties_prepared(self, mock_update):
+        profile = server.ServerProfile('t', self.spec)
+        mock_validate = self.patchobject(profile, '_validate_network',
+                                         return_value={'port': 'PORT_ID'})
+        self.patchobject(profile, '_get_port', return_value=(
+            mock.Mock(id='PORT_ID', network_id='NET2_ID', fixed_ips=[],
+                      security_group_ids=[]), None))
+        prepared = {'id': 'P1', 'network_id': 'NET1_ID', 'remove': True}
+        obj = mock.Mock(id='N1', data={'prepared_ports': [prepared, None]})
+        networks = [{'network': 'NET1'}, {'port': 'PORT'}]
+
+        res = profile._create_ports_from_properties(obj, networks, 'create')
+
+        mock_validate.assert_called_once_with(obj, {'port': 'PORT'},
+                                              'create')
+        self.assertEqual(prepared, res[0])
+        self.assertEqual('PORT_ID', res[1]['id'])
+        self.assertNotIn('remove', res[1])
+        mock_update.assert_called_once_with(
+            mock.ANY, 'N1', {'data': {'internal_ports': res}})
+
     def test_do_get_details(self):
         cc = mock.Mock()
         profile = server.ServerProfile('t', self.spec)
@@ -931,3 +931,45 @@ class TestNovaServerValidate(base.SenlinTestCase):
         mock_image.assert_called_once_with(obj, properties['image'])
         mock_keypair.assert_called_once_with(obj, properties['key_name'])
         mock_network.assert_called_once_with(obj, properties['networks'][0])
+
+    def test__lookup_shared_by_nodes(self):
+        cc = mock.Mock()
+        cc.flavor_find.return_value = mock.Mock(id='FID', is_disabled=False)
+        profile = server.ServerProfile('t', spec)
+        profile._computeclient = cc
+        node1 = mock.Mock(id='N1', user='U1', project='P1')
+        node2 = mock.Mock(id='N2', user='U2', project='P1')
+
+        profile._validate_flavor(node1, 'FLAVOR', 'create')
+        res = profile._validate_flavor(node2, 'FLAVOR', 'create')
+
+        self.assertEqual('FID', res.id)
+        cc.flavor_find.assert_called_once_with('FLAVOR', False)
+
+    def test__lookup_keypair_per_user(self):
+        cc = mock.Mock()
+        profile = server.ServerProfile('t', spec)
+        profile._computeclient = cc
+        node1 = mock.Mock(id='N1', user='U1', project='P1')
+        node2 = mock.Mock(id='N2', user='U2', project='P1')
+
+        profile._validate_keypair(node1, 'KEY', 'create')
+        profile._validate_keypair(node2, 'KEY', 'create')
+        profile._validate_keypair(node1, 'KEY', 'create')
+
+        self.assertEqual(2, cc.keypair_find.call_count)
+
+    def test__lookup_not_found_cached(self):
+        cc = mock.Mock()
+        cc.image_find.side_effect = exc.InternalError(code=404,
+                                                      message='BANG')
+        profile = server.ServerProfile('t', spec)
+        profile._computeclient = cc
+        node = mock.Mock(id='N1', user='U1', project='P1')
+
+        self.assertRaises(exc.EResourceCreation, profile._validate_image,
+                          node, 'IMAGE', 'create')
+        self.assertRaises(exc.InvalidSpec, profile._validate_image,
+                          node, 'IMAGE')
+
+        cc.image_find.assert_called_once_with('IMAGE', False)
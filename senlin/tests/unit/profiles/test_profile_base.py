@@ -13,6 +13,7 @@
 import copy
 
 import mock
+from oslo_config import cfg
 from oslo_context import context as oslo_ctx
 import six
 
@@ -445,6 +446,90 @@ class TestProfileBase(base.SenlinTestCase):
         res_obj = profile.do_get_details.return_value
         self.assertEqual(res_obj, res)
 
+    @mock.patch.object(pb.Profile, 'load')
+    def test_get_placements(self, mock_load):
+        profile = mock.Mock()
+        profile.do_get_placements.return_value = {'N1': {'zone': 'AZ1'}}
+        mock_load.return_value = profile
+        objs = [mock.Mock(id='N1')]
+
+        res = pb.Profile.get_placements(self.ctx, 'FAKE_ID', objs)
+
+        self.assertEqual({'N1': {'zone': 'AZ1'}}, res)
+        mock_load.assert_called_once_with(self.ctx, profile_id='FAKE_ID')
+        profile.do_get_placements.assert_called_once_with(objs)
+
+    @mock.patch.object(pb.Profile, 'load')
+    def test_get_placements_not_supported(self, mock_load):
+        profile = mock.Mock()
+        profile.do_get_placements.side_effect = NotImplementedError
+        profile.do_get_details.side_effect = [
+            {'OS-EXT-AZ:availability_zone': 'AZ1'}, {}]
+        mock_load.return_value = profile
+        obj1 = mock.Mock(id='N1')
+        obj2 = mock.Mock(id='N2')
+
+        res = pb.Profile.get_placements(self.ctx, 'FAKE_ID', [obj1, obj2])
+
+        self.assertEqual({'N1': {'zone': 'AZ1'}}, res)
+        profile.do_get_details.assert_has_calls([mock.call(obj1),
+                                                 mock.call(obj2)])
+
+    @mock.patch.object(pb.Profile, 'load')
+    def test_get_details_many(self, mock_load):
+        profile = mock.Mock()
+        profile.do_get_details_many.return_value = {'N1': {'name': 'S1'}}
+        profile.do_get_details.return_value = {'name': 'S2'}
+        mock_load.return_value = profile
+        obj1 = mock.Mock(id='N1')
+        obj2 = mock.Mock(id='N2')
+
+        res = pb.Profile.get_details_many(self.ctx, 'FAKE_ID', [obj1, obj2])
+
+        self.assertEqual({'N1': {'name': 'S1'}, 'N2': {'name': 'S2'}}, res)
+        mock_load.assert_called_once_with(self.ctx, profile_id='FAKE_ID')
+        profile.do_get_details_many.assert_called_once_with([obj1, obj2])
+        profile.do_get_details.assert_called_once_with(obj2)
+
+    @mock.patch.object(pb.Profile, 'load')
+    def test_get_details_many_not_supported(self, mock_load):
+        cfg.CONF.set_override('collect_concurrency', 2)
+        profile = mock.Mock()
+        profile.do_get_details_many.side_effect = NotImplementedError
+        profile.do_get_details.side_effect = lambda o: {'name': o.id}
+        mock_load.return_value = profile
+        objs = [mock.Mock(id='N%s' % i) for i in range(5)]
+
+        res = pb.Profile.get_details_many(self.ctx, 'FAKE_ID', objs)
+
+        self.assertEqual(dict(('N%s' % i, {'name': 'N%s' % i})
+                              for i in range(5)), res)
+        self.assertEqual(5, profile.do_get_details.call_count)
+
+    @mock.patch.object(pb.Profile, 'load')
+    def test_prepare_objects(self, mock_load):
+        profile = mock.Mock()
+        mock_load.return_value = profile
+        objs = [mock.Mock(id='N1'), mock.Mock(id='N2')]
+
+        res = pb.Profile.prepare_objects(self.ctx, 'FAKE_ID', objs)
+
+        self.assertEqual(profile.do_prepare.return_value, res)
+        mock_load.assert_called_once_with(self.ctx, profile_id='FAKE_ID')
+        profile.do_prepare.assert_called_once_with(objs)
+
+    @mock.patch.object(pb.Profile, 'load')
+    def test_release_objects(self, mock_load):
+        profile = mock.Mock()
+        mock_load.return_value = profile
+        objs = [mock.Mock(id='N1'), mock.Mock(id='N2')]
+
+        res = pb.Profile.release_objects(self.ctx, 'FAKE_ID', objs)
+
+        self.assertEqual(profile.do_release.return_value, res)
+        mock_load.assert_called_once_with(self.ctx, profile_id='FAKE_ID')
+        profile.do_release.assert_called_once_with(objs)
+
     def test_get_schema(self):
         expected = {
             'context': {
@@ -0,0 +1,166 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import time
+
+import eventlet
+import mock
+
+from senlin.common import cache
+from senlin.common import exception as exc
+from senlin.tests.unit.common import base
+from senlin.tests.unit.common import utils
+
+
+class TestTTLCache(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TestTTLCache, self).setUp()
+        self.mock_time = self.patchobject(time, 'time', return_value=100)
+        self.cache = cache.TTLCache('test', ttl=60)
+
+    def _lookups(self, result):
+        return utils.metric_value(cache.LOOKUPS, 'test', result)
+
+    def test_ttl_callable(self):
+        c = cache.TTLCache('test', ttl=lambda: 5, negative_ttl=lambda: 1)
+
+        self.assertEqual(5, c.ttl)
+        self.assertEqual(1, c.negative_ttl)
+
+    def test_get_hit(self):
+        hits = self._lookups('hit')
+        misses = self._lookups('miss')
+        loader = mock.Mock(return_value='VALUE')
+
+        self.assertEqual('VALUE', self.cache.get('KEY', loader))
+        self.assertEqual('VALUE', self.cache.get('KEY', loader))
+
+        loader.assert_called_once_with()
+        self.assertEqual(hits + 1, self._lookups('hit'))
+        self.assertEqual(misses + 1, self._lookups('miss'))
+
+    def test_get_expired(self):
+        loader = mock.Mock(side_effect=['OLD', 'NEW'])
+
+        self.assertEqual('OLD', self.cache.get('KEY', loader))
+        self.mock_time.return_value = 159
+        self.assertEqual('OLD', self.cache.get('KEY', loader))
+        self.mock_time.return_value = 160
+        self.assertEqual('NEW', self.cache.get('KEY', loader))
+
+        self.assertEqual(2, loader.call_count)
+
+    def test_get_value_ttl(self):
+        c = cache.TTLCache('test', ttl=60, value_ttl=lambda v: v)
+
+        self.assertEqual(10, c.get('K1', lambda: 10))
+        self.assertEqual(100, c.get('K2', lambda: 100))
+
+        self.assertEqual({'K1': (110, 10, None), 'K2': (160, 100, None)},
+                         c._entries)
+
+    def test_get_error_cached(self):
+        c = cache.TTLCache('test', ttl=60, negative_ttl=10,
+                           cache_error=lambda ex: ex.code == 404)
+        loader = mock.Mock(side_effect=exc.InternalError(code=404,
+                                                         message='Boom'))
+
+        self.assertRaises(exc.InternalError, c.get, 'KEY', loader)
+        self.mock_time.return_value = 109
+        ex = self.assertRaises(exc.InternalError, c.get, 'KEY', loader)
+        self.assertEqual(404, ex.code)
+        loader.assert_called_once_with()
+
+        self.mock_time.return_value = 110
+        self.assertRaises(exc.InternalError, c.get, 'KEY', loader)
+        self.assertEqual(2, loader.call_count)
+
+    def test_get_error_not_cached(self):
+        loader = mock.Mock(side_effect=[
+            exc.InternalError(code=404, message='Boom'), 'VALUE'])
+
+        self.assertRaises(exc.InternalError, self.cache.get, 'KEY', loader)
+        self.assertEqual('VALUE', self.cache.get('KEY', loader))
+        self.assertEqual({}, self.cache._pending)
+
+    def test_get_disabled(self):
+        c = cache.TTLCache('test', ttl=0)
+        loader = mock.Mock(return_value='VALUE')
+
+        c.get('KEY', loader)
+        c.get('KEY', loader)
+
+        self.assertEqual(2, loader.call_count)
+        self.assertEqual({}, c._entries)
+
+    def test_get_concurrent(self):
+        hits = self._lookups('hit')
+        calls = []
+
+        def loader():
+            calls.append(1)
+            eventlet.sleep(0)
+            return 'VALUE'
+
+        pool = eventlet.GreenPool()
+        results = list(pool.imap(lambda i: self.cache.get('KEY', loader),
+                                 range(3)))
+
+        self.assertEqual(['VALUE'] * 3, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(hits + 2, self._lookups('hit'))
+
+    def test_get_concurrent_error(self):
+        def loader():
+            eventlet.sleep(0)
+            raise exc.InternalError(code=500, message='Boom')
+
+        def get(i):
+            try:
+                return self.cache.get('KEY', loader)
+            except exc.InternalError as ex:
+                return ex.code
+
+        pool = eventlet.GreenPool()
+
+        self.assertEqual([500] * 3, list(pool.imap(get, range(3))))
+
+    def test_store_max_entries(self):
+        c = cache.TTLCache('test', ttl=60, max_entries=2)
+        c.get('K1', lambda: 1)
+        self.mock_time.return_value = 101
+        c.get('K2', lambda: 2)
+
+        c.get('K3', lambda: 3)
+
+        self.assertEqual(['K2', 'K3'], sorted(c._entries))
+
+    def test_invalidate(self):
+        invalidations = utils.metric_value(cache.INVALIDATIONS, 'test')
+        self.cache.get('K1', lambda: 1)
+        self.cache.get('K2', lambda: 2)
+
+        self.cache.invalidate('K1')
+        self.assertEqual(['K2'], list(self.cache._entries))
+
+        self.cache.invalidate()
+        self.assertEqual({}, self.cache._entries)
+        self.assertEqual(invalidations + 2,
+                         utils.metric_value(cache.INVALIDATIONS, 'test'))
+
+    def test_entries_metric(self):
+        c = cache.TTLCache('test_entries', ttl=60)
+        c.get('K1', lambda: 1)
+        c.get('K2', lambda: 2)
+
+        self.assertEqual(2, utils.metric_value(cache.ENTRIES, 'test_entries'))
@@ -0,0 +1,151 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import socket
+
+import eventlet
+import mock
+
+from senlin.common import metrics
+from senlin.tests.unit.common import base
+
+
+class MetricsTest(base.SenlinTestCase):
+
+    def setUp(self):
+        super(MetricsTest, self).setUp()
+        self.patchobject(metrics, '_metrics', new={})
+
+    def test_counter(self):
+        c = metrics.counter('test_total', 'Things done.', ('result',))
+        c.inc(result='ok')
+        c.inc(2, result='ok')
+        c.inc(result='error')
+
+        self.assertEqual('# HELP test_total Things done.\n'
+                         '# TYPE test_total counter\n'
+                         'test_total{result="error"} 1.0\n'
+                         'test_total{result="ok"} 3.0', c.render())
+
+    def test_register_existing(self):
+        c = metrics.counter('test_total', 'Things done.')
+
+        self.assertIs(c, metrics.counter('test_total', 'Things done.'))
+
+    def test_gauge(self):
+        g = metrics.gauge('test_items', 'Items.')
+        g.set(5)
+        g.dec()
+
+        self.assertEqual([('', (), {}, 4)], list(g.samples()))
+
+    def test_gauge_collect(self):
+        g = metrics.gauge('test_items', 'Items.', ('kind',),
+                          collect=lambda: {('b',): 2, ('a',): 1})
+
+        self.assertEqual([('', ('a',), {}, 1), ('', ('b',), {}, 2)],
+                         list(g.samples()))
+
+    def test_gauge_collect_failed(self):
+        collect = mock.Mock(side_effect=Exception('Boom'))
+        g = metrics.gauge('test_items', 'Items.', collect=collect)
+
+        self.assertEqual('# HELP test_items Items.\n'
+                         '# TYPE test_items gauge', g.render())
+
+    def test_histogram(self):
+        h = metrics.histogram('test_seconds', 'Time.', buckets=(0.1, 1))
+        h.observe(0.05)
+        h.observe(0.1)
+        h.observe(3)
+
+        self.assertEqual('# HELP test_seconds Time.\n'
+                         '# TYPE test_seconds histogram\n'
+                         'test_seconds_bucket{le="0.1"} 2.0\n'
+                         'test_seconds_bucket{le="1.0"} 2.0\n'
+                         'test_seconds_bucket{le="+Inf"} 3.0\n'
+                         'test_seconds_sum 3.15\n'
+                         'test_seconds_count 3.0', h.render())
+
+    def test_histogram_time(self):
+        h = metrics.histogram('test_seconds', 'Time.', ('op',))
+        self.patchobject(metrics.time, 'time', side_effect=[10, 12])
+
+        with h.time(op='create'):
+            pass
+
+        samples = list(h.samples())
+        self.assertIn(('_sum', ('create',), {}, 2), samples)
+        self.assertIn(('_count', ('create',), {}, 1), samples)
+
+    def test_label_escaped(self):
+        c = metrics.counter('test_total', 'Things done.', ('name',))
+        c.inc(name='a "b"\n')
+
+        self.assertIn(r'test_total{name="a \"b\"\n"} 1.0', c.render())
+
+    def test_render(self):
+        metrics.counter('b_total', 'B.').inc()
+        metrics.gauge('a_items', 'A.').set(1)
+
+        self.assertEqual('# HELP a_items A.\n'
+                         '# TYPE a_items gauge\n'
+                         'a_items 1.0\n'
+                         '# HELP b_total B.\n'
+                         '# TYPE b_total counter\n'
+                         'b_total 1.0\n', metrics.render())
+
+    def test_app(self):
+        metrics.counter('test_total', 'Things done.').inc()
+        start_response = mock.Mock()
+
+        res = metrics.app({'PATH_INFO': '/metrics'}, start_response)
+
+        body = metrics.render().encode('utf-8')
+        self.assertEqual([body], res)
+        start_response.assert_called_once_with(
+            '200 OK', [('Content-Type', metrics.CONTENT_TYPE),
+                       ('Content-Length', str(len(body)))])
+
+    def test_app_not_found(self):
+        start_response = mock.Mock()
+
+        res = metrics.app({'PATH_INFO': '/other'}, start_response)
+
+        self.assertEqual([b'Not Found\n'], res)
+        start_response.assert_called_once_with(
+            '404 Not Found', [('Content-Type', 'text/plain')])
+
+    @mock.patch.object(eventlet, 'spawn')
+    @mock.patch.object(eventlet, 'listen')
+    def test_serve(self, mock_listen, mock_spawn):
+        sock = mock.Mock()
+        mock_listen.side_effect = [socket.error('In use'), sock]
+
+        res = metrics.serve('127.0.0.1', 9100, tries=3)
+
+        self.assertEqual(9101, res)
+        mock_listen.assert_has_calls([mock.call(('127.0.0.1', 9100)),
+                                      mock.call(('127.0.0.1', 9101))])
+        mock_spawn.assert_called_once_with(metrics.wsgi.server, sock,
+                                           metrics.app, log_output=False)
+
+    @mock.patch.object(eventlet, 'spawn')
+    @mock.patch.object(eventlet, 'listen')
+    def test_serve_no_port(self, mock_listen, mock_spawn):
+        mock_listen.side_effect = socket.error('In use')
+
+        res = metrics.serve('127.0.0.1', 9100, tries=2)
+
+        self.assertIsNone(res)
+        self.assertEqual(2, mock_listen.call_count)
+        self.assertEqual(0, mock_spawn.call_count)
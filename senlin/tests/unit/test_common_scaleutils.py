@@ -281,25 +281,57 @@ class ScaleUtilsTest(base.SenlinTestCase):
     @mock.patch.object(su, 'filter_error_nodes')
     def test__victims_by_profile_age_oldest(self, mock_filter):
         good_nodes = [
-            mock.Mock(id='N11', profile_created_at=110),
-            mock.Mock(id='N15', profile_created_at=150),
-            mock.Mock(id='N12', profile_created_at=120),
-            mock.Mock(id='N13', profile_created_at=130),
-            mock.Mock(id='N14', profile_created_at=140),
+            mock.Mock(id='N11', profile_id='P11'),
+            mock.Mock(id='N15', profile_id='P15'),
+            mock.Mock(id='N12', profile_id='P12'),
+            mock.Mock(id='N13', profile_id='P13'),
+            mock.Mock(id='N14', profile_id='P14'),
         ]
         mock_filter.return_value = (['N1', 'N2'], good_nodes)
+        ages = {'P11': 110, 'P12': 120, 'P13': 130, 'P14': 140, 'P15': 150}
 
         nodes = mock.Mock()
 
-        res = su.nodes_by_profile_age(nodes, 1)
+        res = su.nodes_by_profile_age(nodes, 1, ages)
         self.assertEqual(['N1'], res)
 
-        res = su.nodes_by_profile_age(nodes, 2)
+        res = su.nodes_by_profile_age(nodes, 2, ages)
         self.assertEqual(['N1', 'N2'], res)
 
-        res = su.nodes_by_profile_age(nodes, 5)
+        res = su.nodes_by_profile_age(nodes, 5, ages)
         self.assertEqual(['N1', 'N2', 'N11', 'N12', 'N13'], res)
 
+    @mock.patch.object(su, 'filter_error_nodes')
+    def test_nodes_by_profile_age_with_lookup(self, mock_filter):
+        good_nodes = [
+            mock.Mock(id='N11', profile_id='P2'),
+            mock.Mock(id='N12', profile_id='P1'),
+            mock.Mock(id='N13', profile_id='P3'),
+        ]
+        mock_filter.return_value = ([], good_nodes)
+        ages = {'P1': 100, 'P2': 200, 'P3': 300}
+
+        res = su.nodes_by_profile_age(mock.Mock(), 2, ages)
+        self.assertEqual(['N12', 'N11'], res)
+
+    def test_select_victims(self):
+        nodes = [
+            mock.Mock(id='N1', status='ACTIVE', created_at=110),
+            mock.Mock(id='N2', status='ACTIVE', created_at=100),
+        ]
+
+        res = su.select_victims(nodes, 1, consts.OLDEST_FIRST)
+        self.assertEqual(['N2'], res)
+        res = su.select_victims(nodes, 1, consts.YOUNGEST_FIRST)
+        self.assertEqual(['N1'], res)
+        res = su.select_victims(nodes, 5, consts.RANDOM)
+        self.assertEqual(set(['N1', 'N2']), set(res))
+
+    def test_select_victims_unknown(self):
+        ex = self.assertRaises(ValueError, su.select_victims, [], 1, 'FOO')
+        self.assertEqual("Unknown victim selection criterion 'FOO'.",
+                         str(ex))
+
 
 class CheckSizeParamsTest(base.SenlinTestCase):
 
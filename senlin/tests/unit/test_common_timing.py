@@ -0,0 +1,139 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import time
+
+from senlin.common import timing
+from senlin.db import api as db_api
+from senlin.tests.unit.common import base
+
+
+class TimingTest(base.SenlinTestCase):
+
+    def setUp(self):
+        super(TimingTest, self).setUp()
+        self.mock_time = self.patchobject(time, 'time', return_value=100)
+        self.addCleanup(timing.stop)
+
+    def test_phase_not_recording(self):
+        with timing.phase(timing.EXECUTE):
+            pass
+
+        self.assertIsNone(timing.current())
+
+    def test_phase_exclusive(self):
+        recorder = timing.start()
+
+        with timing.phase(timing.EXECUTE):
+            self.mock_time.return_value = 101
+            with timing.phase(timing.CHILD_WAIT):
+                self.mock_time.return_value = 104
+            self.mock_time.return_value = 106
+
+        self.assertEqual({'execute': 3, 'child_wait': 3}, recorder.phases)
+
+    def test_phase_repeated(self):
+        recorder = timing.start()
+
+        for i in range(2):
+            with timing.phase(timing.LOCK_WAIT):
+                self.mock_time.return_value += 1
+
+        self.assertEqual({'lock_wait': 2}, recorder.phases)
+
+    def test_phase_exception(self):
+        recorder = timing.start()
+
+        def fail():
+            with timing.phase(timing.PRE_OP):
+                self.mock_time.return_value = 102
+                raise Exception('Boom')
+
+        self.assertRaises(Exception, fail)
+        self.assertEqual({'pre_op': 2}, recorder.phases)
+        self.assertEqual([], recorder._stack)
+
+    def test_timed(self):
+        recorder = timing.start()
+
+        @timing.timed(timing.POST_OP)
+        def func(value):
+            self.mock_time.return_value = 105
+            return value
+
+        self.assertEqual('VALUE', func('VALUE'))
+        self.assertEqual({'post_op': 5}, recorder.phases)
+
+    def test_count_calls(self):
+        timing.count_query()
+        with timing.driver_call():
+            pass
+        recorder = timing.start()
+
+        timing.count_query()
+        timing.count_query()
+        with timing.driver_call():
+            # a call made from within a driver call is not counted
+            with timing.driver_call():
+                pass
+        with timing.driver_call():
+            pass
+
+        self.assertIs(recorder, timing.stop())
+        self.assertIsNone(timing.current())
+        self.assertEqual(2, recorder.queries)
+        self.assertEqual(2, recorder.driver_calls)
+
+    def test_driver_call_failed(self):
+        recorder = timing.start()
+        self.addCleanup(timing.stop)
+
+        def fail():
+            with timing.driver_call():
+                raise ValueError()
+
+        self.assertRaises(ValueError, fail)
+        with timing.driver_call():
+            pass
+
+        self.assertEqual(2, recorder.driver_calls)
+
+    def test_count_sql_statements(self):
+        conn = db_api.get_engine().connect()
+        self.addCleanup(conn.close)
+        recorder = timing.start()
+
+        conn.execute('SELECT 1')
+
+        self.assertEqual(1, recorder.queries)
+
+    def test_to_dict(self):
+        recorder = timing.start()
+        recorder.add(timing.QUEUED, 0.12345)
+        recorder.queries = 3
+
+        self.assertEqual({'phases': {'queued': 0.123}, 'queries': 3,
+                          'driver_calls': 0}, recorder.to_dict())
+
+    def test_summarize(self):
+        res = timing.summarize({'phases': {'queued': 0.5, 'execute': 2.0},
+                                'queries': 7, 'driver_calls': 1})
+
+        self.assertEqual({'total': 2.5, 'slowest_phase': 'execute',
+                          'phases': {'queued': 0.5, 'execute': 2.0},
+                          'queries': 7, 'driver_calls': 1}, res)
+
+    def test_summarize_empty(self):
+        res = timing.summarize({})
+
+        self.assertEqual({'total': 0, 'slowest_phase': None, 'phases': {},
+                          'queries': 0, 'driver_calls': 0}, res)
@@ -233,6 +233,23 @@ class TestGetPathParser(base.SenlinTestCase):
                          "character: ^.", six.text_type(err))
 
 
+class TestGetPathFields(base.SenlinTestCase):
+
+    def _fields(self, path):
+        return utils.get_path_fields(utils.get_path_parser(path))
+
+    def test_fields(self):
+        self.assertEqual({'name'}, self._fields('name'))
+        self.assertEqual({'details'}, self._fields('details.addresses'))
+        self.assertEqual({'details'}, self._fields('$.details.ip'))
+        self.assertEqual({'details'}, self._fields('details[0].ip'))
+        self.assertEqual({'name', 'id'}, self._fields("'name','id'"))
+
+    def test_any_field(self):
+        self.assertIsNone(self._fields('*.ip'))
+        self.assertIsNone(self._fields('$'))
+
+
 class EngineDeathTest(base.SenlinTestCase):
 
     def setUp(self):
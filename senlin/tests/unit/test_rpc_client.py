@@ -67,6 +67,23 @@ class EngineRpcAPITestCase(base.SenlinTestCase):
                                                 req=req)
         self.assertEqual(res, new_client.call.return_value)
 
+    @mock.patch.object(messaging, 'get_rpc_client')
+    def test_call_with_timeout(self, mock_client):
+        client = mock.Mock()
+        mock_client.return_value = client
+
+        method = 'fake_method'
+        req = mock.Mock()
+        rpcapi = rpc_client.EngineClient()
+
+        res = rpcapi.call(self.context, method, req, timeout=90)
+
+        rpcapi._client.prepare.assert_called_once_with(timeout=90)
+        new_client = client.prepare.return_value
+        new_client.call.assert_called_once_with(self.context, 'fake_method',
+                                                req=req)
+        self.assertEqual(res, new_client.call.return_value)
+
     @mock.patch.object(messaging, 'get_rpc_client')
     def test_cast(self, mock_client):
         client = mock.Mock()